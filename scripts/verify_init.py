@@ -22,6 +22,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from pmtool.database import Database
+from pmtool.migrations import LATEST_SCHEMA_VERSION
 
 
 def main():
@@ -134,8 +135,10 @@ def main():
         version = db.get_schema_version()
         print(f"現在のスキーマバージョン: {version}")
 
-        if version != 1:
-            print(f"✗ スキーマバージョンが期待値(1)と異なります: {version}")
+        if version != LATEST_SCHEMA_VERSION:
+            print(
+                f"✗ スキーマバージョンが期待値({LATEST_SCHEMA_VERSION})と異なります: {version}"
+            )
             return 1
 
         print("✓ スキーマバージョンOK")
@@ -16,6 +16,7 @@ setup(
     entry_points={
         "console_scripts": [
             "pmtool=pmtool.tui.cli:main",
+            "pmtool-gen=pmtool.datagen:main",
         ],
     },
     python_requires=">=3.10",
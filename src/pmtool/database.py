@@ -15,8 +15,90 @@ Phase 0: 基盤構築
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Union
+
+from .instrumentation import QueryTracer, TracingConnection, attach
+from .migrations import apply_migrations
+from .pool import ConnectionPool
+
+# 性能プロファイルで設定できるPRAGMAと、文字列で指定できる値
+PRAGMA_CHOICES: dict[str, Optional[tuple[str, ...]]] = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "cache_size": None,
+    "mmap_size": None,
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+    "busy_timeout": None,
+}
+
+# 性能プロファイル
+#   default: SQLiteの既定値のまま（rollback journal、コミットごとにfsync）
+#   fast:    WAL + synchronous=NORMAL。コミット時のfsyncを省き、書き込みの多い一括処理向け
+#            （電源断時に直近のコミットが失われる可能性はあるが、DBは破損しない）
+#   safe:    WAL + synchronous=FULL。コミットごとにWALをfsyncする
+PROFILES: dict[str, dict[str, Union[str, int]]] = {
+    "default": {},
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # 64 MiB
+        "mmap_size": 268435456,  # 256 MiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16384,  # 16 MiB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+}
+
+ProfileSpec = Union[str, dict[str, Union[str, int]]]
+
+
+def resolve_profile(profile: ProfileSpec) -> dict[str, Union[str, int]]:
+    """
+    性能プロファイルを検証し、PRAGMA設定の辞書に変換
+
+    Args:
+        profile: プロファイル名 ('default' / 'fast' / 'safe') または PRAGMA設定の辞書
+
+    Returns:
+        dict[str, Union[str, int]]: PRAGMA名 → 値
+
+    Raises:
+        ValueError: 不明なプロファイル名・PRAGMA名、または不正な値の場合
+    """
+    if isinstance(profile, str):
+        try:
+            return dict(PROFILES[profile])
+        except KeyError:
+            raise ValueError(
+                f"不明なプロファイル: {profile}（{', '.join(PROFILES)} のいずれか）"
+            ) from None
+
+    pragmas: dict[str, Union[str, int]] = {}
+    for name, value in profile.items():
+        if name not in PRAGMA_CHOICES:
+            raise ValueError(f"設定できないPRAGMA: {name}")
+        choices = PRAGMA_CHOICES[name]
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise ValueError(f"PRAGMA {name} の値が不正です: {value!r}")
+        if isinstance(value, str):
+            if value.lstrip("-").isdigit():
+                value = int(value)
+            elif choices is not None and value.upper() in choices:
+                value = value.upper()
+            else:
+                raise ValueError(f"PRAGMA {name} の値が不正です: {value!r}")
+        pragmas[name] = value
+    return pragmas
 
 
 class Database:
@@ -26,52 +108,389 @@ class Database:
     このクラスは、データベース接続時に自動的に以下の設定を行います:
     - PRAGMA foreign_keys = ON（外部キー制約の有効化）
     - Row factory設定（カラム名でのアクセスを可能にする）
+    - 性能プロファイルのPRAGMA（journal_mode, synchronous, cache_size 等）
 
     重要:
         外部キー制約はSQLiteでは接続単位で設定されるため、
         データベース操作を行う際は必ず本クラス経由で接続してください。
+
+    スレッド:
+        書き込み用コネクションは1本で、write() で到着順に直列化されます。
+        読み取りは read() でスレッドごとに読み取り専用コネクションを借ります。
+        read() / write() の内側では connect() がそのコネクションを返すため、
+        リポジトリ等は変更なしに別スレッドから使用できます。
+        スコープ外の connect() が共有コネクションを返すのは、最初に connect() した
+        スレッド（所有スレッド）のみです。他のスレッドにはスレッド専用のコネクションを
+        返すため、複数スレッドのトランザクションが1本のコネクション上で混ざることはありません。
+
+    制限:
+        WriterQueue で直列化されるのは write() スコープ内の書き込みのみです。
+        所有スレッド以外がスコープ外で行う書き込み（スレッド専用のコネクション）や、
+        所有スレッドのスコープ外の書き込みは WriterQueue を通らず、
+        ロックの競合は busy_timeout（プロファイルで未指定の場合は sqlite3 の既定の5秒）
+        による待機に任せます。待機が上限を超えると 'database is locked' になり得るため、
+        別スレッドから書き込む場合は write() を使用してください。
     """
 
-    def __init__(self, db_path: str | Path):
+    def __init__(
+        self,
+        db_path: str | Path,
+        profile: ProfileSpec = "default",
+        max_readers: int = 4,
+        tracer: Optional[QueryTracer] = None,
+    ):
         """
         データベース接続を初期化
 
         Args:
             db_path: データベースファイルのパス
+            profile: 性能プロファイル名 ('default' / 'fast' / 'safe') または
+                PRAGMA設定の辞書（例: {"journal_mode": "WAL", "synchronous": "OFF"}）
+            max_readers: read() で同時に貸し出す読み取りコネクションの上限
+            tracer: SQL計測の記録先（指定した場合、すべてのコネクションの実行を記録）
+
+        Raises:
+            ValueError: 不正なプロファイル、または max_readers が1未満の場合
         """
         self.db_path = Path(db_path)
+        self.profile = profile if isinstance(profile, str) else "custom"
+        self.pragmas = resolve_profile(profile)
+        self.tracer = tracer
         self._connection: Optional[sqlite3.Connection] = None
+        self._connection_lock = threading.Lock()
+        self._owner_thread: Optional[int] = None
+        self._thread_connections: list[sqlite3.Connection] = []
+        self._pool = ConnectionPool(
+            lambda: self._open(readonly=True), max_readers=max_readers
+        )
+        self._local = threading.local()
+        self._transaction_listeners: list[Callable[[sqlite3.Connection, str], None]] = []
 
     def connect(self) -> sqlite3.Connection:
         """
         データベースに接続
 
+        read() / write() の内側では、そのスコープのコネクションを返します。
+        それ以外では、所有スレッドには共有の書き込み用コネクションを、
+        他のスレッドにはスレッド専用のコネクションを返します
+        （スレッド専用のコネクションでの書き込みは WriterQueue を通りません）。
+
         Returns:
             sqlite3.Connection: データベース接続オブジェクト
         """
-        # 既存のコネクションがcloseされている場合は再作成
-        if self._connection is not None:
+        scopes = getattr(self._local, "scopes", None)
+        if scopes:
+            return scopes[-1]
+
+        me = threading.get_ident()
+        with self._connection_lock:
+            if self._owner_thread is None:
+                self._owner_thread = me
+            owned = self._owner_thread == me
+        if owned:
+            return self._writer_connection()
+        return self._thread_connection()
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """
+        所有スレッド以外のスレッド専用のコネクションを取得（未作成・クローズ済みの場合は作成）
+
+        作成したコネクションは close() でまとめて閉じるため、
+        スレッド間で閉じられるよう check_same_thread=False で作成されますが、
+        使用するのは作成したスレッドのみです。
+
+        Returns:
+            sqlite3.Connection: 現在のスレッド専用のコネクション
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            with self._connection_lock:
+                if conn not in self._thread_connections:
+                    # close() 済み
+                    conn = None
+
+        if conn is None:
+            conn = self._open()
+            apply_migrations(conn)
+            self._local.connection = conn
+            with self._connection_lock:
+                self._thread_connections.append(conn)
+        return conn
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        """
+        共有の書き込み用コネクションを取得（未作成・クローズ済みの場合は作成）
+
+        Returns:
+            sqlite3.Connection: 書き込み用コネクション
+        """
+        with self._connection_lock:
+            # 既存のコネクションがcloseされている場合は再作成
+            if self._connection is not None:
+                try:
+                    # コネクションの有効性をチェック（SQLを発行せずに確認できる属性を参照）
+                    self._connection.total_changes
+                except sqlite3.ProgrammingError:
+                    # closeされている場合は再作成
+                    self._connection = None
+
+            if self._connection is None:
+                self._connection = self._open()
+                # 既存DBを最新スキーマへ移行（未初期化のDBには何もしない）
+                apply_migrations(self._connection)
+
+            return self._connection
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """
+        読み取り専用コネクションを借りるスコープ
+
+        スコープ内では connect() もこのコネクションを返します。
+        同時に借りられる数は max_readers までで、超えた場合は返却を待ちます。
+
+        Yields:
+            sqlite3.Connection: 読み取り専用コネクション
+
+        Raises:
+            sqlite3.OperationalError: DBファイルが存在しない場合
+        """
+        with self._pool.reader() as conn:
+            self._push_scope(conn)
             try:
-                # コネクションの有効性をチェック
-                self._connection.execute("SELECT 1")
-            except sqlite3.ProgrammingError:
-                # closeされている場合は再作成
-                self._connection = None
+                yield conn
+            finally:
+                self._pop_scope()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """
+        書き込み用コネクションを排他的に使うスコープ
+
+        他スレッドの write() とは到着順に直列化されます。
+        スコープは transaction() でもあるため、最も外側のスコープを正常に抜けるとコミットし、
+        例外の場合はそのスコープの変更を取り消します（入れ子の write() ではコミットしません）。
+        スコープ内では connect() もこのコネクションを返します。
+
+        Yields:
+            sqlite3.Connection: 書き込み用コネクション
+        """
+        self._pool.writer_queue.acquire()
+        try:
+            conn = self._writer_connection()
+            self._push_scope(conn)
+            try:
+                with self.transaction():
+                    yield conn
+            finally:
+                self._pop_scope()
+        finally:
+            self._pool.writer_queue.release()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        作業単位（Unit of Work）のトランザクションスコープ
+
+        スコープ内のリポジトリ等の commit() は最も外側のスコープの終了まで遅延されるため、
+        複数の操作を1回のコミット（1回のfsync）でアトミックに反映できます。
+
+        各スコープは SAVEPOINT で実装されており、入れ子にできます。
+        内側のスコープで例外が発生した場合は、そのスコープの変更のみが取り消されます
+        （外側のスコープは、例外を捕捉すれば処理を続行できます）。
+        最も外側のスコープを正常に抜けるとコミットします。
+
+        Yields:
+            sqlite3.Connection: スコープのコネクション (connect() と同じ)
+        """
+        conn = self.connect()
+        stack = self._transactions()
+        savepoint = f"pmtool_sp_{len(stack)}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+        stack.append(conn)
+        if len(stack) == 1:
+            self._notify_transaction(conn, "begin")
+        try:
+            yield conn
+        except BaseException:
+            stack.pop()
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+            self._notify_transaction(conn, "rollback_to" if stack else "rollback")
+            raise
+        else:
+            stack.pop()
+            conn.execute(f"RELEASE {savepoint}")
+            if not stack:
+                conn.commit()
+                self._notify_transaction(conn, "commit")
+
+    def add_transaction_listener(
+        self, listener: Callable[[sqlite3.Connection, str], None]
+    ) -> None:
+        """
+        transaction() スコープの開始・終了の通知先を登録
+
+        通知はスコープを実行したスレッドで、listener(conn, event) の形で呼ばれます。
+        event は 'begin' / 'commit' / 'rollback' （最も外側のスコープ）、
+        または 'rollback_to' （内側のスコープのロールバック）です。
+        未コミットの変更を反映したキャッシュ等を、コミット時に確定させ
+        ロールバック時に破棄するために使用します。
+
+        Args:
+            listener: 通知を受け取る関数
+        """
+        self._transaction_listeners.append(listener)
+
+    def _notify_transaction(self, conn: sqlite3.Connection, event: str) -> None:
+        """登録済みの通知先に transaction() スコープの開始・終了を通知"""
+        for listener in self._transaction_listeners:
+            listener(conn, event)
+
+    @property
+    def in_transaction(self) -> bool:
+        """現在のスレッドが transaction() スコープ内か"""
+        return bool(self._transactions())
+
+    def commit(self, conn: sqlite3.Connection) -> None:
+        """
+        コミット（transaction() スコープ内では最も外側のスコープまで遅延）
+
+        リポジトリ等は conn.commit() の代わりにこのメソッドを使用します。
+
+        Args:
+            conn: コミットするコネクション
+        """
+        if conn in self._transactions():
+            return
+        conn.commit()
+
+    def rollback(self, conn: sqlite3.Connection) -> None:
+        """
+        ロールバック（transaction() スコープ内ではスコープ側に任せる）
+
+        スコープ内では何もせず、呼び出し側が送出する例外によって
+        スコープの SAVEPOINT まで取り消されます。
+
+        Args:
+            conn: ロールバックするコネクション
+        """
+        if conn in self._transactions():
+            return
+        conn.rollback()
+
+    def _transactions(self) -> list[sqlite3.Connection]:
+        """現在のスレッドの transaction() スコープのコネクション（外側から順）"""
+        stack = getattr(self._local, "transactions", None)
+        if stack is None:
+            stack = self._local.transactions = []
+        return stack
+
+    def _push_scope(self, conn: sqlite3.Connection) -> None:
+        """現在のスレッドで connect() が返すコネクションを積む"""
+        scopes = getattr(self._local, "scopes", None)
+        if scopes is None:
+            scopes = self._local.scopes = []
+        scopes.append(conn)
+
+    def _pop_scope(self) -> None:
+        """_push_scope() で積んだコネクションを戻す"""
+        self._local.scopes.pop()
+
+    def _open(self, readonly: bool = False) -> sqlite3.Connection:
+        """
+        新しいコネクションを作成して設定
 
-        if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path))
-            # Row factoryを設定（カラム名でアクセス可能にする）
-            self._connection.row_factory = sqlite3.Row
-            # 外部キー制約を有効化
-            self._connection.execute("PRAGMA foreign_keys = ON")
+        read() / write() でスレッド間を受け渡すため check_same_thread=False で作成します
+        （同時に使うのは常に1スレッドです。スコープ外の connect() は所有スレッド以外に
+        共有コネクションを返さないため、この設定で共有されることはありません）。
+
+        Args:
+            readonly: Trueの場合は読み取り専用で開く
+
+        Returns:
+            sqlite3.Connection: 設定済みのコネクション
+        """
+        factory = TracingConnection if self.tracer is not None else sqlite3.Connection
+        if readonly:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, factory=factory
+            )
+        else:
+            conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, factory=factory
+            )
+        if self.tracer is not None:
+            attach(conn, self.tracer)
+        self._configure(conn, readonly=readonly)
+        return conn
+
+    def connect_readonly(self) -> sqlite3.Connection:
+        """
+        読み取り専用の新しいコネクションを作成
 
-        return self._connection
+        共有コネクション (connect()) とは別の独立したコネクションを返します。
+        別スレッドでの読み取り処理などに使用し、使用後は呼び出し側で close() してください。
+
+        Returns:
+            sqlite3.Connection: 読み取り専用のデータベース接続オブジェクト
+
+        Raises:
+            sqlite3.OperationalError: DBファイルが存在しない場合
+        """
+        return self._open(readonly=True)
+
+    def _configure(self, conn: sqlite3.Connection, readonly: bool = False) -> None:
+        """
+        新しいコネクションに Row factory・外部キー制約・性能プロファイルを設定
+
+        Args:
+            conn: 設定するコネクション
+            readonly: 読み取り専用コネクションの場合True
+                （journal_mode はDBファイルに保存される設定のため変更しない）
+        """
+        # Row factoryを設定（カラム名でアクセス可能にする）
+        conn.row_factory = sqlite3.Row
+        # 外部キー制約を有効化
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        for name, value in self.pragmas.items():
+            if readonly and name == "journal_mode":
+                continue
+            # 値は resolve_profile() で検証済み（PRAGMAはパラメータ束縛できない）
+            conn.execute(f"PRAGMA {name} = {value}")
+
+    def get_active_pragmas(self) -> dict[str, Union[str, int]]:
+        """
+        共有コネクションで実際に有効な性能関連PRAGMAの値を取得
+
+        Returns:
+            dict[str, Union[str, int]]: PRAGMA名 → 現在値
+                （synchronous / temp_store は名前で返す）
+        """
+        conn = self.connect()
+        active: dict[str, Union[str, int]] = {}
+        for name, choices in PRAGMA_CHOICES.items():
+            value = conn.execute(f"PRAGMA {name}").fetchone()[0]
+            if name == "journal_mode":
+                value = value.upper()
+            elif choices is not None and isinstance(value, int):
+                value = choices[value]
+            active[name] = value
+        return active
 
     def close(self):
-        """データベース接続を閉じる"""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """データベース接続を閉じる（スレッド専用・プールの読み取りコネクションを含む）"""
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            thread_connections, self._thread_connections = self._thread_connections, []
+            self._owner_thread = None
+        for conn in thread_connections:
+            conn.close()
+        self._pool.close()
 
     def is_initialized(self) -> bool:
         """
@@ -177,10 +596,69 @@ class Database:
             # SQLスクリプトを実行
             cursor.executescript(sql_script)
             conn.commit()
+
+            # 最新スキーマへ移行
+            apply_migrations(conn)
         except sqlite3.Error as e:
             conn.rollback()
             raise e
 
+    def get_metadata(self, key: str) -> Optional[str]:
+        """
+        metadata テーブルから値を取得
+
+        Args:
+            key: キー
+
+        Returns:
+            Optional[str]: 値（未設定の場合None）
+        """
+        conn = self.connect()
+        row = conn.execute(
+            "SELECT value FROM metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_metadata(self, key: str, value: str) -> None:
+        """
+        metadata テーブルに値を保存（既存の値は上書き）
+
+        Args:
+            key: キー
+            value: 値
+        """
+        conn = self.connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO metadata (key, value, updated_at)
+                VALUES (?, ?, datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_at = excluded.updated_at
+                """,
+                (key, value),
+            )
+            self.commit(conn)
+        except sqlite3.Error:
+            self.rollback(conn)
+            raise
+
+    def delete_metadata(self, key: str) -> None:
+        """
+        metadata テーブルから値を削除（未設定の場合は何もしない）
+
+        Args:
+            key: キー
+        """
+        conn = self.connect()
+        try:
+            conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+            self.commit(conn)
+        except sqlite3.Error:
+            self.rollback(conn)
+            raise
+
     def verify_foreign_keys(self) -> bool:
         """
         外部キー制約が有効化されているか確認
@@ -0,0 +1,481 @@
+"""
+合成データセット生成モジュール
+
+ベンチマーク用に、規模を指定した大きなpmtoolデータベースを生成します。
+同じ DatasetSpec（seed を含む）からは常に同じ内容が生成されます。
+
+生成されるデータは通常の操作で作成できる状態と同じ制約を満たします:
+    - 依存関係は同じProject内のTask同士・同じTask内のSubTask同士のみ（D1制約）
+    - 依存関係は各スコープ内の並び順で前 → 後の向きのみのため、必ずDAGになる
+    - DONEのノードの先行ノードはすべてDONE、DONEのTaskの子SubTaskはすべてDONE
+    - order_index は親ごとに0からの連番
+
+挿入は1トランザクション内で executemany により一括で行い、IDは空のDBを前提に採番します。
+生成する行は構築上FK制約を満たすため、挿入中はFK検査を無効にします。
+pending_predecessors / progress_rollups を維持するトリガーも挿入中は外し、
+最後に集合演算で1回だけ再計算します。
+
+コマンドラインからは `pmtool-gen` で実行します::
+
+    pmtool-gen data/bench.db --projects 10 --subprojects 10 --tasks 100 --subtasks 100
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .database import PROFILES, Database
+from .migrations import bulk_load
+
+# 進捗の進んだ順（並び順の前方から割り当てる）
+STATUS_ORDER = ("DONE", "IN_PROGRESS", "NOT_STARTED", "UNSET")
+
+DEFAULT_INIT_SQL = Path(__file__).resolve().parents[2] / "scripts" / "init_db.sql"
+
+
+def _now() -> str:
+    """現在のUTCタイムスタンプをISO 8601形式で返す"""
+    return datetime.utcnow().isoformat()
+
+
+def _default_status_mix() -> dict[str, float]:
+    return {status: 0.25 for status in STATUS_ORDER}
+
+
+@dataclass
+class DatasetSpec:
+    """生成するデータセットの規模と性質"""
+
+    projects: int = 10
+    """Project数"""
+
+    subprojects_per_project: int = 10
+    """ProjectごとのSubProject数"""
+
+    tasks_per_subproject: int = 100
+    """SubProjectごとのTask数"""
+
+    subtasks_per_task: int = 10
+    """TaskごとのSubTask数"""
+
+    dependency_density: float = 1.0
+    """ノードあたりの後続への依存関係数の平均（Task・SubTask共通）"""
+
+    status_mix: dict[str, float] = field(default_factory=_default_status_mix)
+    """ステータスの出現比率（合計が1でなくてもよい）"""
+
+    cross_subproject_ratio: float = 0.1
+    """Task依存関係のうち、同じProject内の別SubProjectのTaskへ向かうものの比率"""
+
+    seed: int = 0
+    """乱数シード"""
+
+    def validate(self) -> None:
+        """
+        設定値を検証
+
+        Raises:
+            ValueError: 設定値が範囲外の場合
+        """
+        for name in (
+            "projects",
+            "subprojects_per_project",
+            "tasks_per_subproject",
+            "subtasks_per_task",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} は0以上を指定してください: {getattr(self, name)}")
+        if self.dependency_density < 0:
+            raise ValueError(
+                f"dependency_density は0以上を指定してください: {self.dependency_density}"
+            )
+        if not 0 <= self.cross_subproject_ratio <= 1:
+            raise ValueError(
+                "cross_subproject_ratio は0〜1を指定してください: "
+                f"{self.cross_subproject_ratio}"
+            )
+        unknown = set(self.status_mix) - set(STATUS_ORDER)
+        if unknown:
+            raise ValueError(
+                f"未知のステータスです: {', '.join(sorted(unknown))} "
+                f"(選択肢: {', '.join(STATUS_ORDER)})"
+            )
+        if any(weight < 0 for weight in self.status_mix.values()) or not any(
+            self.status_mix.values()
+        ):
+            raise ValueError("status_mix には0以上の比率を1つ以上指定してください")
+
+    @property
+    def total_tasks(self) -> int:
+        """生成するTaskの総数"""
+        return self.projects * self.subprojects_per_project * self.tasks_per_subproject
+
+    @property
+    def total_subtasks(self) -> int:
+        """生成するSubTaskの総数"""
+        return self.total_tasks * self.subtasks_per_task
+
+
+@dataclass
+class GenerationResult:
+    """データセット生成の結果"""
+
+    projects: int = 0
+    subprojects: int = 0
+    tasks: int = 0
+    subtasks: int = 0
+    task_dependencies: int = 0
+    subtask_dependencies: int = 0
+    elapsed: float = 0.0
+    """所要時間（秒）"""
+
+
+class _Generator:
+    """DatasetSpec から行を順に生成する（挿入は generate_dataset が行う）"""
+
+    def __init__(self, spec: DatasetSpec, timestamp: str):
+        self.spec = spec
+        self.timestamp = timestamp
+        self.rng = random.Random(spec.seed)
+        weights = [spec.status_mix.get(status, 0.0) for status in STATUS_ORDER]
+        self.statuses = [s for s, w in zip(STATUS_ORDER, weights) if w > 0]
+        self.weights = [w for w in weights if w > 0]
+        self.rank = {status: i for i, status in enumerate(STATUS_ORDER)}
+        # Task ID → ステータス（SubTaskのステータス決定に使用）
+        self.task_status: dict[int, str] = {}
+
+    def sample_statuses(self, count: int) -> list[str]:
+        """ステータスを抽出し、進捗の進んだ順に並べる（先頭ほどDONE）"""
+        statuses = self.rng.choices(self.statuses, self.weights, k=count)
+        statuses.sort(key=self.rank.__getitem__)
+        return statuses
+
+    def edges(
+        self, first_id: int, count: int, group_size: int, cross_ratio: float
+    ) -> Iterator[tuple[int, int]]:
+        """
+        連番ノード first_id..first_id+count-1 の間に前 → 後の依存関係を生成
+
+        ノードを group_size 件ずつのグループ（SubProject）に分け、
+        cross_ratio の比率で後方の別グループへ、それ以外は同じグループの後方へ向けます。
+        """
+        density = self.spec.dependency_density
+        whole, fraction = int(density), density - int(density)
+        rng = self.rng
+        for index in range(count - 1):
+            group_end = (index // group_size + 1) * group_size
+            fanout = whole + (rng.random() < fraction)
+            targets = set()
+            for _ in range(fanout):
+                if group_end < count and rng.random() < cross_ratio:
+                    target = rng.randrange(group_end, count)
+                elif index + 1 < group_end:
+                    target = rng.randrange(index + 1, group_end)
+                else:
+                    continue
+                targets.add(target)
+            for target in sorted(targets):
+                yield first_id + index, first_id + target
+
+    def projects(self) -> Iterator[tuple]:
+        for i in range(self.spec.projects):
+            yield (i + 1, f"Project {i + 1}", None, i, self.timestamp, self.timestamp)
+
+    def subprojects(self) -> Iterator[tuple]:
+        spec = self.spec
+        subproject_id = 0
+        for project_id in range(1, spec.projects + 1):
+            for order in range(spec.subprojects_per_project):
+                subproject_id += 1
+                yield (
+                    subproject_id,
+                    project_id,
+                    f"SubProject {order + 1}",
+                    None,
+                    order,
+                    self.timestamp,
+                    self.timestamp,
+                )
+
+    def tasks(self) -> Iterator[tuple]:
+        spec = self.spec
+        per_project = spec.subprojects_per_project * spec.tasks_per_subproject
+        task_id = subproject_id = 0
+        for project_id in range(1, spec.projects + 1):
+            # Project内のTaskは依存関係の向き（前 → 後）と同じ順で進捗が進んでいる
+            statuses = iter(self.sample_statuses(per_project))
+            for _ in range(spec.subprojects_per_project):
+                subproject_id += 1
+                for order in range(spec.tasks_per_subproject):
+                    task_id += 1
+                    status = next(statuses)
+                    self.task_status[task_id] = status
+                    yield (
+                        task_id,
+                        project_id,
+                        subproject_id,
+                        f"Task {order + 1}",
+                        None,
+                        status,
+                        order,
+                        self.timestamp,
+                        self.timestamp,
+                    )
+
+    def task_dependencies(self) -> Iterator[tuple]:
+        spec = self.spec
+        per_project = spec.subprojects_per_project * spec.tasks_per_subproject
+        for p in range(spec.projects):
+            yield from self.edges(
+                p * per_project + 1,
+                per_project,
+                spec.tasks_per_subproject,
+                spec.cross_subproject_ratio,
+            )
+
+    def subtasks(self) -> Iterator[tuple]:
+        count = self.spec.subtasks_per_task
+        names = [f"SubTask {order + 1}" for order in range(count)]
+        subtask_id = 0
+        for task_id in range(1, self.spec.total_tasks + 1):
+            if self.task_status[task_id] == "DONE":
+                statuses = ["DONE"] * count
+            else:
+                statuses = self.sample_statuses(count)
+            for order in range(count):
+                subtask_id += 1
+                yield (
+                    subtask_id,
+                    task_id,
+                    names[order],
+                    None,
+                    statuses[order],
+                    order,
+                    self.timestamp,
+                    self.timestamp,
+                )
+
+    def subtask_dependencies(self) -> Iterator[tuple]:
+        count = self.spec.subtasks_per_task
+        for t in range(self.spec.total_tasks):
+            yield from self.edges(t * count + 1, count, count, 0.0)
+
+
+def generate_dataset(db: Database, spec: DatasetSpec) -> GenerationResult:
+    """
+    初期化済みの空のDBに合成データセットを生成
+
+    Args:
+        db: Database インスタンス（initialize() 済みで、Projectが1件もないこと）
+        spec: 生成するデータセットの設定
+
+    Returns:
+        GenerationResult: 生成した件数と所要時間
+
+    Raises:
+        ValueError: spec の設定値が範囲外の場合
+        RuntimeError: DBが未初期化、または既にデータがある場合
+    """
+    spec.validate()
+    if not db.is_initialized():
+        raise RuntimeError(f"Database is not initialized at {db.db_path}.")
+
+    started = time.perf_counter()
+    conn = db.connect()
+    if conn.execute("SELECT EXISTS (SELECT 1 FROM projects)").fetchone()[0]:
+        raise RuntimeError(f"Database at {db.db_path} already contains data.")
+
+    generator = _Generator(spec, _now())
+    result = GenerationResult()
+    statements = [
+        (
+            "projects",
+            "INSERT INTO projects (id, name, description, order_index, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            generator.projects(),
+        ),
+        (
+            "subprojects",
+            "INSERT INTO subprojects "
+            "(id, project_id, name, description, order_index, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            generator.subprojects(),
+        ),
+        (
+            "tasks",
+            "INSERT INTO tasks (id, project_id, subproject_id, name, description, status, "
+            "order_index, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            generator.tasks(),
+        ),
+        (
+            "task_dependencies",
+            "INSERT INTO task_dependencies (predecessor_id, successor_id) VALUES (?, ?)",
+            generator.task_dependencies(),
+        ),
+        (
+            "subtasks",
+            "INSERT INTO subtasks (id, task_id, name, description, status, order_index, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            generator.subtasks(),
+        ),
+        (
+            "subtask_dependencies",
+            "INSERT INTO subtask_dependencies (predecessor_id, successor_id) VALUES (?, ?)",
+            generator.subtask_dependencies(),
+        ),
+    ]
+
+    # 生成する行は構築上FK制約を満たすため、挿入時の親行の検索を省く
+    # （トランザクション外でのみ切り替わる）
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        # 行ごとの派生データのトリガーは外し、投入後に1回で再計算する
+        with db.transaction(), bulk_load(conn):
+            for attribute, sql, rows in statements:
+                cursor = conn.executemany(sql, rows)
+                setattr(result, attribute, cursor.rowcount)
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    conn.execute("ANALYZE")
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def parse_status_mix(text: str) -> dict[str, float]:
+    """
+    "DONE=0.3,IN_PROGRESS=0.2" 形式のステータス比率をパース
+
+    Args:
+        text: カンマ区切りの STATUS=WEIGHT
+
+    Returns:
+        dict[str, float]: ステータス → 比率（指定しなかったステータスは0）
+
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    mix = {}
+    for item in text.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"ステータス比率は STATUS=WEIGHT 形式で指定してください: {item}")
+        try:
+            mix[name.strip().upper()] = float(value)
+        except ValueError:
+            raise ValueError(f"比率が数値ではありません: {item}") from None
+    return mix
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """pmtool-gen のargparseパーサーを構築"""
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(
+        prog="pmtool-gen", description="ベンチマーク用の合成データセットを生成"
+    )
+    parser.add_argument("output", help="生成するDBファイルのパス")
+    parser.add_argument("--projects", type=int, default=defaults.projects)
+    parser.add_argument(
+        "--subprojects",
+        type=int,
+        default=defaults.subprojects_per_project,
+        help="ProjectごとのSubProject数",
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=defaults.tasks_per_subproject, help="SubProjectごとのTask数"
+    )
+    parser.add_argument(
+        "--subtasks", type=int, default=defaults.subtasks_per_task, help="TaskごとのSubTask数"
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=defaults.dependency_density,
+        help="ノードあたりの依存関係数の平均",
+    )
+    parser.add_argument(
+        "--status-mix",
+        type=parse_status_mix,
+        default=None,
+        metavar="STATUS=WEIGHT,...",
+        help="ステータスの比率（例: DONE=0.3,IN_PROGRESS=0.2,NOT_STARTED=0.3,UNSET=0.2）",
+    )
+    parser.add_argument(
+        "--cross-ratio",
+        type=float,
+        default=defaults.cross_subproject_ratio,
+        help="別SubProjectのTaskへ向かう依存関係の比率",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="乱数シード")
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="fast",
+        help="生成時のSQLite性能プロファイル（既定: fast）",
+    )
+    parser.add_argument(
+        "--init-sql",
+        default=str(DEFAULT_INIT_SQL),
+        help="初期化SQLファイルのパス",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="既存のDBファイルを削除して作り直す"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """pmtool-gen のエントリーポイント"""
+    args = create_parser().parse_args(argv)
+
+    spec = DatasetSpec(
+        projects=args.projects,
+        subprojects_per_project=args.subprojects,
+        tasks_per_subproject=args.tasks,
+        subtasks_per_task=args.subtasks,
+        dependency_density=args.density,
+        cross_subproject_ratio=args.cross_ratio,
+        seed=args.seed,
+    )
+    if args.status_mix is not None:
+        spec.status_mix = args.status_mix
+    try:
+        spec.validate()
+    except ValueError as e:
+        print(f"ERROR: 入力エラー: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    output = Path(args.output)
+    if output.exists():
+        if not args.force:
+            print(
+                f"ERROR: {output} は既に存在します（--force で作り直します）",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        output.unlink()
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    db = Database(str(output), profile=args.profile)
+    try:
+        db.initialize(args.init_sql)
+        result = generate_dataset(db, spec)
+    finally:
+        db.close()
+
+    print(
+        f"{output}: projects={result.projects} subprojects={result.subprojects} "
+        f"tasks={result.tasks} subtasks={result.subtasks} "
+        f"task_dependencies={result.task_dependencies} "
+        f"subtask_dependencies={result.subtask_dependencies} "
+        f"({result.elapsed:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,29 @@ DAG (有向非巡回グラフ) の検証と循環検出を行います。
 import sqlite3
 from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from .database import Database
-from .exceptions import ConstraintViolationError, CyclicDependencyError
-from .models import Dependency
+from .exceptions import (
+    ConstraintViolationError,
+    CyclicDependencyError,
+    DependencyRejectionReason,
+)
+from .graph import DependencyGraph, dependency_table, get_graph_cache
+from .models import AddDependenciesResult, Dependency, RejectedDependency
+from . import traversal
+from .reachability import (
+    REACHABILITY_TABLES,
+    has_reachability_index,
+    rebuild_reachability_index,
+    reachability_table,
+)
+
+# 探索方式
+TRAVERSAL_BACKENDS = ("auto", "memory", "sql")
+
+# IN句に一度に渡すID数の上限 (SQLiteのホスト変数上限に余裕を持たせた値)
+IN_CLAUSE_CHUNK_SIZE = 500
 
 
 def _now() -> str:
@@ -30,14 +48,26 @@ class DependencyManager:
     依存関係を管理するクラス
 
     TaskとSubTaskの依存関係の追加・削除・取得、およびDAG循環検出を提供します。
+
+    閉包・経路・近傍の探索方式 (traversal) は以下から選択できます:
+        - "auto": 到達可能性インデックスがあればそれを使い、なければ "memory"
+        - "memory": キャッシュ済みの依存グラフをPython上で探索
+        - "sql": WITH RECURSIVE クエリでSQLite内で探索
     """
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, traversal: str = "auto"):
         """
         Args:
             db: Database インスタンス
+            traversal: 探索方式 ('auto' / 'memory' / 'sql')
+
+        Raises:
+            ValueError: 不正な traversal の場合
         """
+        if traversal not in TRAVERSAL_BACKENDS:
+            raise ValueError(f"不正な traversal: {traversal}")
         self.db = db
+        self.traversal = traversal
 
     def add_task_dependency(
         self, predecessor_id: int, successor_id: int
@@ -103,6 +133,8 @@ class DependencyManager:
             self.validate_no_cycle(predecessor_id, successor_id, "task", conn=conn)
 
             # INSERT
+            cache = get_graph_cache(self.db, "task")
+            before_token = cache.token(conn)
             now = _now()
             cursor.execute(
                 """
@@ -112,7 +144,12 @@ class DependencyManager:
                 (predecessor_id, successor_id, now),
             )
             dep_id = cursor.lastrowid
-            conn.commit()
+            self.db.commit(conn)
+
+            # キャッシュ済みグラフにエッジを反映
+            cache.apply_committed(
+                conn, before_token, added=[(predecessor_id, successor_id)]
+            )
 
             return Dependency(
                 id=dep_id,
@@ -122,10 +159,10 @@ class DependencyManager:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Task依存関係の作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def add_subtask_dependency(
@@ -192,6 +229,8 @@ class DependencyManager:
             self.validate_no_cycle(predecessor_id, successor_id, "subtask", conn=conn)
 
             # INSERT
+            cache = get_graph_cache(self.db, "subtask")
+            before_token = cache.token(conn)
             now = _now()
             cursor.execute(
                 """
@@ -201,7 +240,12 @@ class DependencyManager:
                 (predecessor_id, successor_id, now),
             )
             dep_id = cursor.lastrowid
-            conn.commit()
+            self.db.commit(conn)
+
+            # キャッシュ済みグラフにエッジを反映
+            cache.apply_committed(
+                conn, before_token, added=[(predecessor_id, successor_id)]
+            )
 
             return Dependency(
                 id=dep_id,
@@ -211,12 +255,238 @@ class DependencyManager:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTask依存関係の作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
+    def add_task_dependencies(
+        self, pairs: Iterable[tuple[int, int]]
+    ) -> AddDependenciesResult:
+        """
+        Task間の依存関係を一括追加
+
+        すべての組をまとめて検証し、受理できたものを1トランザクションで追加します。
+        最初の不正な組で中断せず、拒否した組は理由とともに結果に含めます。
+
+        Args:
+            pairs: (先行TaskID, 後続TaskID) の列
+
+        Returns:
+            AddDependenciesResult: 追加された依存関係と拒否された組
+
+        Raises:
+            ConstraintViolationError: DB制約違反でINSERTに失敗した場合
+        """
+        return self._add_dependencies(pairs, "task")
+
+    def add_subtask_dependencies(
+        self, pairs: Iterable[tuple[int, int]]
+    ) -> AddDependenciesResult:
+        """
+        SubTask間の依存関係を一括追加
+
+        すべての組をまとめて検証し、受理できたものを1トランザクションで追加します。
+        最初の不正な組で中断せず、拒否した組は理由とともに結果に含めます。
+
+        Args:
+            pairs: (先行SubTaskID, 後続SubTaskID) の列
+
+        Returns:
+            AddDependenciesResult: 追加された依存関係と拒否された組
+
+        Raises:
+            ConstraintViolationError: DB制約違反でINSERTに失敗した場合
+        """
+        return self._add_dependencies(pairs, "subtask")
+
+    def _add_dependencies(
+        self, pairs: Iterable[tuple[int, int]], dep_type: str
+    ) -> AddDependenciesResult:
+        """
+        依存関係の一括追加 (add_task_dependencies / add_subtask_dependencies の共通処理)
+
+        検証は以下の順で行い、最初に該当した理由で拒否します:
+            1. 自己参照・入力内の重複
+            2. ノードの存在とD1制約 (同じ親に属すること) — IN句による一括取得
+            3. 既存の依存関係との重複 — キャッシュ済みグラフで判定
+            4. 循環 — 既存グラフと候補全体を1回トポロジカルソートし、
+               循環がある場合のみ入力順に1件ずつ判定して循環を作る組を拒否
+
+        Args:
+            pairs: (先行ノードID, 後続ノードID) の列
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+
+        Returns:
+            AddDependenciesResult: 追加された依存関係と拒否された組
+        """
+        table_name = dependency_table(dep_type)
+        if dep_type == "task":
+            node_table, parent_column = "tasks", "project_id"
+            label, parent_label = "Task", "プロジェクト"
+        else:
+            node_table, parent_column = "subtasks", "task_id"
+            label, parent_label = "SubTask", "Task"
+
+        result = AddDependenciesResult()
+        pairs = [(int(pred), int(succ)) for pred, succ in pairs]
+        if not pairs:
+            return result
+
+        # 拒否した組 {入力位置: 拒否情報}
+        rejected: dict[int, RejectedDependency] = {}
+
+        def reject(index: int, reason: DependencyRejectionReason, message: str):
+            pred, succ = pairs[index]
+            rejected[index] = RejectedDependency(pred, succ, reason, message)
+
+        # 1. 自己参照・入力内の重複
+        seen: set[tuple[int, int]] = set()
+        for index, (pred, succ) in enumerate(pairs):
+            if pred == succ:
+                reject(
+                    index,
+                    DependencyRejectionReason.SELF_REFERENCE,
+                    f"{label}IDは自分自身に依存できません",
+                )
+            elif (pred, succ) in seen:
+                reject(
+                    index,
+                    DependencyRejectionReason.DUPLICATE_IN_BATCH,
+                    f"{label} {pred} → {succ} の依存関係が入力内で重複しています",
+                )
+            else:
+                seen.add((pred, succ))
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        # 2. ノードの存在とD1制約
+        node_ids = sorted({node_id for pair in seen for node_id in pair})
+        parents: dict[int, int] = {}
+        for start in range(0, len(node_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = node_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT id, {parent_column} FROM {node_table} WHERE id IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                parents[row["id"]] = row[parent_column]
+
+        graph = self._get_graph(dep_type, conn=conn)
+        candidates: list[int] = []
+        for index, (pred, succ) in enumerate(pairs):
+            if index in rejected:
+                continue
+            missing = [node_id for node_id in (pred, succ) if node_id not in parents]
+            if missing:
+                reject(
+                    index,
+                    DependencyRejectionReason.NODE_NOT_FOUND,
+                    f"{label}ID {missing[0]} は存在しません",
+                )
+            elif parents[pred] != parents[succ]:
+                reject(
+                    index,
+                    DependencyRejectionReason.LAYER_MISMATCH,
+                    f"{label} {pred} と {label} {succ} は異なる{parent_label}に属しているため、"
+                    f"依存関係を作成できません",
+                )
+            # 3. 既存の依存関係との重複
+            elif graph.has_edge(pred, succ):
+                reject(
+                    index,
+                    DependencyRejectionReason.ALREADY_EXISTS,
+                    f"{label} {pred} → {succ} の依存関係は既に存在します",
+                )
+            else:
+                candidates.append(index)
+
+        # 4. 循環検出
+        candidate_edges = [pairs[index] for index in candidates]
+        if not graph.is_acyclic_with(candidate_edges):
+            working = DependencyGraph(
+                (pred, succ)
+                for pred, succs in graph.forward.items()
+                for succ in succs
+            )
+            accepted: list[int] = []
+            for index in candidates:
+                pred, succ = pairs[index]
+                if working.would_create_cycle(pred, succ):
+                    reject(
+                        index,
+                        DependencyRejectionReason.CYCLE,
+                        f"依存関係 {pred} → {succ} を追加すると循環依存が発生します",
+                    )
+                else:
+                    working.add_edge(pred, succ)
+                    accepted.append(index)
+            candidates = accepted
+            candidate_edges = [pairs[index] for index in candidates]
+
+        result.rejected = [rejected[index] for index in sorted(rejected)]
+        if not candidates:
+            return result
+
+        # INSERT (1トランザクション)
+        cache = get_graph_cache(self.db, dep_type)
+        before_token = cache.token(conn)
+        now = _now()
+
+        try:
+            cursor.executemany(
+                f"""
+                INSERT INTO {table_name} (predecessor_id, successor_id, created_at)
+                VALUES (?, ?, ?)
+                """,
+                [(pred, succ, now) for pred, succ in candidate_edges],
+            )
+
+            # 採番されたIDを取得 (predecessor_id, successor_id はUNIQUE)
+            accepted_set = set(candidate_edges)
+            predecessor_ids = sorted({pred for pred, _ in candidate_edges})
+            dep_ids: dict[tuple[int, int], int] = {}
+            for start in range(0, len(predecessor_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = predecessor_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT id, predecessor_id, successor_id FROM {table_name}
+                    WHERE predecessor_id IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    key = (row["predecessor_id"], row["successor_id"])
+                    if key in accepted_set:
+                        dep_ids[key] = row["id"]
+
+            self.db.commit(conn)
+
+        except sqlite3.IntegrityError as e:
+            self.db.rollback(conn)
+            raise ConstraintViolationError(f"{label}依存関係の一括作成に失敗しました: {e}")
+        except Exception:
+            self.db.rollback(conn)
+            raise
+
+        # キャッシュ済みグラフにエッジを反映
+        cache.apply_committed(conn, before_token, added=candidate_edges)
+
+        result.added = [
+            Dependency(
+                id=dep_ids[(pred, succ)],
+                predecessor_id=pred,
+                successor_id=succ,
+                created_at=now,
+            )
+            for pred, succ in candidate_edges
+        ]
+        return result
+
     def remove_task_dependency(
         self, predecessor_id: int, successor_id: int
     ) -> None:
@@ -248,6 +518,8 @@ class DependencyManager:
                 )
 
             # DELETE
+            cache = get_graph_cache(self.db, "task")
+            before_token = cache.token(conn)
             cursor.execute(
                 """
                 DELETE FROM task_dependencies
@@ -255,13 +527,18 @@ class DependencyManager:
                 """,
                 (predecessor_id, successor_id),
             )
-            conn.commit()
+            self.db.commit(conn)
+
+            # キャッシュ済みグラフからエッジを除去
+            cache.apply_committed(
+                conn, before_token, removed=[(predecessor_id, successor_id)]
+            )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Task依存関係の削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def remove_subtask_dependency(
@@ -295,6 +572,8 @@ class DependencyManager:
                 )
 
             # DELETE
+            cache = get_graph_cache(self.db, "subtask")
+            before_token = cache.token(conn)
             cursor.execute(
                 """
                 DELETE FROM subtask_dependencies
@@ -302,13 +581,18 @@ class DependencyManager:
                 """,
                 (predecessor_id, successor_id),
             )
-            conn.commit()
+            self.db.commit(conn)
+
+            # キャッシュ済みグラフからエッジを除去
+            cache.apply_committed(
+                conn, before_token, removed=[(predecessor_id, successor_id)]
+            )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTask依存関係の削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def get_task_dependencies(self, task_id: int) -> dict[str, list[int]]:
@@ -406,96 +690,73 @@ class DependencyManager:
         Raises:
             CyclicDependencyError: 循環依存が発生する場合
         """
-        # グラフを構築 (同一connを渡す)
-        graph = self._build_dependency_graph(dep_type, conn=conn)
+        graph = self._get_graph(dep_type, conn=conn)
 
         # 新しいエッジ (predecessor → successor) を追加した場合に
         # successor → predecessor へのパスが存在するかチェック
         # もし存在すれば、新しいエッジで循環が形成される
-        if self._has_path(graph, successor_id, predecessor_id):
+        # (維持しているトポロジカル順序に沿うエッジは探索せずに受理される)
+        if graph.would_create_cycle(predecessor_id, successor_id):
             raise CyclicDependencyError(
                 f"依存関係 {predecessor_id} → {successor_id} を追加すると循環依存が発生します"
             )
 
-    def _build_dependency_graph(
-        self,
-        dep_type: str,
-        conn: Optional[sqlite3.Connection] = None,
-    ) -> dict[int, list[int]]:
+    def get_topological_order(self, dep_type: str) -> list[int]:
         """
-        依存関係グラフを構築
+        依存関係を持つノードをトポロジカル順序で取得
+
+        キャッシュされた依存グラフが維持している順序をそのまま返すため、
+        DBが変更されていなければ再計算は行いません。
 
         Args:
             dep_type: 依存関係タイプ ('task' または 'subtask')
-            conn: 既存のコネクション (Noneの場合は新規作成)
 
         Returns:
-            dict: 隣接リスト表現のグラフ {node_id: [successor_ids]}
-        """
-        if conn is None:
-            conn = self.db.connect()
+            list[int]: ノードIDのリスト（先行ノードが必ず後続ノードより前に来る）
 
-        cursor = conn.cursor()
-
-        if dep_type == "task":
-            cursor.execute(
-                "SELECT predecessor_id, successor_id FROM task_dependencies"
-            )
-        elif dep_type == "subtask":
-            cursor.execute(
-                "SELECT predecessor_id, successor_id FROM subtask_dependencies"
-            )
-        else:
-            raise ValueError(f"不正な dep_type: {dep_type}")
-
-        graph: dict[int, list[int]] = {}
-        for row in cursor.fetchall():
-            pred = row["predecessor_id"]
-            succ = row["successor_id"]
-
-            if pred not in graph:
-                graph[pred] = []
-            graph[pred].append(succ)
-
-            # 後続ノードがグラフに存在することを保証
-            if succ not in graph:
-                graph[succ] = []
-
-        return graph
-
-    def _has_path(self, graph: dict[int, list[int]], start: int, end: int) -> bool:
+        Raises:
+            ValueError: 不正な dep_type の場合
+            CyclicDependencyError: DB上の依存関係に循環が含まれる場合
         """
-        グラフ内にstartからendへのパスが存在するかBFSで判定
-
-        Args:
-            graph: 隣接リスト表現のグラフ
-            start: 開始ノード
-            end: 終了ノード
+        graph = self._get_graph(dep_type)
 
-        Returns:
-            bool: パスが存在する場合True
+        try:
+            order = graph.topological_order()
+        except ValueError as e:
+            raise CyclicDependencyError(str(e)) from e
+
+        # 依存関係が削除されて孤立したノードは除外
+        return [
+            node_id
+            for node_id in order
+            if graph.successors(node_id) or graph.predecessors(node_id)
+        ]
+
+    def _get_graph(
+        self,
+        dep_type: str,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> DependencyGraph:
         """
-        if start == end:
-            return True
+        依存関係グラフを取得
 
-        if start not in graph:
-            return False
+        Database ごとにキャッシュされたグラフを返します。
+        DBが変更されていない限り依存テーブルの再読み込みは行いません。
 
-        visited = set()
-        queue = deque([start])
-        visited.add(start)
+        Args:
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+            conn: 既存のコネクション (Noneの場合は新規作成)
 
-        while queue:
-            current = queue.popleft()
+        Returns:
+            DependencyGraph: 依存グラフ（読み取り専用として扱うこと）
 
-            for neighbor in graph.get(current, []):
-                if neighbor == end:
-                    return True
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
+        Raises:
+            ValueError: 不正な dep_type の場合
+        """
+        if conn is None:
+            conn = self.db.connect()
 
-        return False
+        return get_graph_cache(self.db, dep_type).get(conn)
 
     def bridge_dependencies(
         self,
@@ -507,7 +768,12 @@ class DependencyManager:
         ノード削除時に依存関係を橋渡しする
 
         指定されたノードのすべての先行ノードと後続ノードを直接接続します。
-        循環を作る組み合わせはスキップします。
+        グラフを1回だけ取得し、作成すべきエッジをメモリ上で求めてから
+        executemany で一括INSERTします。
+
+        DAGでは「先行 → ノード → 後続」が既に存在するため、後続から先行への
+        パスは存在せず、橋渡しエッジが循環を作ることはありません。
+        DB上に既に循環が含まれる場合のみ、循環を作る組み合わせを個別に判定してスキップします。
 
         Args:
             node_id: 削除対象ノードID
@@ -516,9 +782,7 @@ class DependencyManager:
 
         Returns:
             list[tuple[int, int]]: 作成された橋渡し依存関係のリスト [(pred_id, succ_id), ...]
-
-        Raises:
-            CyclicDependencyError: 橋渡しによって循環が発生する場合
+                                   (pred_id, succ_id の昇順)
         """
         # connが渡されていればそれを使用、なければ新規取得
         own_conn = False
@@ -527,69 +791,55 @@ class DependencyManager:
             own_conn = True
 
         cursor = conn.cursor()
-
-        table_name = (
-            "task_dependencies" if dep_type == "task" else "subtask_dependencies"
-        )
-
-        # 先行ノードを取得
-        cursor.execute(
-            f"SELECT predecessor_id FROM {table_name} WHERE successor_id = ?",
-            (node_id,),
-        )
-        predecessors = [row["predecessor_id"] for row in cursor.fetchall()]
-
-        # 後続ノードを取得
-        cursor.execute(
-            f"SELECT successor_id FROM {table_name} WHERE predecessor_id = ?",
-            (node_id,),
-        )
-        successors = [row["successor_id"] for row in cursor.fetchall()]
-
-        bridged = []
+        table_name = dependency_table(dep_type)
+
+        graph = self._get_graph(dep_type, conn=conn)
+        predecessors = sorted(graph.predecessors(node_id))
+        successors = sorted(graph.successors(node_id))
+
+        # 既に存在する依存関係を除いた組み合わせ
+        bridged = [
+            (pred, succ)
+            for pred in predecessors
+            for succ in successors
+            if not graph.has_edge(pred, succ)
+        ]
+
+        if bridged and not graph.is_acyclic:
+            # 削除対象ノードを除いたグラフ上で循環を作る組み合わせをスキップ
+            working = DependencyGraph(
+                (pred, succ)
+                for pred, succs in graph.forward.items()
+                for succ in succs
+                if node_id not in (pred, succ)
+            )
+            acyclic_bridged = []
+            for pred, succ in bridged:
+                if not working.would_create_cycle(pred, succ):
+                    working.add_edge(pred, succ)
+                    acyclic_bridged.append((pred, succ))
+            bridged = acyclic_bridged
 
         try:
-            # 各組み合わせで橋渡し
-            for pred in predecessors:
-                for succ in successors:
-                    # 既に存在する依存関係はスキップ
-                    cursor.execute(
-                        f"""
-                        SELECT id FROM {table_name}
-                        WHERE predecessor_id = ? AND successor_id = ?
-                        """,
-                        (pred, succ),
-                    )
-                    if cursor.fetchone():
-                        continue
-
-                    # 循環検出 (橋渡し後のグラフで循環が発生しないかチェック)
-                    try:
-                        self.validate_no_cycle(pred, succ, dep_type, conn=conn)
-                    except CyclicDependencyError:
-                        # この組み合わせは循環を作るのでスキップ
-                        continue
-
-                    # 橋渡し依存関係を作成
-                    now = _now()
-                    cursor.execute(
-                        f"""
-                        INSERT INTO {table_name} (predecessor_id, successor_id, created_at)
-                        VALUES (?, ?, ?)
-                        """,
-                        (pred, succ, now),
-                    )
-                    bridged.append((pred, succ))
+            if bridged:
+                now = _now()
+                cursor.executemany(
+                    f"""
+                    INSERT INTO {table_name} (predecessor_id, successor_id, created_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(pred, succ, now) for pred, succ in bridged],
+                )
 
             # 自分でコネクションを作成した場合のみcommit
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return bridged
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def find_path_between_tasks(
@@ -606,37 +856,7 @@ class DependencyManager:
             Optional[list[int]]: 経路が存在する場合、TaskIDのリスト [from, ..., to]
                                  経路が存在しない場合、None
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        # BFSで経路探索
-        queue = deque([(from_task_id, [from_task_id])])
-        visited = {from_task_id}
-
-        while queue:
-            current_id, path = queue.popleft()
-
-            # 目的地に到達した
-            if current_id == to_task_id:
-                return path
-
-            # 後続ノードを探索
-            cursor.execute(
-                """
-                SELECT successor_id FROM task_dependencies
-                WHERE predecessor_id = ?
-                """,
-                (current_id,),
-            )
-            successors = [row["successor_id"] for row in cursor.fetchall()]
-
-            for succ_id in successors:
-                if succ_id not in visited:
-                    visited.add(succ_id)
-                    queue.append((succ_id, path + [succ_id]))
-
-        # 経路が見つからなかった
-        return None
+        return self._find_path(from_task_id, to_task_id, "task")
 
     def find_path_between_subtasks(
         self, from_subtask_id: int, to_subtask_id: int
@@ -652,110 +872,305 @@ class DependencyManager:
             Optional[list[int]]: 経路が存在する場合、SubTaskIDのリスト [from, ..., to]
                                  経路が存在しない場合、None
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
+        return self._find_path(from_subtask_id, to_subtask_id, "subtask")
 
-        # BFSで経路探索
-        queue = deque([(from_subtask_id, [from_subtask_id])])
-        visited = {from_subtask_id}
+    def get_all_task_successors_recursive(self, task_id: int) -> list[int]:
+        """
+        指定されたTaskの全後続ノード（間接的な後続も含む）を取得
 
-        while queue:
-            current_id, path = queue.popleft()
+        Args:
+            task_id: TaskID
 
-            # 目的地に到達した
-            if current_id == to_subtask_id:
-                return path
+        Returns:
+            list[int]: 後続TaskIDのリスト（重複なし、順不同）
+        """
+        return self._get_closure(task_id, "task")
 
-            # 後続ノードを探索
-            cursor.execute(
-                """
-                SELECT successor_id FROM subtask_dependencies
-                WHERE predecessor_id = ?
-                """,
-                (current_id,),
-            )
-            successors = [row["successor_id"] for row in cursor.fetchall()]
+    def get_all_subtask_successors_recursive(self, subtask_id: int) -> list[int]:
+        """
+        指定されたSubTaskの全後続ノード（間接的な後続も含む）を取得
 
-            for succ_id in successors:
-                if succ_id not in visited:
-                    visited.add(succ_id)
-                    queue.append((succ_id, path + [succ_id]))
+        Args:
+            subtask_id: SubTaskID
 
-        # 経路が見つからなかった
-        return None
+        Returns:
+            list[int]: 後続SubTaskIDのリスト（重複なし、順不同）
+        """
+        return self._get_closure(subtask_id, "subtask")
 
-    def get_all_task_successors_recursive(self, task_id: int) -> list[int]:
+    def get_all_task_predecessors_recursive(self, task_id: int) -> list[int]:
         """
-        指定されたTaskの全後続ノード（間接的な後続も含む）を取得
+        指定されたTaskの全先行ノード（間接的な先行も含む）を取得
 
         Args:
             task_id: TaskID
 
         Returns:
-            list[int]: 後続TaskIDのリスト（重複なし、順不同）
+            list[int]: 先行TaskIDのリスト（重複なし、順不同）
+        """
+        return self._get_closure(task_id, "task", reverse=True)
+
+    def get_all_subtask_predecessors_recursive(self, subtask_id: int) -> list[int]:
+        """
+        指定されたSubTaskの全先行ノード（間接的な先行も含む）を取得
+
+        Args:
+            subtask_id: SubTaskID
+
+        Returns:
+            list[int]: 先行SubTaskIDのリスト（重複なし、順不同）
         """
+        return self._get_closure(subtask_id, "subtask", reverse=True)
+
+    def get_neighborhood(
+        self,
+        node_id: int,
+        dep_type: str,
+        max_depth: Optional[int] = 1,
+        direction: str = "successors",
+    ) -> dict[int, int]:
+        """
+        深さ制限付きで近傍ノードを取得
+
+        Args:
+            node_id: 起点ノードID
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+            max_depth: 探索する最大距離 (Noneの場合は無制限)
+            direction: 'successors'（後続方向）または 'predecessors'（先行方向）
+
+        Returns:
+            dict[int, int]: {node_id: 起点からの最短距離}（起点自身は含まない）
+
+        Raises:
+            ValueError: 不正な direction の場合
+        """
+        if direction not in ("successors", "predecessors"):
+            raise ValueError(f"不正な direction: {direction}")
+        reverse = direction == "predecessors"
+
         conn = self.db.connect()
-        cursor = conn.cursor()
+        if self._traversal_backend(conn, dep_type) == "sql":
+            return traversal.neighborhood(conn, dep_type, node_id, max_depth, reverse)
+
+        return self._get_graph(dep_type, conn=conn).distances(
+            node_id, reverse=reverse, max_depth=max_depth
+        )
 
-        all_successors = set()
-        queue = deque([task_id])
-        visited = {task_id}
+    def is_reachable(self, from_id: int, to_id: int, dep_type: str) -> bool:
+        """
+        from_id から to_id へ依存関係を辿って到達できるか判定
 
-        while queue:
-            current_id = queue.popleft()
+        到達可能性インデックスがある場合は主キー参照1回で判定します。
 
-            # 直接の後続ノードを取得
-            cursor.execute(
-                """
-                SELECT successor_id FROM task_dependencies
-                WHERE predecessor_id = ?
-                """,
-                (current_id,),
-            )
-            successors = [row["successor_id"] for row in cursor.fetchall()]
+        Args:
+            from_id: 開始ノードID
+            to_id: 終了ノードID
+            dep_type: 依存関係タイプ ('task' または 'subtask')
 
-            for succ_id in successors:
-                all_successors.add(succ_id)
-                if succ_id not in visited:
-                    visited.add(succ_id)
-                    queue.append(succ_id)
+        Returns:
+            bool: 到達可能な場合True (from_id == to_id の場合もTrue)
+        """
+        if from_id == to_id:
+            return True
 
-        return list(all_successors)
+        conn = self.db.connect()
+        backend = self._traversal_backend(conn, dep_type)
+        if backend == "memory":
+            return self._get_graph(dep_type, conn=conn).has_path(from_id, to_id)
+        if backend == "sql":
+            return traversal.is_reachable(conn, dep_type, from_id, to_id)
+
+        row = conn.execute(
+            f"""
+            SELECT 1 FROM {reachability_table(dep_type)}
+            WHERE ancestor_id = ? AND descendant_id = ?
+            """,
+            (from_id, to_id),
+        ).fetchone()
+        return row is not None
 
-    def get_all_subtask_successors_recursive(self, subtask_id: int) -> list[int]:
+    def has_reachability_index(self, dep_type: str) -> bool:
         """
-        指定されたSubTaskの全後続ノード（間接的な後続も含む）を取得
+        到達可能性インデックスが作成済みか判定
 
         Args:
-            subtask_id: SubTaskID
+            dep_type: 依存関係タイプ ('task' または 'subtask')
 
         Returns:
-            list[int]: 後続SubTaskIDのリスト（重複なし、順不同）
+            bool: 作成済みの場合True
+        """
+        return has_reachability_index(self.db.connect(), dep_type)
+
+    def rebuild_reachability_index(
+        self, dep_type: Optional[str] = None
+    ) -> dict[str, int]:
         """
+        到達可能性インデックスを作成・全件再構築
+
+        作成後は依存関係の追加・削除に合わせてトリガーで差分更新されます。
+
+        Args:
+            dep_type: 依存関係タイプ ('task' / 'subtask')。Noneの場合は両方
+
+        Returns:
+            dict[str, int]: {dep_type: 到達可能なノード組の件数}
+        """
+        dep_types = [dep_type] if dep_type is not None else list(REACHABILITY_TABLES)
+
         conn = self.db.connect()
-        cursor = conn.cursor()
+        try:
+            counts = {
+                target: rebuild_reachability_index(conn, target)
+                for target in dep_types
+            }
+            self.db.commit(conn)
+            return counts
+        except Exception:
+            self.db.rollback(conn)
+            raise
+
+    def _traversal_backend(self, conn: sqlite3.Connection, dep_type: str) -> str:
+        """
+        実際に使用する探索方式を決定
 
-        all_successors = set()
-        queue = deque([subtask_id])
-        visited = {subtask_id}
+        Returns:
+            str: 'index' / 'memory' / 'sql'
+        """
+        if self.traversal != "auto":
+            return self.traversal
+        if has_reachability_index(conn, dep_type):
+            return "index"
+        return "memory"
+
+    def _find_path(
+        self, from_id: int, to_id: int, dep_type: str
+    ) -> Optional[list[int]]:
+        """
+        2ノード間の最短依存経路を探索
 
-        while queue:
-            current_id = queue.popleft()
+        "index" / "sql" では「from の子孫かつ to の祖先」に挟まれたエッジのみを
+        1クエリで読み込み、"memory" ではキャッシュ済みグラフ上でBFSします。
 
-            # 直接の後続ノードを取得
-            cursor.execute(
-                """
-                SELECT successor_id FROM subtask_dependencies
-                WHERE predecessor_id = ?
+        Args:
+            from_id: 開始ノードID
+            to_id: 終了ノードID
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+
+        Returns:
+            Optional[list[int]]: 経路 [from, ..., to]、存在しない場合None
+        """
+        conn = self.db.connect()
+        backend = self._traversal_backend(conn, dep_type)
+
+        if from_id == to_id or backend == "memory":
+            graph = self._get_graph(dep_type, conn=conn)
+            return _bfs_path(from_id, to_id, graph.successors)
+
+        if backend == "sql":
+            edges = traversal.edges_between(conn, dep_type, from_id, to_id)
+        else:
+            if not self.is_reachable(from_id, to_id, dep_type):
+                return None
+
+            reach = reachability_table(dep_type)
+            cursor = conn.execute(
+                f"""
+                SELECT predecessor_id, successor_id FROM {dependency_table(dep_type)}
+                WHERE predecessor_id IN (
+                    SELECT ? UNION SELECT descendant_id FROM {reach} WHERE ancestor_id = ?
+                )
+                AND successor_id IN (
+                    SELECT ? UNION SELECT ancestor_id FROM {reach} WHERE descendant_id = ?
+                )
                 """,
-                (current_id,),
+                (from_id, from_id, to_id, to_id),
             )
-            successors = [row["successor_id"] for row in cursor.fetchall()]
+            edges = [(row[0], row[1]) for row in cursor.fetchall()]
 
-            for succ_id in successors:
-                all_successors.add(succ_id)
-                if succ_id not in visited:
-                    visited.add(succ_id)
-                    queue.append(succ_id)
+        between: dict[int, list[int]] = {}
+        for pred, succ in edges:
+            between.setdefault(pred, []).append(succ)
 
-        return list(all_successors)
+        return _bfs_path(from_id, to_id, lambda node_id: between.get(node_id, []))
+
+    def _get_closure(
+        self, node_id: int, dep_type: str, reverse: bool = False
+    ) -> list[int]:
+        """
+        全後続ノード（または全先行ノード）を取得
+
+        "index" ではインデックス読み取り1回、"sql" では再帰CTE 1回、
+        "memory" ではキャッシュ済みグラフ上のBFSで求めます。
+
+        Args:
+            node_id: ノードID
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+            reverse: Trueの場合は先行方向
+
+        Returns:
+            list[int]: ノードIDのリスト（重複なし、ID昇順）
+        """
+        conn = self.db.connect()
+        backend = self._traversal_backend(conn, dep_type)
+
+        if backend == "memory":
+            graph = self._get_graph(dep_type, conn=conn)
+            return sorted(graph.distances(node_id, reverse=reverse))
+        if backend == "sql":
+            return traversal.closure(conn, dep_type, node_id, reverse=reverse)
+
+        source, target = (
+            ("descendant_id", "ancestor_id") if reverse else ("ancestor_id", "descendant_id")
+        )
+        cursor = conn.execute(
+            f"""
+            SELECT {target} FROM {reachability_table(dep_type)}
+            WHERE {source} = ?
+            ORDER BY {target}
+            """,
+            (node_id,),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _bfs_path(
+    start: int, end: int, successors_of: Callable[[int], Iterable[int]]
+) -> Optional[list[int]]:
+    """
+    BFSで start から end への最短経路を求める
+
+    各ノードには親ポインタのみを記録し、経路は到達時に1回だけ復元します
+    (ステップごとに経路リストを複製しないため、経路長に対して線形)。
+    同じ深さの候補はID昇順に辿るため、結果は決定的です。
+
+    Args:
+        start: 開始ノード
+        end: 終了ノード
+        successors_of: ノードIDから直接の後続ノードIDを返す関数
+
+    Returns:
+        Optional[list[int]]: 経路 [start, ..., end]、存在しない場合None
+    """
+    parents: dict[int, Optional[int]] = {start: None}
+    queue = deque([start])
+
+    while queue:
+        current_id = queue.popleft()
+
+        # 目的地に到達した
+        if current_id == end:
+            path = []
+            node: Optional[int] = current_id
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
+            return path
+
+        for succ_id in sorted(successors_of(current_id)):
+            if succ_id not in parents:
+                parents[succ_id] = current_id
+                queue.append(succ_id)
+
+    # 経路が見つからなかった
+    return None
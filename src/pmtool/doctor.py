@@ -4,12 +4,23 @@ doctor/check モジュール
 データベースの整合性をチェックし、異常を検出・報告する機能を提供します。
 """
 
-from dataclasses import dataclass
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Callable, Dict, List, Optional, Set
 
 from .database import Database
 from .dependencies import DependencyManager
+from .exceptions import ValidationError
+from .graph import (
+    dependency_table,
+    representative_cycle,
+    strongly_connected_components,
+)
 from .repository import (
     ProjectRepository,
     SubProjectRepository,
@@ -17,6 +28,19 @@ from .repository import (
     TaskRepository,
 )
 
+WATERMARK_KEY = "doctor.watermark"
+"""差分チェックのウォーターマークを保存する metadata のキー"""
+
+
+def _now() -> str:
+    """
+    現在のUTCタイムスタンプをISO 8601形式で返す
+
+    Returns:
+        str: ISO 8601形式のUTCタイムスタンプ
+    """
+    return datetime.utcnow().isoformat()
+
 
 class IssueLevel(Enum):
     """問題のレベル"""
@@ -45,6 +69,94 @@ class Issue:
     """詳細情報"""
 
 
+@dataclass
+class DoctorScope:
+    """差分チェックの対象範囲"""
+
+    since: str
+    """ウォーターマーク（この時刻以降の変更が対象）"""
+
+    project_ids: Set[int] = field(default_factory=set)
+    """対象 Project ID"""
+
+    subproject_ids: Set[int] = field(default_factory=set)
+    """対象 SubProject ID"""
+
+    task_ids: Set[int] = field(default_factory=set)
+    """対象 Task ID"""
+
+    subtask_ids: Set[int] = field(default_factory=set)
+    """対象 SubTask ID"""
+
+    def ids(self, kind: str) -> Set[int]:
+        """
+        エンティティ種別に対応するID集合を返す
+
+        Args:
+            kind: 'project' / 'subproject' / 'task' / 'subtask'
+
+        Returns:
+            Set[int]: ID集合（変更可能な参照）
+        """
+        return getattr(self, f"{kind}_ids")
+
+    @property
+    def total(self) -> int:
+        """対象エンティティの総数"""
+        return (
+            len(self.project_ids)
+            + len(self.subproject_ids)
+            + len(self.task_ids)
+            + len(self.subtask_ids)
+        )
+
+
+def _scope_filter(
+    scope: Optional[DoctorScope], kind: str, *columns: str
+) -> tuple[str, list]:
+    """
+    対象範囲で絞り込む WHERE 条件とパラメータを生成
+
+    ID集合はJSON配列として1つのパラメータで渡すため、件数によらず
+    変数上限に抵触せず、読み取り専用コネクションでも使用できます。
+
+    Args:
+        scope: 対象範囲 (Noneの場合は絞り込まない)
+        kind: エンティティ種別
+        *columns: ID集合と照合するカラム（いずれかが一致すれば対象）
+
+    Returns:
+        tuple[str, list]: (条件式, パラメータ)
+    """
+    if scope is None:
+        return "1", []
+    ids = json.dumps(sorted(scope.ids(kind)))
+    cond = " OR ".join(
+        f"{column} IN (SELECT value FROM json_each(?))" for column in columns
+    )
+    return f"({cond})", [ids] * len(columns)
+
+
+def _task_group_filter(scope: Optional[DoctorScope]) -> tuple[str, list]:
+    """
+    Task の兄弟グループ（SubProject 内または Project 直下）を対象範囲で絞り込む条件を生成
+
+    Args:
+        scope: 対象範囲 (Noneの場合は絞り込まない)
+
+    Returns:
+        tuple[str, list]: (条件式, パラメータ)
+    """
+    if scope is None:
+        return "1", []
+    sp_cond, sp_params = _scope_filter(scope, "subproject", "subproject_id")
+    project_cond, project_params = _scope_filter(scope, "project", "project_id")
+    return (
+        f"({sp_cond} OR (subproject_id IS NULL AND {project_cond}))",
+        sp_params + project_params,
+    )
+
+
 @dataclass
 class DoctorReport:
     """doctor/check の実行結果レポート"""
@@ -55,6 +167,12 @@ class DoctorReport:
     warnings: List[Issue]
     """警告のリスト"""
 
+    timings: Dict[str, float] = field(default_factory=dict)
+    """チェックごとの所要時間（秒）"""
+
+    scope: Optional[DoctorScope] = None
+    """差分チェックの対象範囲（全件チェックの場合None）"""
+
     @property
     def error_count(self) -> int:
         """エラー件数"""
@@ -90,46 +208,292 @@ class Doctor:
         self.subtask_repo = SubTaskRepository(db)
         self.dep_manager = DependencyManager(db)
 
-    def check_all(self) -> DoctorReport:
+    def check_all(self, jobs: int = 1) -> DoctorReport:
         """
         すべてのチェックを実行
 
+        jobs が2以上の場合、各チェックをスレッドプールで並列に実行します。
+        並列実行時は各チェックがそれぞれ読み取り専用コネクションを使用するため、
+        共有コネクションの未コミットの変更は参照されません
+        (WALモードのDBであれば書き込み中でもブロックされずに読み取れます)。
+
+        Args:
+            jobs: 並列実行数 (1の場合は共有コネクションで順に実行)
+
+        Returns:
+            DoctorReport: チェック結果レポート（チェックごとの所要時間を含む）
+
+        Raises:
+            ValidationError: jobs が1未満の場合
+        """
+        return self._run_checks(jobs)
+
+    def check_full(self, jobs: int = 1) -> DoctorReport:
+        """
+        すべてのチェックを実行し、差分チェックのウォーターマークをリセット
+
+        エラーが0件の場合はチェック開始時刻をウォーターマークとして保存し、
+        エラーがある場合はウォーターマークを削除します
+        (次回の差分チェックは全件チェックになります)。
+
+        Args:
+            jobs: 並列実行数
+
         Returns:
             DoctorReport: チェック結果レポート
+
+        Raises:
+            ValidationError: jobs が1未満の場合
         """
-        issues: List[Issue] = []
+        started_at = _now()
+        report = self._run_checks(jobs)
+        self._save_watermark(report, started_at)
+        return report
+
+    def check_incremental(self, jobs: int = 1) -> DoctorReport:
+        """
+        前回のチェック以降に変更されたエンティティとその隣接要素のみをチェック
+
+        ウォーターマーク（前回チェック開始時刻）以降に updated_at / created_at が
+        更新された行を起点に DoctorScope を求め、各チェックをその範囲に限定して実行します。
+        ウォーターマークが未保存の場合は check_full() と同じ全件チェックを行います。
+
+        エラーが0件の場合のみウォーターマークを進めるため、検出されたエラーは
+        解消されるまで以降の差分チェックでも報告されます。
+
+        注意: updated_at / created_at を更新しない直接のSQL操作による変更は検出できません。
+        その場合は check_full() を実行してください。
+
+        Args:
+            jobs: 並列実行数
+
+        Returns:
+            DoctorReport: チェック結果レポート（scope に対象範囲を含む）
+
+        Raises:
+            ValidationError: jobs が1未満の場合
+        """
+        since = self.db.get_metadata(WATERMARK_KEY)
+        if since is None:
+            return self.check_full(jobs)
+
+        started_at = _now()
+        scope = self.compute_scope(since)
+        report = self._run_checks(jobs, scope)
+        report.scope = scope
+        if report.is_healthy:
+            self.db.set_metadata(WATERMARK_KEY, started_at)
+        return report
+
+    def compute_scope(self, since: str) -> "DoctorScope":
+        """
+        指定時刻以降に変更されたエンティティから差分チェックの対象範囲を求める
+
+        起点:
+            - updated_at >= since の Project / SubProject / Task / SubTask
+            - created_at >= since の依存関係の両端ノード
+        拡張:
+            - Task / SubTask の直接の先行・後続ノード
+            - 対象 SubTask の親 Task、対象 Task の親 SubProject / Project、
+              対象 SubProject の親 Project / 親 SubProject
+
+        Args:
+            since: ウォーターマーク（ISO 8601形式のUTCタイムスタンプ）
+
+        Returns:
+            DoctorScope: 対象範囲
+        """
+        conn = self.db.connect()
+        scope = DoctorScope(since=since)
+
+        for table_name, ids in (
+            ("projects", scope.project_ids),
+            ("subprojects", scope.subproject_ids),
+            ("tasks", scope.task_ids),
+            ("subtasks", scope.subtask_ids),
+        ):
+            rows = conn.execute(
+                f"SELECT id FROM {table_name} WHERE updated_at >= ?", (since,)
+            ).fetchall()
+            ids.update(row[0] for row in rows)
+
+        for dep_type in ("task", "subtask"):
+            rows = conn.execute(
+                f"""
+                SELECT predecessor_id, successor_id FROM {dependency_table(dep_type)}
+                WHERE created_at >= ?
+                """,
+                (since,),
+            ).fetchall()
+            scope.ids(dep_type).update(node for row in rows for node in row)
+
+        # 直接の先行・後続ノード（SubTask を先に広げ、その親 Task を含めてから Task を広げる）
+        for dep_type in ("subtask", "task"):
+            if dep_type == "task":
+                cond, params = _scope_filter(scope, "subtask", "id")
+                rows = conn.execute(
+                    f"SELECT DISTINCT task_id FROM subtasks WHERE {cond}", params
+                ).fetchall()
+                scope.task_ids.update(row[0] for row in rows)
+
+            cond, params = _scope_filter(
+                scope, dep_type, "predecessor_id", "successor_id"
+            )
+            rows = conn.execute(
+                f"""
+                SELECT predecessor_id, successor_id FROM {dependency_table(dep_type)}
+                WHERE {cond}
+                """,
+                params,
+            ).fetchall()
+            scope.ids(dep_type).update(node for row in rows for node in row)
+
+        # 親 SubProject / Project
+        cond, params = _scope_filter(scope, "task", "id")
+        for project_id, subproject_id in conn.execute(
+            f"SELECT project_id, subproject_id FROM tasks WHERE {cond}", params
+        ).fetchall():
+            scope.project_ids.add(project_id)
+            if subproject_id is not None:
+                scope.subproject_ids.add(subproject_id)
+
+        cond, params = _scope_filter(scope, "subproject", "id")
+        for project_id, parent_id in conn.execute(
+            f"SELECT project_id, parent_subproject_id FROM subprojects WHERE {cond}",
+            params,
+        ).fetchall():
+            scope.project_ids.add(project_id)
+            if parent_id is not None:
+                scope.subproject_ids.add(parent_id)
+
+        return scope
+
+    def _save_watermark(self, report: DoctorReport, started_at: str) -> None:
+        """
+        全件チェックの結果に応じてウォーターマークを保存または削除
+
+        Args:
+            report: 全件チェックの結果レポート
+            started_at: チェック開始時刻
+        """
+        if report.is_healthy:
+            self.db.set_metadata(WATERMARK_KEY, started_at)
+        else:
+            self.db.delete_metadata(WATERMARK_KEY)
+
+    def _run_checks(
+        self, jobs: int, scope: Optional["DoctorScope"] = None
+    ) -> DoctorReport:
+        """
+        チェックを実行してレポートを生成
+
+        Args:
+            jobs: 並列実行数
+            scope: チェック対象範囲 (Noneの場合は全件)
+
+        Returns:
+            DoctorReport: チェック結果レポート
 
-        # 各チェックを実行
-        issues.extend(self._check_fk_integrity())
-        issues.extend(self._check_dag_integrity())
-        issues.extend(self._check_status_consistency())
-        issues.extend(self._check_order_index())
-        issues.extend(self._check_subproject_nesting())
+        Raises:
+            ValidationError: jobs が1未満の場合
+        """
+        if jobs < 1:
+            raise ValidationError(f"jobs は1以上を指定してください: {jobs}")
+
+        checks = self._checks()
+        if jobs == 1:
+            results = [self._run_check(check, scope=scope) for _, check in checks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(checks))) as executor:
+                futures = [
+                    executor.submit(self._run_check, check, True, scope)
+                    for _, check in checks
+                ]
+                results = [future.result() for future in futures]
+
+        issues: List[Issue] = []
+        timings: Dict[str, float] = {}
+        for (name, _), (check_issues, elapsed) in zip(checks, results):
+            issues.extend(check_issues)
+            timings[name] = elapsed
 
         # Error/Warning に分類
         errors = [issue for issue in issues if issue.level == IssueLevel.ERROR]
         warnings = [issue for issue in issues if issue.level == IssueLevel.WARNING]
 
-        return DoctorReport(errors=errors, warnings=warnings)
+        return DoctorReport(errors=errors, warnings=warnings, timings=timings)
 
-    def _check_fk_integrity(self) -> List[Issue]:
+    def _checks(
+        self,
+    ) -> List[tuple[str, Callable[..., List[Issue]]]]:
+        """
+        実行するチェックの一覧
+
+        Returns:
+            List[tuple[str, Callable]]: (チェック名, チェックメソッド) のリスト（レポート順）
+        """
+        return [
+            ("fk_integrity", self._check_fk_integrity),
+            ("dag_integrity", self._check_dag_integrity),
+            ("status_consistency", self._check_status_consistency),
+            ("order_index", self._check_order_index),
+            ("subproject_nesting", self._check_subproject_nesting),
+            ("progress_rollups", self._check_progress_rollups),
+        ]
+
+    def _run_check(
+        self,
+        check: Callable[..., List[Issue]],
+        readonly: bool = False,
+        scope: Optional["DoctorScope"] = None,
+    ) -> tuple[List[Issue], float]:
+        """
+        1つのチェックを実行して所要時間を計測
+
+        Args:
+            check: チェックメソッド
+            readonly: Trueの場合はプールの読み取り専用コネクション (db.read()) で実行
+            scope: チェック対象範囲 (Noneの場合は全件)
+
+        Returns:
+            tuple[List[Issue], float]: (検出された問題, 所要時間（秒）)
+        """
+        started = time.perf_counter()
+        if not readonly:
+            issues = check(None, scope)
+        else:
+            with self.db.read() as conn:
+                issues = check(conn, scope)
+        return issues, time.perf_counter() - started
+
+    def _check_fk_integrity(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
         """
         外部キー整合性チェック
 
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
         Returns:
             List[Issue]: 検出された問題のリスト
         """
         issues = []
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         cursor = conn.cursor()
 
         # SubProject の project_id チェック
+        cond, params = _scope_filter(scope, "subproject", "sp.id")
         cursor.execute("""
             SELECT sp.id, sp.name, sp.project_id
             FROM subprojects sp
             LEFT JOIN projects p ON sp.project_id = p.id
-            WHERE p.id IS NULL
-        """)
+            WHERE p.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -145,12 +509,13 @@ class Doctor:
             )
 
         # Task の project_id チェック
+        cond, params = _scope_filter(scope, "task", "t.id")
         cursor.execute("""
             SELECT t.id, t.name, t.project_id
             FROM tasks t
             LEFT JOIN projects p ON t.project_id = p.id
-            WHERE p.id IS NULL
-        """)
+            WHERE p.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -173,7 +538,8 @@ class Doctor:
             AND NOT EXISTS (
                 SELECT 1 FROM subprojects sp WHERE sp.id = t.subproject_id
             )
-        """)
+            AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -189,12 +555,13 @@ class Doctor:
             )
 
         # SubTask の task_id チェック
+        cond, params = _scope_filter(scope, "subtask", "st.id")
         cursor.execute("""
             SELECT st.id, st.name, st.task_id
             FROM subtasks st
             LEFT JOIN tasks t ON st.task_id = t.id
-            WHERE t.id IS NULL
-        """)
+            WHERE t.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -210,12 +577,15 @@ class Doctor:
             )
 
         # Task依存関係の参照整合性チェック
+        cond, params = _scope_filter(
+            scope, "task", "td.predecessor_id", "td.successor_id"
+        )
         cursor.execute("""
             SELECT td.predecessor_id, td.successor_id
             FROM task_dependencies td
             LEFT JOIN tasks t1 ON td.predecessor_id = t1.id
-            WHERE t1.id IS NULL
-        """)
+            WHERE t1.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -233,8 +603,8 @@ class Doctor:
             SELECT td.predecessor_id, td.successor_id
             FROM task_dependencies td
             LEFT JOIN tasks t2 ON td.successor_id = t2.id
-            WHERE t2.id IS NULL
-        """)
+            WHERE t2.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -249,12 +619,15 @@ class Doctor:
             )
 
         # SubTask依存関係の参照整合性チェック
+        cond, params = _scope_filter(
+            scope, "subtask", "std.predecessor_id", "std.successor_id"
+        )
         cursor.execute("""
             SELECT std.predecessor_id, std.successor_id
             FROM subtask_dependencies std
             LEFT JOIN subtasks st1 ON std.predecessor_id = st1.id
-            WHERE st1.id IS NULL
-        """)
+            WHERE st1.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -272,8 +645,8 @@ class Doctor:
             SELECT std.predecessor_id, std.successor_id
             FROM subtask_dependencies std
             LEFT JOIN subtasks st2 ON std.successor_id = st2.id
-            WHERE st2.id IS NULL
-        """)
+            WHERE st2.id IS NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -288,173 +661,147 @@ class Doctor:
             )
         return issues
 
-    def _check_dag_integrity(self) -> List[Issue]:
+    def _check_dag_integrity(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
         """
         DAG整合性チェック（サイクル検出、禁止依存）
 
+        強連結成分ごとに1件の問題として報告し、代表サイクルを添えます。
+
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
         Returns:
             List[Issue]: 検出された問題のリスト
         """
         issues = []
 
-        # Task依存のサイクル検出
-        try:
-            cycles = self._detect_cycles_task()
-            for cycle in cycles:
+        for dep_type, code, label in (
+            ("task", "DAG001", "Task"),
+            ("subtask", "DAG002", "SubTask"),
+        ):
+            try:
+                cycles = self._detect_cycles(dep_type, conn, scope)
+            except Exception:
+                # サイクル検出で例外が発生した場合はスキップ
+                continue
+
+            for component, cycle in cycles:
                 issues.append(
                     Issue(
                         level=IssueLevel.ERROR,
-                        code="DAG001",
-                        message=f"Task依存関係にサイクルが存在します: {' → '.join(map(str, cycle))}",
-                        details={"cycle": cycle},
+                        code=code,
+                        message=f"{label}依存関係にサイクルが存在します: {' → '.join(map(str, cycle))}",
+                        details={"cycle": cycle, "component": component},
                     )
                 )
-        except Exception:
-            # サイクル検出で例外が発生した場合はスキップ
-            pass
-
-        # SubTask依存のサイクル検出
-        try:
-            cycles = self._detect_cycles_subtask()
-            for cycle in cycles:
-                issues.append(
-                    Issue(
-                        level=IssueLevel.ERROR,
-                        code="DAG002",
-                        message=f"SubTask依存関係にサイクルが存在します: {' → '.join(map(str, cycle))}",
-                        details={"cycle": cycle},
-                    )
-                )
-        except Exception:
-            # サイクル検出で例外が発生した場合はスキップ
-            pass
 
         return issues
 
-    def _detect_cycles_task(self) -> List[List[int]]:
+    def _detect_cycles(
+        self,
+        dep_type: str,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[tuple[List[int], List[int]]]:
         """
-        Task依存関係のサイクルを検出
-
-        Returns:
-            List[List[int]]: 検出されたサイクルのリスト
-        """
-        # DFSでサイクル検出（簡易実装）
-        conn = self.db.connect()
-        cursor = conn.cursor()
-        cycles = []
+        依存関係のサイクルを強連結成分として検出
 
-        # すべてのTaskを取得
-        cursor.execute("SELECT id FROM tasks")
-        task_ids = [row[0] for row in cursor.fetchall()]
+        依存テーブルを1回のクエリで隣接リストに読み込み、
+        反復版Tarjanアルゴリズムで強連結成分を求めます。
 
-        for task_id in task_ids:
-            visited = set()
-            rec_stack = set()
-            path = []
+        scope を指定した場合は、対象ノードから辿れ、かつ対象ノードへ戻れるノード間の
+        エッジだけを読み込みます。対象ノードを含むサイクルはすべてこの部分グラフに収まるため、
+        対象ノードを含む強連結成分は全件読み込み時と同じ結果になります。
 
-            if self._dfs_task(task_id, visited, rec_stack, path, cursor):
-                # サイクル検出（pathから抽出）
-                if path:
-                    cycles.append(path.copy())
-
-        return cycles
-
-    def _dfs_task(
-        self, node_id: int, visited: set, rec_stack: set, path: list, cursor
-    ) -> bool:
-        """Task依存のDFS（簡易版・サイクル検出用）"""
-        visited.add(node_id)
-        rec_stack.add(node_id)
-        path.append(node_id)
-
-        # 後続ノードを取得
-        cursor.execute(
-            "SELECT successor_id FROM task_dependencies WHERE predecessor_id = ?",
-            (node_id,),
-        )
-        successors = [row[0] for row in cursor.fetchall()]
-
-        for successor_id in successors:
-            if successor_id not in visited:
-                if self._dfs_task(successor_id, visited, rec_stack, path, cursor):
-                    return True
-            elif successor_id in rec_stack:
-                # サイクル検出
-                return True
-
-        rec_stack.remove(node_id)
-        path.pop()
-        return False
-
-    def _detect_cycles_subtask(self) -> List[List[int]]:
-        """
-        SubTask依存関係のサイクルを検出
+        Args:
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
 
         Returns:
-            List[List[int]]: 検出されたサイクルのリスト
+            List[tuple[List[int], List[int]]]: (成分のノードID, 代表サイクル) のリスト
         """
-        # Task版と同様の実装（SubTask用）
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
+        table_name = dependency_table(dep_type)
         cursor = conn.cursor()
-        cycles = []
-
-        cursor.execute("SELECT id FROM subtasks")
-        subtask_ids = [row[0] for row in cursor.fetchall()]
+        if scope is None:
+            cursor.execute(f"SELECT predecessor_id, successor_id FROM {table_name}")
+        else:
+            seeds = json.dumps(sorted(scope.ids(dep_type)))
+            cursor.execute(
+                f"""
+                WITH RECURSIVE
+                down(node_id) AS (
+                    SELECT value FROM json_each(?)
+                    UNION
+                    SELECT e.successor_id
+                    FROM {table_name} AS e
+                    JOIN down AS d ON e.predecessor_id = d.node_id
+                ),
+                up(node_id) AS (
+                    SELECT value FROM json_each(?)
+                    UNION
+                    SELECT e.predecessor_id
+                    FROM {table_name} AS e
+                    JOIN up AS u ON e.successor_id = u.node_id
+                )
+                SELECT predecessor_id, successor_id FROM {table_name}
+                WHERE predecessor_id IN (SELECT node_id FROM down)
+                  AND successor_id IN (SELECT node_id FROM up)
+                """,
+                (seeds, seeds),
+            )
 
-        for subtask_id in subtask_ids:
-            visited = set()
-            rec_stack = set()
-            path = []
+        adjacency: dict[int, list[int]] = {}
+        for pred, succ in cursor.fetchall():
+            adjacency.setdefault(pred, []).append(succ)
 
-            if self._dfs_subtask(subtask_id, visited, rec_stack, path, cursor):
-                if path:
-                    cycles.append(path.copy())
+        cycles = []
+        for component in strongly_connected_components(adjacency):
+            node = component[0]
+            if len(component) == 1 and node not in adjacency.get(node, ()):
+                continue
+            if scope is not None and scope.ids(dep_type).isdisjoint(component):
+                continue
+            cycles.append((component, representative_cycle(adjacency, component)))
 
         return cycles
 
-    def _dfs_subtask(
-        self, node_id: int, visited: set, rec_stack: set, path: list, cursor
-    ) -> bool:
-        """SubTask依存のDFS（簡易版・サイクル検出用）"""
-        visited.add(node_id)
-        rec_stack.add(node_id)
-        path.append(node_id)
-
-        cursor.execute(
-            "SELECT successor_id FROM subtask_dependencies WHERE predecessor_id = ?",
-            (node_id,),
-        )
-        successors = [row[0] for row in cursor.fetchall()]
-
-        for successor_id in successors:
-            if successor_id not in visited:
-                if self._dfs_subtask(successor_id, visited, rec_stack, path, cursor):
-                    return True
-            elif successor_id in rec_stack:
-                return True
-
-        rec_stack.remove(node_id)
-        path.pop()
-        return False
-
-    def _check_status_consistency(self) -> List[Issue]:
+    def _check_status_consistency(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
         """
         ステータス整合性チェック
 
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
         Returns:
             List[Issue]: 検出された問題のリスト
         """
         issues = []
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         cursor = conn.cursor()
 
         # ステータス値の不正チェック（Phase 4 で追加）
         # Task の不正なステータス値
+        cond, params = _scope_filter(scope, "task", "id")
         cursor.execute("""
             SELECT id, name, status
             FROM tasks
             WHERE status NOT IN ('UNSET', 'NOT_STARTED', 'IN_PROGRESS', 'DONE')
-        """)
+            AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -470,11 +817,13 @@ class Doctor:
             )
 
         # SubTask の不正なステータス値
+        cond, params = _scope_filter(scope, "subtask", "id")
         cursor.execute("""
             SELECT id, name, status
             FROM subtasks
             WHERE status NOT IN ('UNSET', 'NOT_STARTED', 'IN_PROGRESS', 'DONE')
-        """)
+            AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -490,14 +839,16 @@ class Doctor:
             )
 
         # 子SubTaskが未完了なのに親TaskがDONEの場合
+        cond, params = _scope_filter(scope, "task", "t.id")
         cursor.execute("""
             SELECT t.id, t.name, COUNT(st.id) as incomplete_count
             FROM tasks t
             INNER JOIN subtasks st ON st.task_id = t.id
             WHERE t.status = 'DONE'
             AND st.status != 'DONE'
+            AND {cond}
             GROUP BY t.id, t.name
-        """)
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -513,6 +864,7 @@ class Doctor:
             )
 
         # 先行Taskが未完了なのに後続TaskがDONEの場合
+        cond, params = _scope_filter(scope, "task", "t2.id", "t1.id")
         cursor.execute("""
             SELECT t2.id, t2.name, t1.id as pred_id, t1.name as pred_name
             FROM tasks t2
@@ -520,7 +872,8 @@ class Doctor:
             INNER JOIN tasks t1 ON td.predecessor_id = t1.id
             WHERE t2.status = 'DONE'
             AND t1.status != 'DONE'
-        """)
+            AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -537,6 +890,7 @@ class Doctor:
             )
 
         # 先行SubTaskが未完了なのに後続SubTaskがDONEの場合
+        cond, params = _scope_filter(scope, "subtask", "st2.id", "st1.id")
         cursor.execute("""
             SELECT st2.id, st2.name, st1.id as pred_id, st1.name as pred_name
             FROM subtasks st2
@@ -544,7 +898,8 @@ class Doctor:
             INNER JOIN subtasks st1 ON std.predecessor_id = st1.id
             WHERE st2.status = 'DONE'
             AND st1.status != 'DONE'
-        """)
+            AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -561,25 +916,35 @@ class Doctor:
             )
         return issues
 
-    def _check_order_index(self) -> List[Issue]:
+    def _check_order_index(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
         """
         order_index 異常チェック（重複・負値・欠番）
 
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
         Returns:
             List[Issue]: 検出された問題のリスト
         """
         issues = []
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         cursor = conn.cursor()
 
         # --- 負値チェック（Phase 4 で追加） ---
 
         # SubProject の order_index 負値チェック
+        cond, params = _scope_filter(scope, "subproject", "id")
         cursor.execute("""
             SELECT id, name, order_index
             FROM subprojects
-            WHERE order_index < 0
-        """)
+            WHERE order_index < 0 AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -595,11 +960,12 @@ class Doctor:
             )
 
         # Task の order_index 負値チェック
+        cond, params = _scope_filter(scope, "task", "id")
         cursor.execute("""
             SELECT id, name, order_index
             FROM tasks
-            WHERE order_index < 0
-        """)
+            WHERE order_index < 0 AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -615,11 +981,12 @@ class Doctor:
             )
 
         # SubTask の order_index 負値チェック
+        cond, params = _scope_filter(scope, "subtask", "id")
         cursor.execute("""
             SELECT id, name, order_index
             FROM subtasks
-            WHERE order_index < 0
-        """)
+            WHERE order_index < 0 AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -635,15 +1002,20 @@ class Doctor:
             )
 
         # --- 重複チェック ---
+        # 差分チェックでは、対象範囲の親を持つ兄弟グループのみを集計する
+        sp_cond, sp_params = _scope_filter(scope, "project", "project_id")
+        task_cond, task_params = _task_group_filter(scope)
+        st_cond, st_params = _scope_filter(scope, "task", "task_id")
 
         # SubProject の order_index 重複チェック
         # 注: parent_subproject_id も考慮する必要がある（親が異なれば別の文脈）
         cursor.execute("""
             SELECT project_id, COALESCE(parent_subproject_id, -1) as parent_id, order_index, COUNT(*) as dup_count
             FROM subprojects
+            WHERE {cond}
             GROUP BY project_id, parent_subproject_id, order_index
             HAVING dup_count > 1
-        """)
+        """.format(cond=sp_cond), sp_params)
         for row in cursor.fetchall():
             parent_info = f"parent_subproject_id={row[1]}" if row[1] != -1 else "parent_subproject_id=NULL"
             issues.append(
@@ -665,9 +1037,10 @@ class Doctor:
         cursor.execute("""
             SELECT project_id, COALESCE(subproject_id, -1) as sp_id, order_index, COUNT(*) as dup_count
             FROM tasks
+            WHERE {cond}
             GROUP BY project_id, subproject_id, order_index
             HAVING dup_count > 1
-        """)
+        """.format(cond=task_cond), task_params)
         for row in cursor.fetchall():
             context_info = f"SubProject {row[1]}" if row[1] != -1 else f"Project {row[0]} 直下"
             issues.append(
@@ -688,9 +1061,10 @@ class Doctor:
         cursor.execute("""
             SELECT task_id, order_index, COUNT(*) as dup_count
             FROM subtasks
+            WHERE {cond}
             GROUP BY task_id, order_index
             HAVING dup_count > 1
-        """)
+        """.format(cond=st_cond), st_params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -712,9 +1086,10 @@ class Doctor:
             SELECT project_id, COALESCE(parent_subproject_id, -1) as parent_id,
                    COUNT(*) as total_count, MAX(order_index) as max_index
             FROM subprojects
+            WHERE {cond}
             GROUP BY project_id, parent_subproject_id
             HAVING max_index > (total_count - 1)
-        """)
+        """.format(cond=sp_cond), sp_params)
         for row in cursor.fetchall():
             parent_info = f"parent_subproject_id={row[1]}" if row[1] != -1 else "parent_subproject_id=NULL"
             issues.append(
@@ -736,9 +1111,10 @@ class Doctor:
             SELECT project_id, COALESCE(subproject_id, -1) as sp_id,
                    COUNT(*) as total_count, MAX(order_index) as max_index
             FROM tasks
+            WHERE {cond}
             GROUP BY project_id, subproject_id
             HAVING max_index > (total_count - 1)
-        """)
+        """.format(cond=task_cond), task_params)
         for row in cursor.fetchall():
             context_info = f"SubProject {row[1]}" if row[1] != -1 else f"Project {row[0]} 直下"
             issues.append(
@@ -759,9 +1135,10 @@ class Doctor:
         cursor.execute("""
             SELECT task_id, COUNT(*) as total_count, MAX(order_index) as max_index
             FROM subtasks
+            WHERE {cond}
             GROUP BY task_id
             HAVING max_index > (total_count - 1)
-        """)
+        """.format(cond=st_cond), st_params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -778,25 +1155,35 @@ class Doctor:
 
         return issues
 
-    def _check_subproject_nesting(self) -> List[Issue]:
+    def _check_subproject_nesting(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
         """
         SubProject 入れ子存在チェック
 
         Phase 3 では SubProject 入れ子（parent_subproject_id != NULL）を
         機能対応しないため、存在する場合は WARNING を出す。
 
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
         Returns:
             List[Issue]: 検出された問題のリスト
         """
         issues = []
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         cursor = conn.cursor()
 
+        cond, params = _scope_filter(scope, "subproject", "id")
         cursor.execute("""
             SELECT id, name, parent_subproject_id
             FROM subprojects
-            WHERE parent_subproject_id IS NOT NULL
-        """)
+            WHERE parent_subproject_id IS NOT NULL AND {cond}
+        """.format(cond=cond), params)
         for row in cursor.fetchall():
             issues.append(
                 Issue(
@@ -812,3 +1199,82 @@ class Doctor:
             )
 
         return issues
+
+    def _check_progress_rollups(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        scope: Optional["DoctorScope"] = None,
+    ) -> List[Issue]:
+        """
+        進捗集計 (progress_rollups) チェック
+
+        Task / SubTask をステータス別に数え直し、トリガーで維持されている
+        Project / SubProject ごとの件数と一致するかを検証する。
+
+        Args:
+            conn: 使用するコネクション (Noneの場合は共有コネクション)
+            scope: チェック対象範囲 (Noneの場合は全件)
+
+        Returns:
+            List[Issue]: 検出された問題のリスト
+        """
+        issues = []
+        if conn is None:
+            conn = self.db.connect()
+        cursor = conn.cursor()
+
+        p_cond, p_params = _scope_filter(scope, "project", "scope_id")
+        sp_cond, sp_params = _scope_filter(scope, "subproject", "scope_id")
+        cursor.execute("""
+            WITH recount(scope, scope_id, node_type, status, count) AS (
+                SELECT 'project', project_id, 'task', status, COUNT(*)
+                FROM tasks GROUP BY project_id, status
+                UNION ALL
+                SELECT 'subproject', subproject_id, 'task', status, COUNT(*)
+                FROM tasks WHERE subproject_id IS NOT NULL
+                GROUP BY subproject_id, status
+                UNION ALL
+                SELECT 'project', t.project_id, 'subtask', st.status, COUNT(*)
+                FROM subtasks st JOIN tasks t ON t.id = st.task_id
+                GROUP BY t.project_id, st.status
+                UNION ALL
+                SELECT 'subproject', t.subproject_id, 'subtask', st.status, COUNT(*)
+                FROM subtasks st JOIN tasks t ON t.id = st.task_id
+                WHERE t.subproject_id IS NOT NULL
+                GROUP BY t.subproject_id, st.status
+            ),
+            merged(scope, scope_id, node_type, status, expected, actual) AS (
+                SELECT scope, scope_id, node_type, status, count, 0 FROM recount
+                UNION ALL
+                SELECT scope, scope_id, node_type, status, 0, count FROM progress_rollups
+            )
+            SELECT scope, scope_id, node_type, status, SUM(expected), SUM(actual)
+            FROM merged
+            WHERE (scope = 'project' AND {p_cond}) OR (scope = 'subproject' AND {sp_cond})
+            GROUP BY scope, scope_id, node_type, status
+            HAVING SUM(expected) != SUM(actual)
+            ORDER BY scope, scope_id, node_type, status
+        """.format(p_cond=p_cond, sp_cond=sp_cond), p_params + sp_params)
+        for row in cursor.fetchall():
+            label = "Project" if row[0] == "project" else "SubProject"
+            node_label = "Task" if row[2] == "task" else "SubTask"
+            issues.append(
+                Issue(
+                    level=IssueLevel.ERROR,
+                    code="ROLLUP001",
+                    message=(
+                        f"{label} {row[1]} の進捗集計が一致しません"
+                        f"（{node_label} {row[3]}: 集計 {row[5]} 件、実数 {row[4]} 件）"
+                    ),
+                    details={
+                        "scope": row[0],
+                        "scope_id": row[1],
+                        "node_type": row[2],
+                        "status": row[3],
+                        "expected": row[4],
+                        "actual": row[5],
+                    },
+                )
+            )
+
+        return issues
@@ -34,6 +34,28 @@ class CyclicDependencyError(PMToolError):
     pass
 
 
+class DependencyRejectionReason(Enum):
+    """一括追加時に依存関係が拒否された理由コード"""
+
+    NODE_NOT_FOUND = "node_not_found"
+    """先行または後続ノードが存在しない"""
+
+    LAYER_MISMATCH = "layer_mismatch"
+    """両ノードが同じ親 (Project / Task) に属していない"""
+
+    SELF_REFERENCE = "self_reference"
+    """自分自身への依存"""
+
+    ALREADY_EXISTS = "already_exists"
+    """同じ依存関係が既に存在する"""
+
+    DUPLICATE_IN_BATCH = "duplicate_in_batch"
+    """同じ依存関係が入力内で重複している"""
+
+    CYCLE = "cycle"
+    """追加すると循環依存が発生する"""
+
+
 class StatusTransitionFailureReason(Enum):
     """ステータス遷移失敗の理由コード"""
 
@@ -55,6 +77,9 @@ class StatusTransitionFailureReason(Enum):
     INVALID_TRANSITION = "invalid_transition"
     """無効な遷移（その他の理由）"""
 
+    DUPLICATE_IN_BATCH = "duplicate_in_batch"
+    """一括更新の入力内で同じノードが重複している"""
+
 
 class StatusTransitionError(PMToolError):
     """
@@ -0,0 +1,234 @@
+"""
+フロー分析（サイクルタイム・WIP・スループット）
+
+StatusManager が記録するステータス遷移の履歴 (status_events) から、
+プロジェクトごとに以下を集計します。
+
+- サイクルタイム: 最初に IN_PROGRESS になってから、最後に DONE になるまでの日数
+  （集計期間内に完了し、現在も DONE のノードが対象。パーセンタイルは nearest-rank 法）
+- スループット: 週ごとの DONE への遷移数
+- WIP: 各週末時点で IN_PROGRESS のノード数
+
+集計はウィンドウ関数を使ったSQLで行います。読み込むのは集計期間内の遷移と、
+期間内に完了したノードの履歴のみで、期間前の遷移は WIP の基準値として
+カバリングインデックス上で合計するだけのため、表本体を読むのは集計期間分に
+限られます（WIP は週ごとの増減の累積和として求めます）。
+履歴の記録開始前からのステータスは遷移が存在しないため集計に含まれません。
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from .database import Database
+from .exceptions import ValidationError
+from .repository import ProjectRepository
+
+# パーセンタイル（サイクルタイム）
+PERCENTILES = (50, 85, 95)
+
+# 既定の集計期間（週）
+DEFAULT_WEEKS = 12
+
+
+@dataclass
+class WeeklyFlow:
+    """1週間分のスループットとWIP"""
+
+    week_start: str
+    """週の開始日（月曜日、YYYY-MM-DD）"""
+
+    throughput: int = 0
+    """その週に DONE へ遷移した件数"""
+
+    wip: int = 0
+    """その週の終わりに IN_PROGRESS だった件数"""
+
+
+@dataclass
+class FlowStats:
+    """1プロジェクト分のフロー分析結果"""
+
+    project_id: int
+    project_name: str
+    completed: int = 0
+    """集計期間内に DONE へ遷移した件数"""
+
+    cycle_time_count: int = 0
+    """サイクルタイムを計測できたノード数"""
+
+    cycle_time_mean: Optional[float] = None
+    """サイクルタイムの平均（日）"""
+
+    cycle_time_percentiles: dict[int, float] = field(default_factory=dict)
+    """パーセンタイル → サイクルタイム（日）"""
+
+    weeks: list[WeeklyFlow] = field(default_factory=list)
+    """週ごとのスループットとWIP（古い順）"""
+
+
+def _week_start(day: date) -> date:
+    """
+    指定日を含む週の月曜日を返す
+
+    Args:
+        day: 日付
+
+    Returns:
+        date: 月曜日
+    """
+    return day - timedelta(days=day.weekday())
+
+
+def compute_flow_stats(
+    db: Database,
+    project_id: Optional[int] = None,
+    node_type: str = "task",
+    weeks: int = DEFAULT_WEEKS,
+    now: Optional[datetime] = None,
+) -> list[FlowStats]:
+    """
+    プロジェクトごとのサイクルタイム・WIP・週次スループットを集計
+
+    Args:
+        db: Database インスタンス
+        project_id: 対象プロジェクトID（Noneの場合は履歴のある全プロジェクト）
+        node_type: 'task' または 'subtask'
+        weeks: 集計期間（今週を含む直近の週数）
+        now: 集計の基準日時（UTC、Noneの場合は現在時刻）
+
+    Returns:
+        list[FlowStats]: プロジェクトID順の集計結果
+            （削除済みプロジェクトの履歴は含まれない）
+
+    Raises:
+        ValidationError: node_type / weeks が不正な場合、または指定したプロジェクトが存在しない場合
+    """
+    if node_type not in ("task", "subtask"):
+        raise ValidationError(f"無効なノードタイプ: {node_type}")
+    if weeks < 1:
+        raise ValidationError(f"weeks は1以上を指定してください: {weeks}")
+
+    current_week = _week_start((now or datetime.utcnow()).date())
+    week_starts = [
+        (current_week - timedelta(weeks=offset)).isoformat()
+        for offset in range(weeks - 1, -1, -1)
+    ]
+    since = week_starts[0]
+
+    project_cond = "1"
+    params: dict = {"node_type": node_type, "since": since}
+    if project_id is not None:
+        project_cond = "project_id = :project_id"
+        params["project_id"] = project_id
+    # 共通のCTEにすると履歴全体が一時テーブルに実体化されるため、各FROMに条件を展開する
+    events = f"status_events WHERE node_type = :node_type AND {project_cond}"
+
+    conn = db.connect()
+
+    # サイクルタイム（パーセンタイルは nearest-rank: rn * 100 >= p * n となる最小の rn）
+    percentile_columns = ",\n".join(
+        f"MIN(CASE WHEN rn * 100 >= {p} * n THEN days END)" for p in PERCENTILES
+    )
+    cycle_rows = conn.execute(
+        f"""
+        WITH per_node AS (
+            SELECT project_id, to_status, occurred_at,
+                   ROW_NUMBER() OVER node_history AS rn,
+                   MIN(CASE WHEN to_status = 'IN_PROGRESS' THEN occurred_at END)
+                       OVER node_history AS started_at
+            FROM {events}
+              AND node_id IN (
+                  SELECT node_id FROM {events}
+                    AND to_status = 'DONE' AND occurred_at >= :since
+              )
+            WINDOW node_history AS (
+                PARTITION BY node_id ORDER BY occurred_at DESC, id DESC
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+        ),
+        cycles AS (
+            SELECT project_id, julianday(occurred_at) - julianday(started_at) AS days
+            FROM per_node
+            WHERE rn = 1 AND to_status = 'DONE' AND started_at IS NOT NULL
+              AND occurred_at >= :since
+        ),
+        ranked AS (
+            SELECT project_id, days,
+                   ROW_NUMBER() OVER (PARTITION BY project_id ORDER BY days) AS rn,
+                   COUNT(*) OVER (PARTITION BY project_id) AS n
+            FROM cycles
+        )
+        SELECT project_id, COUNT(*), AVG(days),
+               {percentile_columns}
+        FROM ranked
+        GROUP BY project_id
+        """,
+        params,
+    ).fetchall()
+
+    # 週次スループットとWIP（期間内は週ごとの増減の累積和、期間前の増減は基準値として合計）
+    weekly_rows = conn.execute(
+        f"""
+        WITH weekly AS (
+            SELECT project_id,
+                   date(occurred_at, '-6 days', 'weekday 1') AS week,
+                   SUM(to_status = 'DONE' AND from_status != 'DONE') AS completed,
+                   SUM((to_status = 'IN_PROGRESS') - (from_status = 'IN_PROGRESS'))
+                       AS wip_delta
+            FROM {events} AND occurred_at >= :since
+            GROUP BY project_id, week
+        )
+        SELECT project_id, week, completed,
+               SUM(wip_delta) OVER (
+                   PARTITION BY project_id ORDER BY week ROWS UNBOUNDED PRECEDING
+               )
+        FROM weekly
+        UNION ALL
+        SELECT project_id, NULL, 0,
+               SUM((to_status = 'IN_PROGRESS') - (from_status = 'IN_PROGRESS'))
+        FROM {events} AND occurred_at < :since
+        GROUP BY project_id
+        """,
+        params,
+    ).fetchall()
+
+    project_ids = {row[0] for row in cycle_rows} | {row[0] for row in weekly_rows}
+    if project_id is not None:
+        project_ids.add(project_id)
+    projects = ProjectRepository(db).get_by_ids(project_ids)
+    if project_id is not None and project_id not in projects:
+        raise ValidationError(f"プロジェクトID {project_id} は存在しません")
+
+    stats = {
+        pid: FlowStats(project_id=pid, project_name=project.name)
+        for pid, project in sorted(projects.items())
+    }
+    for row in cycle_rows:
+        if row[0] not in stats:
+            continue
+        item = stats[row[0]]
+        item.cycle_time_count = row[1]
+        item.cycle_time_mean = row[2]
+        item.cycle_time_percentiles = dict(zip(PERCENTILES, row[3:]))
+
+    baseline: dict[int, int] = {}
+    by_week: dict[int, dict[str, tuple[int, int]]] = {}
+    for pid, week, completed, wip in weekly_rows:
+        if week is None:
+            baseline[pid] = wip
+        else:
+            by_week.setdefault(pid, {})[week] = (completed, wip)
+
+    for pid, item in stats.items():
+        base = baseline.get(pid, 0)
+        recorded = by_week.get(pid, {})
+        delta = 0
+        for week in week_starts:
+            completed, delta = recorded.get(week, (0, delta))
+            item.weeks.append(
+                WeeklyFlow(week_start=week, throughput=completed, wip=base + delta)
+            )
+            item.completed += completed
+
+    return list(stats.values())
@@ -0,0 +1,700 @@
+"""
+依存関係グラフのインメモリキャッシュ
+
+このモジュールはTask間・SubTask間の依存グラフ（前方・逆方向の隣接リスト）を
+プロセス内に保持し、Database インスタンスおよび依存タイプ ('task' / 'subtask')
+ごとに再利用する仕組みを提供します。
+
+キャッシュの有効性は接続単位のトークン (PRAGMA data_version, total_changes) で判定します:
+    - data_version: 他の接続がDBを変更（コミット）すると値が変わる
+    - total_changes: 同一接続でのINSERT/UPDATE/DELETE件数（依存テーブル以外の変更や
+      ON DELETE CASCADE による削除も含めて検知するため）
+
+DependencyManager が自身で依存関係を追加・削除してコミットした場合は、
+apply_committed() でキャッシュをその場で更新し、全件再読み込みを避けます。
+グラフはトポロジカル順序も動的に維持するため、循環判定は影響範囲の探索のみで済みます。
+"""
+
+import heapq
+import sqlite3
+import weakref
+from collections import deque
+from itertools import chain
+from typing import Iterable, Optional
+
+from .database import Database
+
+DEPENDENCY_TABLES = {
+    "task": "task_dependencies",
+    "subtask": "subtask_dependencies",
+}
+
+
+def dependency_table(dep_type: str) -> str:
+    """
+    依存タイプに対応するテーブル名を返す
+
+    Args:
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+
+    Returns:
+        str: テーブル名
+
+    Raises:
+        ValueError: 不正な dep_type の場合
+    """
+    try:
+        return DEPENDENCY_TABLES[dep_type]
+    except KeyError:
+        raise ValueError(f"不正な dep_type: {dep_type}") from None
+
+
+class DependencyGraph:
+    """
+    依存グラフ（前方・逆方向の隣接リスト）
+
+    グラフがDAGである間はトポロジカル順序（ノード → 位置）を動的に維持します
+    (Pearce–Kelly アルゴリズム)。順序に沿ったエッジの追加は O(1) で受理し、
+    順序に反するエッジの場合のみ、両端の位置に挟まれた影響範囲を探索して
+    循環判定と並べ替えを行います。
+
+    DB上のデータに既に循環が含まれる場合は順序を保持せず、
+    循環判定は通常のBFS (has_path) にフォールバックします。
+
+    Attributes:
+        forward: {node_id: {successor_ids}}
+        reverse: {node_id: {predecessor_ids}}
+    """
+
+    def __init__(self, edges: Iterable[tuple[int, int]] = ()):
+        """
+        Args:
+            edges: 初期エッジ (predecessor_id, successor_id) の列
+        """
+        self.forward: dict[int, set[int]] = {}
+        self.reverse: dict[int, set[int]] = {}
+        # 初期エッジの投入中は順序を維持せず、最後にまとめて計算する
+        self._order: Optional[dict[int, int]] = None
+        for pred, succ in edges:
+            self.add_node(pred)
+            self.add_node(succ)
+            self.forward[pred].add(succ)
+            self.reverse[succ].add(pred)
+
+        self._order = self._compute_order()
+        self._next_position = len(self.forward)
+
+    @property
+    def edge_count(self) -> int:
+        """エッジ数"""
+        return sum(len(succs) for succs in self.forward.values())
+
+    @property
+    def is_acyclic(self) -> bool:
+        """トポロジカル順序を維持できている（DAGである）か"""
+        return self._order is not None
+
+    def _compute_order(self) -> Optional[dict[int, int]]:
+        """
+        Kahnのアルゴリズムで初期のトポロジカル順序を計算
+
+        同順位のノードはID昇順で並べます。
+
+        Returns:
+            Optional[dict[int, int]]: {node_id: 位置}、循環がある場合None
+        """
+        in_degree = {node: len(preds) for node, preds in self.reverse.items()}
+        ready = [node for node, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+
+        order: dict[int, int] = {}
+        while ready:
+            node = heapq.heappop(ready)
+            order[node] = len(order)
+            for succ in self.forward[node]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    heapq.heappush(ready, succ)
+
+        if len(order) != len(self.forward):
+            return None
+        return order
+
+    def add_node(self, node_id: int) -> None:
+        """ノードを追加（既に存在する場合は何もしない）"""
+        if node_id in self.forward:
+            return
+        self.forward[node_id] = set()
+        self.reverse[node_id] = set()
+        if self._order is not None:
+            self._order[node_id] = self._next_position
+            self._next_position += 1
+
+    def add_edge(self, pred: int, succ: int) -> None:
+        """
+        エッジ pred → succ を追加し、トポロジカル順序を更新
+
+        エッジによって循環が生じる場合、以降は順序を維持しません。
+        """
+        self.add_node(pred)
+        self.add_node(succ)
+
+        if self._order is not None:
+            if pred == succ:
+                self._order = None
+            elif self._order[pred] > self._order[succ]:
+                forward_region = self._forward_region(succ, self._order[pred])
+                if forward_region is None:
+                    self._order = None
+                else:
+                    backward_region = self._backward_region(
+                        pred, self._order[succ]
+                    )
+                    self._reorder(backward_region, forward_region)
+
+        self.forward[pred].add(succ)
+        self.reverse[succ].add(pred)
+
+    def remove_edge(self, pred: int, succ: int) -> None:
+        """エッジ pred → succ を削除（存在しない場合は何もしない）"""
+        self.forward.get(pred, set()).discard(succ)
+        self.reverse.get(succ, set()).discard(pred)
+
+    def copy(self) -> "DependencyGraph":
+        """トポロジカル順序を含めたグラフの複製を返す"""
+        clone = DependencyGraph()
+        clone.forward = {node: set(succs) for node, succs in self.forward.items()}
+        clone.reverse = {node: set(preds) for node, preds in self.reverse.items()}
+        clone._order = dict(self._order) if self._order is not None else None
+        clone._next_position = self._next_position
+        return clone
+
+    def has_edge(self, pred: int, succ: int) -> bool:
+        """エッジ pred → succ が存在するか"""
+        return succ in self.forward.get(pred, ())
+
+    def successors(self, node_id: int) -> set[int]:
+        """直接の後続ノード集合"""
+        return self.forward.get(node_id, set())
+
+    def predecessors(self, node_id: int) -> set[int]:
+        """直接の先行ノード集合"""
+        return self.reverse.get(node_id, set())
+
+    def would_create_cycle(self, pred: int, succ: int) -> bool:
+        """
+        エッジ pred → succ を追加すると循環が生じるか判定
+
+        トポロジカル順序を維持している場合、pred が succ より前に位置していれば
+        O(1) で判定し、そうでなければ位置 [succ, pred] の範囲のみを探索します。
+
+        Args:
+            pred: 先行ノード
+            succ: 後続ノード
+
+        Returns:
+            bool: 循環が生じる場合True
+        """
+        if pred == succ:
+            return True
+        if pred not in self.forward or succ not in self.forward:
+            return False
+
+        if self._order is None:
+            return self.has_path(succ, pred)
+
+        upper = self._order[pred]
+        if upper < self._order[succ]:
+            return False
+        return self._forward_region(succ, upper) is None
+
+    def is_acyclic_with(self, edges: Iterable[tuple[int, int]]) -> bool:
+        """
+        既存のグラフに edges を加えた全体がDAGになるか、1回のトポロジカルソートで判定
+
+        グラフ自体は変更しません。
+
+        Args:
+            edges: 追加候補のエッジ (predecessor_id, successor_id) の列
+
+        Returns:
+            bool: 循環が生じない場合True
+        """
+        extra: dict[int, list[int]] = {}
+        in_degree = {node: len(preds) for node, preds in self.reverse.items()}
+        for pred, succ in edges:
+            extra.setdefault(pred, []).append(succ)
+            in_degree.setdefault(pred, 0)
+            in_degree[succ] = in_degree.get(succ, 0) + 1
+
+        ready = [node for node, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while ready:
+            node = ready.pop()
+            visited += 1
+            for succ in chain(self.forward.get(node, ()), extra.get(node, ())):
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    ready.append(succ)
+
+        return visited == len(in_degree)
+
+    def topological_order(self) -> list[int]:
+        """
+        維持しているトポロジカル順序でノードを返す
+
+        Returns:
+            list[int]: ノードIDのリスト（先行ノードが必ず前に来る）
+
+        Raises:
+            ValueError: グラフに循環が含まれる場合
+        """
+        if self._order is None:
+            raise ValueError("依存グラフに循環が含まれるため、トポロジカル順序を計算できません")
+        return sorted(self._order, key=self._order.__getitem__)
+
+    def _forward_region(self, start: int, upper: int) -> Optional[list[int]]:
+        """
+        start から前方に辿れるノードのうち、位置が upper 以下のものを列挙
+
+        Args:
+            start: 開始ノード（追加エッジの後続側）
+            upper: 探索範囲の上限位置（追加エッジの先行側の位置）
+
+        Returns:
+            Optional[list[int]]: 影響範囲のノード、位置 upper のノード（先行側）に
+                                 到達した場合（=循環）はNone
+        """
+        order = self._order
+        visited = {start}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for neighbor in self.forward[current]:
+                position = order[neighbor]
+                if position == upper:
+                    return None
+                if position < upper and neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return list(visited)
+
+    def _backward_region(self, start: int, lower: int) -> list[int]:
+        """
+        start から逆方向に辿れるノードのうち、位置が lower より大きいものを列挙
+
+        Args:
+            start: 開始ノード（追加エッジの先行側）
+            lower: 探索範囲の下限位置（追加エッジの後続側の位置）
+
+        Returns:
+            list[int]: 影響範囲のノード
+        """
+        order = self._order
+        visited = {start}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for neighbor in self.reverse[current]:
+                if order[neighbor] > lower and neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return list(visited)
+
+    def _reorder(self, backward: list[int], forward: list[int]) -> None:
+        """
+        影響範囲のノードに位置を再割り当て
+
+        影響範囲が使っていた位置の集合を、先行側の領域 → 後続側の領域の順に
+        (それぞれの領域内の相対順序を保ったまま) 割り当て直します。
+        """
+        order = self._order
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        nodes = backward + forward
+        positions = sorted(order[node] for node in nodes)
+        for node, position in zip(nodes, positions):
+            order[node] = position
+
+    def has_path(self, start: int, end: int) -> bool:
+        """
+        start から end へのパスが存在するかBFSで判定
+
+        Args:
+            start: 開始ノード
+            end: 終了ノード
+
+        Returns:
+            bool: パスが存在する場合True
+        """
+        if start == end:
+            return True
+
+        if start not in self.forward:
+            return False
+
+        visited = {start}
+        queue = deque([start])
+
+        while queue:
+            current = queue.popleft()
+            for neighbor in self.forward.get(current, ()):
+                if neighbor == end:
+                    return True
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+
+        return False
+
+    def distances(
+        self,
+        start: int,
+        reverse: bool = False,
+        max_depth: Optional[int] = None,
+    ) -> dict[int, int]:
+        """
+        start から辿れるノードまでの最短距離をBFSで求める
+
+        Args:
+            start: 開始ノード
+            reverse: Trueの場合は先行方向に辿る
+            max_depth: 探索する最大距離 (Noneの場合は無制限)
+
+        Returns:
+            dict[int, int]: {node_id: 距離}（start 自身は含まない）
+        """
+        adjacency = self.reverse if reverse else self.forward
+        result: dict[int, int] = {}
+        visited = {start}
+        queue = deque([(start, 0)])
+
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbor in adjacency.get(current, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    result[neighbor] = depth + 1
+                    queue.append((neighbor, depth + 1))
+
+        return result
+
+
+def strongly_connected_components(
+    adjacency: dict[int, Iterable[int]],
+) -> list[list[int]]:
+    """
+    強連結成分を反復版Tarjanアルゴリズムで求める
+
+    再帰を使わないため、長い依存チェーンでも再帰上限に達しません。
+
+    Args:
+        adjacency: {node_id: 後続ノードIDの列}（後続側にしか現れないノードも可）
+
+    Returns:
+        list[list[int]]: 強連結成分（各成分はID昇順）のリスト
+    """
+    index_of: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[list[int]] = []
+
+    for root in sorted(adjacency):
+        if root in index_of:
+            continue
+
+        # (ノード, 後続ノードのイテレータ) を積む明示的なDFSスタック
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for succ in successors:
+                if succ not in index_of:
+                    index_of[succ] = lowlink[succ] = len(index_of)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(adjacency.get(succ, ()))))
+                    advanced = True
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[succ])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+
+    return components
+
+
+def representative_cycle(
+    adjacency: dict[int, Iterable[int]], component: list[int]
+) -> list[int]:
+    """
+    強連結成分内の代表サイクル（最小IDのノードを通る最短サイクル）を求める
+
+    Args:
+        adjacency: {node_id: 後続ノードIDの列}
+        component: 強連結成分のノードID（ID昇順）
+
+    Returns:
+        list[int]: サイクル [start, ..., start]（閉路にならない成分の場合は空リスト）
+    """
+    members = set(component)
+    start = component[0]
+    parents: dict[int, int] = {}
+    queue = deque([start])
+    visited = {start}
+
+    while queue:
+        current = queue.popleft()
+        for succ in sorted(adjacency.get(current, ())):
+            if succ not in members:
+                continue
+            if succ == start:
+                cycle = [start]
+                node = current
+                while node != start:
+                    cycle.append(node)
+                    node = parents[node]
+                cycle.append(start)
+                # 逆順に辿ったので start → ... → start の順に直す
+                cycle[1:-1] = reversed(cycle[1:-1])
+                return cycle
+            if succ not in visited:
+                visited.add(succ)
+                parents[succ] = current
+                queue.append(succ)
+
+    return []
+
+
+def _connection_token(conn: sqlite3.Connection) -> tuple[int, int]:
+    """
+    接続のキャッシュ判定用トークンを取得
+
+    Returns:
+        tuple[int, int]: (PRAGMA data_version, total_changes)
+    """
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    return (data_version, conn.total_changes)
+
+
+class DependencyGraphCache:
+    """
+    1つの Database・1つの依存タイプに対応するグラフキャッシュ
+
+    get() はトークンが一致する限り保持中のグラフを返し、不一致の場合のみ
+    依存テーブルを全件読み込み直します。
+
+    Database.transaction() のスコープ内では、コミット済みのグラフとは別に
+    未コミットの変更を反映したスコープ専用のグラフ（オーバーレイ）を保持します。
+    オーバーレイは最も外側のスコープのコミット時に共有のキャッシュへ反映し、
+    ロールバック時には破棄します（on_transaction() で通知を受けます）。
+    """
+
+    def __init__(self, dep_type: str):
+        """
+        Args:
+            dep_type: 依存関係タイプ ('task' または 'subtask')
+        """
+        self.dep_type = dep_type
+        self.table_name = dependency_table(dep_type)
+        self._graph: Optional[DependencyGraph] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._token: Optional[tuple[int, int]] = None
+        # transaction() スコープ中のコネクション → (オーバーレイ, トークン)
+        # （スコープ中でオーバーレイ未構築の場合は None）
+        self._pending: dict[
+            sqlite3.Connection, Optional[tuple[DependencyGraph, tuple[int, int]]]
+        ] = {}
+
+    def token(self, conn: sqlite3.Connection) -> tuple[int, int]:
+        """接続の現在のトークンを返す（書き込み前の記録用）"""
+        return _connection_token(conn)
+
+    def get(self, conn: sqlite3.Connection) -> DependencyGraph:
+        """
+        依存グラフを取得（必要な場合のみ再読み込み）
+
+        transaction() スコープ内で再読み込みした場合、そのグラフは未コミットの変更を
+        含み得るため、スコープのオーバーレイとして保持します。
+        スコープ外のトランザクション中に再読み込みした場合は保持しません。
+
+        Args:
+            conn: 読み込みに使用するコネクション
+
+        Returns:
+            DependencyGraph: 依存グラフ（呼び出し側で変更しないこと）
+        """
+        token = _connection_token(conn)
+        pending = self._pending.get(conn)
+        if pending is not None and pending[1] == token:
+            return pending[0]
+        if (
+            self._graph is not None
+            and self._conn is conn
+            and self._token == token
+        ):
+            return self._graph
+
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT predecessor_id, successor_id FROM {self.table_name}"
+        )
+        graph = DependencyGraph(
+            (row[0], row[1]) for row in cursor.fetchall()
+        )
+
+        if conn in self._pending:
+            self._pending[conn] = (graph, token)
+        elif conn.in_transaction:
+            self.invalidate()
+        else:
+            self._graph = graph
+            self._conn = conn
+            self._token = token
+
+        return graph
+
+    def apply_committed(
+        self,
+        conn: sqlite3.Connection,
+        before_token: tuple[int, int],
+        added: Iterable[tuple[int, int]] = (),
+        removed: Iterable[tuple[int, int]] = (),
+    ) -> None:
+        """
+        この接続でコミットしたエッジの追加・削除をキャッシュに反映
+
+        書き込み前のトークンがキャッシュのトークンと一致しない場合
+        （キャッシュ未構築、または書き込み前に別の変更があった場合）は、
+        安全側に倒してキャッシュを破棄します。
+        transaction() スコープ内では共有のキャッシュには触れず、オーバーレイに反映します
+        （共有のキャッシュへの反映は最も外側のスコープのコミット時）。
+
+        Args:
+            conn: 書き込みに使用したコネクション（コミット済みであること）
+            before_token: 書き込み前に token() で取得したトークン
+            added: 追加したエッジ (predecessor_id, successor_id) の列
+            removed: 削除したエッジ (predecessor_id, successor_id) の列
+        """
+        if conn in self._pending:
+            pending = self._pending[conn]
+            if pending is not None and pending[1] == before_token:
+                graph = pending[0]
+            elif (
+                self._graph is not None
+                and self._conn is conn
+                and self._token == before_token
+            ):
+                # スコープ内で最初の変更: ロールバックに備えて共有のグラフは変更しない
+                graph = self._graph.copy()
+            else:
+                self._pending[conn] = None
+                return
+
+            for pred, succ in removed:
+                graph.remove_edge(pred, succ)
+            for pred, succ in added:
+                graph.add_edge(pred, succ)
+            self._pending[conn] = (graph, _connection_token(conn))
+            return
+
+        if (
+            self._graph is None
+            or self._conn is not conn
+            or self._token != before_token
+            or conn.in_transaction
+        ):
+            self.invalidate()
+            return
+
+        for pred, succ in removed:
+            self._graph.remove_edge(pred, succ)
+        for pred, succ in added:
+            self._graph.add_edge(pred, succ)
+
+        self._token = _connection_token(conn)
+
+    def on_transaction(self, conn: sqlite3.Connection, event: str) -> None:
+        """
+        Database.transaction() のスコープの開始・終了を受け取る
+
+        Args:
+            conn: スコープのコネクション
+            event: 'begin' / 'commit' / 'rollback' （最も外側のスコープ）、
+                または 'rollback_to' （内側のスコープのロールバック）
+        """
+        if event == "begin":
+            self._pending[conn] = None
+        elif event == "rollback_to":
+            # 取り消されたエッジを含み得るため、次回 get() で読み込み直す
+            if conn in self._pending:
+                self._pending[conn] = None
+        elif event == "commit":
+            pending = self._pending.pop(conn, None)
+            if pending is not None and pending[1] == _connection_token(conn):
+                self._graph, self._token = pending
+                self._conn = conn
+        else:
+            self._pending.pop(conn, None)
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄（次回 get() で再読み込み）"""
+        self._graph = None
+        self._conn = None
+        self._token = None
+        self._pending = dict.fromkeys(self._pending)
+
+
+# Database インスタンスごとのキャッシュ（Database が破棄されると自動的に解放される）
+_caches: "weakref.WeakKeyDictionary[Database, dict[str, DependencyGraphCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_graph_cache(db: Database, dep_type: str) -> DependencyGraphCache:
+    """
+    Database・依存タイプに対応するグラフキャッシュを取得
+
+    同じ Database インスタンスを共有する DependencyManager 同士は、
+    同じキャッシュを共有します。
+
+    Args:
+        db: Database インスタンス
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+
+    Returns:
+        DependencyGraphCache: グラフキャッシュ
+    """
+    dependency_table(dep_type)
+    per_db = _caches.setdefault(db, {})
+    cache = per_db.get(dep_type)
+    if cache is None:
+        cache = DependencyGraphCache(dep_type)
+        per_db[dep_type] = cache
+        db.add_transaction_listener(cache.on_transaction)
+        if db.in_transaction:
+            # スコープの途中で作成した場合も、このスコープからオーバーレイを使う
+            cache.on_transaction(db.connect(), "begin")
+    return cache
@@ -0,0 +1,397 @@
+"""
+SQL計測（ステートメント単位の統計と遅いクエリのログ）
+
+Database(tracer=QueryTracer()) を指定すると、Database が開くすべてのコネクションが
+TracingConnection になり、実行したSQLを正規化したテキストごとに
+実行回数・合計時間・p95・返却行数を集計します。
+
+- execute / executemany / fetch* / commit / rollback を時間計測付きのラッパーで記録します。
+- ラッパーを通らないステートメント（executescript 等）は set_trace_callback で回数のみ記録します。
+- 閾値を超えたステートメントは EXPLAIN QUERY PLAN とともに slow_queries に記録します。
+
+CLI では `PMTOOL_TRACE=1` または `--trace` で有効になり、終了時に集計表を表示します。
+"""
+
+import math
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_ROW_LIST = re.compile(r"(\(\?, \.\.\.\)|\(\?\))(?:\s*,\s*(?:\(\?, \.\.\.\)|\(\?\)))+")
+_WHITESPACE = re.compile(r"\s+")
+
+# EXPLAIN QUERY PLAN を取得できるステートメント
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    集計用にSQLを正規化
+
+    リテラルを ? に置き換え、IN (?, ?, ...) や複数行 VALUES を1つにまとめ、
+    空白を詰めます。パラメータ数だけが異なるステートメントは同じテキストになります。
+
+    Args:
+        sql: SQL文
+
+    Returns:
+        str: 正規化したSQL
+    """
+    text = _STRING_LITERAL.sub("?", sql)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _PLACEHOLDER_LIST.sub("(?, ...)", text)
+    text = _ROW_LIST.sub(r"\1, ...", text)
+    return text
+
+
+@dataclass
+class StatementStats:
+    """正規化したステートメントごとの集計"""
+
+    sql: str
+    """正規化したSQL"""
+
+    count: int = 0
+    """実行回数"""
+
+    total_time: float = 0.0
+    """合計時間（秒）"""
+
+    rows: int = 0
+    """返却行数の合計"""
+
+    durations: list[float] = field(default_factory=list)
+    """実行ごとの所要時間（秒）"""
+
+    @property
+    def p95(self) -> float:
+        """所要時間の95パーセンタイル（秒、nearest-rank）"""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+@dataclass
+class SlowQuery:
+    """閾値を超えたステートメント"""
+
+    sql: str
+    """実行したSQL（正規化前）"""
+
+    elapsed: float
+    """所要時間（秒）"""
+
+    plan: list[str]
+    """EXPLAIN QUERY PLAN の detail 列"""
+
+
+class QueryTracer:
+    """
+    ステートメント統計の収集器
+
+    複数のコネクション・スレッドから同時に記録できます。
+    """
+
+    def __init__(self, slow_threshold_ms: Optional[float] = 100.0):
+        """
+        Args:
+            slow_threshold_ms: 遅いクエリとして記録する閾値（ミリ秒、Noneの場合は記録しない）
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.stats: dict[str, StatementStats] = {}
+        self.slow_queries: list[SlowQuery] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # --- 記録 ---
+
+    def record(
+        self, sql: str, elapsed: Optional[float], rows: int = 0
+    ) -> None:
+        """
+        ステートメントの実行を1件記録
+
+        Args:
+            sql: SQL文（正規化前）
+            elapsed: 所要時間（秒、不明な場合None）
+            rows: 返却行数
+        """
+        key = normalize_sql(sql)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StatementStats(sql=key)
+            stats.count += 1
+            stats.rows += rows
+            if elapsed is not None:
+                stats.total_time += elapsed
+                stats.durations.append(elapsed)
+
+    def is_slow(self, elapsed: float) -> bool:
+        """所要時間が閾値を超えているか"""
+        return (
+            self.slow_threshold_ms is not None
+            and elapsed * 1000 >= self.slow_threshold_ms
+        )
+
+    def record_slow(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        params: Any,
+        elapsed: float,
+    ) -> None:
+        """
+        遅いステートメントを EXPLAIN QUERY PLAN とともに記録
+
+        Args:
+            conn: 実行したコネクション
+            sql: SQL文
+            params: パラメータ（Noneの場合は実行計画を取得しない）
+            elapsed: 所要時間（秒）
+        """
+        plan: list[str] = []
+        if params is not None and sql.lstrip().upper().startswith(_EXPLAINABLE):
+            with self.suspended():
+                try:
+                    cursor = sqlite3.Cursor(conn)
+                    cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                    plan = [row[-1] for row in cursor.fetchall()]
+                except sqlite3.Error as e:
+                    plan = [f"(実行計画を取得できません: {e})"]
+        with self._lock:
+            self.slow_queries.append(SlowQuery(sql=sql, elapsed=elapsed, plan=plan))
+
+    def trace_callback(self, sql: str) -> None:
+        """
+        set_trace_callback 用のコールバック
+
+        ラッパー経由の実行中（トリガー内のステートメントや暗黙のBEGINを含む）は、
+        その実行の一部として計測済みのため記録しません。
+        """
+        if getattr(self._local, "depth", 0):
+            return
+        self.record(sql, None)
+
+    # --- ラッパーの入れ子管理 ---
+
+    def enter(self) -> None:
+        """ラッパー経由の実行開始（trace_callback を抑止）"""
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+
+    def exit(self) -> None:
+        """ラッパー経由の実行終了"""
+        self._local.depth -= 1
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """with 文の間 trace_callback を抑止する"""
+        self.enter()
+        try:
+            yield
+        finally:
+            self.exit()
+
+    # --- 集計結果 ---
+
+    @property
+    def total_statements(self) -> int:
+        """記録したステートメントの総数"""
+        with self._lock:
+            return sum(stats.count for stats in self.stats.values())
+
+    def summary(self) -> list[StatementStats]:
+        """
+        合計時間の降順に並べた集計結果
+
+        Returns:
+            list[StatementStats]: 集計結果
+        """
+        with self._lock:
+            return sorted(
+                self.stats.values(), key=lambda s: (-s.total_time, -s.count, s.sql)
+            )
+
+    def reset(self) -> None:
+        """集計をクリア"""
+        with self._lock:
+            self.stats.clear()
+            self.slow_queries.clear()
+
+
+class TracingCursor(sqlite3.Cursor):
+    """
+    実行と取得の時間・行数を記録するカーソル
+
+    execute() から結果を取り切る（または次の execute / close）までを1回の実行として記録します。
+    SQLiteは結果を取得しながら処理を進めるため、fetch の時間も実行時間に含めます。
+    """
+
+    _tracer: Optional[QueryTracer] = None
+    _pending: Optional[list] = None  # [sql, params, elapsed, rows]
+
+    def execute(self, sql: str, parameters: Any = (), /):
+        self._finish()
+        tracer = self.connection.tracer
+        if tracer is None:
+            return super().execute(sql, parameters)
+
+        self._tracer = tracer
+        tracer.enter()
+        started = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - started
+            tracer.exit()
+            self._pending = [sql, parameters, elapsed, 0]
+        if self.description is None:
+            self._finish()
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable, /):
+        self._finish()
+        tracer = self.connection.tracer
+        if tracer is None:
+            return super().executemany(sql, seq_of_parameters)
+
+        tracer.enter()
+        started = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        finally:
+            elapsed = time.perf_counter() - started
+            tracer.exit()
+        tracer.record(sql, elapsed)
+        if tracer.is_slow(elapsed):
+            tracer.record_slow(self.connection, sql, None, elapsed)
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        else:
+            self._add_rows(1)
+        return row
+
+    def fetchmany(self, size: Optional[int] = None):
+        if size is None:
+            size = self.arraysize
+        rows = self._timed(lambda: super(TracingCursor, self).fetchmany(size))
+        self._add_rows(len(rows))
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._add_rows(len(rows))
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        self._add_rows(1)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        # 結果を取り切らずに破棄されたカーソル（fetchone() 1回のみ等）もここで記録する
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def _timed(self, fetch):
+        """取得処理を実行し、所要時間を保留中の実行に加算"""
+        if self._pending is None:
+            return fetch()
+        self._tracer.enter()
+        started = time.perf_counter()
+        try:
+            return fetch()
+        finally:
+            self._tracer.exit()
+            if self._pending is not None:
+                self._pending[2] += time.perf_counter() - started
+
+    def _add_rows(self, count: int) -> None:
+        if self._pending is not None:
+            self._pending[3] += count
+
+    def _finish(self) -> None:
+        """保留中の実行を記録"""
+        pending, self._pending = self._pending, None
+        if pending is None or self._tracer is None:
+            return
+        sql, params, elapsed, rows = pending
+        self._tracer.record(sql, elapsed, rows)
+        if self._tracer.is_slow(elapsed):
+            self._tracer.record_slow(self.connection, sql, params, elapsed)
+
+
+class TracingConnection(sqlite3.Connection):
+    """
+    TracingCursor を既定のカーソルとし、commit / rollback も計測するコネクション
+
+    sqlite3.connect(..., factory=TracingConnection) で作成し、tracer を設定して使用します。
+    """
+
+    tracer: Optional[QueryTracer] = None
+
+    def cursor(self, factory=TracingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable, /):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        self._timed("COMMIT", super().commit)
+
+    def rollback(self):
+        self._timed("ROLLBACK", super().rollback)
+
+    def _timed(self, label: str, action) -> None:
+        """トランザクション操作を計測（トランザクション外では何もしないため記録しない）"""
+        if self.tracer is None or not self.in_transaction:
+            action()
+            return
+        self.tracer.enter()
+        started = time.perf_counter()
+        try:
+            action()
+        finally:
+            self.tracer.exit()
+            self.tracer.record(label, time.perf_counter() - started)
+
+
+def attach(conn: sqlite3.Connection, tracer: QueryTracer) -> None:
+    """
+    コネクションに tracer を設定
+
+    Args:
+        conn: TracingConnection として作成したコネクション
+        tracer: 記録先
+    """
+    conn.tracer = tracer
+    conn.set_trace_callback(tracer.trace_callback)
@@ -0,0 +1,520 @@
+"""
+スキーマ移行（マイグレーション）モジュール
+
+scripts/init_db.sql が作成するスキーマをバージョン1とし、
+それ以降のスキーマ変更をバージョン順に適用します。
+適用済みのバージョンは schema_version テーブルに記録されます。
+
+マイグレーションは Database.initialize() の直後、および
+Database.connect() で新しいコネクションを開いたときに自動的に適用されるため、
+既存のDBファイルも次回接続時に最新スキーマへ更新されます。
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+
+def _backfill_pending_sql(node_table: str, dep_table: str, where: str = "") -> str:
+    """
+    pending_predecessors を依存関係から数え直すUPDATE文
+
+    Args:
+        node_table: 'tasks' または 'subtasks'
+        dep_table: node_table に対応する依存テーブル
+        where: 更新対象を絞り込むWHERE句（空の場合は全行）
+
+    Returns:
+        str: UPDATE文
+    """
+    return f"""
+            UPDATE {node_table} SET pending_predecessors = (
+                SELECT COUNT(*) FROM {dep_table} d
+                JOIN {node_table} p ON p.id = d.predecessor_id
+                WHERE d.successor_id = {node_table}.id AND p.status != 'DONE'
+            )
+            {where}
+            """
+
+
+def _backfill_rollups_sql(project_filter: str = "1") -> str:
+    """
+    progress_rollups を Task / SubTask から集計し直すINSERT文
+
+    Args:
+        project_filter: 集計対象の Task を絞り込む条件（tasks の別名 t で参照）
+
+    Returns:
+        str: INSERT ... SELECT 文
+    """
+    return f"""
+            INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+            SELECT 'project', t.project_id, 'task', t.status, COUNT(*)
+            FROM tasks t WHERE {project_filter} GROUP BY t.project_id, t.status
+            UNION ALL
+            SELECT 'subproject', t.subproject_id, 'task', t.status, COUNT(*)
+            FROM tasks t WHERE t.subproject_id IS NOT NULL AND {project_filter}
+            GROUP BY t.subproject_id, t.status
+            UNION ALL
+            SELECT 'project', t.project_id, 'subtask', st.status, COUNT(*)
+            FROM subtasks st JOIN tasks t ON t.id = st.task_id
+            WHERE {project_filter}
+            GROUP BY t.project_id, st.status
+            UNION ALL
+            SELECT 'subproject', t.subproject_id, 'subtask', st.status, COUNT(*)
+            FROM subtasks st JOIN tasks t ON t.id = st.task_id
+            WHERE t.subproject_id IS NOT NULL AND {project_filter}
+            GROUP BY t.subproject_id, st.status
+            """
+
+# (バージョン, 説明, SQL文のリスト) — バージョン昇順
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (
+        2,
+        "metadata テーブルと updated_at インデックス (doctor --incremental 用)",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_projects_updated_at ON projects(updated_at)",
+            "CREATE INDEX IF NOT EXISTS idx_subprojects_updated_at ON subprojects(updated_at)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks(updated_at)",
+            "CREATE INDEX IF NOT EXISTS idx_subtasks_updated_at ON subtasks(updated_at)",
+            "CREATE INDEX IF NOT EXISTS idx_task_deps_created_at ON task_dependencies(created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_subtask_deps_created_at ON subtask_dependencies(created_at)",
+        ],
+    ),
+    (
+        3,
+        "未完了の先行ノード数 (pending_predecessors) と着手可能ノードの部分インデックス",
+        [
+            # pending_predecessors はトリガーで維持する:
+            #   - 依存関係の追加・削除で後続ノードを ±1（先行ノードが未完了の場合のみ）
+            #   - DONE になった / DONE でなくなったノードの後続を ∓1
+            #   - 未完了のノードの削除前に後続を -1（カスケード削除される依存関係の
+            #     削除トリガーでは先行ノードが既に存在しないため二重に数えない）
+            # --- tasks ---
+            "ALTER TABLE tasks ADD COLUMN pending_predecessors INTEGER NOT NULL DEFAULT 0",
+            _backfill_pending_sql("tasks", "task_dependencies"),
+            """
+            CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(project_id, id)
+            WHERE status != 'DONE' AND pending_predecessors = 0
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_task_dependencies_ready_insert
+            AFTER INSERT ON task_dependencies
+            BEGIN
+                UPDATE tasks SET pending_predecessors = pending_predecessors + 1
+                WHERE id = NEW.successor_id
+                  AND EXISTS (
+                      SELECT 1 FROM tasks WHERE id = NEW.predecessor_id AND status != 'DONE'
+                  );
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_task_dependencies_ready_delete
+            AFTER DELETE ON task_dependencies
+            BEGIN
+                UPDATE tasks SET pending_predecessors = pending_predecessors - 1
+                WHERE id = OLD.successor_id
+                  AND EXISTS (
+                      SELECT 1 FROM tasks WHERE id = OLD.predecessor_id AND status != 'DONE'
+                  );
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_ready_status
+            AFTER UPDATE OF status ON tasks
+            WHEN (OLD.status = 'DONE') != (NEW.status = 'DONE')
+            BEGIN
+                UPDATE tasks
+                SET pending_predecessors =
+                    pending_predecessors + CASE WHEN NEW.status = 'DONE' THEN -1 ELSE 1 END
+                WHERE id IN (SELECT successor_id FROM task_dependencies WHERE predecessor_id = NEW.id);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_ready_delete
+            BEFORE DELETE ON tasks
+            WHEN OLD.status != 'DONE'
+            BEGIN
+                UPDATE tasks SET pending_predecessors = pending_predecessors - 1
+                WHERE id IN (SELECT successor_id FROM task_dependencies WHERE predecessor_id = OLD.id);
+            END
+            """,
+            # --- subtasks ---
+            "ALTER TABLE subtasks ADD COLUMN pending_predecessors INTEGER NOT NULL DEFAULT 0",
+            _backfill_pending_sql("subtasks", "subtask_dependencies"),
+            """
+            CREATE INDEX IF NOT EXISTS idx_subtasks_ready ON subtasks(task_id, id)
+            WHERE status != 'DONE' AND pending_predecessors = 0
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtask_dependencies_ready_insert
+            AFTER INSERT ON subtask_dependencies
+            BEGIN
+                UPDATE subtasks SET pending_predecessors = pending_predecessors + 1
+                WHERE id = NEW.successor_id
+                  AND EXISTS (
+                      SELECT 1 FROM subtasks WHERE id = NEW.predecessor_id AND status != 'DONE'
+                  );
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtask_dependencies_ready_delete
+            AFTER DELETE ON subtask_dependencies
+            BEGIN
+                UPDATE subtasks SET pending_predecessors = pending_predecessors - 1
+                WHERE id = OLD.successor_id
+                  AND EXISTS (
+                      SELECT 1 FROM subtasks WHERE id = OLD.predecessor_id AND status != 'DONE'
+                  );
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtasks_ready_status
+            AFTER UPDATE OF status ON subtasks
+            WHEN (OLD.status = 'DONE') != (NEW.status = 'DONE')
+            BEGIN
+                UPDATE subtasks
+                SET pending_predecessors =
+                    pending_predecessors + CASE WHEN NEW.status = 'DONE' THEN -1 ELSE 1 END
+                WHERE id IN (SELECT successor_id FROM subtask_dependencies WHERE predecessor_id = NEW.id);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtasks_ready_delete
+            BEFORE DELETE ON subtasks
+            WHEN OLD.status != 'DONE'
+            BEGIN
+                UPDATE subtasks SET pending_predecessors = pending_predecessors - 1
+                WHERE id IN (SELECT successor_id FROM subtask_dependencies WHERE predecessor_id = OLD.id);
+            END
+            """,
+        ],
+    ),
+    (
+        4,
+        "Project / SubProject ごとの状態別件数 (progress_rollups)",
+        [
+            # scope='project' は Project 配下の全 Task / SubTask、scope='subproject' は
+            # SubProject 直下の Task とその SubTask を数える（SubProject の入れ子は
+            # 機能対応していないため親 SubProject へは波及させない）。
+            # 親子の外部キーは ON DELETE RESTRICT のため、削除は常に子から行われる。
+            """
+            CREATE TABLE IF NOT EXISTS progress_rollups (
+                scope TEXT NOT NULL CHECK (scope IN ('project', 'subproject')),
+                scope_id INTEGER NOT NULL,
+                node_type TEXT NOT NULL CHECK (node_type IN ('task', 'subtask')),
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (scope, scope_id, node_type, status)
+            ) WITHOUT ROWID
+            """,
+            _backfill_rollups_sql(),
+            # --- tasks ---
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_insert
+            AFTER INSERT ON tasks
+            BEGIN
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                VALUES ('project', NEW.project_id, 'task', NEW.status, 1)
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'subproject', NEW.subproject_id, 'task', NEW.status, 1
+                WHERE NEW.subproject_id IS NOT NULL
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_delete
+            AFTER DELETE ON tasks
+            BEGIN
+                UPDATE progress_rollups SET count = count - 1
+                WHERE node_type = 'task' AND status = OLD.status
+                  AND ((scope = 'project' AND scope_id = OLD.project_id)
+                       OR (scope = 'subproject' AND scope_id = OLD.subproject_id));
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_status
+            AFTER UPDATE OF status ON tasks
+            WHEN OLD.status != NEW.status
+            BEGIN
+                UPDATE progress_rollups SET count = count - 1
+                WHERE node_type = 'task' AND status = OLD.status
+                  AND ((scope = 'project' AND scope_id = OLD.project_id)
+                       OR (scope = 'subproject' AND scope_id = OLD.subproject_id));
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                VALUES ('project', NEW.project_id, 'task', NEW.status, 1)
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'subproject', NEW.subproject_id, 'task', NEW.status, 1
+                WHERE NEW.subproject_id IS NOT NULL
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+            END
+            """,
+            # --- subtasks ---
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtasks_rollup_insert
+            AFTER INSERT ON subtasks
+            BEGIN
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'project', project_id, 'subtask', NEW.status, 1
+                FROM tasks WHERE id = NEW.task_id
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'subproject', subproject_id, 'subtask', NEW.status, 1
+                FROM tasks WHERE id = NEW.task_id AND subproject_id IS NOT NULL
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtasks_rollup_delete
+            AFTER DELETE ON subtasks
+            BEGIN
+                UPDATE progress_rollups SET count = count - 1
+                WHERE node_type = 'subtask' AND status = OLD.status
+                  AND ((scope = 'project'
+                        AND scope_id = (SELECT project_id FROM tasks WHERE id = OLD.task_id))
+                       OR (scope = 'subproject'
+                           AND scope_id = (SELECT subproject_id FROM tasks WHERE id = OLD.task_id)));
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subtasks_rollup_status
+            AFTER UPDATE OF status ON subtasks
+            WHEN OLD.status != NEW.status
+            BEGIN
+                UPDATE progress_rollups SET count = count - 1
+                WHERE node_type = 'subtask' AND status = OLD.status
+                  AND ((scope = 'project'
+                        AND scope_id = (SELECT project_id FROM tasks WHERE id = OLD.task_id))
+                       OR (scope = 'subproject'
+                           AND scope_id = (SELECT subproject_id FROM tasks WHERE id = OLD.task_id)));
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'project', project_id, 'subtask', NEW.status, 1
+                FROM tasks WHERE id = NEW.task_id
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+                INSERT INTO progress_rollups (scope, scope_id, node_type, status, count)
+                SELECT 'subproject', subproject_id, 'subtask', NEW.status, 1
+                FROM tasks WHERE id = NEW.task_id AND subproject_id IS NOT NULL
+                ON CONFLICT (scope, scope_id, node_type, status) DO UPDATE SET count = count + 1;
+            END
+            """,
+            # --- 集計対象そのものの削除 ---
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_projects_rollup_delete
+            AFTER DELETE ON projects
+            BEGIN
+                DELETE FROM progress_rollups WHERE scope = 'project' AND scope_id = OLD.id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_subprojects_rollup_delete
+            AFTER DELETE ON subprojects
+            BEGIN
+                DELETE FROM progress_rollups WHERE scope = 'subproject' AND scope_id = OLD.id;
+            END
+            """,
+        ],
+    ),
+    (
+        5,
+        "ステータス遷移の履歴 (status_events)",
+        [
+            # 追記専用。ノード削除後も集計に使えるよう外部キーは張らず、
+            # プロジェクト単位の集計用に遷移時点の project_id を保持する。
+            """
+            CREATE TABLE IF NOT EXISTS status_events (
+                id INTEGER PRIMARY KEY,
+                node_type TEXT NOT NULL CHECK (node_type IN ('task', 'subtask')),
+                node_id INTEGER NOT NULL,
+                project_id INTEGER NOT NULL,
+                from_status TEXT NOT NULL,
+                to_status TEXT NOT NULL,
+                occurred_at TEXT NOT NULL
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_status_events_node
+            ON status_events(node_type, node_id, occurred_at)
+            """,
+            # WIP の基準値（期間前の増減の合計）を表を読まずに求められるよう遷移を含める
+            """
+            CREATE INDEX IF NOT EXISTS idx_status_events_project
+            ON status_events(node_type, project_id, occurred_at, from_status, to_status)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_status_events_time
+            ON status_events(node_type, occurred_at)
+            """,
+        ],
+    ),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# 一括投入中に外す、派生データ（pending_predecessors / progress_rollups）を維持するトリガー
+# （LIKE パターン。rebuild_derived() で再計算できるものに限る）
+DERIVED_TRIGGER_PATTERNS = (r"trg\_%\_ready\_%", r"trg\_%\_rollup\_%")
+
+
+def rebuild_derived(conn: sqlite3.Connection, project_id: Optional[int] = None) -> None:
+    """
+    pending_predecessors と progress_rollups を集合演算で再計算
+
+    マイグレーションの初期値の計算と同じSQLを使用します。
+
+    Args:
+        conn: コネクション
+        project_id: 再計算するプロジェクト（Noneの場合はDB全体）。
+            指定する場合、そのプロジェクト外のノードの先行ノード・件数は
+            変わっていないこと
+    """
+    if project_id is None:
+        conn.execute(_backfill_pending_sql("tasks", "task_dependencies"))
+        conn.execute(_backfill_pending_sql("subtasks", "subtask_dependencies"))
+        conn.execute("DELETE FROM progress_rollups")
+        conn.execute(_backfill_rollups_sql())
+        return
+
+    params = {"project_id": project_id}
+    conn.execute(
+        _backfill_pending_sql(
+            "tasks", "task_dependencies", "WHERE project_id = :project_id"
+        ),
+        params,
+    )
+    conn.execute(
+        _backfill_pending_sql(
+            "subtasks",
+            "subtask_dependencies",
+            "WHERE task_id IN (SELECT id FROM tasks WHERE project_id = :project_id)",
+        ),
+        params,
+    )
+    conn.execute(
+        """
+        DELETE FROM progress_rollups
+        WHERE (scope = 'project' AND scope_id = :project_id)
+           OR (scope = 'subproject'
+               AND scope_id IN (SELECT id FROM subprojects WHERE project_id = :project_id))
+        """,
+        params,
+    )
+    conn.execute(_backfill_rollups_sql("t.project_id = :project_id"), params)
+
+
+@dataclass
+class BulkLoadScope:
+    """bulk_load() のスコープ終了時に再計算する範囲"""
+
+    project_id: Optional[int] = None
+    """投入先のプロジェクト（Noneの場合はDB全体を再計算）"""
+
+
+@contextmanager
+def bulk_load(conn: sqlite3.Connection) -> Iterator[BulkLoadScope]:
+    """
+    派生データのトリガーを外して一括投入するスコープ
+
+    行ごとに発火するトリガーの代わりに、スコープの終了時に rebuild_derived() で
+    1回だけ再計算し、トリガーを元に戻します。トリガーの削除・再作成も投入と
+    同じトランザクションに含まれるため、呼び出し側のトランザクション内で使用してください
+    （ロールバックした場合はトリガーも元に戻ります）。
+
+    Args:
+        conn: コネクション（トランザクション中であること）
+
+    Yields:
+        BulkLoadScope: 投入先が1プロジェクトに限られる場合、project_id を設定すると
+            再計算をそのプロジェクトに限定します
+    """
+    condition = " OR ".join("name LIKE ? ESCAPE '\\'" for _ in DERIVED_TRIGGER_PATTERNS)
+    triggers = conn.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND ({condition})",
+        DERIVED_TRIGGER_PATTERNS,
+    ).fetchall()
+    for name, _sql in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+
+    scope = BulkLoadScope()
+    try:
+        yield scope
+        rebuild_derived(conn, scope.project_id)
+    finally:
+        existing = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+        for name, sql in triggers:
+            if name not in existing:
+                conn.execute(sql)
+
+
+def get_current_version(conn: sqlite3.Connection) -> Optional[int]:
+    """
+    適用済みの最新スキーマバージョンを取得
+
+    Args:
+        conn: コネクション
+
+    Returns:
+        Optional[int]: スキーマバージョン（未初期化の場合None）
+    """
+    row = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"
+    ).fetchone()
+    if row is None:
+        return None
+
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] if row else None
+
+
+def apply_migrations(conn: sqlite3.Connection) -> list[int]:
+    """
+    未適用のマイグレーションをバージョン順に適用
+
+    各バージョンは1トランザクションで適用し、失敗した場合はそのバージョンを
+    ロールバックして例外を送出します。未初期化のDBには何もしません。
+
+    Args:
+        conn: コネクション
+
+    Returns:
+        list[int]: 今回適用したバージョンのリスト
+
+    Raises:
+        sqlite3.Error: マイグレーションの適用に失敗した場合
+    """
+    current = get_current_version(conn)
+    if current is None:
+        return []
+
+    applied = []
+    for version, _description, statements in MIGRATIONS:
+        if version <= current:
+            continue
+
+        try:
+            conn.execute("BEGIN")
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT INTO schema_version (version) VALUES (?)", (version,)
+            )
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+        applied.append(version)
+
+    return applied
@@ -5,7 +5,9 @@ ProjectManagementTool のデータモデル
 これらのモデルはデータベースレコードの型安全な表現を提供します。
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .exceptions import DependencyRejectionReason, StatusTransitionFailureReason
 
 
 @dataclass
@@ -126,6 +128,164 @@ class Dependency:
     created_at: str
 
 
+@dataclass
+class RejectedDependency:
+    """
+    一括追加で拒否された依存関係
+
+    Attributes:
+        predecessor_id: 先行ノードのID
+        successor_id: 後続ノードのID
+        reason: 拒否理由コード
+        message: 表示用メッセージ
+    """
+    predecessor_id: int
+    successor_id: int
+    reason: DependencyRejectionReason
+    message: str
+
+
+@dataclass
+class AddDependenciesResult:
+    """
+    DependencyManager.add_task_dependencies() / add_subtask_dependencies() の戻り値
+
+    Attributes:
+        added: 追加された依存関係 (入力順)
+        rejected: 拒否された依存関係と理由 (入力順)
+    """
+    added: list[Dependency] = field(default_factory=list)
+    rejected: list[RejectedDependency] = field(default_factory=list)
+
+    @property
+    def has_rejections(self) -> bool:
+        """拒否された依存関係が存在するか"""
+        return len(self.rejected) > 0
+
+
+@dataclass
+class StatusChange:
+    """
+    一括ステータス更新の1件分の変更
+
+    Attributes:
+        node_type: ノードタイプ ('task' または 'subtask')
+        node_id: TaskIDまたはSubTaskID
+        status: 新しいステータス
+    """
+    node_type: str
+    node_id: int
+    status: str
+
+
+@dataclass
+class RejectedStatusChange:
+    """
+    一括ステータス更新で拒否された変更
+
+    Attributes:
+        change: 拒否された変更
+        reason: 拒否理由コード
+        message: 表示用メッセージ
+        details: 詳細情報 (未完了の先行ノード・子SubTask等、StatusTransitionError.details と同じ形式)
+    """
+    change: StatusChange
+    reason: StatusTransitionFailureReason
+    message: str
+    details: dict = field(default_factory=dict)
+
+
+@dataclass
+class UpdateStatusesResult:
+    """
+    StatusManager.update_statuses() の戻り値
+
+    Attributes:
+        applied: 適用された変更 (適用順 = SubTask → Task、先行 → 後続)
+        rejected: 拒否された変更と理由 (入力順)
+    """
+    applied: list[StatusChange] = field(default_factory=list)
+    rejected: list[RejectedStatusChange] = field(default_factory=list)
+
+    @property
+    def has_rejections(self) -> bool:
+        """拒否された変更が存在するか"""
+        return len(self.rejected) > 0
+
+
+@dataclass
+class ProgressRollup:
+    """
+    Project / SubProject 配下のステータス別件数（progress_rollups から読み込む）
+
+    Attributes:
+        task_counts: Taskのステータス別件数 (例: {"DONE": 3, "IN_PROGRESS": 1})
+        subtask_counts: SubTaskのステータス別件数
+    """
+    task_counts: dict[str, int] = field(default_factory=dict)
+    subtask_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Task と SubTask の合計件数"""
+        return sum(self.task_counts.values()) + sum(self.subtask_counts.values())
+
+    @property
+    def done(self) -> int:
+        """DONE の Task と SubTask の合計件数"""
+        return self.task_counts.get("DONE", 0) + self.subtask_counts.get("DONE", 0)
+
+    @property
+    def percent(self) -> float | None:
+        """進捗率（DONE件数 / 合計件数 × 100、対象が0件の場合None）"""
+        if self.total == 0:
+            return None
+        return self.done * 100.0 / self.total
+
+
+@dataclass
+class TaskNode:
+    """
+    階層ツリー内のTaskとその子SubTaskを表す
+
+    Attributes:
+        task: Task本体
+        subtasks: order_index順に並べられた子SubTask一覧
+    """
+    task: Task
+    subtasks: list[SubTask] = field(default_factory=list)
+
+
+@dataclass
+class SubProjectNode:
+    """
+    階層ツリー内のSubProjectとその配下のTaskを表す
+
+    Attributes:
+        subproject: SubProject本体
+        tasks: order_index順に並べられた配下Task一覧
+    """
+    subproject: SubProject
+    tasks: list[TaskNode] = field(default_factory=list)
+
+
+@dataclass
+class ProjectTree:
+    """
+    Project→SubProject→Task→SubTask の4階層ツリーを表す
+
+    ProjectRepository.load_tree() が固定回数のクエリで組み立てて返します。
+
+    Attributes:
+        project: Project本体
+        subprojects: order_index順に並べられたSubProject一覧
+        direct_tasks: Project直下のTask一覧 (subproject_id = NULL)
+    """
+    project: Project
+    subprojects: list[SubProjectNode] = field(default_factory=list)
+    direct_tasks: list[TaskNode] = field(default_factory=list)
+
+
 # ============================================================
 # Phase 5: テンプレート機能関連モデル
 # ============================================================
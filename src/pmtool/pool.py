@@ -0,0 +1,165 @@
+"""
+コネクションプール
+
+Database が内部で使用する、スレッド間でコネクションを共有するための仕組みを提供します。
+
+- 読み取り: 上限付きの読み取り専用コネクションの集合を、スレッド単位で貸し出します。
+  同じスレッドで入れ子に借りた場合は同じコネクションを返します。
+- 書き込み: 書き込み用コネクションは1本のみで、WriterQueue で到着順に直列化します。
+  同一プロセス内の書き込みが同時に走らないため、'database is locked' を待つことがありません。
+"""
+
+import sqlite3
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class WriterQueue:
+    """
+    書き込みの順番待ち
+
+    到着順（FIFO）に1スレッドずつ書き込み権を与えるロックです。
+    権利を持つスレッドは入れ子で acquire() でき、同じ回数 release() すると解放されます。
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._waiters: deque[object] = deque()
+        self._owner: Optional[int] = None
+        self._depth = 0
+
+    def acquire(self) -> int:
+        """
+        書き込み権を取得（順番が来るまで待機）
+
+        Returns:
+            int: 取得後の入れ子の深さ（1の場合は最外側）
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return self._depth
+
+            ticket = object()
+            self._waiters.append(ticket)
+            while self._owner is not None or self._waiters[0] is not ticket:
+                self._cond.wait()
+            self._waiters.popleft()
+            self._owner = me
+            self._depth = 1
+            return self._depth
+
+    def release(self) -> None:
+        """
+        書き込み権を解放
+
+        Raises:
+            RuntimeError: 書き込み権を持たないスレッドから呼ばれた場合
+        """
+        with self._cond:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("書き込み権を持たないスレッドから release() されました")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+
+    @property
+    def waiting(self) -> int:
+        """順番待ちのスレッド数"""
+        with self._cond:
+            return len(self._waiters)
+
+
+class ConnectionPool:
+    """
+    読み取り専用コネクションのプールと書き込みの順番待ち
+
+    書き込み用コネクション自体は Database が保持し、
+    このクラスは読み取りコネクションの貸し出しと WriterQueue を管理します。
+    """
+
+    def __init__(
+        self,
+        reader_factory: Callable[[], sqlite3.Connection],
+        max_readers: int = 4,
+    ):
+        """
+        Args:
+            reader_factory: 読み取り専用コネクションを作成する関数
+                （スレッド間で受け渡すため check_same_thread=False で作成すること）
+            max_readers: 同時に貸し出す読み取りコネクションの上限
+
+        Raises:
+            ValueError: max_readers が1未満の場合
+        """
+        if max_readers < 1:
+            raise ValueError(f"max_readers は1以上を指定してください: {max_readers}")
+
+        self.max_readers = max_readers
+        self.writer_queue = WriterQueue()
+        self._reader_factory = reader_factory
+        self._slots = threading.BoundedSemaphore(max_readers)
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._readers: list[sqlite3.Connection] = []
+        self._local = threading.local()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        読み取り専用コネクションを借りる
+
+        上限まで貸し出し中の場合は返却を待ちます。
+        同じスレッドで入れ子に呼んだ場合は、既に借りているコネクションを返します。
+
+        Yields:
+            sqlite3.Connection: 読み取り専用コネクション
+        """
+        held = getattr(self._local, "reader", None)
+        if held is not None:
+            yield held
+            return
+
+        self._slots.acquire()
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._reader_factory()
+                with self._lock:
+                    self._readers.append(conn)
+
+            self._local.reader = conn
+            try:
+                yield conn
+            finally:
+                self._local.reader = None
+                # 読み取りトランザクションを残したまま返却しない
+                if conn.in_transaction:
+                    conn.rollback()
+                with self._lock:
+                    closed = conn not in self._readers
+                    if not closed:
+                        self._idle.append(conn)
+                # 貸し出し中に close() された場合はここで閉じる
+                if closed:
+                    conn.close()
+        finally:
+            self._slots.release()
+
+    @property
+    def reader_count(self) -> int:
+        """作成済みの読み取りコネクション数"""
+        with self._lock:
+            return len(self._readers)
+
+    def close(self) -> None:
+        """作成済みの読み取りコネクションをすべて閉じる（以降の reader() では再作成される）"""
+        with self._lock:
+            readers, self._readers, self._idle = self._readers, [], []
+        for conn in readers:
+            conn.close()
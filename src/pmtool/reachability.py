@@ -0,0 +1,186 @@
+"""
+到達可能性インデックス（推移閉包テーブル）
+
+このモジュールは依存関係の推移閉包を保持するテーブル
+task_reachability / subtask_reachability を管理します。
+インデックスは任意機能で、`pmtool deps reindex` で作成・再構築されるまでは存在しません。
+
+一度作成すると、依存テーブルへの INSERT / DELETE トリガーで差分更新されるため、
+「AからBへ到達可能か」は主キー参照1回、「Aの全後続ノード」はインデックス読み取り1回で
+求められます。
+
+削除時の差分更新は DAG を前提としています:
+    エッジ x → y を削除したとき、影響を受けるのは
+    A = {x とその祖先} × D = {y とその子孫} の組のみです。
+    これらをいったん削除し、「A内ノードから (残った閉包で) 到達できる w」→ 残存エッジ w → z →
+    「(残った閉包で) D内ノードへ到達できる z」 という形の経路が存在する組だけを再挿入します。
+    DAGでは A と D が交わらないため、どの経路にも A から出る最後のエッジがあり、
+    その前後の区間は削除対象外の閉包で表されることから、この再挿入で過不足なく復元されます。
+"""
+
+import sqlite3
+
+from .graph import dependency_table
+
+REACHABILITY_TABLES = {
+    "task": "task_reachability",
+    "subtask": "subtask_reachability",
+}
+
+
+def reachability_table(dep_type: str) -> str:
+    """
+    依存タイプに対応する到達可能性テーブル名を返す
+
+    Args:
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+
+    Returns:
+        str: テーブル名
+
+    Raises:
+        ValueError: 不正な dep_type の場合
+    """
+    try:
+        return REACHABILITY_TABLES[dep_type]
+    except KeyError:
+        raise ValueError(f"不正な dep_type: {dep_type}") from None
+
+
+def _ddl_statements(dep_type: str) -> list[str]:
+    """到達可能性テーブル・インデックス・トリガーのDDLを返す"""
+    reach = reachability_table(dep_type)
+    deps = dependency_table(dep_type)
+
+    ancestors_of_old_pred = f"""(
+                SELECT OLD.predecessor_id
+                UNION
+                SELECT ancestor_id FROM {reach} WHERE descendant_id = OLD.predecessor_id
+            )"""
+    descendants_of_old_succ = f"""(
+                SELECT OLD.successor_id
+                UNION
+                SELECT descendant_id FROM {reach} WHERE ancestor_id = OLD.successor_id
+            )"""
+
+    return [
+        f"""
+        CREATE TABLE IF NOT EXISTS {reach} (
+            ancestor_id INTEGER NOT NULL,
+            descendant_id INTEGER NOT NULL,
+            PRIMARY KEY (ancestor_id, descendant_id)
+        ) WITHOUT ROWID
+        """,
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{reach}_descendant
+        ON {reach}(descendant_id, ancestor_id)
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{reach}_insert
+        AFTER INSERT ON {deps}
+        BEGIN
+            INSERT OR IGNORE INTO {reach} (ancestor_id, descendant_id)
+            SELECT a.node_id, d.node_id
+            FROM (
+                SELECT NEW.predecessor_id AS node_id
+                UNION
+                SELECT ancestor_id FROM {reach} WHERE descendant_id = NEW.predecessor_id
+            ) AS a,
+            (
+                SELECT NEW.successor_id AS node_id
+                UNION
+                SELECT descendant_id FROM {reach} WHERE ancestor_id = NEW.successor_id
+            ) AS d;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{reach}_delete
+        AFTER DELETE ON {deps}
+        BEGIN
+            DELETE FROM {reach}
+            WHERE ancestor_id IN {ancestors_of_old_pred}
+              AND descendant_id IN {descendants_of_old_succ};
+
+            INSERT OR IGNORE INTO {reach} (ancestor_id, descendant_id)
+            SELECT l.ancestor_id, r.descendant_id
+            FROM (
+                SELECT ancestor_id, descendant_id FROM {reach}
+                WHERE ancestor_id IN {ancestors_of_old_pred}
+                UNION ALL
+                SELECT node_id, node_id FROM (
+                    SELECT OLD.predecessor_id AS node_id
+                    UNION
+                    SELECT ancestor_id FROM {reach} WHERE descendant_id = OLD.predecessor_id
+                )
+            ) AS l
+            JOIN {deps} AS e ON e.predecessor_id = l.descendant_id
+            JOIN (
+                SELECT ancestor_id, descendant_id FROM {reach}
+                WHERE descendant_id IN {descendants_of_old_succ}
+                UNION ALL
+                SELECT node_id, node_id FROM (
+                    SELECT OLD.successor_id AS node_id
+                    UNION
+                    SELECT descendant_id FROM {reach} WHERE ancestor_id = OLD.successor_id
+                )
+            ) AS r ON r.ancestor_id = e.successor_id;
+        END
+        """,
+    ]
+
+
+def has_reachability_index(conn: sqlite3.Connection, dep_type: str) -> bool:
+    """
+    到達可能性インデックスが作成済みか判定
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+
+    Returns:
+        bool: 作成済みの場合True
+    """
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (reachability_table(dep_type),),
+    ).fetchone()
+    return row is not None
+
+
+def rebuild_reachability_index(conn: sqlite3.Connection, dep_type: str) -> int:
+    """
+    到達可能性インデックスを作成（未作成の場合）し、依存テーブルから全件再構築
+
+    コミットは呼び出し側で行います。
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+
+    Returns:
+        int: 到達可能なノード組の件数
+    """
+    reach = reachability_table(dep_type)
+    deps = dependency_table(dep_type)
+
+    cursor = conn.cursor()
+    for statement in _ddl_statements(dep_type):
+        cursor.execute(statement)
+
+    cursor.execute(f"DELETE FROM {reach}")
+    cursor.execute(
+        f"""
+        INSERT INTO {reach} (ancestor_id, descendant_id)
+        WITH RECURSIVE closure(ancestor_id, descendant_id) AS (
+            SELECT predecessor_id, successor_id FROM {deps}
+            UNION
+            SELECT c.ancestor_id, e.successor_id
+            FROM closure AS c
+            JOIN {deps} AS e ON e.predecessor_id = c.descendant_id
+        )
+        SELECT ancestor_id, descendant_id FROM closure
+        """
+    )
+
+    cursor.execute(f"SELECT COUNT(*) FROM {reach}")
+    return cursor.fetchone()[0]
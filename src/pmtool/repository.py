@@ -5,13 +5,23 @@ CRUD操作リポジトリ
 データベースCRUD操作を提供します。
 """
 
+import json
 import sqlite3
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
 
 from .database import Database
 from .exceptions import ConstraintViolationError, DeletionError, ValidationError
-from .models import Project, SubProject, Task, SubTask
+from .models import (
+    ProgressRollup,
+    Project,
+    ProjectTree,
+    SubProject,
+    SubProjectNode,
+    SubTask,
+    Task,
+    TaskNode,
+)
 from .validators import (
     validate_description,
     validate_name,
@@ -30,6 +40,287 @@ def _now() -> str:
     return datetime.utcnow().isoformat()
 
 
+def _build_task_nodes(
+    task_rows: list[sqlite3.Row], subtask_rows: list[sqlite3.Row]
+) -> list[TaskNode]:
+    """
+    Task行とSubTask行からTaskNodeのリストを組み立てる
+
+    task_rows / subtask_rows はそれぞれ表示順に並べ済みであることを前提とし、
+    SubTaskは親TaskIDでグループ化して各TaskNodeに振り分けます。
+
+    Args:
+        task_rows: tasksテーブルの行 (order_index順)
+        subtask_rows: subtasksテーブルの行 (task_id, order_index順)
+
+    Returns:
+        list[TaskNode]: task_rowsと同じ順序のTaskNode一覧
+    """
+    nodes = [
+        TaskNode(
+            task=Task(
+                id=row["id"],
+                project_id=row["project_id"],
+                subproject_id=row["subproject_id"],
+                name=row["name"],
+                description=row["description"],
+                status=row["status"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+        )
+        for row in task_rows
+    ]
+    node_by_task_id = {node.task.id: node for node in nodes}
+
+    for row in subtask_rows:
+        node = node_by_task_id.get(row["task_id"])
+        if node is None:
+            continue
+        node.subtasks.append(
+            SubTask(
+                id=row["id"],
+                task_id=row["task_id"],
+                name=row["name"],
+                description=row["description"],
+                status=row["status"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+        )
+
+    return nodes
+
+
+def _validate_items(
+    items: Iterable[Union[str, Mapping[str, Any]]], label: str
+) -> list[tuple[str, Optional[str], str]]:
+    """
+    create_many の入力をすべて検証する
+
+    Args:
+        items: 名前、または name（必須）・description・status をキーに持つ辞書の列
+        label: エラーメッセージ用のエンティティ名（'Task' / 'SubTask'）
+
+    Returns:
+        list[tuple[str, Optional[str], str]]: (名前, 説明, ステータス) のリスト
+
+    Raises:
+        ValidationError: 入力値が不正な場合
+        ConstraintViolationError: 入力内で名前が重複している場合
+    """
+    validated = []
+    seen: set[str] = set()
+    for item in items:
+        if isinstance(item, str):
+            item = {"name": item}
+        name = validate_name(item.get("name"))
+        if name in seen:
+            raise ConstraintViolationError(f"{label}名 '{name}' が入力内で重複しています")
+        seen.add(name)
+        validated.append(
+            (
+                name,
+                validate_description(item.get("description")),
+                validate_status(item.get("status", "UNSET")),
+            )
+        )
+    return validated
+
+
+# 連鎖削除で1回のDELETE文が削除する行数の上限
+CASCADE_DELETE_CHUNK_SIZE = 5000
+
+# 連鎖削除の進捗コールバック: (テーブル名, 削除済み件数, 削除対象件数)
+CascadeProgress = Callable[[str, int, int], None]
+
+# 連鎖削除の対象を保持する一時テーブル (temp.pmtool_cascade_<テーブル名>)
+_CASCADE_TABLES = ("subprojects", "tasks", "subtasks")
+
+
+def _collect_cascade_targets(
+    cursor: sqlite3.Cursor,
+    subprojects_sql: str,
+    tasks_sql: str,
+    params: tuple,
+) -> dict[str, int]:
+    """
+    連鎖削除の対象IDを一時テーブルに集め、件数を返す
+
+    IDをPython側のリストやIN句に展開せず、INSERT ... SELECT と副問い合わせで集合として扱うため、
+    対象が数十万件でもバインド変数の上限（SQLITE_MAX_VARIABLE_NUMBER）に達しません。
+    一時テーブルの seq は削除順の連番です（SubProjectは深い階層から順に並べます）。
+
+    Args:
+        cursor: カーソル
+        subprojects_sql: 削除対象のSubProjectの (id, depth) を返すSELECT文
+        tasks_sql: 削除対象のTaskのIDを返すSELECT文
+            （temp.pmtool_cascade_subprojects を参照できます）
+        params: 両方のSELECT文に渡すパラメータ
+
+    Returns:
+        dict[str, int]: 'subprojects', 'tasks', 'subtasks', 'task_dependencies',
+            'subtask_dependencies' の件数
+    """
+    for table in _CASCADE_TABLES:
+        cursor.execute(f"DROP TABLE IF EXISTS temp.pmtool_cascade_{table}")
+        cursor.execute(
+            f"""
+            CREATE TEMP TABLE pmtool_cascade_{table} (
+                seq INTEGER PRIMARY KEY,
+                id INTEGER NOT NULL UNIQUE
+            )
+            """
+        )
+
+    cursor.execute(
+        f"""
+        INSERT INTO temp.pmtool_cascade_subprojects (id)
+        SELECT id FROM ({subprojects_sql}) ORDER BY depth DESC, id
+        """,
+        params,
+    )
+    cursor.execute(
+        f"INSERT INTO temp.pmtool_cascade_tasks (id) SELECT id FROM ({tasks_sql}) ORDER BY id",
+        params,
+    )
+    cursor.execute(
+        """
+        INSERT INTO temp.pmtool_cascade_subtasks (id)
+        SELECT st.id FROM subtasks st
+        JOIN temp.pmtool_cascade_tasks t ON st.task_id = t.id
+        ORDER BY st.id
+        """
+    )
+
+    cursor.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM temp.pmtool_cascade_subprojects),
+            (SELECT COUNT(*) FROM temp.pmtool_cascade_tasks),
+            (SELECT COUNT(*) FROM temp.pmtool_cascade_subtasks),
+            (SELECT COUNT(*) FROM task_dependencies
+             WHERE predecessor_id IN (SELECT id FROM temp.pmtool_cascade_tasks)
+                OR successor_id IN (SELECT id FROM temp.pmtool_cascade_tasks)),
+            (SELECT COUNT(*) FROM subtask_dependencies
+             WHERE predecessor_id IN (SELECT id FROM temp.pmtool_cascade_subtasks)
+                OR successor_id IN (SELECT id FROM temp.pmtool_cascade_subtasks))
+        """
+    )
+    row = cursor.fetchone()
+    return {
+        "subprojects": row[0],
+        "tasks": row[1],
+        "subtasks": row[2],
+        "task_dependencies": row[3],
+        "subtask_dependencies": row[4],
+    }
+
+
+def _count_cascade_targets(
+    cursor: sqlite3.Cursor,
+    subprojects_sql: str,
+    tasks_sql: str,
+    params: tuple,
+) -> dict[str, int]:
+    """
+    連鎖削除の対象件数のみを取得（dry-run用）
+
+    _collect_cascade_targets() をSAVEPOINTで囲んで最後に取り消すため、
+    一時テーブルへの書き込みを含めて何も残さず、トランザクション外で呼んだ場合は
+    トランザクションも開いたままにしません。
+
+    Args:
+        cursor: カーソル
+        subprojects_sql: _collect_cascade_targets() と同じ
+        tasks_sql: _collect_cascade_targets() と同じ
+        params: _collect_cascade_targets() と同じ
+
+    Returns:
+        dict[str, int]: _collect_cascade_targets() と同じ件数
+    """
+    cursor.execute("SAVEPOINT pmtool_cascade_dry_run")
+    try:
+        return _collect_cascade_targets(cursor, subprojects_sql, tasks_sql, params)
+    finally:
+        cursor.execute("ROLLBACK TO pmtool_cascade_dry_run")
+        cursor.execute("RELEASE pmtool_cascade_dry_run")
+
+
+def _delete_cascade_targets(
+    cursor: sqlite3.Cursor,
+    counts: dict[str, int],
+    chunk_size: int,
+    on_progress: Optional[CascadeProgress],
+) -> None:
+    """
+    一時テーブルに集めた対象を子→親の順に chunk_size 件ずつ削除
+
+    依存関係は ON DELETE CASCADE により自動削除されます。
+
+    Args:
+        cursor: カーソル
+        counts: _collect_cascade_targets() が返した件数
+        chunk_size: 1回のDELETE文で削除する件数
+        on_progress: 1チャンク削除するごとに呼ばれるコールバック
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size は1以上である必要があります: {chunk_size}")
+
+    for table in reversed(_CASCADE_TABLES):
+        total = counts[table]
+        for start in range(0, total, chunk_size):
+            end = min(start + chunk_size, total)
+            cursor.execute(
+                f"""
+                DELETE FROM {table} WHERE id IN (
+                    SELECT id FROM temp.pmtool_cascade_{table} WHERE seq > ? AND seq <= ?
+                )
+                """,
+                (start, end),
+            )
+            if on_progress is not None:
+                on_progress(table, end, total)
+
+
+def _drop_cascade_targets(cursor: sqlite3.Cursor) -> None:
+    """連鎖削除の一時テーブルを削除"""
+    for table in _CASCADE_TABLES:
+        cursor.execute(f"DROP TABLE IF EXISTS temp.pmtool_cascade_{table}")
+
+
+def _load_progress(
+    cursor: sqlite3.Cursor, scope: str, id_sql: str, params: Union[list, tuple]
+) -> dict[int, ProgressRollup]:
+    """
+    progress_rollups からステータス別件数を読み込む
+
+    Args:
+        cursor: カーソル
+        scope: 'project' または 'subproject'
+        id_sql: 対象の scope_id を返すサブクエリ
+        params: サブクエリのパラメータ
+
+    Returns:
+        dict[int, ProgressRollup]: scope_id → 件数（件数0の行は含めない）
+    """
+    cursor.execute(
+        f"""
+        SELECT scope_id, node_type, status, count FROM progress_rollups
+        WHERE scope = ? AND scope_id IN ({id_sql}) AND count > 0
+        """,
+        [scope, *params],
+    )
+    result: dict[int, ProgressRollup] = {}
+    for scope_id, node_type, status, count in cursor.fetchall():
+        rollup = result.setdefault(scope_id, ProgressRollup())
+        counts = rollup.task_counts if node_type == "task" else rollup.subtask_counts
+        counts[status] = count
+    return result
+
+
 class ProjectRepository:
     """
     Projectエンティティのリポジトリ
@@ -86,7 +377,7 @@ class ProjectRepository:
                 (name, description, next_order_index, now, now),
             )
             project_id = cursor.lastrowid
-            conn.commit()
+            self.db.commit(conn)
 
             return Project(
                 id=project_id,
@@ -98,10 +389,10 @@ class ProjectRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"プロジェクトの作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def get_by_id(self, project_id: int) -> Optional[Project]:
@@ -131,6 +422,39 @@ class ProjectRepository:
             updated_at=row["updated_at"],
         )
 
+    def get_by_ids(self, project_ids: Iterable[int]) -> dict[int, Project]:
+        """
+        複数のProjectを1回のクエリで取得
+
+        Args:
+            project_ids: ProjectIDの列（重複可）
+
+        Returns:
+            dict[int, Project]: ID → Project（存在しないIDは含まれない）
+        """
+        ids = sorted(set(project_ids))
+        if not ids:
+            return {}
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT * FROM projects WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),),
+        )
+
+        return {
+            row["id"]: Project(
+                id=row["id"],
+                name=row["name"],
+                description=row["description"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in cursor.fetchall()
+        }
+
     def get_all(self) -> list[Project]:
         """
         すべてのProjectを取得
@@ -155,6 +479,105 @@ class ProjectRepository:
             for row in rows
         ]
 
+    def get_progress(
+        self, project_ids: Optional[Iterable[int]] = None
+    ) -> dict[int, ProgressRollup]:
+        """
+        Projectごとのステータス別件数を取得
+
+        トリガーで維持される集計表 (progress_rollups) を読むだけで、
+        Task / SubTask は走査しません。
+
+        Args:
+            project_ids: 対象ProjectIDの列（Noneの場合は全Project）
+
+        Returns:
+            dict[int, ProgressRollup]: ProjectID → 件数（Task / SubTask のないProjectは含まれない）
+        """
+        cursor = self.db.connect().cursor()
+        if project_ids is None:
+            return _load_progress(cursor, "project", "SELECT id FROM projects", [])
+        return _load_progress(
+            cursor,
+            "project",
+            "SELECT value FROM json_each(?)",
+            [json.dumps(sorted(set(project_ids)))],
+        )
+
+    def load_tree(self, project_id: int) -> Optional[ProjectTree]:
+        """
+        Project配下の4階層ツリーをまとめて取得
+
+        SubProject・Task・SubTaskをそれぞれ1回ずつ（合計4クエリ）読み込み、
+        メモリ上で階層構造を組み立てます。SubProjectやTaskの件数に関わらず
+        クエリ回数は一定です。
+
+        Args:
+            project_id: プロジェクトID
+
+        Returns:
+            ProjectTree | None: 組み立てられたツリー、Projectが存在しない場合は None
+        """
+        project = self.get_by_id(project_id)
+        if not project:
+            return None
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT * FROM subprojects WHERE project_id = ? ORDER BY order_index, id",
+            (project_id,),
+        )
+        subproject_rows = cursor.fetchall()
+
+        cursor.execute(
+            "SELECT * FROM tasks WHERE project_id = ? ORDER BY order_index, id",
+            (project_id,),
+        )
+        task_rows = cursor.fetchall()
+
+        cursor.execute(
+            """
+            SELECT st.* FROM subtasks st
+            INNER JOIN tasks t ON st.task_id = t.id
+            WHERE t.project_id = ?
+            ORDER BY st.task_id, st.order_index, st.id
+            """,
+            (project_id,),
+        )
+        subtask_rows = cursor.fetchall()
+
+        task_nodes = _build_task_nodes(task_rows, subtask_rows)
+
+        subproject_nodes = [
+            SubProjectNode(
+                subproject=SubProject(
+                    id=row["id"],
+                    project_id=row["project_id"],
+                    parent_subproject_id=row["parent_subproject_id"],
+                    name=row["name"],
+                    description=row["description"],
+                    order_index=row["order_index"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                )
+            )
+            for row in subproject_rows
+        ]
+        node_by_subproject_id = {
+            node.subproject.id: node for node in subproject_nodes
+        }
+
+        tree = ProjectTree(project=project, subprojects=subproject_nodes)
+        for node in task_nodes:
+            if node.task.subproject_id is None:
+                tree.direct_tasks.append(node)
+            elif node.task.subproject_id in node_by_subproject_id:
+                node_by_subproject_id[node.task.subproject_id].tasks.append(node)
+
+        return tree
+
     def update(
         self,
         project_id: int,
@@ -213,7 +636,7 @@ class ProjectRepository:
                 """,
                 (new_name, new_description, now, project_id),
             )
-            conn.commit()
+            self.db.commit(conn)
 
             return Project(
                 id=project_id,
@@ -225,10 +648,10 @@ class ProjectRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"プロジェクトの更新に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def delete(self, project_id: int) -> None:
@@ -262,28 +685,36 @@ class ProjectRepository:
 
             # DELETE (FK RESTRICTで保護されているが、念のため明示的にチェック済み)
             cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-            conn.commit()
+            self.db.commit(conn)
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"プロジェクトの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def cascade_delete(
-        self, project_id: int, dry_run: bool = False, conn: Optional[sqlite3.Connection] = None
+        self,
+        project_id: int,
+        dry_run: bool = False,
+        conn: Optional[sqlite3.Connection] = None,
+        chunk_size: int = CASCADE_DELETE_CHUNK_SIZE,
+        on_progress: Optional[CascadeProgress] = None,
     ) -> dict:
         """
         Projectを子要素も含めて連鎖削除（Phase 4 実装）
 
         子SubProject、Task、SubTaskを再帰的に削除します。
         依存関係はON DELETE CASCADEにより自動削除されます。
+        対象は一時テーブルに集合として集め、chunk_size 件ずつ削除します。
 
         Args:
             project_id: プロジェクトID
             dry_run: True の場合、削除対象を収集するのみで実際には削除しない
             conn: 既存のコネクション（トランザクション共有用）
+            chunk_size: 1回のDELETE文で削除する件数
+            on_progress: 進捗コールバック (テーブル名, 削除済み件数, 削除対象件数)
 
         Returns:
             dict: 削除結果 {
@@ -311,110 +742,49 @@ class ProjectRepository:
             if not cursor.fetchone():
                 raise ConstraintViolationError(f"プロジェクトID {project_id} は存在しません")
 
-            # 削除対象の収集
-            # SubProject配下のTaskを取得
-            cursor.execute(
+            # 削除対象の収集（SubProjectは入れ子を含めて階層の深さとともに取得）
+            collect = _count_cascade_targets if dry_run else _collect_cascade_targets
+            counts = collect(
+                cursor,
                 """
+                WITH RECURSIVE tree(id, depth) AS (
+                    SELECT id, 0 FROM subprojects
+                    WHERE project_id = :id AND parent_subproject_id IS NULL
+                    UNION ALL
+                    SELECT sp.id, tree.depth + 1
+                    FROM subprojects sp JOIN tree ON sp.parent_subproject_id = tree.id
+                )
+                SELECT id, depth FROM tree
+                """,
+                """
+                SELECT id FROM tasks WHERE project_id = :id
+                UNION
                 SELECT t.id FROM tasks t
-                INNER JOIN subprojects sp ON t.subproject_id = sp.id
-                WHERE sp.project_id = ?
+                JOIN temp.pmtool_cascade_subprojects sp ON t.subproject_id = sp.id
                 """,
-                (project_id,),
+                {"id": project_id},
             )
-            task_ids_from_subprojects = [row[0] for row in cursor.fetchall()]
-
-            # Project直下のTaskを取得
-            cursor.execute(
-                "SELECT id FROM tasks WHERE project_id = ? AND subproject_id IS NULL",
-                (project_id,),
-            )
-            task_ids_direct = [row[0] for row in cursor.fetchall()]
-
-            all_task_ids = task_ids_from_subprojects + task_ids_direct
-
-            # SubTaskを取得
-            if all_task_ids:
-                placeholders = ",".join("?" * len(all_task_ids))
-                cursor.execute(
-                    f"SELECT id FROM subtasks WHERE task_id IN ({placeholders})",
-                    all_task_ids,
-                )
-                subtask_ids = [row[0] for row in cursor.fetchall()]
-            else:
-                subtask_ids = []
-
-            # SubProjectを取得
-            cursor.execute("SELECT id FROM subprojects WHERE project_id = ?", (project_id,))
-            subproject_ids = [row[0] for row in cursor.fetchall()]
-
-            # 依存関係数を取得
-            if all_task_ids:
-                placeholders = ",".join("?" * len(all_task_ids))
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM task_dependencies
-                    WHERE predecessor_id IN ({placeholders}) OR successor_id IN ({placeholders})
-                    """,
-                    all_task_ids + all_task_ids,
-                )
-                task_dep_count = cursor.fetchone()[0]
-            else:
-                task_dep_count = 0
-
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM subtask_dependencies
-                    WHERE predecessor_id IN ({placeholders}) OR successor_id IN ({placeholders})
-                    """,
-                    subtask_ids + subtask_ids,
-                )
-                subtask_dep_count = cursor.fetchone()[0]
-            else:
-                subtask_dep_count = 0
-
-            result = {
-                "projects": 1,
-                "subprojects": len(subproject_ids),
-                "tasks": len(all_task_ids),
-                "subtasks": len(subtask_ids),
-                "task_dependencies": task_dep_count,
-                "subtask_dependencies": subtask_dep_count,
-            }
+            result = {"projects": 1, **counts}
 
             if dry_run:
-                # dry-runモード: SELECTのみなのでrollbackは不要
-                # rollbackは呼び出し元で実施する
+                # dry-runモード: 一時テーブルへの書き込みも含めて取り消し済み
                 return result
 
             # 実削除: 子→親の順で削除
-            # SubTask削除（依存関係は ON DELETE CASCADE で自動削除）
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(f"DELETE FROM subtasks WHERE id IN ({placeholders})", subtask_ids)
-
-            # Task削除（依存関係は ON DELETE CASCADE で自動削除）
-            if all_task_ids:
-                placeholders = ",".join("?" * len(all_task_ids))
-                cursor.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", all_task_ids)
-
-            # SubProject削除
-            if subproject_ids:
-                placeholders = ",".join("?" * len(subproject_ids))
-                cursor.execute(f"DELETE FROM subprojects WHERE id IN ({placeholders})", subproject_ids)
+            _delete_cascade_targets(cursor, counts, chunk_size, on_progress)
+            _drop_cascade_targets(cursor)
 
             # Project削除
             cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return result
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
 
@@ -535,7 +905,7 @@ class SubProjectRepository:
                 "UPDATE projects SET updated_at = ? WHERE id = ?", (now, project_id)
             )
 
-            conn.commit()
+            self.db.commit(conn)
 
             return SubProject(
                 id=subproject_id,
@@ -549,10 +919,10 @@ class SubProjectRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubProjectの作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def get_by_id(self, subproject_id: int) -> Optional[SubProject]:
@@ -584,6 +954,41 @@ class SubProjectRepository:
             updated_at=row["updated_at"],
         )
 
+    def get_by_ids(self, subproject_ids: Iterable[int]) -> dict[int, SubProject]:
+        """
+        複数のSubProjectを1回のクエリで取得
+
+        Args:
+            subproject_ids: SubProjectIDの列（重複可）
+
+        Returns:
+            dict[int, SubProject]: ID → SubProject（存在しないIDは含まれない）
+        """
+        ids = sorted(set(subproject_ids))
+        if not ids:
+            return {}
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT * FROM subprojects WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),),
+        )
+
+        return {
+            row["id"]: SubProject(
+                id=row["id"],
+                project_id=row["project_id"],
+                parent_subproject_id=row["parent_subproject_id"],
+                name=row["name"],
+                description=row["description"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in cursor.fetchall()
+        }
+
     def get_by_project(self, project_id: int) -> list[SubProject]:
         """
         プロジェクトIDですべてのSubProjectを取得
@@ -616,6 +1021,73 @@ class SubProjectRepository:
             for row in rows
         ]
 
+    def get_progress_by_project(self, project_id: int) -> dict[int, ProgressRollup]:
+        """
+        プロジェクト配下のSubProjectごとのステータス別件数を取得
+
+        件数は SubProject 直下の Task とその SubTask を対象とし、
+        集計表 (progress_rollups) を読むだけで Task / SubTask は走査しません。
+
+        Args:
+            project_id: プロジェクトID
+
+        Returns:
+            dict[int, ProgressRollup]: SubProjectID → 件数（Task のないSubProjectは含まれない）
+        """
+        cursor = self.db.connect().cursor()
+        return _load_progress(
+            cursor,
+            "subproject",
+            "SELECT id FROM subprojects WHERE project_id = ?",
+            [project_id],
+        )
+
+    def load_tree(self, subproject_id: int) -> Optional[SubProjectNode]:
+        """
+        SubProject配下のTask/SubTaskツリーをまとめて取得
+
+        Task・SubTaskをそれぞれ1回ずつ（合計3クエリ）読み込み、
+        メモリ上で階層構造を組み立てます。
+
+        Args:
+            subproject_id: SubProjectID
+
+        Returns:
+            SubProjectNode | None: 組み立てられたツリー、SubProjectが存在しない場合は None
+        """
+        subproject = self.get_by_id(subproject_id)
+        if not subproject:
+            return None
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT * FROM tasks
+            WHERE project_id = ? AND subproject_id = ?
+            ORDER BY order_index, id
+            """,
+            (subproject.project_id, subproject_id),
+        )
+        task_rows = cursor.fetchall()
+
+        cursor.execute(
+            """
+            SELECT st.* FROM subtasks st
+            INNER JOIN tasks t ON st.task_id = t.id
+            WHERE t.project_id = ? AND t.subproject_id = ?
+            ORDER BY st.task_id, st.order_index, st.id
+            """,
+            (subproject.project_id, subproject_id),
+        )
+        subtask_rows = cursor.fetchall()
+
+        return SubProjectNode(
+            subproject=subproject,
+            tasks=_build_task_nodes(task_rows, subtask_rows),
+        )
+
     def update(
         self,
         subproject_id: int,
@@ -699,7 +1171,7 @@ class SubProjectRepository:
                 (now, row["project_id"]),
             )
 
-            conn.commit()
+            self.db.commit(conn)
 
             return SubProject(
                 id=subproject_id,
@@ -713,10 +1185,10 @@ class SubProjectRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubProjectの更新に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def delete(self, subproject_id: int) -> None:
@@ -759,32 +1231,40 @@ class SubProjectRepository:
                 (now, row["project_id"]),
             )
 
-            conn.commit()
+            self.db.commit(conn)
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubProjectの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def cascade_delete(
-        self, subproject_id: int, dry_run: bool = False, conn: Optional[sqlite3.Connection] = None
+        self,
+        subproject_id: int,
+        dry_run: bool = False,
+        conn: Optional[sqlite3.Connection] = None,
+        chunk_size: int = CASCADE_DELETE_CHUNK_SIZE,
+        on_progress: Optional[CascadeProgress] = None,
     ) -> dict:
         """
         SubProjectを子要素も含めて連鎖削除（Phase 4 実装）
 
-        子Task、SubTaskを再帰的に削除します。
+        入れ子の子SubProjectと、それらに属するTask、SubTaskを再帰的に削除します。
         依存関係はON DELETE CASCADEにより自動削除されます。
+        対象は一時テーブルに集合として集め、chunk_size 件ずつ削除します。
 
         Args:
             subproject_id: SubProjectID
             dry_run: True の場合、削除対象を収集するのみで実際には削除しない
             conn: 既存のコネクション（トランザクション共有用）
+            chunk_size: 1回のDELETE文で削除する件数
+            on_progress: 進捗コールバック (テーブル名, 削除済み件数, 削除対象件数)
 
         Returns:
             dict: 削除結果 {
-                'subprojects': 削除されるSubProject数,
+                'subprojects': 削除されるSubProject数 (自身と入れ子の子),
                 'tasks': 削除されるTask数,
                 'subtasks': 削除されるSubTask数,
                 'task_dependencies': 削除されるTask依存関係数,
@@ -803,95 +1283,61 @@ class SubProjectRepository:
             cursor = conn.cursor()
 
             # SubProjectの存在確認
-            cursor.execute("SELECT project_id FROM subprojects WHERE id = ?", (subproject_id,))
+            cursor.execute(
+                "SELECT project_id, parent_subproject_id FROM subprojects WHERE id = ?",
+                (subproject_id,),
+            )
             row = cursor.fetchone()
             if not row:
                 raise ConstraintViolationError(f"SubProjectID {subproject_id} は存在しません")
 
-            project_id = row[0]
-
-            # 削除対象の収集
-            # Taskを取得
-            cursor.execute("SELECT id FROM tasks WHERE subproject_id = ?", (subproject_id,))
-            task_ids = [row[0] for row in cursor.fetchall()]
+            project_id, parent_subproject_id = row[0], row[1]
 
-            # SubTaskを取得
-            if task_ids:
-                placeholders = ",".join("?" * len(task_ids))
-                cursor.execute(
-                    f"SELECT id FROM subtasks WHERE task_id IN ({placeholders})",
-                    task_ids,
-                )
-                subtask_ids = [row[0] for row in cursor.fetchall()]
-            else:
-                subtask_ids = []
-
-            # 依存関係数を取得
-            if task_ids:
-                placeholders = ",".join("?" * len(task_ids))
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM task_dependencies
-                    WHERE predecessor_id IN ({placeholders}) OR successor_id IN ({placeholders})
-                    """,
-                    task_ids + task_ids,
-                )
-                task_dep_count = cursor.fetchone()[0]
-            else:
-                task_dep_count = 0
-
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM subtask_dependencies
-                    WHERE predecessor_id IN ({placeholders}) OR successor_id IN ({placeholders})
-                    """,
-                    subtask_ids + subtask_ids,
+            # 削除対象の収集（自身と入れ子の子SubProjectを階層の深さとともに取得）
+            collect = _count_cascade_targets if dry_run else _collect_cascade_targets
+            result = collect(
+                cursor,
+                """
+                WITH RECURSIVE tree(id, depth) AS (
+                    SELECT id, 0 FROM subprojects WHERE id = :id
+                    UNION ALL
+                    SELECT sp.id, tree.depth + 1
+                    FROM subprojects sp JOIN tree ON sp.parent_subproject_id = tree.id
                 )
-                subtask_dep_count = cursor.fetchone()[0]
-            else:
-                subtask_dep_count = 0
-
-            result = {
-                "subprojects": 1,
-                "tasks": len(task_ids),
-                "subtasks": len(subtask_ids),
-                "task_dependencies": task_dep_count,
-                "subtask_dependencies": subtask_dep_count,
-            }
+                SELECT id, depth FROM tree
+                """,
+                """
+                SELECT t.id FROM tasks t
+                JOIN temp.pmtool_cascade_subprojects sp ON t.subproject_id = sp.id
+                """,
+                {"id": subproject_id},
+            )
 
             if dry_run:
-                # dry-runモード: SELECTのみなのでrollbackは不要
-                # rollbackは呼び出し元で実施する
+                # dry-runモード: 一時テーブルへの書き込みも含めて取り消し済み
                 return result
 
             # 実削除: 子→親の順で削除
-            # SubTask削除（依存関係は ON DELETE CASCADE で自動削除）
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(f"DELETE FROM subtasks WHERE id IN ({placeholders})", subtask_ids)
+            _delete_cascade_targets(cursor, result, chunk_size, on_progress)
+            _drop_cascade_targets(cursor)
 
-            # Task削除（依存関係は ON DELETE CASCADE で自動削除）
-            if task_ids:
-                placeholders = ",".join("?" * len(task_ids))
-                cursor.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", task_ids)
-
-            # SubProject削除
-            cursor.execute("DELETE FROM subprojects WHERE id = ?", (subproject_id,))
-
-            # 親プロジェクトの updated_at を更新
+            # 親の updated_at を更新
             now = _now()
+            if parent_subproject_id is not None:
+                cursor.execute(
+                    "UPDATE subprojects SET updated_at = ? WHERE id = ?",
+                    (now, parent_subproject_id),
+                )
             cursor.execute("UPDATE projects SET updated_at = ? WHERE id = ?", (now, project_id))
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return result
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
 
@@ -1022,7 +1468,7 @@ class TaskRepository:
                     "UPDATE projects SET updated_at = ? WHERE id = ?", (now, project_id)
                 )
 
-            conn.commit()
+            self.db.commit(conn)
 
             return Task(
                 id=task_id,
@@ -1037,12 +1483,161 @@ class TaskRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Taskの作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
+    def create_many(
+        self,
+        project_id: int,
+        subproject_id: Optional[int],
+        items: Iterable[Union[str, Mapping[str, Any]]],
+    ) -> list[Task]:
+        """
+        同じ親の下にTaskを一括作成
+
+        create() を繰り返す場合と同じ結果になりますが、件数に関わらず
+        親の存在確認・名前の重複確認・order_index の採番・挿入・親の updated_at 更新を
+        それぞれ1回のクエリで行います。途中で失敗した場合は1件も作成されません。
+
+        Args:
+            project_id: 親プロジェクトID
+            subproject_id: 親SubProjectID (None の場合はプロジェクト直下)
+            items: Task名、または name（必須）・description・status をキーに持つ辞書の列
+
+        Returns:
+            list[Task]: 作成されたTask (入力順、order_index は連番)
+
+        Raises:
+            ValidationError: 入力値が不正な場合
+            ConstraintViolationError: 親が存在しない、または名前が重複している場合
+        """
+        validated = _validate_items(items, "Task")
+        if not validated:
+            return []
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        try:
+            with self.db.transaction():
+                # 親の存在確認
+                if subproject_id is None:
+                    cursor.execute("SELECT id FROM projects WHERE id = ?", (project_id,))
+                    if not cursor.fetchone():
+                        raise ConstraintViolationError(
+                            f"プロジェクトID {project_id} は存在しません"
+                        )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT
+                            EXISTS (SELECT 1 FROM projects WHERE id = ?),
+                            EXISTS (SELECT 1 FROM subprojects WHERE id = ?)
+                        """,
+                        (project_id, subproject_id),
+                    )
+                    project_exists, subproject_exists = cursor.fetchone()
+                    if not project_exists:
+                        raise ConstraintViolationError(
+                            f"プロジェクトID {project_id} は存在しません"
+                        )
+                    if not subproject_exists:
+                        raise ConstraintViolationError(
+                            f"SubProjectID {subproject_id} は存在しません"
+                        )
+
+                # 名前の重複チェック (既存のTaskとの重複を1回で確認)
+                cursor.execute(
+                    """
+                    SELECT name FROM tasks
+                    WHERE project_id = ? AND subproject_id IS ?
+                      AND name IN (SELECT value FROM json_each(?))
+                    LIMIT 1
+                    """,
+                    (project_id, subproject_id, json.dumps([v[0] for v in validated])),
+                )
+                duplicate = cursor.fetchone()
+                if duplicate:
+                    raise ConstraintViolationError(
+                        f"Task名 '{duplicate['name']}' は既に存在します"
+                    )
+
+                # order_index は現在の最大値から連番で割り当てる
+                cursor.execute(
+                    """
+                    SELECT COALESCE(MAX(order_index), -1) + 1
+                    FROM tasks
+                    WHERE project_id = ? AND subproject_id IS ?
+                    """,
+                    (project_id, subproject_id),
+                )
+                first_order_index = cursor.fetchone()[0]
+
+                # INSERT
+                now = _now()
+                cursor.executemany(
+                    """
+                    INSERT INTO tasks
+                    (project_id, subproject_id, name, description, status, order_index, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        (
+                            project_id,
+                            subproject_id,
+                            name,
+                            description,
+                            status,
+                            first_order_index + offset,
+                            now,
+                            now,
+                        )
+                        for offset, (name, description, status) in enumerate(validated)
+                    ),
+                )
+
+                # executemany では lastrowid が取れないため、採番した order_index からIDを引く
+                cursor.execute(
+                    """
+                    SELECT id, order_index FROM tasks
+                    WHERE project_id = ? AND subproject_id IS ? AND order_index >= ?
+                    """,
+                    (project_id, subproject_id, first_order_index),
+                )
+                ids = {row["order_index"]: row["id"] for row in cursor.fetchall()}
+
+                # 親の updated_at を更新
+                if subproject_id is not None:
+                    cursor.execute(
+                        "UPDATE subprojects SET updated_at = ? WHERE id = ?",
+                        (now, subproject_id),
+                    )
+                else:
+                    cursor.execute(
+                        "UPDATE projects SET updated_at = ? WHERE id = ?", (now, project_id)
+                    )
+
+        except sqlite3.IntegrityError as e:
+            raise ConstraintViolationError(f"Taskの作成に失敗しました: {e}")
+
+        return [
+            Task(
+                id=ids[first_order_index + offset],
+                project_id=project_id,
+                subproject_id=subproject_id,
+                name=name,
+                description=description,
+                status=status,
+                order_index=first_order_index + offset,
+                created_at=now,
+                updated_at=now,
+            )
+            for offset, (name, description, status) in enumerate(validated)
+        ]
+
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """
         IDでTaskを取得
@@ -1073,6 +1668,42 @@ class TaskRepository:
             updated_at=row["updated_at"],
         )
 
+    def get_by_ids(self, task_ids: Iterable[int]) -> dict[int, Task]:
+        """
+        複数のTaskを1回のクエリで取得
+
+        Args:
+            task_ids: TaskIDの列（重複可）
+
+        Returns:
+            dict[int, Task]: ID → Task（存在しないIDは含まれない）
+        """
+        ids = sorted(set(task_ids))
+        if not ids:
+            return {}
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT * FROM tasks WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),),
+        )
+
+        return {
+            row["id"]: Task(
+                id=row["id"],
+                project_id=row["project_id"],
+                subproject_id=row["subproject_id"],
+                name=row["name"],
+                description=row["description"],
+                status=row["status"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in cursor.fetchall()
+        }
+
     def get_by_parent(
         self, project_id: int, subproject_id: Optional[int] = None
     ) -> list[Task]:
@@ -1243,7 +1874,7 @@ class TaskRepository:
                     (now, row["project_id"]),
                 )
 
-            conn.commit()
+            self.db.commit(conn)
 
             return Task(
                 id=task_id,
@@ -1258,10 +1889,10 @@ class TaskRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Taskの更新に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def delete(self, task_id: int) -> None:
@@ -1310,13 +1941,13 @@ class TaskRepository:
                     (now, row["project_id"]),
                 )
 
-            conn.commit()
+            self.db.commit(conn)
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Taskの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def delete_with_bridge(self, task_id: int) -> list[tuple[int, int]]:
@@ -1380,14 +2011,14 @@ class TaskRepository:
                     (now, row["project_id"]),
                 )
 
-            conn.commit()
+            self.db.commit(conn)
             return bridged
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"Taskの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def cascade_delete(
@@ -1432,37 +2063,24 @@ class TaskRepository:
             project_id = row[0]
             subproject_id = row[1]
 
-            # 削除対象の収集
-            # SubTaskを取得
-            cursor.execute("SELECT id FROM subtasks WHERE task_id = ?", (task_id,))
-            subtask_ids = [row[0] for row in cursor.fetchall()]
-
-            # 依存関係数を取得
+            # 削除対象の件数（SubTaskは副問い合わせで集合として扱う）
             cursor.execute(
                 """
-                SELECT COUNT(*) FROM task_dependencies
-                WHERE predecessor_id = ? OR successor_id = ?
+                SELECT
+                    (SELECT COUNT(*) FROM subtasks WHERE task_id = :id),
+                    (SELECT COUNT(*) FROM task_dependencies
+                     WHERE predecessor_id = :id OR successor_id = :id),
+                    (SELECT COUNT(*) FROM subtask_dependencies
+                     WHERE predecessor_id IN (SELECT id FROM subtasks WHERE task_id = :id)
+                        OR successor_id IN (SELECT id FROM subtasks WHERE task_id = :id))
                 """,
-                (task_id, task_id),
+                {"id": task_id},
             )
-            task_dep_count = cursor.fetchone()[0]
-
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM subtask_dependencies
-                    WHERE predecessor_id IN ({placeholders}) OR successor_id IN ({placeholders})
-                    """,
-                    subtask_ids + subtask_ids,
-                )
-                subtask_dep_count = cursor.fetchone()[0]
-            else:
-                subtask_dep_count = 0
+            subtask_count, task_dep_count, subtask_dep_count = cursor.fetchone()
 
             result = {
                 "tasks": 1,
-                "subtasks": len(subtask_ids),
+                "subtasks": subtask_count,
                 "task_dependencies": task_dep_count,
                 "subtask_dependencies": subtask_dep_count,
             }
@@ -1474,9 +2092,7 @@ class TaskRepository:
 
             # 実削除: 子→親の順で削除
             # SubTask削除（依存関係は ON DELETE CASCADE で自動削除）
-            if subtask_ids:
-                placeholders = ",".join("?" * len(subtask_ids))
-                cursor.execute(f"DELETE FROM subtasks WHERE id IN ({placeholders})", subtask_ids)
+            cursor.execute("DELETE FROM subtasks WHERE task_id = ?", (task_id,))
 
             # Task削除（依存関係は ON DELETE CASCADE で自動削除）
             cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
@@ -1489,13 +2105,13 @@ class TaskRepository:
                 cursor.execute("UPDATE projects SET updated_at = ? WHERE id = ?", (now, project_id))
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return result
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
 
@@ -1580,7 +2196,7 @@ class SubTaskRepository:
             # 親Taskの updated_at を更新
             cursor.execute("UPDATE tasks SET updated_at = ? WHERE id = ?", (now, task_id))
 
-            conn.commit()
+            self.db.commit(conn)
 
             return SubTask(
                 id=subtask_id,
@@ -1594,12 +2210,122 @@ class SubTaskRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTaskの作成に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
+    def create_many(
+        self,
+        task_id: int,
+        items: Iterable[Union[str, Mapping[str, Any]]],
+    ) -> list[SubTask]:
+        """
+        同じTaskの下にSubTaskを一括作成
+
+        create() を繰り返す場合と同じ結果になりますが、件数に関わらず
+        親の存在確認・名前の重複確認・order_index の採番・挿入・親の updated_at 更新を
+        それぞれ1回のクエリで行います。途中で失敗した場合は1件も作成されません。
+
+        Args:
+            task_id: 親TaskID
+            items: SubTask名、または name（必須）・description・status をキーに持つ辞書の列
+
+        Returns:
+            list[SubTask]: 作成されたSubTask (入力順、order_index は連番)
+
+        Raises:
+            ValidationError: 入力値が不正な場合
+            ConstraintViolationError: 親Taskが存在しない、または名前が重複している場合
+        """
+        validated = _validate_items(items, "SubTask")
+        if not validated:
+            return []
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        try:
+            with self.db.transaction():
+                # 親Taskの存在確認
+                cursor.execute("SELECT id FROM tasks WHERE id = ?", (task_id,))
+                if not cursor.fetchone():
+                    raise ConstraintViolationError(f"TaskID {task_id} は存在しません")
+
+                # 名前の重複チェック (既存のSubTaskとの重複を1回で確認)
+                cursor.execute(
+                    """
+                    SELECT name FROM subtasks
+                    WHERE task_id = ? AND name IN (SELECT value FROM json_each(?))
+                    LIMIT 1
+                    """,
+                    (task_id, json.dumps([v[0] for v in validated])),
+                )
+                duplicate = cursor.fetchone()
+                if duplicate:
+                    raise ConstraintViolationError(
+                        f"SubTask名 '{duplicate['name']}' は既に存在します"
+                    )
+
+                # order_index は現在の最大値から連番で割り当てる
+                cursor.execute(
+                    "SELECT COALESCE(MAX(order_index), -1) + 1 FROM subtasks WHERE task_id = ?",
+                    (task_id,),
+                )
+                first_order_index = cursor.fetchone()[0]
+
+                # INSERT
+                now = _now()
+                cursor.executemany(
+                    """
+                    INSERT INTO subtasks
+                    (task_id, name, description, status, order_index, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        (
+                            task_id,
+                            name,
+                            description,
+                            status,
+                            first_order_index + offset,
+                            now,
+                            now,
+                        )
+                        for offset, (name, description, status) in enumerate(validated)
+                    ),
+                )
+
+                # executemany では lastrowid が取れないため、採番した order_index からIDを引く
+                cursor.execute(
+                    "SELECT id, order_index FROM subtasks WHERE task_id = ? AND order_index >= ?",
+                    (task_id, first_order_index),
+                )
+                ids = {row["order_index"]: row["id"] for row in cursor.fetchall()}
+
+                # 親Taskの updated_at を更新
+                cursor.execute(
+                    "UPDATE tasks SET updated_at = ? WHERE id = ?", (now, task_id)
+                )
+
+        except sqlite3.IntegrityError as e:
+            raise ConstraintViolationError(f"SubTaskの作成に失敗しました: {e}")
+
+        return [
+            SubTask(
+                id=ids[first_order_index + offset],
+                task_id=task_id,
+                name=name,
+                description=description,
+                status=status,
+                order_index=first_order_index + offset,
+                created_at=now,
+                updated_at=now,
+            )
+            for offset, (name, description, status) in enumerate(validated)
+        ]
+
     def get_by_id(self, subtask_id: int) -> Optional[SubTask]:
         """
         IDでSubTaskを取得
@@ -1629,6 +2355,41 @@ class SubTaskRepository:
             updated_at=row["updated_at"],
         )
 
+    def get_by_ids(self, subtask_ids: Iterable[int]) -> dict[int, SubTask]:
+        """
+        複数のSubTaskを1回のクエリで取得
+
+        Args:
+            subtask_ids: SubTaskIDの列（重複可）
+
+        Returns:
+            dict[int, SubTask]: ID → SubTask（存在しないIDは含まれない）
+        """
+        ids = sorted(set(subtask_ids))
+        if not ids:
+            return {}
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT * FROM subtasks WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),),
+        )
+
+        return {
+            row["id"]: SubTask(
+                id=row["id"],
+                task_id=row["task_id"],
+                name=row["name"],
+                description=row["description"],
+                status=row["status"],
+                order_index=row["order_index"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in cursor.fetchall()
+        }
+
     def get_by_task(self, task_id: int) -> list[SubTask]:
         """
         TaskIDですべてのSubTaskを取得
@@ -1729,7 +2490,7 @@ class SubTaskRepository:
                 (now, row["task_id"]),
             )
 
-            conn.commit()
+            self.db.commit(conn)
 
             return SubTask(
                 id=subtask_id,
@@ -1743,10 +2504,10 @@ class SubTaskRepository:
             )
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTaskの更新に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def delete(self, subtask_id: int) -> None:
@@ -1786,13 +2547,13 @@ class SubTaskRepository:
                 "UPDATE tasks SET updated_at = ? WHERE id = ?", (now, row["task_id"])
             )
 
-            conn.commit()
+            self.db.commit(conn)
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTaskの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
 
     def cascade_delete(
@@ -1863,13 +2624,13 @@ class SubTaskRepository:
             cursor.execute("UPDATE tasks SET updated_at = ? WHERE id = ?", (now, task_id))
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return result
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def delete_with_bridge(self, subtask_id: int) -> list[tuple[int, int]]:
@@ -1914,12 +2675,12 @@ class SubTaskRepository:
                 "UPDATE tasks SET updated_at = ? WHERE id = ?", (now, row["task_id"])
             )
 
-            conn.commit()
+            self.db.commit(conn)
             return bridged
 
         except sqlite3.IntegrityError as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise ConstraintViolationError(f"SubTaskの削除に失敗しました: {e}")
         except Exception as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise
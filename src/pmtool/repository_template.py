@@ -76,7 +76,7 @@ class TemplateRepository:
             template_id = cursor.lastrowid
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return Template(
                 id=template_id,
@@ -89,7 +89,7 @@ class TemplateRepository:
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def get_template(
@@ -232,11 +232,11 @@ class TemplateRepository:
             cursor.execute("DELETE FROM templates WHERE id = ?", (template_id,))
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     # ============================================================
@@ -282,7 +282,7 @@ class TemplateRepository:
             template_task_id = cursor.lastrowid
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return TemplateTask(
                 id=template_task_id,
@@ -294,7 +294,7 @@ class TemplateRepository:
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def get_template_tasks(
@@ -380,7 +380,7 @@ class TemplateRepository:
             template_subtask_id = cursor.lastrowid
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return TemplateSubTask(
                 id=template_subtask_id,
@@ -392,7 +392,7 @@ class TemplateRepository:
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def get_template_subtasks(
@@ -477,7 +477,7 @@ class TemplateRepository:
             template_dep_id = cursor.lastrowid
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return TemplateDependency(
                 id=template_dep_id,
@@ -488,7 +488,7 @@ class TemplateRepository:
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def get_template_dependencies(
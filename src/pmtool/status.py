@@ -5,17 +5,56 @@
 DONE遷移時の前提条件チェック(D3)を含みます。
 """
 
+import heapq
+import json
 import sqlite3
 from datetime import datetime
+from typing import Iterable
 
 from .database import Database
 from .dependencies import DependencyManager
-from .exceptions import StatusTransitionError, StatusTransitionFailureReason
-from .models import SubTask, Task
+from .exceptions import (
+    StatusTransitionError,
+    StatusTransitionFailureReason,
+    ValidationError,
+)
+from .models import (
+    RejectedStatusChange,
+    StatusChange,
+    SubTask,
+    Task,
+    UpdateStatusesResult,
+)
 from .repository import SubTaskRepository, TaskRepository
 from .validators import validate_status
 
 
+# ノードタイプごとの (ノードテーブル, 依存関係テーブル)
+_LAYER_TABLES = {
+    "task": ("tasks", "task_dependencies"),
+    "subtask": ("subtasks", "subtask_dependencies"),
+}
+
+# ノードタイプの表示名
+_LABELS = {"task": "Task", "subtask": "SubTask"}
+
+# ステータス遷移の履歴を追記するSQL（パラメータ: 遷移前, 遷移後, 日時, ノードID）
+_INSERT_STATUS_EVENT = {
+    "task": """
+        INSERT INTO status_events
+            (node_type, node_id, project_id, from_status, to_status, occurred_at)
+        SELECT 'task', id, project_id, ?, ?, ? FROM tasks WHERE id = ?
+    """,
+    "subtask": """
+        INSERT INTO status_events
+            (node_type, node_id, project_id, from_status, to_status, occurred_at)
+        SELECT 'subtask', st.id, t.project_id, ?, ?, ?
+        FROM subtasks st JOIN tasks t ON t.id = st.task_id
+        WHERE st.id = ?
+    """,
+}
+
+
 def _now() -> str:
     """
     現在のUTCタイムスタンプをISO 8601形式で返す
@@ -48,6 +87,8 @@ class StatusManager:
         """
         Taskのステータスを更新
 
+        ステータスが変わった場合は遷移を status_events に記録します。
+
         Args:
             task_id: TaskID
             new_status: 新しいステータス
@@ -88,7 +129,11 @@ class StatusManager:
                 "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
                 (new_status, now, task_id),
             )
-            conn.commit()
+            if task.status != new_status:
+                cursor.execute(
+                    _INSERT_STATUS_EVENT["task"], (task.status, new_status, now, task_id)
+                )
+            self.db.commit(conn)
 
             # 更新されたTaskを返す
             task.status = new_status
@@ -96,13 +141,15 @@ class StatusManager:
             return task
 
         except sqlite3.Error as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise StatusTransitionError(f"Taskステータスの更新に失敗しました: {e}")
 
     def update_subtask_status(self, subtask_id: int, new_status: str) -> SubTask:
         """
         SubTaskのステータスを更新
 
+        ステータスが変わった場合は遷移を status_events に記録します。
+
         Args:
             subtask_id: SubTaskID
             new_status: 新しいステータス
@@ -143,7 +190,11 @@ class StatusManager:
                 "UPDATE subtasks SET status = ?, updated_at = ? WHERE id = ?",
                 (new_status, now, subtask_id),
             )
-            conn.commit()
+            if subtask.status != new_status:
+                cursor.execute(
+                    _INSERT_STATUS_EVENT["subtask"], (subtask.status, new_status, now, subtask_id)
+                )
+            self.db.commit(conn)
 
             # 更新されたSubTaskを返す
             subtask.status = new_status
@@ -151,9 +202,257 @@ class StatusManager:
             return subtask
 
         except sqlite3.Error as e:
-            conn.rollback()
+            self.db.rollback(conn)
             raise StatusTransitionError(f"SubTaskステータスの更新に失敗しました: {e}")
 
+    def update_statuses(
+        self, changes: Iterable[tuple[str, int, str]], dry_run: bool = False
+    ) -> UpdateStatusesResult:
+        """
+        Task / SubTask のステータスを一括更新
+
+        DONE遷移の前提条件 (D3) は、一括更新を適用した後の状態に対して検証します。
+        変更は SubTask → Task、先行 → 後続 のトポロジカル順に判定するため、
+        同じ入力内で先行ノードや子SubTaskをDONEにする変更も考慮されます
+        （入力の並び順は問いません）。拒否された変更は適用されず、
+        それを前提とするDONE遷移も拒否されます。
+        DB上の依存関係が循環しているために判定順を決められない変更は
+        INVALID_TRANSITION として拒否されます。
+
+        最初の不正な変更で中断せず、受理できた変更を1トランザクションで
+        executemany により適用し、拒否した変更は理由とともに結果に含めます。
+        ステータスが実際に変わったノードは status_events に遷移を記録します。
+
+        Args:
+            changes: (ノードタイプ, ノードID, 新しいステータス) の列
+            dry_run: True の場合、判定のみ行いDBを変更しない
+
+        Returns:
+            UpdateStatusesResult: 適用された変更と拒否された変更
+
+        Raises:
+            StatusTransitionError: DBの更新に失敗した場合
+        """
+        changes = [
+            StatusChange(node_type, int(node_id), status)
+            for node_type, node_id, status in changes
+        ]
+        result = UpdateStatusesResult()
+        if not changes:
+            return result
+
+        # 拒否した変更 {入力位置: 拒否情報}
+        rejected: dict[int, RejectedStatusChange] = {}
+
+        def reject(
+            index: int,
+            reason: StatusTransitionFailureReason,
+            message: str,
+            details: dict | None = None,
+        ) -> None:
+            rejected[index] = RejectedStatusChange(
+                changes[index], reason, message, details or {}
+            )
+
+        # 1. ノードタイプ・ステータス値・入力内の重複
+        candidates: dict[tuple[str, int], int] = {}  # (ノードタイプ, ID) -> 入力位置
+        for index, change in enumerate(changes):
+            key = (change.node_type, change.node_id)
+            if change.node_type not in _LAYER_TABLES:
+                reject(
+                    index,
+                    StatusTransitionFailureReason.INVALID_NODE_TYPE,
+                    f"無効なノードタイプ: {change.node_type}",
+                )
+                continue
+            try:
+                change.status = validate_status(change.status)
+            except ValidationError:
+                reject(
+                    index,
+                    StatusTransitionFailureReason.INVALID_STATUS,
+                    f"無効なステータス値: {change.status}",
+                )
+                continue
+            if key in candidates:
+                reject(
+                    index,
+                    StatusTransitionFailureReason.DUPLICATE_IN_BATCH,
+                    f"{_LABELS[change.node_type]} {change.node_id} が入力内で重複しています",
+                )
+                continue
+            candidates[key] = index
+
+        # 2. 現在の状態と、DONE遷移の判定に必要な先行ノード・子SubTaskを層ごとに一括取得
+        conn = self.db.connect()
+        current: dict[tuple[str, int], str] = {}
+        predecessors: dict[tuple[str, int], list[sqlite3.Row]] = {}
+        children: dict[int, list[sqlite3.Row]] = {}
+
+        for node_type, (node_table, dep_table) in _LAYER_TABLES.items():
+            ids = [node_id for kind, node_id in candidates if kind == node_type]
+            if not ids:
+                continue
+            for row in conn.execute(
+                f"SELECT id, status FROM {node_table} WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(ids),),
+            ):
+                current[(node_type, row["id"])] = row["status"]
+
+            done_ids = [
+                node_id
+                for node_id in ids
+                if changes[candidates[(node_type, node_id)]].status == "DONE"
+            ]
+            if not done_ids:
+                continue
+            for row in conn.execute(
+                f"""
+                SELECT d.successor_id, n.id, n.name, n.status
+                FROM {dep_table} d
+                JOIN {node_table} n ON n.id = d.predecessor_id
+                WHERE d.successor_id IN (SELECT value FROM json_each(?))
+                ORDER BY n.id
+                """,
+                (json.dumps(done_ids),),
+            ):
+                predecessors.setdefault((node_type, row["successor_id"]), []).append(row)
+            if node_type == "task":
+                for row in conn.execute(
+                    """
+                    SELECT task_id, id, name, status FROM subtasks
+                    WHERE task_id IN (SELECT value FROM json_each(?))
+                    ORDER BY order_index, id
+                    """,
+                    (json.dumps(done_ids),),
+                ):
+                    children.setdefault(row["task_id"], []).append(row)
+
+        for key, index in list(candidates.items()):
+            if key not in current:
+                reject(
+                    index,
+                    StatusTransitionFailureReason.NODE_NOT_FOUND,
+                    f"{_LABELS[key[0]]}ID {key[1]} は存在しません",
+                    {"node_id": key[1], "node_type": key[0]},
+                )
+                del candidates[key]
+
+        # 3. トポロジカル順 (SubTask → 親Task、先行 → 後続) に判定
+        # 入力内のノード間の辺のみを考慮し、同順位は入力順に処理する
+        successors: dict[tuple[str, int], list[tuple[str, int]]] = {}
+        in_degree = dict.fromkeys(candidates, 0)
+        for key in candidates:
+            sources = [(key[0], row["id"]) for row in predecessors.get(key, [])]
+            if key[0] == "task":
+                sources += [("subtask", row["id"]) for row in children.get(key[1], [])]
+            for source in sources:
+                if source in candidates:
+                    successors.setdefault(source, []).append(key)
+                    in_degree[key] += 1
+
+        # 判定済みで受理した変更 {(ノードタイプ, ID): 新しいステータス}
+        accepted: dict[tuple[str, int], str] = {}
+
+        def post_batch(node_type: str, row: sqlite3.Row) -> dict:
+            status = accepted.get((node_type, row["id"]), row["status"])
+            return {"id": row["id"], "name": row["name"], "status": status}
+
+        ready = [(index, key) for key, index in candidates.items() if in_degree[key] == 0]
+        heapq.heapify(ready)
+        while ready:
+            index, key = heapq.heappop(ready)
+            node_type, node_id = key
+            change = changes[index]
+
+            if change.status == "DONE":
+                incomplete_predecessors = [
+                    node
+                    for node in (post_batch(node_type, row) for row in predecessors.get(key, []))
+                    if node["status"] != "DONE"
+                ]
+                child_rows = children.get(node_id, []) if node_type == "task" else []
+                incomplete_children = [
+                    node
+                    for node in (post_batch("subtask", row) for row in child_rows)
+                    if node["status"] != "DONE"
+                ]
+                if incomplete_predecessors:
+                    reject(
+                        index,
+                        StatusTransitionFailureReason.PREREQUISITE_NOT_DONE,
+                        f"すべての先行{node_type}がDONEでないため、DONEに遷移できません",
+                        {
+                            "node_id": node_id,
+                            "node_type": node_type,
+                            "incomplete_predecessors": incomplete_predecessors,
+                        },
+                    )
+                elif incomplete_children:
+                    reject(
+                        index,
+                        StatusTransitionFailureReason.CHILD_NOT_DONE,
+                        "すべての子SubTaskがDONEでないため、TaskをDONEに遷移できません",
+                        {
+                            "node_id": node_id,
+                            "node_type": node_type,
+                            "incomplete_children": incomplete_children,
+                        },
+                    )
+
+            if index not in rejected:
+                accepted[key] = change.status
+                result.applied.append(change)
+
+            for successor in successors.get(key, []):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    heapq.heappush(ready, (candidates[successor], successor))
+
+        # DB上の依存関係の循環に含まれる（またはその後続の）ノードは入次数が0にならず、
+        # 判定順を決められないため拒否する
+        for key, index in candidates.items():
+            if key not in accepted and index not in rejected:
+                reject(
+                    index,
+                    StatusTransitionFailureReason.INVALID_TRANSITION,
+                    f"{_LABELS[key[0]]} {key[1]} は依存関係の循環により判定順を決められないため、"
+                    "DONEに遷移できません",
+                    {"node_id": key[1], "node_type": key[0]},
+                )
+
+        result.rejected = [rejected[index] for index in sorted(rejected)]
+        if dry_run or not result.applied:
+            return result
+
+        # 4. 受理した変更を1トランザクションで適用
+        now = _now()
+        try:
+            with self.db.transaction() as conn:
+                for node_type, (node_table, _) in _LAYER_TABLES.items():
+                    rows = [
+                        (change.status, now, change.node_id)
+                        for change in result.applied
+                        if change.node_type == node_type
+                    ]
+                    if rows:
+                        conn.executemany(
+                            f"UPDATE {node_table} SET status = ?, updated_at = ? WHERE id = ?",
+                            rows,
+                        )
+                    events = [
+                        (current[(node_type, change.node_id)], change.status, now, change.node_id)
+                        for change in result.applied
+                        if change.node_type == node_type
+                        and current[(node_type, change.node_id)] != change.status
+                    ]
+                    if events:
+                        conn.executemany(_INSERT_STATUS_EVENT[node_type], events)
+        except sqlite3.Error as e:
+            raise StatusTransitionError(f"ステータスの一括更新に失敗しました: {e}")
+
+        return result
+
     def validate_done_transition(
         self, node_id: int, node_type: str
     ) -> tuple[bool, str, StatusTransitionFailureReason | None, dict]:
@@ -205,6 +504,8 @@ class StatusManager:
         """
         すべての先行ノードがDONEかチェック
 
+        未完了の先行ノードが1件でも見つかった時点で打ち切る EXISTS クエリ1回で判定します。
+
         Args:
             node_id: ノードID
             node_type: ノードタイプ ('task' または 'subtask')
@@ -212,48 +513,45 @@ class StatusManager:
         Returns:
             bool: すべての先行ノードがDONEの場合True
         """
-        if node_type == "task":
-            deps = self.dep_manager.get_task_dependencies(node_id)
-            predecessors = deps["predecessors"]
-
-            for pred_id in predecessors:
-                pred_task = self.task_repo.get_by_id(pred_id)
-                if pred_task and pred_task.status != "DONE":
-                    return False
-
-        elif node_type == "subtask":
-            deps = self.dep_manager.get_subtask_dependencies(node_id)
-            predecessors = deps["predecessors"]
-
-            for pred_id in predecessors:
-                pred_subtask = self.subtask_repo.get_by_id(pred_id)
-                if pred_subtask and pred_subtask.status != "DONE":
-                    return False
+        if node_type not in _LAYER_TABLES:
+            return True
+        node_table, dep_table = _LAYER_TABLES[node_type]
 
-        return True
+        conn = self.db.connect()
+        row = conn.execute(
+            f"""
+            SELECT NOT EXISTS (
+                SELECT 1 FROM {dep_table} d
+                JOIN {node_table} n ON n.id = d.predecessor_id
+                WHERE d.successor_id = ? AND n.status != 'DONE'
+            )
+            """,
+            (node_id,),
+        ).fetchone()
+        return bool(row[0])
 
     def _all_child_subtasks_done(self, task_id: int) -> bool:
         """
         Taskのすべての子SubTaskがDONEかチェック
 
+        未完了の子SubTaskが1件でも見つかった時点で打ち切る EXISTS クエリ1回で判定します。
+
         Args:
             task_id: TaskID
 
         Returns:
             bool: すべての子SubTaskがDONEの場合True (子がいない場合もTrue)
         """
-        subtasks = self.subtask_repo.get_by_task(task_id)
-
-        # 子SubTaskがいない場合はTrue
-        if not subtasks:
-            return True
-
-        # すべてDONEかチェック
-        for subtask in subtasks:
-            if subtask.status != "DONE":
-                return False
-
-        return True
+        conn = self.db.connect()
+        row = conn.execute(
+            """
+            SELECT NOT EXISTS (
+                SELECT 1 FROM subtasks WHERE task_id = ? AND status != 'DONE'
+            )
+            """,
+            (task_id,),
+        ).fetchone()
+        return bool(row[0])
 
     def _get_incomplete_predecessors(
         self, node_id: int, node_type: str
@@ -261,73 +559,56 @@ class StatusManager:
         """
         未完了の先行ノードのリストを取得
 
+        依存関係とノードを結合した1回のクエリで、未完了の行のみを取得します。
+
         Args:
             node_id: ノードID
             node_type: ノードタイプ ('task' または 'subtask')
 
         Returns:
-            list[dict]: 未完了の先行ノード情報のリスト
+            list[dict]: 未完了の先行ノード情報のリスト (ID順)
                 例: [{"id": 3, "name": "先行タスク", "status": "IN_PROGRESS"}, ...]
         """
-        incomplete = []
+        if node_type not in _LAYER_TABLES:
+            return []
+        node_table, dep_table = _LAYER_TABLES[node_type]
 
-        if node_type == "task":
-            deps = self.dep_manager.get_task_dependencies(node_id)
-            predecessors = deps["predecessors"]
-
-            for pred_id in predecessors:
-                pred_task = self.task_repo.get_by_id(pred_id)
-                if pred_task and pred_task.status != "DONE":
-                    incomplete.append(
-                        {
-                            "id": pred_task.id,
-                            "name": pred_task.name,
-                            "status": pred_task.status,
-                        }
-                    )
-
-        elif node_type == "subtask":
-            deps = self.dep_manager.get_subtask_dependencies(node_id)
-            predecessors = deps["predecessors"]
-
-            for pred_id in predecessors:
-                pred_subtask = self.subtask_repo.get_by_id(pred_id)
-                if pred_subtask and pred_subtask.status != "DONE":
-                    incomplete.append(
-                        {
-                            "id": pred_subtask.id,
-                            "name": pred_subtask.name,
-                            "status": pred_subtask.status,
-                        }
-                    )
-
-        return incomplete
+        conn = self.db.connect()
+        rows = conn.execute(
+            f"""
+            SELECT n.id, n.name, n.status
+            FROM {dep_table} d
+            JOIN {node_table} n ON n.id = d.predecessor_id
+            WHERE d.successor_id = ? AND n.status != 'DONE'
+            ORDER BY n.id
+            """,
+            (node_id,),
+        ).fetchall()
+        return [{"id": row[0], "name": row[1], "status": row[2]} for row in rows]
 
     def _get_incomplete_child_subtasks(self, task_id: int) -> list[dict]:
         """
         未完了の子SubTaskのリストを取得
 
+        1回のクエリで未完了の行のみを取得します（モデルへの変換は行いません）。
+
         Args:
             task_id: TaskID
 
         Returns:
-            list[dict]: 未完了の子SubTask情報のリスト
+            list[dict]: 未完了の子SubTask情報のリスト (order_index順)
                 例: [{"id": 5, "name": "子SubTask", "status": "NOT_STARTED"}, ...]
         """
-        incomplete = []
-        subtasks = self.subtask_repo.get_by_task(task_id)
-
-        for subtask in subtasks:
-            if subtask.status != "DONE":
-                incomplete.append(
-                    {
-                        "id": subtask.id,
-                        "name": subtask.name,
-                        "status": subtask.status,
-                    }
-                )
-
-        return incomplete
+        conn = self.db.connect()
+        rows = conn.execute(
+            """
+            SELECT id, name, status FROM subtasks
+            WHERE task_id = ? AND status != 'DONE'
+            ORDER BY order_index, id
+            """,
+            (task_id,),
+        ).fetchall()
+        return [{"id": row[0], "name": row[1], "status": row[2]} for row in rows]
 
     def dry_run_status_update(
         self, node_id: int, node_type: str, new_status: str
@@ -395,3 +676,102 @@ class StatusManager:
 
         # 4. DONE以外への遷移は常に許可（現在の仕様）
         return (True, "", None, {})
+
+    def get_ready_nodes(
+        self,
+        project_id: int | None = None,
+        node_type: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, list]:
+        """
+        着手可能なノード（未完了で、先行ノードがすべてDONE）を取得
+
+        未完了の先行ノード数 (pending_predecessors) はトリガーで依存関係・ステータスの
+        変更ごとに維持されているため、部分インデックスの走査のみで取得できます。
+        判定は同じ層の先行ノードのみを対象とし、親Taskの状態は考慮しません。
+
+        Args:
+            project_id: 対象プロジェクトID（Noneの場合は全プロジェクト）
+            node_type: 'task' または 'subtask'（Noneの場合は両方）
+            limit: 層ごとの最大取得件数（Noneの場合は全件）
+
+        Returns:
+            dict[str, list]: {"tasks": [Task, ...], "subtasks": [SubTask, ...]}
+                (Taskはプロジェクト・ID順、SubTaskは親Task・ID順)
+
+        Raises:
+            ValidationError: node_type が不正な場合
+        """
+        if node_type is not None and node_type not in _LAYER_TABLES:
+            raise ValidationError(f"無効なノードタイプ: {node_type}")
+
+        conn = self.db.connect()
+        limit_sql = " LIMIT ?" if limit is not None else ""
+        result: dict[str, list] = {"tasks": [], "subtasks": []}
+
+        if node_type in (None, "task"):
+            params: list = []
+            where = "status != 'DONE' AND pending_predecessors = 0"
+            if project_id is not None:
+                where += " AND project_id = ?"
+                params.append(project_id)
+            if limit is not None:
+                params.append(limit)
+            rows = conn.execute(
+                f"""
+                SELECT id, project_id, subproject_id, name, description, status,
+                       order_index, created_at, updated_at
+                FROM tasks INDEXED BY idx_tasks_ready
+                WHERE {where}
+                ORDER BY project_id, id{limit_sql}
+                """,
+                params,
+            ).fetchall()
+            result["tasks"] = [
+                Task(
+                    id=row["id"],
+                    project_id=row["project_id"],
+                    subproject_id=row["subproject_id"],
+                    name=row["name"],
+                    description=row["description"],
+                    status=row["status"],
+                    order_index=row["order_index"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                )
+                for row in rows
+            ]
+
+        if node_type in (None, "subtask"):
+            params = []
+            where = "st.status != 'DONE' AND st.pending_predecessors = 0"
+            if project_id is not None:
+                where += " AND st.task_id IN (SELECT id FROM tasks WHERE project_id = ?)"
+                params.append(project_id)
+            if limit is not None:
+                params.append(limit)
+            rows = conn.execute(
+                f"""
+                SELECT st.id, st.task_id, st.name, st.description, st.status,
+                       st.order_index, st.created_at, st.updated_at
+                FROM subtasks st INDEXED BY idx_subtasks_ready
+                WHERE {where}
+                ORDER BY st.task_id, st.id{limit_sql}
+                """,
+                params,
+            ).fetchall()
+            result["subtasks"] = [
+                SubTask(
+                    id=row["id"],
+                    task_id=row["task_id"],
+                    name=row["name"],
+                    description=row["description"],
+                    status=row["status"],
+                    order_index=row["order_index"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                )
+                for row in rows
+            ]
+
+        return result
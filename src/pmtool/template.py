@@ -19,7 +19,12 @@ from .models import (
     ExternalDependencyWarning,
     SaveTemplateResult,
 )
-from .exceptions import EntityNotFoundError
+from .exceptions import (
+    ConstraintViolationError,
+    CyclicDependencyError,
+    DependencyRejectionReason,
+    EntityNotFoundError,
+)
 
 
 class TemplateManager:
@@ -218,7 +223,7 @@ class TemplateManager:
                     )
 
             if own_conn:
-                conn.commit()
+                self.db.commit(conn)
 
             return SaveTemplateResult(
                 template=template, external_dependencies=external_warnings
@@ -226,7 +231,7 @@ class TemplateManager:
 
         except Exception as e:
             if own_conn:
-                conn.rollback()
+                self.db.rollback(conn)
             raise
 
     def apply_template(
@@ -250,12 +255,12 @@ class TemplateManager:
         Raises:
             EntityNotFoundError: テンプレートまたはProjectが存在しない
         """
-        own_conn = False
         if conn is None:
             conn = self.db.connect()
-            own_conn = True
 
-        try:
+        # SubProject・Task・SubTask・依存関係の作成を1つの作業単位としてコミットする
+        # （途中で失敗した場合は何も作成されない）
+        with self.db.transaction():
             # 1. テンプレート存在確認
             template = self.template_repo.get_template(template_id, conn)
             if template is None:
@@ -296,17 +301,19 @@ class TemplateManager:
             if template.include_tasks:
                 # Task複製
                 template_tasks = self.template_repo.get_template_tasks(template_id, conn)
-                task_order_to_id = {}  # task_order -> 新Task ID のマッピング
-
-                for template_task in template_tasks:
-                    new_task = self.task_repo.create(
-                        project_id=project_id,
-                        subproject_id=new_subproject.id,
-                        name=template_task.name,
-                        description=template_task.description,
-                        status="UNSET",
-                    )
-                    task_order_to_id[template_task.task_order] = new_task.id
+                new_tasks = self.task_repo.create_many(
+                    project_id,
+                    new_subproject.id,
+                    (
+                        {"name": tt.name, "description": tt.description}
+                        for tt in template_tasks
+                    ),
+                )
+                # task_order -> 新Task ID のマッピング
+                task_order_to_id = {
+                    template_task.task_order: new_task.id
+                    for template_task, new_task in zip(template_tasks, new_tasks)
+                }
 
                 # SubTask複製
                 template_subtasks = self.template_repo.get_template_subtasks(
@@ -324,37 +331,35 @@ class TemplateManager:
                     new_task_id = task_order_to_id[template_task.task_order]
                     subtasks = subtasks_by_template_task.get(template_task.id, [])
 
-                    for template_subtask in subtasks:
-                        self.subtask_repo.create(
-                            task_id=new_task_id,
-                            name=template_subtask.name,
-                            description=template_subtask.description,
-                            status="UNSET",
-                        )
+                    self.subtask_repo.create_many(
+                        new_task_id,
+                        (
+                            {"name": ts.name, "description": ts.description}
+                            for ts in subtasks
+                        ),
+                    )
 
                 # 内部依存関係再接続
                 template_deps = self.template_repo.get_template_dependencies(
                     template_id, conn
                 )
 
-                for dep in template_deps:
-                    pred_task_id = task_order_to_id[dep.predecessor_order]
-                    succ_task_id = task_order_to_id[dep.successor_order]
-
-                    self.dep_manager.add_task_dependency(
-                        pred_task_id, succ_task_id
+                dep_result = self.dep_manager.add_task_dependencies(
+                    (
+                        task_order_to_id[dep.predecessor_order],
+                        task_order_to_id[dep.successor_order],
                     )
+                    for dep in template_deps
+                )
+                if dep_result.has_rejections:
+                    rejection = dep_result.rejected[0]
+                    if rejection.reason == DependencyRejectionReason.CYCLE:
+                        raise CyclicDependencyError(rejection.message)
+                    raise ConstraintViolationError(rejection.message)
 
-            if own_conn:
-                conn.commit()
 
             return new_subproject.id
 
-        except Exception as e:
-            if own_conn:
-                conn.rollback()
-            raise
-
     def dry_run(
         self,
         template_id: int,
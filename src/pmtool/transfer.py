@@ -0,0 +1,637 @@
+"""
+プロジェクトのエクスポート / インポート（NDJSON）
+
+1行に1エンティティのJSONオブジェクトを書き出す NDJSON 形式で、
+プロジェクト全体（SubProject・Task・SubTask・依存関係）を環境間で移行します。
+
+ファイルは以下の順に並びます（インポート時もこの順であることを前提に逐次処理します）:
+    header → project → subproject（親が先）→ task → subtask
+    → task_dependency → subtask_dependency
+
+- エクスポートは読み取り専用コネクションのカーソルを逐次読み出し、1件ずつ書き出します。
+- インポートはファイルを1行ずつ読み、batch_size 件ごとにIDを振り直して executemany で
+  挿入します。依存関係は最後に1回の一括検証（DependencyManager）で再構築します。
+  全体を1トランザクションで行うため、途中で失敗した場合は何も作成されません。
+  pending_predecessors / progress_rollups を維持するトリガーは取り込み中は外し、
+  最後にプロジェクト単位で再計算します。
+
+どちらもファイル全体をメモリに載せないため、数百万行のファイルも扱えます
+（依存関係の再構築のみ、依存関係の組をまとめて検証します）。
+"""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+from .database import Database
+from .dependencies import DependencyManager
+from .exceptions import (
+    ConstraintViolationError,
+    CyclicDependencyError,
+    DependencyRejectionReason,
+    EntityNotFoundError,
+    ValidationError,
+)
+from .migrations import bulk_load
+from .repository import ProjectRepository
+from .validators import (
+    validate_description,
+    validate_name,
+    validate_order_index,
+    validate_status,
+)
+
+NDJSON_FORMAT = "pmtool-ndjson"
+NDJSON_VERSION = 1
+
+# レコード種別（ファイル内の並び順）
+RECORD_TYPES = (
+    "project",
+    "subproject",
+    "task",
+    "subtask",
+    "task_dependency",
+    "subtask_dependency",
+)
+
+# インポート時に1回の executemany で挿入する件数
+DEFAULT_BATCH_SIZE = 5000
+
+# ノード種別ごとの (テーブル名, 親の種別, 親IDのフィールド名, 親が必須か)
+_NODE_TABLES = {
+    "subproject": ("subprojects", "subproject", "parent_subproject_id", False),
+    "task": ("tasks", "subproject", "subproject_id", False),
+    "subtask": ("subtasks", "task", "task_id", True),
+}
+
+
+def _now() -> str:
+    """
+    現在のUTCタイムスタンプをISO 8601形式で返す
+
+    Returns:
+        str: ISO 8601形式のUTCタイムスタンプ
+    """
+    return datetime.utcnow().isoformat()
+
+
+@dataclass
+class TransferResult:
+    """エクスポート / インポートの結果"""
+
+    project_id: int
+    """エクスポート元 / インポート先のプロジェクトID"""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    """レコード種別ごとの件数"""
+
+    elapsed: float = 0.0
+    """所要時間（秒）"""
+
+    @property
+    def total_records(self) -> int:
+        """レコードの総数（header を除く）"""
+        return sum(self.counts.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        """スループット（レコード/秒）"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.total_records / self.elapsed
+
+
+# --- エクスポート ---
+
+
+def iter_project_records(db: Database, project_id: int) -> Iterator[dict[str, Any]]:
+    """
+    プロジェクト全体を NDJSON のレコードとして1件ずつ返す
+
+    独立した読み取り専用コネクションの1つの読み取りトランザクション内で読み出すため、
+    途中で書き込みがあっても一貫したスナップショットになります。
+    最初のレコードは header です。
+
+    Args:
+        db: Database インスタンス
+        project_id: エクスポートするプロジェクトID
+
+    Yields:
+        dict[str, Any]: レコード（"type" キーにレコード種別）
+
+    Raises:
+        EntityNotFoundError: プロジェクトが存在しない場合
+    """
+    conn = db.connect_readonly()
+    try:
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT id, name, description, created_at FROM projects WHERE id = ?",
+            (project_id,),
+        )
+        project = cursor.fetchone()
+        if project is None:
+            raise EntityNotFoundError(f"Project ID {project_id} が見つかりません")
+
+        yield {
+            "type": "header",
+            "format": NDJSON_FORMAT,
+            "version": NDJSON_VERSION,
+            "exported_at": _now(),
+        }
+        yield {"type": "project", **dict(project)}
+
+        # SubProject は親が先になるよう階層の深さ順に並べる
+        cursor.execute(
+            """
+            WITH RECURSIVE tree(id, depth) AS (
+                SELECT id, 0 FROM subprojects
+                WHERE project_id = ? AND parent_subproject_id IS NULL
+                UNION ALL
+                SELECT s.id, tree.depth + 1
+                FROM subprojects s JOIN tree ON s.parent_subproject_id = tree.id
+            )
+            SELECT s.id, s.parent_subproject_id, s.name, s.description,
+                   s.order_index, s.created_at
+            FROM subprojects s JOIN tree ON s.id = tree.id
+            ORDER BY tree.depth, s.id
+            """,
+            (project_id,),
+        )
+        for row in cursor:
+            yield {"type": "subproject", **dict(row)}
+
+        cursor.execute(
+            """
+            SELECT id, subproject_id, name, description, status, order_index, created_at
+            FROM tasks WHERE project_id = ?
+            ORDER BY id
+            """,
+            (project_id,),
+        )
+        for row in cursor:
+            yield {"type": "task", **dict(row)}
+
+        cursor.execute(
+            """
+            SELECT st.id, st.task_id, st.name, st.description, st.status,
+                   st.order_index, st.created_at
+            FROM subtasks st JOIN tasks t ON st.task_id = t.id
+            WHERE t.project_id = ?
+            ORDER BY st.id
+            """,
+            (project_id,),
+        )
+        for row in cursor:
+            yield {"type": "subtask", **dict(row)}
+
+        cursor.execute(
+            """
+            SELECT d.predecessor_id, d.successor_id
+            FROM task_dependencies d JOIN tasks t ON d.predecessor_id = t.id
+            WHERE t.project_id = ?
+            ORDER BY d.id
+            """,
+            (project_id,),
+        )
+        for row in cursor:
+            yield {"type": "task_dependency", **dict(row)}
+
+        cursor.execute(
+            """
+            SELECT d.predecessor_id, d.successor_id
+            FROM subtask_dependencies d
+            JOIN subtasks st ON d.predecessor_id = st.id
+            JOIN tasks t ON st.task_id = t.id
+            WHERE t.project_id = ?
+            ORDER BY d.id
+            """,
+            (project_id,),
+        )
+        for row in cursor:
+            yield {"type": "subtask_dependency", **dict(row)}
+
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def export_project(db: Database, project_id: int, fp: TextIO) -> TransferResult:
+    """
+    プロジェクト全体を NDJSON として書き出す
+
+    Args:
+        db: Database インスタンス
+        project_id: エクスポートするプロジェクトID
+        fp: 書き込み先（テキストモード）
+
+    Returns:
+        TransferResult: 書き出したレコード数と所要時間
+
+    Raises:
+        EntityNotFoundError: プロジェクトが存在しない場合
+    """
+    result = TransferResult(project_id=project_id)
+    started = time.perf_counter()
+
+    for record in iter_project_records(db, project_id):
+        fp.write(json.dumps(record, ensure_ascii=False))
+        fp.write("\n")
+        record_type = record["type"]
+        if record_type != "header":
+            result.counts[record_type] = result.counts.get(record_type, 0) + 1
+
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+# --- インポート ---
+
+
+class _Importer:
+    """
+    NDJSON のインポート処理（import_ndjson の実装）
+
+    旧ID → 新IDの対応は一時テーブルに保持し、バッチごとに親IDを1回のクエリで引きます。
+    新IDは各テーブルの採番済みの最大値から連番で割り当てます。
+    """
+
+    def __init__(self, db: Database, name: Optional[str], batch_size: int):
+        self.db = db
+        self.name = name
+        self.batch_size = batch_size
+        self.conn = db.connect()
+        self.cursor = self.conn.cursor()
+        self.project_id: Optional[int] = None
+        self.counts: dict[str, int] = {}
+        self.next_ids: dict[str, int] = {}
+        self.now = _now()
+
+    def run(self, lines: Iterable[str]) -> int:
+        """
+        すべての行を処理し、作成したプロジェクトIDを返す
+
+        Raises:
+            ValidationError: ファイルの形式・内容が不正な場合
+            ConstraintViolationError: 名前の重複など制約に違反する場合
+            CyclicDependencyError: 依存関係に循環がある場合
+        """
+        self.cursor.execute("DROP TABLE IF EXISTS temp.pmtool_import_ids")
+        self.cursor.execute("DROP TABLE IF EXISTS temp.pmtool_import_deps")
+        self.cursor.execute(
+            """
+            CREATE TEMP TABLE pmtool_import_ids (
+                kind TEXT NOT NULL,
+                old_id INTEGER NOT NULL,
+                new_id INTEGER NOT NULL,
+                PRIMARY KEY (kind, old_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self.cursor.execute(
+            """
+            CREATE TEMP TABLE pmtool_import_deps (
+                kind TEXT NOT NULL,
+                predecessor_id INTEGER NOT NULL,
+                successor_id INTEGER NOT NULL
+            )
+            """
+        )
+
+        header_seen = False
+        current: Optional[str] = None
+        batch: list[tuple[int, dict[str, Any]]] = []
+
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            record = self._parse(line_no, line)
+            record_type = record.get("type")
+
+            if not header_seen:
+                self._check_header(line_no, record)
+                header_seen = True
+                continue
+
+            if record_type not in RECORD_TYPES:
+                raise ValidationError(f"{line_no}行目: 不明なレコード種別です: {record_type}")
+            if current is None and record_type != "project":
+                raise ValidationError(f"{line_no}行目: 先頭のレコードは project である必要があります")
+            if current is not None and (
+                record_type == "project"
+                or RECORD_TYPES.index(record_type) < RECORD_TYPES.index(current)
+            ):
+                raise ValidationError(
+                    f"{line_no}行目: レコードの順序が不正です（{current} の後に {record_type}）"
+                )
+
+            if record_type != current or len(batch) >= self.batch_size:
+                self._flush(current, batch)
+                batch = []
+                current = record_type
+            batch.append((line_no, record))
+
+        if not header_seen:
+            raise ValidationError("NDJSON ファイルが空です")
+        self._flush(current, batch)
+        if self.project_id is None:
+            raise ValidationError("project レコードがありません")
+
+        self._rebuild_dependencies("task")
+        self._rebuild_dependencies("subtask")
+
+        self.cursor.execute("DROP TABLE temp.pmtool_import_ids")
+        self.cursor.execute("DROP TABLE temp.pmtool_import_deps")
+        return self.project_id
+
+    @staticmethod
+    def _parse(line_no: int, line: str) -> dict[str, Any]:
+        """1行をJSONオブジェクトとして解析"""
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"{line_no}行目: JSONとして解析できません: {e}")
+        if not isinstance(record, dict):
+            raise ValidationError(f"{line_no}行目: JSONオブジェクトである必要があります")
+        return record
+
+    @staticmethod
+    def _check_header(line_no: int, record: dict[str, Any]) -> None:
+        """header レコードの形式とバージョンを確認"""
+        if record.get("type") != "header" or record.get("format") != NDJSON_FORMAT:
+            raise ValidationError(
+                f"{line_no}行目: {NDJSON_FORMAT} 形式の header レコードがありません"
+            )
+        if record.get("version") != NDJSON_VERSION:
+            raise ValidationError(
+                f"{line_no}行目: 未対応のバージョンです: {record.get('version')}"
+            )
+
+    def _flush(self, kind: Optional[str], batch: list[tuple[int, dict[str, Any]]]) -> None:
+        """同じ種別のレコードのバッチを挿入"""
+        if kind is None or not batch:
+            return
+        self.counts[kind] = self.counts.get(kind, 0) + len(batch)
+
+        if kind == "project":
+            self._insert_project(batch)
+        elif kind in _NODE_TABLES:
+            self._insert_nodes(kind, batch)
+        else:
+            self._stage_dependencies(kind, batch)
+
+    def _insert_project(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        """project レコードから新しいプロジェクトを作成"""
+        if len(batch) > 1:
+            raise ValidationError(f"{batch[1][0]}行目: project レコードは1件のみ指定できます")
+        line_no, record = batch[0]
+        try:
+            project = ProjectRepository(self.db).create(
+                self.name if self.name is not None else record.get("name"),
+                record.get("description"),
+            )
+        except ValidationError as e:
+            raise ValidationError(f"{line_no}行目: {e}")
+        self.project_id = project.id
+
+    def _allocate_ids(self, table: str, count: int) -> int:
+        """
+        新IDを count 個連番で確保し、先頭のIDを返す
+
+        AUTOINCREMENT の採番済みの値（sqlite_sequence）も考慮し、削除済みのIDは再利用しません。
+        """
+        if table not in self.next_ids:
+            self.cursor.execute(
+                f"""
+                SELECT MAX(
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = ?), 0),
+                    COALESCE((SELECT MAX(id) FROM {table}), 0)
+                ) + 1
+                """,
+                (table,),
+            )
+            self.next_ids[table] = self.cursor.fetchone()[0]
+        first = self.next_ids[table]
+        self.next_ids[table] += count
+        return first
+
+    def _insert_nodes(self, kind: str, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        """SubProject / Task / SubTask のバッチを新IDで挿入"""
+        table, parent_kind, parent_field, parent_required = _NODE_TABLES[kind]
+        first_id = self._allocate_ids(table, len(batch))
+
+        # 旧ID → 新ID を先に登録する（同じバッチ内の親子も解決できるように）
+        try:
+            self.cursor.executemany(
+                "INSERT INTO temp.pmtool_import_ids (kind, old_id, new_id) VALUES (?, ?, ?)",
+                (
+                    (kind, record["id"], first_id + offset)
+                    for offset, (_, record) in enumerate(batch)
+                ),
+            )
+        except KeyError:
+            raise ValidationError(self._missing_field(batch, "id"))
+        except sqlite3.IntegrityError:
+            raise ValidationError(f"{kind} レコードのIDが重複しています（{batch[0][0]}行目以降）")
+
+        # 親IDをバッチ単位で振り直す
+        parent_ids = {
+            record.get(parent_field)
+            for _, record in batch
+            if record.get(parent_field) is not None
+        }
+        self.cursor.execute(
+            """
+            SELECT old_id, new_id FROM temp.pmtool_import_ids
+            WHERE kind = ? AND old_id IN (SELECT value FROM json_each(?))
+            """,
+            (parent_kind, json.dumps(sorted(parent_ids, key=str))),
+        )
+        parent_map = {row["old_id"]: row["new_id"] for row in self.cursor.fetchall()}
+
+        rows = []
+        for offset, (line_no, record) in enumerate(batch):
+            old_parent = record.get(parent_field)
+            if old_parent is None:
+                if parent_required:
+                    raise ValidationError(f"{line_no}行目: {parent_field} がありません")
+                new_parent = None
+            elif old_parent in parent_map:
+                new_parent = parent_map[old_parent]
+            else:
+                raise ValidationError(
+                    f"{line_no}行目: {parent_field}={old_parent} の {parent_kind} が"
+                    f"ファイル内に見つかりません"
+                )
+
+            try:
+                values = (
+                    first_id + offset,
+                    new_parent,
+                    validate_name(record.get("name")),
+                    validate_description(record.get("description")),
+                    validate_order_index(record.get("order_index")),
+                    record.get("created_at") or self.now,
+                )
+                status = (
+                    () if kind == "subproject" else (validate_status(record.get("status")),)
+                )
+            except ValidationError as e:
+                raise ValidationError(f"{line_no}行目: {e}")
+            rows.append(values + status)
+
+        try:
+            if kind == "subproject":
+                self.cursor.executemany(
+                    """
+                    INSERT INTO subprojects
+                    (id, project_id, parent_subproject_id, name, description, order_index,
+                     created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        (id_, self.project_id, parent, *rest, self.now)
+                        for id_, parent, *rest in rows
+                    ),
+                )
+            elif kind == "task":
+                self.cursor.executemany(
+                    """
+                    INSERT INTO tasks
+                    (id, project_id, subproject_id, name, description, order_index,
+                     created_at, status, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        (id_, self.project_id, parent, *rest, self.now)
+                        for id_, parent, *rest in rows
+                    ),
+                )
+            else:
+                self.cursor.executemany(
+                    """
+                    INSERT INTO subtasks
+                    (id, task_id, name, description, order_index, created_at, status,
+                     updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    ((*row, self.now) for row in rows),
+                )
+        except sqlite3.IntegrityError as e:
+            raise ConstraintViolationError(
+                f"{kind} の作成に失敗しました（{batch[0][0]}行目以降）: {e}"
+            )
+
+    def _stage_dependencies(
+        self, kind: str, batch: list[tuple[int, dict[str, Any]]]
+    ) -> None:
+        """依存関係のバッチを旧IDのまま一時テーブルに積む（再構築は最後に一括で行う）"""
+        node_kind = kind.removesuffix("_dependency")
+        try:
+            self.cursor.executemany(
+                """
+                INSERT INTO temp.pmtool_import_deps (kind, predecessor_id, successor_id)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    (node_kind, record["predecessor_id"], record["successor_id"])
+                    for _, record in batch
+                ),
+            )
+        except KeyError as e:
+            raise ValidationError(self._missing_field(batch, e.args[0]))
+
+    def _rebuild_dependencies(self, kind: str) -> None:
+        """積んだ依存関係を新IDに振り直し、まとめて検証して追加"""
+        self.cursor.execute(
+            """
+            SELECT d.predecessor_id, d.successor_id,
+                   p.new_id AS new_predecessor, s.new_id AS new_successor
+            FROM temp.pmtool_import_deps d
+            LEFT JOIN temp.pmtool_import_ids p
+                ON p.kind = d.kind AND p.old_id = d.predecessor_id
+            LEFT JOIN temp.pmtool_import_ids s
+                ON s.kind = d.kind AND s.old_id = d.successor_id
+            WHERE d.kind = ?
+            ORDER BY d.rowid
+            """,
+            (kind,),
+        )
+        pairs = []
+        for row in self.cursor.fetchall():
+            if row["new_predecessor"] is None or row["new_successor"] is None:
+                raise ValidationError(
+                    f"{kind}_dependency {row['predecessor_id']} → {row['successor_id']} の"
+                    f"{kind} がファイル内に見つかりません"
+                )
+            pairs.append((row["new_predecessor"], row["new_successor"]))
+        if not pairs:
+            return
+
+        dep_manager = DependencyManager(self.db)
+        if kind == "task":
+            result = dep_manager.add_task_dependencies(pairs)
+        else:
+            result = dep_manager.add_subtask_dependencies(pairs)
+        if result.has_rejections:
+            rejection = result.rejected[0]
+            if rejection.reason == DependencyRejectionReason.CYCLE:
+                raise CyclicDependencyError(rejection.message)
+            raise ConstraintViolationError(rejection.message)
+
+    @staticmethod
+    def _missing_field(batch: list[tuple[int, dict[str, Any]]], name: str) -> str:
+        """必須フィールドが欠けている最初のレコードのエラーメッセージ"""
+        for line_no, record in batch:
+            if name not in record:
+                return f"{line_no}行目: {name} がありません"
+        return f"{batch[0][0]}行目以降: {name} がありません"
+
+
+def import_ndjson(
+    db: Database,
+    lines: Iterable[str],
+    name: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> TransferResult:
+    """
+    NDJSON からプロジェクト全体を新しいプロジェクトとして取り込む
+
+    すべてのIDは振り直されます。status・order_index・created_at はファイルの値を引き継ぎ、
+    updated_at はインポート時刻になります（doctor --incremental の対象に含めるため）。
+    全体を1トランザクションで行い、失敗した場合は何も作成されません。
+
+    Args:
+        db: Database インスタンス
+        lines: NDJSON の各行（ファイルオブジェクトをそのまま渡せます）
+        name: 新しいプロジェクト名（省略時はファイル内の名前）
+        batch_size: 1回の executemany で挿入する件数
+
+    Returns:
+        TransferResult: 作成したプロジェクトIDと取り込んだレコード数・所要時間
+
+    Raises:
+        ValidationError: ファイルの形式・内容が不正な場合
+        ConstraintViolationError: プロジェクト名の重複など制約に違反する場合
+        CyclicDependencyError: 依存関係に循環がある場合
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size は1以上である必要があります: {batch_size}")
+
+    started = time.perf_counter()
+    importer = _Importer(db, name, batch_size)
+    # 行ごとの派生データのトリガーは外し、取り込んだプロジェクトのみ最後に再計算する
+    with db.transaction() as conn, bulk_load(conn) as scope:
+        project_id = importer.run(lines)
+        scope.project_id = project_id
+
+    return TransferResult(
+        project_id=project_id,
+        counts=importer.counts,
+        elapsed=time.perf_counter() - started,
+    )
@@ -0,0 +1,190 @@
+"""
+再帰CTEによる依存グラフ探索
+
+このモジュールは依存テーブルに対する WITH RECURSIVE クエリで、
+後続・先行の閉包、経路探索用の部分グラフ、深さ制限付きの近傍を
+1ステートメントで求める関数を提供します。
+
+グラフをPythonに読み込まずにSQLite内で完結させたい場合の探索方式で、
+DependencyManager(traversal="sql") から使用されます。
+"""
+
+import sqlite3
+from typing import Optional
+
+from .graph import dependency_table
+
+
+def _direction_columns(reverse: bool) -> tuple[str, str]:
+    """
+    探索方向に対応する (起点側カラム, 到達側カラム) を返す
+
+    Args:
+        reverse: Trueの場合は先行方向
+    """
+    if reverse:
+        return "successor_id", "predecessor_id"
+    return "predecessor_id", "successor_id"
+
+
+def closure(
+    conn: sqlite3.Connection, dep_type: str, node_id: int, reverse: bool = False
+) -> list[int]:
+    """
+    ノードから辿れる全ノード（後続または先行の閉包）を取得
+
+    UNION による重複排除で、循環を含むデータでも停止します。
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+        node_id: 起点ノードID
+        reverse: Trueの場合は先行方向に辿る
+
+    Returns:
+        list[int]: ノードIDのリスト（ID昇順）
+    """
+    table_name = dependency_table(dep_type)
+    source, target = _direction_columns(reverse)
+
+    cursor = conn.execute(
+        f"""
+        WITH RECURSIVE reach(node_id) AS (
+            SELECT {target} FROM {table_name} WHERE {source} = ?
+            UNION
+            SELECT e.{target}
+            FROM {table_name} AS e
+            JOIN reach AS r ON e.{source} = r.node_id
+        )
+        SELECT node_id FROM reach ORDER BY node_id
+        """,
+        (node_id,),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def is_reachable(
+    conn: sqlite3.Connection, dep_type: str, from_id: int, to_id: int
+) -> bool:
+    """
+    from_id から to_id へ到達できるか判定
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+        from_id: 開始ノードID
+        to_id: 終了ノードID
+
+    Returns:
+        bool: 到達可能な場合True
+    """
+    if from_id == to_id:
+        return True
+
+    table_name = dependency_table(dep_type)
+    row = conn.execute(
+        f"""
+        WITH RECURSIVE reach(node_id) AS (
+            SELECT ?
+            UNION
+            SELECT e.successor_id
+            FROM {table_name} AS e
+            JOIN reach AS r ON e.predecessor_id = r.node_id
+        )
+        SELECT 1 FROM reach WHERE node_id = ? LIMIT 1
+        """,
+        (from_id, to_id),
+    ).fetchone()
+    return row is not None
+
+
+def edges_between(
+    conn: sqlite3.Connection, dep_type: str, from_id: int, to_id: int
+) -> list[tuple[int, int]]:
+    """
+    from_id の子孫かつ to_id の祖先であるノード間のエッジを取得
+
+    from_id → to_id の経路はすべてこの部分グラフに含まれるため、
+    経路探索はこの結果だけを使って行えます。
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+        from_id: 開始ノードID
+        to_id: 終了ノードID
+
+    Returns:
+        list[tuple[int, int]]: エッジ (predecessor_id, successor_id) のリスト
+    """
+    table_name = dependency_table(dep_type)
+    cursor = conn.execute(
+        f"""
+        WITH RECURSIVE
+        down(node_id) AS (
+            SELECT ?
+            UNION
+            SELECT e.successor_id
+            FROM {table_name} AS e
+            JOIN down AS d ON e.predecessor_id = d.node_id
+        ),
+        up(node_id) AS (
+            SELECT ?
+            UNION
+            SELECT e.predecessor_id
+            FROM {table_name} AS e
+            JOIN up AS u ON e.successor_id = u.node_id
+        )
+        SELECT predecessor_id, successor_id FROM {table_name}
+        WHERE predecessor_id IN (SELECT node_id FROM down)
+          AND successor_id IN (SELECT node_id FROM up)
+        """,
+        (from_id, to_id),
+    )
+    return [(row[0], row[1]) for row in cursor.fetchall()]
+
+
+def neighborhood(
+    conn: sqlite3.Connection,
+    dep_type: str,
+    node_id: int,
+    max_depth: Optional[int],
+    reverse: bool = False,
+) -> dict[int, int]:
+    """
+    深さ制限付きで近傍ノードとその最短距離を取得
+
+    Args:
+        conn: コネクション
+        dep_type: 依存関係タイプ ('task' または 'subtask')
+        node_id: 起点ノードID
+        max_depth: 探索する最大距離 (Noneの場合は無制限)
+        reverse: Trueの場合は先行方向に辿る
+
+    Returns:
+        dict[int, int]: {node_id: 距離}（起点自身は含まない）
+    """
+    table_name = dependency_table(dep_type)
+    if max_depth is None:
+        # (node_id, depth) の組は循環があると際限なく増えるため、
+        # 最短距離の上限であるエッジ数を深さの上限とする
+        max_depth = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+    source, target = _direction_columns(reverse)
+
+    cursor = conn.execute(
+        f"""
+        WITH RECURSIVE hood(node_id, depth) AS (
+            SELECT ?, 0
+            UNION
+            SELECT e.{target}, h.depth + 1
+            FROM hood AS h
+            JOIN {table_name} AS e ON e.{source} = h.node_id
+            WHERE h.depth < ?
+        )
+        SELECT node_id, MIN(depth) FROM hood
+        WHERE node_id != ?
+        GROUP BY node_id
+        """,
+        (node_id, max_depth, node_id),
+    )
+    return {row[0]: row[1] for row in cursor.fetchall()}
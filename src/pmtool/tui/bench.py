@@ -0,0 +1,511 @@
+"""
+ベンチマークランナー（pmtool bench）
+
+datagen で生成した規模の異なるDBに対して、固定のシナリオ（CLIコマンド相当の処理）を実行し、
+シナリオごとに以下を計測します。
+
+- 実行時間（repeat 回の中央値と最小値）
+- 発行したSQLの数（QueryTracer）
+- ピークメモリ（tracemalloc、時間計測とは別の1回で計測）
+
+書き込みを伴うシナリオも含め、各実行は1つのトランザクション内で行ってロールバックするため、
+繰り返し実行しても同じ状態のDBに対する計測になります。
+
+結果はJSONファイルに保存でき、以前の結果（ベースライン）と閾値付きで比較できます。
+"""
+
+import gc
+import hashlib
+import io
+import json
+import platform
+import sqlite3
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from rich.console import Console
+
+from ..database import Database
+from ..datagen import DEFAULT_INIT_SQL, DatasetSpec, generate_dataset
+from ..instrumentation import QueryTracer
+from ..template import TemplateManager
+from . import commands, display
+
+RESULT_FORMAT_VERSION = 1
+
+# 規模名 → 生成するデータセット
+BENCH_SIZES: dict[str, DatasetSpec] = {
+    "small": DatasetSpec(
+        projects=2, subprojects_per_project=3, tasks_per_subproject=20, subtasks_per_task=5
+    ),
+    "medium": DatasetSpec(
+        projects=5, subprojects_per_project=10, tasks_per_subproject=50, subtasks_per_task=10
+    ),
+    "large": DatasetSpec(
+        projects=10, subprojects_per_project=10, tasks_per_subproject=100, subtasks_per_task=20
+    ),
+}
+
+
+@dataclass
+class BenchTargets:
+    """シナリオの対象ノード（生成したDBから決定）"""
+
+    project_id: int
+    subproject_id: int
+    first_task_id: int
+    """Project内で最初のTask（後続が最も多い）"""
+
+    last_task_id: int
+    """Project内で最後のTask（先行が最も多い）"""
+
+    dependency_to_id: int
+    """first_task_id からの依存関係がまだないTask（deps add の後続）"""
+
+
+@dataclass
+class Scenario:
+    """ベンチマークシナリオ"""
+
+    name: str
+    description: str
+    run: Callable[[Database, BenchTargets], None]
+
+
+@dataclass
+class BenchResult:
+    """1シナリオ × 1規模の計測結果"""
+
+    size: str
+    scenario: str
+    wall_time: float
+    """実行時間の中央値（秒）"""
+
+    wall_time_min: float
+    """実行時間の最小値（秒）"""
+
+    queries: int
+    """1回の実行で発行したSQLの数"""
+
+    peak_memory: int
+    """ピークメモリ（バイト）"""
+
+
+@dataclass
+class BenchThresholds:
+    """ベースラインとの比較で退行とみなす増加率"""
+
+    wall_time: float = 0.25
+    queries: float = 0.0
+    peak_memory: float = 0.25
+    wall_time_floor: float = 0.005
+    """実行時間の増加がこの秒数以下の場合は退行としない（短いシナリオの揺らぎ対策）"""
+
+
+@dataclass
+class Regression:
+    """ベースラインから閾値を超えて悪化した計測値"""
+
+    size: str
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """ベースラインに対する増加率"""
+        if self.baseline == 0:
+            return float("inf")
+        return self.current / self.baseline - 1
+
+
+@dataclass
+class BenchComparison:
+    """ベースラインとの比較結果"""
+
+    regressions: list[Regression] = field(default_factory=list)
+    missing: list[tuple[str, str]] = field(default_factory=list)
+    """ベースラインにない (規模, シナリオ)"""
+
+    @property
+    def ok(self) -> bool:
+        return not self.regressions
+
+
+# ===== シナリオ =====
+
+
+def _command(*argv: Union[str, Callable[[BenchTargets], object]]):
+    """CLI引数でコマンドハンドラを実行するシナリオ（引数には対象を返す関数も指定可）"""
+
+    def run(db: Database, targets: BenchTargets) -> None:
+        from .cli import create_parser
+
+        args = create_parser().parse_args(
+            [str(arg(targets)) if callable(arg) else arg for arg in argv]
+        )
+        handlers = {
+            "list": commands.handle_list,
+            "show": commands.handle_show,
+            "deps": commands.handle_deps,
+            "status": commands.handle_status,
+            "delete": commands.handle_delete,
+            "doctor": commands.handle_doctor,
+        }
+        handlers[args.command](db, args)
+
+    return run
+
+
+def _template_save_apply(db: Database, targets: BenchTargets) -> None:
+    manager = TemplateManager(db)
+    result = manager.save_template(
+        targets.subproject_id, "bench template", include_tasks=True
+    )
+    manager.apply_template(result.template.id, targets.project_id, "bench copy")
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("list-projects", "list projects", _command("list", "projects")),
+    Scenario(
+        "show-project",
+        "show project <id>",
+        _command("show", "project", lambda t: t.project_id),
+    ),
+    Scenario(
+        "deps-add",
+        "deps add task（循環チェックを含む）",
+        _command(
+            "deps", "add", "task",
+            "--from", lambda t: t.first_task_id,
+            "--to", lambda t: t.dependency_to_id,
+        ),
+    ),
+    Scenario(
+        "deps-impact",
+        "deps impact task <id>",
+        _command("deps", "impact", "task", lambda t: t.first_task_id),
+    ),
+    Scenario(
+        "status-done",
+        "status task <id> DONE --dry-run（DONE遷移の検証）",
+        _command("status", "task", lambda t: t.last_task_id, "DONE", "--dry-run"),
+    ),
+    Scenario(
+        "delete-dry-run",
+        "delete subproject <id> --cascade --dry-run",
+        _command(
+            "delete", "subproject", lambda t: t.subproject_id, "--cascade", "--dry-run"
+        ),
+    ),
+    Scenario("doctor", "doctor", _command("doctor")),
+    Scenario("template", "テンプレート保存・適用", _template_save_apply),
+]
+
+
+# ===== 実行 =====
+
+
+def prepare_database(size: str, workdir: Union[str, Path]) -> Path:
+    """
+    規模に対応するベンチマーク用DBを用意（生成済みの場合は再利用）
+
+    ファイル名にデータセット設定のハッシュを含むため、BENCH_SIZES を変更すると作り直されます。
+
+    Args:
+        size: 規模名（BENCH_SIZES のキー）
+        workdir: DBファイルを置くディレクトリ
+
+    Returns:
+        Path: DBファイルのパス
+
+    Raises:
+        ValueError: 不明な規模名の場合
+    """
+    if size not in BENCH_SIZES:
+        raise ValueError(
+            f"不明な規模です: {size} (選択肢: {', '.join(BENCH_SIZES)})"
+        )
+    spec = BENCH_SIZES[size]
+    digest = hashlib.sha1(
+        json.dumps(asdict(spec), sort_keys=True).encode("utf-8")
+    ).hexdigest()[:10]
+    path = Path(workdir) / f"bench-{size}-{digest}.db"
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".tmp")
+    partial.unlink(missing_ok=True)
+    db = Database(str(partial), profile="fast")
+    try:
+        db.initialize(DEFAULT_INIT_SQL)
+        generate_dataset(db, spec)
+        # WALを本体に書き戻してから単一ファイルとして配置する
+        db.connect().execute("PRAGMA journal_mode = DELETE")
+    finally:
+        db.close()
+    partial.replace(path)
+    return path
+
+
+def find_targets(db: Database) -> BenchTargets:
+    """
+    生成したDBからシナリオの対象ノードを決定
+
+    Args:
+        db: Database インスタンス
+
+    Returns:
+        BenchTargets: 対象ノード
+    """
+    conn = db.connect()
+    project_id = conn.execute("SELECT MIN(id) FROM projects").fetchone()[0]
+    subproject_id = conn.execute(
+        "SELECT MIN(id) FROM subprojects WHERE project_id = ?", (project_id,)
+    ).fetchone()[0]
+    first_task_id, last_task_id = conn.execute(
+        "SELECT MIN(id), MAX(id) FROM tasks WHERE project_id = ?", (project_id,)
+    ).fetchone()
+    # 後方のTaskへの依存関係は、生成データの並び順と同じ向きのため循環しない
+    dependency_to_id = conn.execute(
+        """
+        SELECT MAX(id) FROM tasks
+        WHERE project_id = ? AND id != ?
+          AND id NOT IN (SELECT successor_id FROM task_dependencies WHERE predecessor_id = ?)
+        """,
+        (project_id, first_task_id, first_task_id),
+    ).fetchone()[0]
+    return BenchTargets(
+        project_id=project_id,
+        subproject_id=subproject_id,
+        first_task_id=first_task_id,
+        last_task_id=last_task_id,
+        dependency_to_id=dependency_to_id,
+    )
+
+
+class _Rollback(Exception):
+    """シナリオの変更を破棄するための例外"""
+
+
+@contextmanager
+def _rolled_back(db: Database) -> Iterator[None]:
+    """with 文の中の変更をすべてロールバックする"""
+    try:
+        with db.transaction():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    """コマンドハンドラの表示を捨てる"""
+    sink = Console(file=io.StringIO(), width=120)
+    saved = commands.console, display.console
+    commands.console = display.console = sink
+    try:
+        yield
+    finally:
+        commands.console, display.console = saved
+
+
+def _run_once(db: Database, scenario: Scenario, targets: BenchTargets) -> None:
+    with _quiet(), _rolled_back(db):
+        scenario.run(db, targets)
+
+
+def measure(
+    db: Database,
+    tracer: QueryTracer,
+    scenario: Scenario,
+    targets: BenchTargets,
+    size: str,
+    repeat: int = 3,
+) -> BenchResult:
+    """
+    1シナリオを計測
+
+    Args:
+        db: tracer を設定した Database インスタンス
+        tracer: db の計測結果の記録先
+        scenario: 実行するシナリオ
+        targets: 対象ノード
+        size: 規模名（結果に記録）
+        repeat: 時間計測の繰り返し回数
+
+    Returns:
+        BenchResult: 計測結果
+    """
+    durations = []
+    queries = 0
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        tracer.reset()
+        started = time.perf_counter()
+        _run_once(db, scenario, targets)
+        durations.append(time.perf_counter() - started)
+        # 結果を取り切らずに破棄されたカーソルの実行も数える
+        gc.collect()
+        queries = tracer.total_statements
+
+    # tracemalloc は実行を遅くするため、時間計測とは別の1回で計測する
+    tracemalloc.start()
+    try:
+        _run_once(db, scenario, targets)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        size=size,
+        scenario=scenario.name,
+        wall_time=statistics.median(durations),
+        wall_time_min=min(durations),
+        queries=queries,
+        peak_memory=peak_memory,
+    )
+
+
+def run_benchmarks(
+    sizes: list[str],
+    scenario_names: Optional[list[str]] = None,
+    repeat: int = 3,
+    workdir: Union[str, Path] = "data/bench",
+    profile: Union[str, dict] = "default",
+    on_result: Optional[Callable[[BenchResult], None]] = None,
+) -> list[BenchResult]:
+    """
+    ベンチマークを実行
+
+    Args:
+        sizes: 規模名のリスト
+        scenario_names: 実行するシナリオ名（Noneの場合はすべて）
+        repeat: 時間計測の繰り返し回数
+        workdir: 生成したDBを置くディレクトリ
+        profile: 計測時のSQLite性能プロファイル
+        on_result: シナリオごとに結果を受け取る関数（進捗表示用）
+
+    Returns:
+        list[BenchResult]: 計測結果
+
+    Raises:
+        ValueError: 不明な規模名・シナリオ名の場合
+    """
+    scenarios = SCENARIOS
+    if scenario_names:
+        by_name = {scenario.name: scenario for scenario in SCENARIOS}
+        unknown = [name for name in scenario_names if name not in by_name]
+        if unknown:
+            raise ValueError(
+                f"不明なシナリオです: {', '.join(unknown)} "
+                f"(選択肢: {', '.join(by_name)})"
+            )
+        scenarios = [by_name[name] for name in scenario_names]
+
+    results = []
+    for size in sizes:
+        path = prepare_database(size, workdir)
+        tracer = QueryTracer(slow_threshold_ms=None)
+        db = Database(str(path), profile=profile, tracer=tracer)
+        try:
+            targets = find_targets(db)
+            for scenario in scenarios:
+                result = measure(db, tracer, scenario, targets, size, repeat)
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            db.close()
+    return results
+
+
+# ===== 保存・比較 =====
+
+
+def save_results(path: Union[str, Path], results: list[BenchResult]) -> None:
+    """
+    計測結果をJSONファイルに保存
+
+    Args:
+        path: 保存先
+        results: 計測結果
+    """
+    payload = {
+        "version": RESULT_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "results": [asdict(result) for result in results],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_results(path: Union[str, Path]) -> list[BenchResult]:
+    """
+    save_results() で保存した計測結果を読み込み
+
+    Args:
+        path: JSONファイルのパス
+
+    Returns:
+        list[BenchResult]: 計測結果
+
+    Raises:
+        ValueError: 形式が異なる場合
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("version") != RESULT_FORMAT_VERSION:
+        raise ValueError(
+            f"ベンチマーク結果の形式が異なります: version={payload.get('version')}"
+        )
+    return [BenchResult(**result) for result in payload["results"]]
+
+
+def compare_results(
+    current: list[BenchResult],
+    baseline: list[BenchResult],
+    thresholds: Optional[BenchThresholds] = None,
+) -> BenchComparison:
+    """
+    計測結果をベースラインと比較
+
+    各計測値がベースラインの (1 + 閾値) 倍を超えた場合に退行とします。
+    実行時間は増加が wall_time_floor 秒以下であれば退行としません。
+
+    Args:
+        current: 今回の計測結果
+        baseline: ベースラインの計測結果
+        thresholds: 退行とみなす増加率
+
+    Returns:
+        BenchComparison: 退行した計測値とベースラインにないシナリオ
+    """
+    thresholds = thresholds or BenchThresholds()
+    previous = {(result.size, result.scenario): result for result in baseline}
+    comparison = BenchComparison()
+
+    for result in current:
+        base = previous.get((result.size, result.scenario))
+        if base is None:
+            comparison.missing.append((result.size, result.scenario))
+            continue
+        for metric in ("wall_time", "queries", "peak_memory"):
+            before, after = getattr(base, metric), getattr(result, metric)
+            if metric == "wall_time" and after - before <= thresholds.wall_time_floor:
+                continue
+            if after > before * (1 + getattr(thresholds, metric)):
+                comparison.regressions.append(
+                    Regression(result.size, result.scenario, metric, before, after)
+                )
+    return comparison
@@ -5,12 +5,14 @@ argparseによるサブコマンド方式のCLIインターフェースを提供
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 from rich.console import Console
 
-from ..database import Database
+from ..database import PROFILES, Database
+from ..instrumentation import QueryTracer
 from ..exceptions import (
     ConstraintViolationError,
     CyclicDependencyError,
@@ -19,7 +21,10 @@ from ..exceptions import (
     StatusTransitionError,
     ValidationError,
 )
-from . import commands
+from ..flow import DEFAULT_WEEKS
+from ..transfer import DEFAULT_BATCH_SIZE
+from . import commands, display
+from .bench import BENCH_SIZES, SCENARIOS, BenchThresholds
 
 console = Console()
 
@@ -28,11 +33,36 @@ def create_parser() -> argparse.ArgumentParser:
     """
     argparseパーサーを構築
 
-    サブコマンド: list, show, add, delete, status, deps
+    サブコマンド: list, show, add, delete, status, deps, doctor, export, import, bench
     """
     parser = argparse.ArgumentParser(
         prog="pmtool", description="階層型プロジェクト管理ツール"
     )
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="default",
+        help="SQLite性能プロファイル（fast: WAL+synchronous=NORMAL, safe: WAL+synchronous=FULL）",
+    )
+    parser.add_argument(
+        "--pragma",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="プロファイルのPRAGMA設定を個別に上書き（複数指定可、例: --pragma synchronous=OFF）",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="実行したSQLを計測し、終了時に集計表を表示（環境変数 PMTOOL_TRACE=1 と同じ）",
+    )
+    parser.add_argument(
+        "--trace-slow-ms",
+        type=float,
+        default=None,
+        metavar="MS",
+        help="遅いクエリとして実行計画を表示する閾値（ミリ秒、既定: PMTOOL_TRACE_SLOW_MS または 100）",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="サブコマンド")
 
@@ -96,14 +126,20 @@ def create_parser() -> argparse.ArgumentParser:
     # status コマンド
     status_parser = subparsers.add_parser("status", help="ステータス変更")
     status_parser.add_argument(
-        "entity", choices=["task", "subtask"], help="対象エンティティ"
+        "entity", choices=["task", "subtask"], nargs="?", help="対象エンティティ"
     )
-    status_parser.add_argument("id", type=int, help="エンティティID")
+    status_parser.add_argument("id", type=int, nargs="?", help="エンティティID")
     status_parser.add_argument(
         "status",
         choices=["UNSET", "NOT_STARTED", "IN_PROGRESS", "DONE"],
+        nargs="?",
         help="新しいステータス",
     )
+    status_parser.add_argument(
+        "--bulk",
+        metavar="FILE",
+        help="ファイルに列挙した変更を一括適用（1行に '<task|subtask> <ID> <STATUS>'、# 以降はコメント）",
+    )
     status_parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -122,6 +158,39 @@ def create_parser() -> argparse.ArgumentParser:
     update_parser.add_argument("--description", "--desc", type=str, help="新しい説明")
     update_parser.add_argument("--order", type=int, help="新しいorder_index")
 
+    # ready コマンド
+    ready_parser = subparsers.add_parser(
+        "ready", help="着手可能なノード（未完了で先行ノードがすべてDONE）を表示"
+    )
+    ready_parser.add_argument("--project", type=int, help="対象プロジェクトID")
+    ready_parser.add_argument(
+        "--type", choices=["task", "subtask"], dest="node_type", help="対象の層（省略時は両方）"
+    )
+    ready_parser.add_argument(
+        "--limit", type=int, default=100, help="層ごとの最大表示件数（既定: 100）"
+    )
+
+    # stats コマンド
+    stats_parser = subparsers.add_parser("stats", help="ステータス履歴の分析")
+    stats_subparsers = stats_parser.add_subparsers(dest="stats_command")
+    stats_flow = stats_subparsers.add_parser(
+        "flow", help="サイクルタイム・WIP・週次スループット（プロジェクト別）"
+    )
+    stats_flow.add_argument("--project", type=int, help="対象プロジェクトID")
+    stats_flow.add_argument(
+        "--type",
+        choices=["task", "subtask"],
+        default="task",
+        dest="node_type",
+        help="対象の層（既定: task）",
+    )
+    stats_flow.add_argument(
+        "--weeks",
+        type=int,
+        default=DEFAULT_WEEKS,
+        help=f"集計期間（今週を含む直近の週数、既定: {DEFAULT_WEEKS}）",
+    )
+
     # deps コマンド
     deps_parser = subparsers.add_parser("deps", help="依存関係管理")
     deps_subparsers = deps_parser.add_subparsers(dest="deps_command")
@@ -168,6 +237,12 @@ def create_parser() -> argparse.ArgumentParser:
     deps_chain.add_argument("entity", choices=["task", "subtask"])
     deps_chain.add_argument("--from", dest="from_id", type=int, required=True, help="開始ノードID")
     deps_chain.add_argument("--to", dest="to_id", type=int, required=True, help="終了ノードID")
+    deps_chain.add_argument(
+        "--traversal",
+        choices=["auto", "memory", "sql"],
+        default="auto",
+        help="探索方式（auto: インデックスがあれば使用 / memory / sql）",
+    )
 
     # deps impact
     deps_impact = deps_subparsers.add_parser(
@@ -175,15 +250,196 @@ def create_parser() -> argparse.ArgumentParser:
     )
     deps_impact.add_argument("entity", choices=["task", "subtask"])
     deps_impact.add_argument("id", type=int, help="エンティティID")
+    deps_impact.add_argument(
+        "--traversal",
+        choices=["auto", "memory", "sql"],
+        default="auto",
+        help="探索方式（auto: インデックスがあれば使用 / memory / sql）",
+    )
+
+    # deps reindex
+    deps_reindex = deps_subparsers.add_parser(
+        "reindex", help="到達可能性インデックスを再構築（chain/impactを高速化）"
+    )
+    deps_reindex.add_argument(
+        "entity",
+        choices=["task", "subtask"],
+        nargs="?",
+        help="対象（省略時は task と subtask の両方）",
+    )
 
     # doctor/check コマンド
     doctor_parser = subparsers.add_parser(
         "doctor", help="データベース整合性チェック", aliases=["check"]
     )
+    doctor_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="チェックの並列実行数（2以上で各チェックを読み取り専用接続で並列実行）",
+    )
+    doctor_mode = doctor_parser.add_mutually_exclusive_group()
+    doctor_mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="前回のチェック以降に変更された箇所とその隣接要素のみをチェック",
+    )
+    doctor_mode.add_argument(
+        "--full",
+        action="store_true",
+        help="全件チェックを行い、差分チェックのウォーターマークをリセット",
+    )
+
+    # export コマンド
+    export_parser = subparsers.add_parser(
+        "export", help="プロジェクト全体をファイルに書き出す（環境間の移行用）"
+    )
+    export_parser.add_argument("entity", choices=["project"], help="書き出し対象")
+    export_parser.add_argument("id", type=int, help="エンティティID")
+    export_parser.add_argument(
+        "--format", choices=["ndjson"], default="ndjson", help="出力形式（既定: ndjson）"
+    )
+    export_parser.add_argument(
+        "-o", "--output", help="書き出し先ファイル（省略時は project-<ID>.ndjson）"
+    )
+
+    # import コマンド
+    import_parser = subparsers.add_parser(
+        "import", help="export したファイルを新しいプロジェクトとして取り込む"
+    )
+    import_parser.add_argument("file", help="NDJSONファイル")
+    import_parser.add_argument("--name", help="新しいプロジェクト名（省略時はファイル内の名前）")
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"1回にまとめて挿入する件数（既定: {DEFAULT_BATCH_SIZE}）",
+    )
+
+    # bench コマンド
+    bench_parser = subparsers.add_parser(
+        "bench", help="生成したDBに対するベンチマーク（時間・SQL数・メモリ）"
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(BENCH_SIZES),
+        default=["small"],
+        help="計測するデータセットの規模（複数指定可）",
+    )
+    bench_parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="実行するシナリオ（複数指定可、省略時はすべて）",
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=3, help="時間計測の繰り返し回数（中央値を記録）"
+    )
+    bench_parser.add_argument(
+        "--workdir",
+        default="data/bench",
+        help="生成したDBを置くディレクトリ（生成済みのDBは再利用）",
+    )
+    bench_parser.add_argument("--output", help="計測結果を保存するJSONファイル")
+    bench_parser.add_argument(
+        "--baseline", help="比較するベースラインのJSONファイル（退行があれば終了コード1）"
+    )
+    bench_parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=BenchThresholds.wall_time,
+        help="退行とみなす実行時間の増加率（既定: 0.25）",
+    )
+    bench_parser.add_argument(
+        "--query-threshold",
+        type=float,
+        default=BenchThresholds.queries,
+        help="退行とみなすSQL数の増加率（既定: 0）",
+    )
+    bench_parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=BenchThresholds.peak_memory,
+        help="退行とみなすピークメモリの増加率（既定: 0.25）",
+    )
+
+    # --trace はサブコマンドの後ろにも指定できるようにする
+    _add_trace_option(subparsers)
 
     return parser
 
 
+def _add_trace_option(subparsers: argparse._SubParsersAction) -> None:
+    """
+    入れ子のサブコマンドを含むすべてのサブコマンドに --trace を追加
+
+    SUPPRESS によりサブコマンド側で未指定の場合はトップレベルの値を上書きしません。
+    エイリアスは同じパーサーを指すため重複を除きます。
+
+    Args:
+        subparsers: add_subparsers() の戻り値
+    """
+    for subparser in {id(p): p for p in subparsers.choices.values()}.values():
+        subparser.add_argument(
+            "--trace",
+            action="store_true",
+            default=argparse.SUPPRESS,
+            help="実行したSQLを計測し、終了時に集計表を表示",
+        )
+        for action in subparser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                _add_trace_option(action)
+
+
+def build_tracer(args: argparse.Namespace) -> QueryTracer | None:
+    """
+    --trace / PMTOOL_TRACE から SQL計測の記録先を構築
+
+    Args:
+        args: コマンドライン引数
+
+    Returns:
+        QueryTracer | None: 計測が無効の場合None
+    """
+    enabled = getattr(args, "trace", False) or os.environ.get(
+        "PMTOOL_TRACE", ""
+    ) not in ("", "0")
+    if not enabled:
+        return None
+
+    slow_ms = getattr(args, "trace_slow_ms", None)
+    if slow_ms is None:
+        slow_ms = float(os.environ.get("PMTOOL_TRACE_SLOW_MS", "100"))
+    return QueryTracer(slow_threshold_ms=slow_ms)
+
+
+def build_profile(args: argparse.Namespace) -> str | dict:
+    """
+    --profile / --pragma から Database に渡す性能プロファイルを構築
+
+    Args:
+        args: コマンドライン引数
+
+    Returns:
+        str | dict: プロファイル名（--pragma 未指定時）または PRAGMA設定の辞書
+
+    Raises:
+        ValueError: --pragma の書式が NAME=VALUE でない場合
+    """
+    if not args.pragma:
+        return args.profile
+
+    pragmas: dict = dict(PROFILES[args.profile])
+    for item in args.pragma:
+        name, sep, value = item.partition("=")
+        if not sep or not name or not value:
+            raise ValueError(f"--pragma は NAME=VALUE の形式で指定してください: {item}")
+        pragmas[name.strip()] = value.strip()
+    return pragmas
+
+
 def main() -> None:
     """
     CLIのエントリーポイント
@@ -197,9 +453,23 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
+    # bench は生成したDBに対して実行するため data/pmtool.db は開かない
+    if args.command == "bench":
+        try:
+            ok = commands.handle_bench(args, profile=build_profile(args))
+        except ValueError as e:
+            console.print(f"[red]ERROR: 入力エラー: {e}[/red]")
+            sys.exit(1)
+        sys.exit(0 if ok else 1)
+
     # DB初期化
     db_path = Path("data/pmtool.db")
-    db = Database(str(db_path))
+    tracer = build_tracer(args)
+    try:
+        db = Database(str(db_path), profile=build_profile(args), tracer=tracer)
+    except ValueError as e:
+        console.print(f"[red]ERROR: 入力エラー: {e}[/red]")
+        sys.exit(1)
 
     try:
         # サブコマンドディスパッチ
@@ -215,10 +485,18 @@ def main() -> None:
             commands.handle_status(db, args)
         elif args.command == "update":
             commands.handle_update(db, args)
+        elif args.command == "ready":
+            commands.handle_ready(db, args)
+        elif args.command == "stats":
+            commands.handle_stats(db, args)
         elif args.command == "deps":
             commands.handle_deps(db, args)
         elif args.command in ("doctor", "check"):
             commands.handle_doctor(db, args)
+        elif args.command == "export":
+            commands.handle_export(db, args)
+        elif args.command == "import":
+            commands.handle_import(db, args)
         else:
             console.print(f"[red]エラー: 未知のコマンド '{args.command}'[/red]")
             sys.exit(1)
@@ -274,6 +552,10 @@ def main() -> None:
 
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # sys.exit() による終了時も集計表を表示する
+        if tracer is not None:
+            display.show_query_trace(tracer)
 
 
 if __name__ == "__main__":
@@ -8,12 +8,14 @@ from argparse import Namespace
 from typing import Optional
 
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TaskID, TextColumn
 
 from ..database import Database
 from ..dependencies import DependencyManager
 from ..doctor import Doctor
-from ..exceptions import DeletionError
+from ..exceptions import DeletionError, ValidationError
 from ..repository import (
+    CascadeProgress,
     ProjectRepository,
     SubProjectRepository,
     SubTaskRepository,
@@ -21,7 +23,8 @@ from ..repository import (
     _now,
 )
 from ..status import StatusManager
-from . import display
+from .. import flow, transfer
+from . import bench, display
 from . import input as tui_input
 
 console = Console()
@@ -43,7 +46,7 @@ def handle_list(db: Database, args: Namespace) -> None:
     if entity_type == "projects":
         repo = ProjectRepository(db)
         projects = repo.get_all()
-        display.show_project_list(projects)
+        display.show_project_list(projects, repo.get_progress())
 
 
 # ===== show コマンド =====
@@ -276,9 +279,10 @@ def _show_delete_impact(
         f"\n[bold cyan]=== Dry-run: Delete {entity_type.title()} {entity_id} ===[/bold cyan]\n"
     )
 
-    # トランザクション開始
+    # トランザクション開始（セーブポイントで囲み、呼び出し元のトランザクションは巻き戻さない）
     conn = db.connect()
     cursor = conn.cursor()
+    cursor.execute("SAVEPOINT pmtool_dry_run")
 
     try:
         # 削除前の件数を取得
@@ -382,7 +386,8 @@ def _show_delete_impact(
 
     finally:
         # 必ず rollback（dry-run なので変更を破棄）
-        conn.rollback()
+        cursor.execute("ROLLBACK TO pmtool_dry_run")
+        cursor.execute("RELEASE pmtool_dry_run")
         # 注: Database.connect() はシングルトン接続を返すため、ここで close() しない
         # close() すると他の処理で "Cannot operate on a closed database" エラーになる
 
@@ -595,30 +600,44 @@ def _delete_cascade(db: Database, entity_type: str, entity_id: int) -> None:
         entity_type: 削除対象のエンティティ種別
         entity_id: 削除対象のエンティティID
     """
-    conn = db.connect()
-    cursor = conn.cursor()
-
     try:
-        # トランザクション開始
-        conn.execute("BEGIN")
-
-        # エンティティ種別に応じてカスケード削除
-        _delete_cascade_in_transaction(db, entity_type, entity_id, conn)
+        # 削除全体を1トランザクションで行い、チャンクごとに進捗を表示する
+        with Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+        ) as progress, db.transaction() as conn:
+            bars: dict[str, TaskID] = {}
+
+            def on_progress(table: str, done: int, total: int) -> None:
+                if table not in bars:
+                    bars[table] = progress.add_task(f"{table} を削除中", total=total)
+                progress.update(bars[table], completed=done)
+
+            # エンティティ種別に応じてカスケード削除
+            result = _delete_cascade_in_transaction(
+                db, entity_type, entity_id, conn, on_progress=on_progress
+            )
 
-        # コミット
-        conn.commit()
+        deleted = ", ".join(f"{name}={count}" for name, count in result.items() if count)
         console.print(
             f"[green]✓[/green] {entity_type.title()} ID={entity_id} をカスケード削除しました。"
+            f" [dim]({deleted})[/dim]"
         )
 
     except Exception as e:
-        conn.rollback()
         console.print(f"[red]ERROR: カスケード削除に失敗しました: {e}[/red]")
         raise
 
 
 def _delete_cascade_in_transaction(
-    db: Database, entity_type: str, entity_id: int, conn
+    db: Database,
+    entity_type: str,
+    entity_id: int,
+    conn,
+    on_progress: Optional[CascadeProgress] = None,
 ) -> dict:
     """
     カスケード削除のトランザクション内処理（Phase 4 実装）
@@ -630,6 +649,7 @@ def _delete_cascade_in_transaction(
         entity_type: 削除対象のエンティティ種別
         entity_id: 削除対象のエンティティID
         conn: データベース接続
+        on_progress: 進捗コールバック（Project / SubProject の削除で使用）
 
     Returns:
         dict: 削除結果（dry-runモードで使用）
@@ -643,10 +663,14 @@ def _delete_cascade_in_transaction(
 
     if entity_type == "project":
         repo = ProjectRepository(db)
-        return repo.cascade_delete(entity_id, dry_run=False, conn=conn)
+        return repo.cascade_delete(
+            entity_id, dry_run=False, conn=conn, on_progress=on_progress
+        )
     elif entity_type == "subproject":
         repo = SubProjectRepository(db)
-        return repo.cascade_delete(entity_id, dry_run=False, conn=conn)
+        return repo.cascade_delete(
+            entity_id, dry_run=False, conn=conn, on_progress=on_progress
+        )
     elif entity_type == "task":
         repo = TaskRepository(db)
         return repo.cascade_delete(entity_id, dry_run=False, conn=conn)
@@ -676,11 +700,24 @@ def handle_status(db: Database, args: Namespace) -> None:
     entity_id = args.id
     new_status = args.status
     dry_run = getattr(args, "dry_run", False)
+    bulk_file = getattr(args, "bulk", None)
 
     # StatusManager初期化
     dep_manager = DependencyManager(db)
     status_manager = StatusManager(db, dep_manager)
 
+    # 一括更新モード
+    if bulk_file:
+        if entity_type is not None:
+            raise ValidationError("--bulk と対象の個別指定は同時に使用できません")
+        changes = _read_status_changes(bulk_file)
+        result = status_manager.update_statuses(changes, dry_run=dry_run)
+        display.show_status_batch_result(result, dry_run=dry_run)
+        return
+
+    if entity_type is None or entity_id is None or new_status is None:
+        raise ValidationError("entity, id, status を指定してください（または --bulk FILE）")
+
     # dry-runモード
     if dry_run:
         can_transition, error_msg, reason, details = status_manager.dry_run_status_update(
@@ -725,6 +762,36 @@ def handle_status(db: Database, args: Namespace) -> None:
         )
 
 
+def _read_status_changes(path: str) -> list[tuple[str, int, str]]:
+    """
+    status --bulk のファイルを読み込む
+
+    1行に '<task|subtask> <ID> <STATUS>' を空白またはカンマ区切りで記述します。
+    空行と # 以降はコメントとして無視します。
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        list[tuple[str, int, str]]: (ノードタイプ, ノードID, 新しいステータス) のリスト
+
+    Raises:
+        ValidationError: 書式が不正な行がある場合
+    """
+    changes = []
+    with open(path, encoding="utf-8") as fp:
+        for line_no, line in enumerate(fp, start=1):
+            fields = line.split("#", 1)[0].replace(",", " ").split()
+            if not fields:
+                continue
+            if len(fields) != 3 or not fields[1].isdigit():
+                raise ValidationError(
+                    f"{path}:{line_no}: '<task|subtask> <ID> <STATUS>' の形式で指定してください"
+                )
+            changes.append((fields[0].lower(), int(fields[1]), fields[2].upper()))
+    return changes
+
+
 # ===== update コマンド =====
 
 
@@ -963,6 +1030,56 @@ def _update_order_index(db: Database, entity_type: str, entity_id: int, new_orde
         raise
 
 
+# ===== ready コマンド =====
+
+
+def handle_ready(db: Database, args: Namespace) -> None:
+    """
+    readyコマンドの処理
+
+    未完了で先行ノードがすべてDONEのTask/SubTaskを一覧表示する。
+
+    Args:
+        db: Database インスタンス
+        args: コマンドライン引数
+    """
+    if args.limit is not None and args.limit <= 0:
+        raise ValidationError("--limit は1以上を指定してください")
+    if args.project is not None and ProjectRepository(db).get_by_id(args.project) is None:
+        raise ValidationError(f"プロジェクトID {args.project} は存在しません")
+
+    status_mgr = StatusManager(db, DependencyManager(db))
+    ready = status_mgr.get_ready_nodes(
+        project_id=args.project, node_type=args.node_type, limit=args.limit
+    )
+    display.show_ready_nodes(ready, limit=args.limit)
+
+
+# ===== stats コマンド =====
+
+
+def handle_stats(db: Database, args: Namespace) -> None:
+    """
+    statsコマンドの処理
+
+    stats flow: ステータス履歴からプロジェクト別のサイクルタイム・WIP・週次スループットを表示する。
+
+    Args:
+        db: Database インスタンス
+        args: コマンドライン引数
+
+    Raises:
+        ValidationError: サブコマンドが指定されていない場合
+    """
+    if args.stats_command != "flow":
+        raise ValidationError("サブコマンドを指定してください: flow")
+
+    stats = flow.compute_flow_stats(
+        db, project_id=args.project, node_type=args.node_type, weeks=args.weeks
+    )
+    display.show_flow_stats(stats, args.node_type)
+
+
 # ===== deps コマンド =====
 
 
@@ -970,7 +1087,7 @@ def handle_deps(db: Database, args: Namespace) -> None:
     """
     depsコマンドの処理
 
-    deps add/remove/list/graph/chain/impact のサブコマンドに応じて依存関係を操作する。
+    deps add/remove/list/graph/chain/impact/reindex のサブコマンドに応じて依存関係を操作する。
 
     Args:
         db: Database インスタンス
@@ -979,7 +1096,7 @@ def handle_deps(db: Database, args: Namespace) -> None:
     deps_command = args.deps_command
     entity_type = args.entity
 
-    dep_manager = DependencyManager(db)
+    dep_manager = DependencyManager(db, traversal=getattr(args, "traversal", "auto"))
 
     if deps_command == "add":
         _deps_add(dep_manager, entity_type, args.from_id, args.to_id)
@@ -994,6 +1111,8 @@ def handle_deps(db: Database, args: Namespace) -> None:
         _deps_chain(db, dep_manager, entity_type, args.from_id, args.to_id)
     elif deps_command == "impact":
         _deps_impact(db, dep_manager, entity_type, args.id)
+    elif deps_command == "reindex":
+        _deps_reindex(dep_manager, entity_type)
 
 
 def _deps_add(
@@ -1111,6 +1230,16 @@ def _deps_impact(
         display.show_impact_analysis_subtask(db, entity_id, all_successors)
 
 
+def _deps_reindex(dep_manager: DependencyManager, entity_type: Optional[str]) -> None:
+    """到達可能性インデックス再構築"""
+    counts = dep_manager.rebuild_reachability_index(entity_type)
+    for dep_type, count in counts.items():
+        label = "Task" if dep_type == "task" else "SubTask"
+        console.print(
+            f"[green]✓[/green] {label}到達可能性インデックス再構築: {count}件"
+        )
+
+
 # ===== doctor/check コマンド =====
 
 
@@ -1127,7 +1256,13 @@ def handle_doctor(db: Database, args: Namespace) -> None:
     console.print("[bold cyan]データベース整合性チェック実行中...[/bold cyan]\n")
 
     # チェック実行
-    report = doctor.check_all()
+    jobs = getattr(args, "jobs", 1)
+    if getattr(args, "incremental", False):
+        report = doctor.check_incremental(jobs=jobs)
+    elif getattr(args, "full", False):
+        report = doctor.check_full(jobs=jobs)
+    else:
+        report = doctor.check_all(jobs=jobs)
 
     # レポート表示
     display.show_doctor_report(report)
@@ -1139,3 +1274,91 @@ def handle_doctor(db: Database, args: Namespace) -> None:
         console.print(
             f"\n[bold red]NG: {report.error_count}件のエラーが検出されました[/bold red]"
         )
+
+
+# ===== export / import コマンド =====
+
+
+def handle_export(db: Database, args: Namespace) -> None:
+    """
+    exportコマンドの処理（プロジェクト全体をNDJSONで書き出す）
+
+    Args:
+        db: Database インスタンス
+        args: コマンドライン引数
+    """
+    output = args.output or f"project-{args.id}.ndjson"
+    with open(output, "w", encoding="utf-8", newline="\n") as fp:
+        result = transfer.export_project(db, args.id, fp)
+
+    display.show_transfer_result(result, "エクスポート")
+    console.print(f"[green]書き出しました: {output}[/green]")
+
+
+def handle_import(db: Database, args: Namespace) -> None:
+    """
+    importコマンドの処理（NDJSONファイルを新しいプロジェクトとして取り込む）
+
+    Args:
+        db: Database インスタンス
+        args: コマンドライン引数
+    """
+    with open(args.file, encoding="utf-8") as fp:
+        result = transfer.import_ndjson(
+            db, fp, name=args.name, batch_size=args.batch_size
+        )
+
+    display.show_transfer_result(result, "インポート")
+    console.print(f"[green]プロジェクトを作成しました (ID: {result.project_id})[/green]")
+
+
+# ===== bench コマンド =====
+
+
+def handle_bench(args: Namespace, profile: str | dict = "default") -> bool:
+    """
+    benchコマンドの処理（ベンチマークの実行・保存・ベースライン比較）
+
+    Args:
+        args: コマンドライン引数
+        profile: 計測時のSQLite性能プロファイル
+
+    Returns:
+        bool: ベースラインとの比較で退行がなければTrue（比較しない場合もTrue）
+
+    Raises:
+        ValueError: 不明な規模名・シナリオ名、またはベースラインの形式が異なる場合
+    """
+    baseline = bench.load_results(args.baseline) if args.baseline else None
+
+    console.print(
+        f"[bold cyan]ベンチマーク実行中...[/bold cyan] "
+        f"[dim](sizes={', '.join(args.sizes)}, repeat={args.repeat})[/dim]\n"
+    )
+    results = bench.run_benchmarks(
+        args.sizes,
+        scenario_names=args.scenarios,
+        repeat=args.repeat,
+        workdir=args.workdir,
+        profile=profile,
+        on_result=lambda r: console.print(
+            f"  [dim]{r.size:<8} {r.scenario:<16} {r.wall_time * 1000:10.1f} ms[/dim]"
+        ),
+    )
+    display.show_bench_results(results)
+
+    if args.output:
+        bench.save_results(args.output, results)
+        console.print(f"\n[green]計測結果を保存しました: {args.output}[/green]")
+
+    if baseline is None:
+        return True
+
+    thresholds = bench.BenchThresholds(
+        wall_time=args.time_threshold,
+        queries=args.query_threshold,
+        peak_memory=args.memory_threshold,
+    )
+    comparison = bench.compare_results(results, baseline, thresholds)
+    display.show_bench_comparison(comparison, thresholds)
+    return comparison.ok
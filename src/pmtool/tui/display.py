@@ -4,31 +4,43 @@ TUI 表示ロジック
 Rich を使った階層ツリー表示、テーブル表示、依存関係表示を提供します。
 """
 
+from typing import TYPE_CHECKING, Optional
+
 from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 
 from ..database import Database
 from ..doctor import DoctorReport, IssueLevel
-from ..models import Project
+from ..flow import PERCENTILES, FlowStats
+from ..instrumentation import QueryTracer
+from ..models import ProgressRollup, Project, SubTask, Task, UpdateStatusesResult
 from ..repository import (
     ProjectRepository,
     SubProjectRepository,
     SubTaskRepository,
     TaskRepository,
 )
+from ..transfer import RECORD_TYPES, TransferResult
 from . import formatters
 
+if TYPE_CHECKING:
+    from .bench import BenchComparison, BenchResult, BenchThresholds
+
 console = Console()
 
 
-def show_project_list(projects: list[Project]) -> None:
+def show_project_list(
+    projects: list[Project], progress: Optional[dict[int, ProgressRollup]] = None
+) -> None:
     """
     Project一覧をRich Tableで表示
 
     Args:
         projects: Projectのリスト
+        progress: ProjectID → ステータス別件数（ProjectRepository.get_progress() の結果）
     """
+    progress = progress or {}
     if not projects:
         console.print("[yellow]プロジェクトが見つかりません。[/yellow]")
         return
@@ -37,9 +49,10 @@ def show_project_list(projects: list[Project]) -> None:
         title="プロジェクト一覧", show_header=True, header_style="bold magenta"
     )
     table.add_column("ID", style="cyan", width=6)
-    table.add_column("名前", style="white")
+    table.add_column("名前", style="white", no_wrap=True)
     table.add_column("説明", style="dim")
     table.add_column("表示順序", justify="right", width=10)
+    table.add_column("進捗", justify="right", no_wrap=True)
     table.add_column("作成日時", style="dim", width=20)
 
     for proj in projects:
@@ -48,6 +61,7 @@ def show_project_list(projects: list[Project]) -> None:
             proj.name,
             proj.description or "",
             str(proj.order_index),
+            formatters.format_progress(progress.get(proj.id)),
             proj.created_at[:19],  # "YYYY-MM-DDTHH:MM:SS"
         )
 
@@ -63,20 +77,20 @@ def show_project_tree(db: Database, project_id: int, use_emoji: bool = True) ->
         project_id: 表示対象のProject ID
         use_emoji: 絵文字を使用するかどうか（デフォルト: True）
     """
-    # リポジトリ初期化
+    # 4階層ツリーを一括取得（SubProject/Task/SubTaskの件数に関わらず固定回数のクエリ）
     proj_repo = ProjectRepository(db)
-    subproj_repo = SubProjectRepository(db)
-    task_repo = TaskRepository(db)
-    subtask_repo = SubTaskRepository(db)
-
-    # Project取得
-    project = proj_repo.get_by_id(project_id)
-    if not project:
+    project_tree = proj_repo.load_tree(project_id)
+    if not project_tree:
         console.print(
             f"[red]エラー: Project ID={project_id} が見つかりません。[/red]"
         )
         return
 
+    project = project_tree.project
+    # 進捗は集計表から読む（Task / SubTask の再集計は行わない）
+    project_progress = proj_repo.get_progress([project_id]).get(project.id)
+    subproject_progress = SubProjectRepository(db).get_progress_by_project(project_id)
+
     # 記号取得
     project_symbol = formatters.get_entity_symbol("project", use_emoji)
     subproject_symbol = formatters.get_entity_symbol("subproject", use_emoji)
@@ -85,45 +99,46 @@ def show_project_tree(db: Database, project_id: int, use_emoji: bool = True) ->
 
     # Treeルート作成
     tree = Tree(
-        f"{project_symbol} [bold]{project.name}[/bold] (ID={project.id})", guide_style="dim"
+        f"{project_symbol} [bold]{project.name}[/bold] (ID={project.id}) "
+        f"[cyan]{formatters.format_progress(project_progress)}[/cyan]",
+        guide_style="dim",
     )
 
-    # SubProject取得・追加
-    subprojects = subproj_repo.get_by_project(project_id)
-    for subproj in subprojects:
-        subproj_node = tree.add(f"{subproject_symbol} {subproj.name} (ID={subproj.id})")
+    # SubProject・Task・SubTask追加
+    for subproj_node in project_tree.subprojects:
+        subproj = subproj_node.subproject
+        subproj_branch = tree.add(
+            f"{subproject_symbol} {subproj.name} (ID={subproj.id}) "
+            f"[cyan]{formatters.format_progress(subproject_progress.get(subproj.id))}[/cyan]"
+        )
 
-        # Task取得・追加
-        tasks = task_repo.get_by_parent(project_id=project_id, subproject_id=subproj.id)
-        for task in tasks:
+        for task_node in subproj_node.tasks:
+            task = task_node.task
             status_display = formatters.format_status(task.status, use_emoji)
-            task_node = subproj_node.add(
+            task_branch = subproj_branch.add(
                 f"{task_symbol} {task.name} (ID={task.id}) {status_display}"
             )
 
-            # SubTask取得・追加
-            subtasks = subtask_repo.get_by_task(task.id)
-            for subtask in subtasks:
+            for subtask in task_node.subtasks:
                 subtask_status = formatters.format_status(subtask.status, use_emoji)
-                task_node.add(
+                task_branch.add(
                     f"{subtask_symbol}  {subtask.name} (ID={subtask.id}) {subtask_status}"
                 )
 
     # プロジェクト直下のTask（subproject_id=None）も追加（レビュー指摘B-9対応）
-    direct_tasks = task_repo.get_by_parent(project_id=project_id, subproject_id=None)
-    if direct_tasks:
+    if project_tree.direct_tasks:
         # 区画ノードを作成
         direct_tasks_node = tree.add(f"{task_symbol} [dim]Tasks (direct)[/dim]")
-        for task in direct_tasks:
+        for task_node in project_tree.direct_tasks:
+            task = task_node.task
             status_display = formatters.format_status(task.status, use_emoji)
-            task_node = direct_tasks_node.add(
+            task_branch = direct_tasks_node.add(
                 f"{task_symbol} {task.name} (ID={task.id}) {status_display}"
             )
 
-            subtasks = subtask_repo.get_by_task(task.id)
-            for subtask in subtasks:
+            for subtask in task_node.subtasks:
                 subtask_status = formatters.format_status(subtask.status, use_emoji)
-                task_node.add(
+                task_branch.add(
                     f"{subtask_symbol}  {subtask.name} (ID={subtask.id}) {subtask_status}"
                 )
 
@@ -222,6 +237,364 @@ def show_doctor_report(report: DoctorReport) -> None:
     if report.is_healthy and report.warning_count == 0:
         console.print("[dim]問題は検出されませんでした[/dim]")
 
+    # チェックごとの所要時間
+    if report.timings:
+        console.print()
+        console.print("[bold]Timings:[/bold]")
+        for name, elapsed in report.timings.items():
+            console.print(f"  [dim]{name:<20} {elapsed * 1000:8.1f} ms[/dim]")
+
+    # 差分チェックの対象範囲
+    if report.scope is not None:
+        scope = report.scope
+        console.print()
+        console.print(f"[bold]Scope:[/bold] [dim]since {scope.since}[/dim]")
+        console.print(
+            f"  [dim]Projects={len(scope.project_ids)}, "
+            f"SubProjects={len(scope.subproject_ids)}, "
+            f"Tasks={len(scope.task_ids)}, "
+            f"SubTasks={len(scope.subtask_ids)}[/dim]"
+        )
+
+
+def show_query_trace(tracer: QueryTracer, limit: int = 30) -> None:
+    """
+    SQL計測の集計表と遅いクエリを表示（--trace / PMTOOL_TRACE）
+
+    Args:
+        tracer: 計測結果
+        limit: 表示するステートメントの最大数（合計時間の降順）
+    """
+    summary = tracer.summary()
+    console.print()
+    table = Table(
+        title=f"SQL Trace（{tracer.total_statements} statements）",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Calls", justify="right", width=7)
+    table.add_column("Total ms", justify="right", width=10)
+    table.add_column("p95 ms", justify="right", width=9)
+    table.add_column("Rows", justify="right", width=8)
+    table.add_column("SQL", style="dim", overflow="fold")
+
+    for stats in summary[:limit]:
+        table.add_row(
+            str(stats.count),
+            f"{stats.total_time * 1000:.2f}",
+            f"{stats.p95 * 1000:.2f}",
+            str(stats.rows),
+            stats.sql,
+        )
+    console.print(table)
+    if len(summary) > limit:
+        console.print(f"[dim]... 他 {len(summary) - limit} 種類のステートメント[/dim]")
+
+    if tracer.slow_queries:
+        console.print()
+        console.print(
+            f"[bold yellow]Slow queries (>= {tracer.slow_threshold_ms:g} ms):[/bold yellow]"
+        )
+        for slow in tracer.slow_queries:
+            console.print(f"  [yellow]{slow.elapsed * 1000:.2f} ms[/yellow] {' '.join(slow.sql.split())}")
+            for detail in slow.plan:
+                console.print(f"    [dim]{detail}[/dim]")
+
+
+def show_bench_results(results: "list[BenchResult]") -> None:
+    """
+    ベンチマークの計測結果を表示
+
+    Args:
+        results: 計測結果
+    """
+    console.print()
+    table = Table(title="Benchmark", show_header=True, header_style="bold magenta")
+    table.add_column("Size", style="cyan")
+    table.add_column("Scenario")
+    table.add_column("Median ms", justify="right")
+    table.add_column("Min ms", justify="right")
+    table.add_column("Queries", justify="right")
+    table.add_column("Peak KiB", justify="right")
+
+    for result in results:
+        table.add_row(
+            result.size,
+            result.scenario,
+            f"{result.wall_time * 1000:.1f}",
+            f"{result.wall_time_min * 1000:.1f}",
+            str(result.queries),
+            f"{result.peak_memory / 1024:.0f}",
+        )
+    console.print(table)
+
+
+def show_bench_comparison(
+    comparison: "BenchComparison", thresholds: "BenchThresholds"
+) -> None:
+    """
+    ベンチマークのベースライン比較結果を表示
+
+    Args:
+        comparison: 比較結果
+        thresholds: 退行とみなした増加率
+    """
+    console.print()
+    console.print(
+        f"[bold]Baseline comparison[/bold] [dim](thresholds: time +{thresholds.wall_time:.0%}, "
+        f"queries +{thresholds.queries:.0%}, memory +{thresholds.peak_memory:.0%})[/dim]"
+    )
+    for size, scenario in comparison.missing:
+        console.print(f"  [dim]{size} {scenario}: ベースラインにありません[/dim]")
+
+    if comparison.ok:
+        console.print("[bold green]OK: 退行はありません[/bold green]")
+        return
+
+    units = {
+        "wall_time": lambda v: f"{v * 1000:.1f} ms",
+        "queries": lambda v: f"{v:g}",
+        "peak_memory": lambda v: f"{v / 1024:.0f} KiB",
+    }
+    for regression in comparison.regressions:
+        fmt = units[regression.metric]
+        console.print(
+            f"  [red]{regression.size} {regression.scenario} {regression.metric}: "
+            f"{fmt(regression.baseline)} → {fmt(regression.current)} "
+            f"(+{regression.ratio:.0%})[/red]"
+        )
+    console.print(
+        f"[bold red]NG: {len(comparison.regressions)}件の退行が検出されました[/bold red]"
+    )
+
+
+def show_status_batch_result(result: UpdateStatusesResult, dry_run: bool = False) -> None:
+    """
+    一括ステータス更新の結果を表示
+
+    Args:
+        result: 一括更新の結果
+        dry_run: dry-run の結果か（適用せず判定のみ）
+    """
+    if dry_run:
+        console.print(
+            f"[green]✓ {len(result.applied)}件の変更が適用可能です[/green] "
+            "[dim](dry-run: DBは変更していません)[/dim]"
+        )
+    else:
+        console.print(f"[green]✓ {len(result.applied)}件の変更を適用しました[/green]")
+    if not result.has_rejections:
+        return
+
+    table = Table(
+        title=f"拒否された変更 ({len(result.rejected)}件)",
+        show_header=True,
+        header_style="bold red",
+    )
+    table.add_column("Type", style="cyan")
+    table.add_column("ID", justify="right")
+    table.add_column("Status")
+    table.add_column("Reason", style="yellow")
+    table.add_column("Message")
+
+    for rejection in result.rejected:
+        change = rejection.change
+        pending = rejection.details.get("incomplete_predecessors") or rejection.details.get(
+            "incomplete_children", []
+        )
+        message = rejection.message
+        if pending:
+            message += "\n  未完了: " + ", ".join(
+                f"{node['id']} ({node['status']})" for node in pending
+            )
+        table.add_row(
+            change.node_type,
+            str(change.node_id),
+            change.status,
+            rejection.reason.value,
+            message,
+        )
+    console.print(table)
+
+
+def show_ready_nodes(ready: dict[str, list], limit: int | None = None) -> None:
+    """
+    着手可能なTask/SubTaskをRich Tableで表示
+
+    Args:
+        ready: StatusManager.get_ready_nodes() の結果
+        limit: 層ごとの表示上限（件数が上限に達した場合に注記する）
+    """
+    tasks: list[Task] = ready.get("tasks", [])
+    subtasks: list[SubTask] = ready.get("subtasks", [])
+    if not tasks and not subtasks:
+        console.print("[yellow]着手可能なノードはありません。[/yellow]")
+        return
+
+    for label, nodes, parent_label in (
+        ("Task", tasks, "Project"),
+        ("SubTask", subtasks, "Task"),
+    ):
+        if not nodes:
+            continue
+        table = Table(
+            title=f"着手可能な{label} ({len(nodes)}件)",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("ID", style="cyan", justify="right", width=6)
+        table.add_column(parent_label, justify="right", width=8)
+        table.add_column("名前", style="white")
+        table.add_column("ステータス")
+        for node in nodes:
+            parent_id = node.project_id if isinstance(node, Task) else node.task_id
+            table.add_row(
+                str(node.id),
+                str(parent_id),
+                node.name,
+                formatters.format_status(node.status),
+            )
+        console.print(table)
+        if limit is not None and len(nodes) >= limit:
+            console.print(f"[dim]（先頭 {limit} 件のみ表示しています。--limit で変更できます）[/dim]")
+
+
+def show_flow_stats(stats: list[FlowStats], node_type: str = "task") -> None:
+    """
+    プロジェクト別のサイクルタイム・WIP・週次スループットを表示
+
+    Args:
+        stats: compute_flow_stats() の結果
+        node_type: 集計対象の層（見出し用）
+    """
+    if not stats:
+        console.print("[yellow]ステータス履歴がありません。[/yellow]")
+        return
+
+    label = "Task" if node_type == "task" else "SubTask"
+    summary = Table(
+        title=f"{label} のフロー指標", show_header=True, header_style="bold magenta"
+    )
+    summary.add_column("ID", style="cyan", justify="right")
+    summary.add_column("Project")
+    summary.add_column("完了", justify="right")
+    summary.add_column("計測", justify="right")
+    for p in PERCENTILES:
+        summary.add_column(f"p{p} (日)", justify="right")
+    summary.add_column("平均 (日)", justify="right")
+    summary.add_column("WIP", justify="right")
+
+    def days(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    for item in stats:
+        summary.add_row(
+            str(item.project_id),
+            item.project_name,
+            str(item.completed),
+            str(item.cycle_time_count),
+            *(days(item.cycle_time_percentiles.get(p)) for p in PERCENTILES),
+            days(item.cycle_time_mean),
+            str(item.weeks[-1].wip if item.weeks else 0),
+        )
+    console.print(summary)
+
+    weekly = Table(title="週次スループット / WIP", show_header=True, header_style="bold magenta")
+    weekly.add_column("週（月曜）", style="dim")
+    for item in stats:
+        weekly.add_column(f"{item.project_name}\n完了 / WIP", justify="right")
+    for index, week in enumerate(stats[0].weeks):
+        weekly.add_row(
+            week.week_start,
+            *(f"{item.weeks[index].throughput} / {item.weeks[index].wip}" for item in stats),
+        )
+    console.print(weekly)
+
+
+def show_transfer_result(result: TransferResult, action: str) -> None:
+    """
+    エクスポート / インポートの件数とスループットを表示
+
+    Args:
+        result: 処理結果
+        action: 処理名（"エクスポート" / "インポート"）
+    """
+    table = Table(title=f"{action}結果", show_header=True, header_style="bold magenta")
+    table.add_column("Record", style="cyan")
+    table.add_column("Count", justify="right")
+
+    for record_type in RECORD_TYPES:
+        table.add_row(record_type, f"{result.counts.get(record_type, 0):,}")
+    console.print(table)
+    console.print(
+        f"[bold]{result.total_records:,}[/bold] レコード / {result.elapsed:.2f} 秒 "
+        f"[dim]({result.rows_per_second:,.0f} rows/s)[/dim]"
+    )
+
+
+def _load_task_locations(
+    db: Database, task_ids: list[int]
+) -> dict[int, tuple[Task, str, str]]:
+    """
+    Taskと所属先（Project名・SubProject名）をまとめて取得
+
+    Taskの件数に関わらず、Task・SubProject・Projectをそれぞれ1回のクエリで取得します。
+
+    Args:
+        db: Database インスタンス
+        task_ids: TaskIDのリスト
+
+    Returns:
+        dict[int, tuple[Task, str, str]]: TaskID → (Task, Project名, SubProject名)
+            （存在しないTaskは含まれない、所属先が不明な場合は "?"）
+    """
+    tasks = TaskRepository(db).get_by_ids(task_ids)
+    subprojects = SubProjectRepository(db).get_by_ids(
+        task.subproject_id for task in tasks.values() if task.subproject_id is not None
+    )
+    projects = ProjectRepository(db).get_by_ids(task.project_id for task in tasks.values())
+
+    locations = {}
+    for task_id, task in tasks.items():
+        proj = projects.get(task.project_id)
+        subproj = subprojects.get(task.subproject_id)
+        locations[task_id] = (
+            task,
+            proj.name if proj else "?",
+            subproj.name if subproj else "?",
+        )
+    return locations
+
+
+def _load_subtask_parents(
+    db: Database, subtask_ids: list[int]
+) -> dict[int, tuple[SubTask, str]]:
+    """
+    SubTaskと親Task名をまとめて取得
+
+    SubTaskの件数に関わらず、SubTask・Taskをそれぞれ1回のクエリで取得します。
+
+    Args:
+        db: Database インスタンス
+        subtask_ids: SubTaskIDのリスト
+
+    Returns:
+        dict[int, tuple[SubTask, str]]: SubTaskID → (SubTask, 親Task名)
+            （存在しないSubTaskは含まれない、親Taskが不明な場合は "?"）
+    """
+    subtasks = SubTaskRepository(db).get_by_ids(subtask_ids)
+    parents = TaskRepository(db).get_by_ids(
+        subtask.task_id for subtask in subtasks.values()
+    )
+
+    return {
+        subtask_id: (
+            subtask,
+            parents[subtask.task_id].name if subtask.task_id in parents else "?",
+        )
+        for subtask_id, subtask in subtasks.items()
+    }
+
 
 def show_dependency_graph_task(
     db: Database, task_id: int, predecessors: list[int], successors: list[int]
@@ -236,8 +609,6 @@ def show_dependency_graph_task(
         successors: 直接後続TaskIDリスト
     """
     task_repo = TaskRepository(db)
-    subproj_repo = SubProjectRepository(db)
-    proj_repo = ProjectRepository(db)
 
     # 対象Taskの情報取得
     target_task = task_repo.get_by_id(task_id)
@@ -245,19 +616,18 @@ def show_dependency_graph_task(
         console.print(f"[red]Task {task_id} が見つかりません[/red]")
         return
 
+    # 先行・後続ノードの情報を一括取得（ノード数に関わらず固定回数のクエリ）
+    locations = _load_task_locations(db, predecessors + successors)
+
     console.print(f"\n[bold]=== Dependency Graph: Task {task_id} ===[/bold]\n")
 
     # 直接先行ノード表示
     console.print("[bold]Direct Predecessors (must be DONE first):[/bold]")
     if predecessors:
         for pred_id in predecessors:
-            pred_task = task_repo.get_by_id(pred_id)
-            if pred_task:
-                subproj = subproj_repo.get_by_id(pred_task.subproject_id)
-                proj = proj_repo.get_by_id(subproj.project_id) if subproj else None
-                status_symbol = formatters.format_task_status(pred_task.status)
-                proj_name = proj.name if proj else "?"
-                subproj_name = subproj.name if subproj else "?"
+            if pred_id in locations:
+                pred_task, proj_name, subproj_name = locations[pred_id]
+                status_symbol = formatters.format_status(pred_task.status)
                 console.print(
                     f"  → Task {pred_id} (in Project '{proj_name}' > SubProject '{subproj_name}') {status_symbol}"
                 )
@@ -270,13 +640,9 @@ def show_dependency_graph_task(
     console.print("[bold]Direct Successors (waiting for this task):[/bold]")
     if successors:
         for succ_id in successors:
-            succ_task = task_repo.get_by_id(succ_id)
-            if succ_task:
-                subproj = subproj_repo.get_by_id(succ_task.subproject_id)
-                proj = proj_repo.get_by_id(subproj.project_id) if subproj else None
-                status_symbol = formatters.format_task_status(succ_task.status)
-                proj_name = proj.name if proj else "?"
-                subproj_name = subproj.name if subproj else "?"
+            if succ_id in locations:
+                succ_task, proj_name, subproj_name = locations[succ_id]
+                status_symbol = formatters.format_status(succ_task.status)
                 console.print(
                     f"  → Task {succ_id} (in Project '{proj_name}' > SubProject '{subproj_name}') {status_symbol}"
                 )
@@ -299,7 +665,6 @@ def show_dependency_graph_subtask(
         successors: 直接後続SubTaskIDリスト
     """
     subtask_repo = SubTaskRepository(db)
-    task_repo = TaskRepository(db)
 
     # 対象SubTaskの情報取得
     target_subtask = subtask_repo.get_by_id(subtask_id)
@@ -307,17 +672,18 @@ def show_dependency_graph_subtask(
         console.print(f"[red]SubTask {subtask_id} が見つかりません[/red]")
         return
 
+    # 先行・後続ノードの情報を一括取得（ノード数に関わらず固定回数のクエリ）
+    parents = _load_subtask_parents(db, predecessors + successors)
+
     console.print(f"\n[bold]=== Dependency Graph: SubTask {subtask_id} ===[/bold]\n")
 
     # 直接先行ノード表示
     console.print("[bold]Direct Predecessors (must be DONE first):[/bold]")
     if predecessors:
         for pred_id in predecessors:
-            pred_subtask = subtask_repo.get_by_id(pred_id)
-            if pred_subtask:
-                parent_task = task_repo.get_by_id(pred_subtask.task_id)
-                status_symbol = formatters.format_subtask_status(pred_subtask.status)
-                parent_task_name = parent_task.name if parent_task else "?"
+            if pred_id in parents:
+                pred_subtask, parent_task_name = parents[pred_id]
+                status_symbol = formatters.format_status(pred_subtask.status)
                 console.print(
                     f"  → SubTask {pred_id} (in Task '{parent_task_name}') {status_symbol}"
                 )
@@ -330,11 +696,9 @@ def show_dependency_graph_subtask(
     console.print("[bold]Direct Successors (waiting for this subtask):[/bold]")
     if successors:
         for succ_id in successors:
-            succ_subtask = subtask_repo.get_by_id(succ_id)
-            if succ_subtask:
-                parent_task = task_repo.get_by_id(succ_subtask.task_id)
-                status_symbol = formatters.format_subtask_status(succ_subtask.status)
-                parent_task_name = parent_task.name if parent_task else "?"
+            if succ_id in parents:
+                succ_subtask, parent_task_name = parents[succ_id]
+                status_symbol = formatters.format_status(succ_subtask.status)
                 console.print(
                     f"  → SubTask {succ_id} (in Task '{parent_task_name}') {status_symbol}"
                 )
@@ -352,14 +716,14 @@ def show_dependency_chain_task(db: Database, path: list[int]) -> None:
         db: Database インスタンス
         path: TaskIDのリスト [from, ..., to]
     """
-    task_repo = TaskRepository(db)
+    tasks = TaskRepository(db).get_by_ids(path)
 
     console.print(f"\n[bold]=== Dependency Chain ===[/bold]\n")
 
     for i, task_id in enumerate(path):
-        task = task_repo.get_by_id(task_id)
+        task = tasks.get(task_id)
         if task:
-            status_symbol = formatters.format_task_status(task.status)
+            status_symbol = formatters.format_status(task.status)
             console.print(f"  Task {task_id}: {task.name} {status_symbol}")
             if i < len(path) - 1:
                 console.print("    ↓")
@@ -375,14 +739,14 @@ def show_dependency_chain_subtask(db: Database, path: list[int]) -> None:
         db: Database インスタンス
         path: SubTaskIDのリスト [from, ..., to]
     """
-    subtask_repo = SubTaskRepository(db)
+    subtasks = SubTaskRepository(db).get_by_ids(path)
 
     console.print(f"\n[bold]=== Dependency Chain ===[/bold]\n")
 
     for i, subtask_id in enumerate(path):
-        subtask = subtask_repo.get_by_id(subtask_id)
+        subtask = subtasks.get(subtask_id)
         if subtask:
-            status_symbol = formatters.format_subtask_status(subtask.status)
+            status_symbol = formatters.format_status(subtask.status)
             console.print(f"  SubTask {subtask_id}: {subtask.name} {status_symbol}")
             if i < len(path) - 1:
                 console.print("    ↓")
@@ -400,26 +764,23 @@ def show_impact_analysis_task(db: Database, task_id: int, all_successors: list[i
         all_successors: 全後続TaskIDリスト（間接も含む）
     """
     task_repo = TaskRepository(db)
-    subproj_repo = SubProjectRepository(db)
-    proj_repo = ProjectRepository(db)
 
     target_task = task_repo.get_by_id(task_id)
     if not target_task:
         console.print(f"[red]Task {task_id} が見つかりません[/red]")
         return
 
+    # 後続ノードの情報を一括取得（ノード数に関わらず固定回数のクエリ）
+    locations = _load_task_locations(db, all_successors)
+
     console.print(f"\n[bold]=== Impact Analysis: Task {task_id} ===[/bold]\n")
     console.print(f"[bold]後続Task（このTaskがDONEになると解放される可能性のあるTask）:[/bold]")
 
     if all_successors:
         for succ_id in all_successors:
-            succ_task = task_repo.get_by_id(succ_id)
-            if succ_task:
-                subproj = subproj_repo.get_by_id(succ_task.subproject_id)
-                proj = proj_repo.get_by_id(subproj.project_id) if subproj else None
-                status_symbol = formatters.format_task_status(succ_task.status)
-                proj_name = proj.name if proj else "?"
-                subproj_name = subproj.name if subproj else "?"
+            if succ_id in locations:
+                succ_task, proj_name, subproj_name = locations[succ_id]
+                status_symbol = formatters.format_status(succ_task.status)
                 console.print(
                     f"  → Task {succ_id}: {succ_task.name} (in Project '{proj_name}' > SubProject '{subproj_name}') {status_symbol}"
                 )
@@ -441,13 +802,15 @@ def show_impact_analysis_subtask(
         all_successors: 全後続SubTaskIDリスト（間接も含む）
     """
     subtask_repo = SubTaskRepository(db)
-    task_repo = TaskRepository(db)
 
     target_subtask = subtask_repo.get_by_id(subtask_id)
     if not target_subtask:
         console.print(f"[red]SubTask {subtask_id} が見つかりません[/red]")
         return
 
+    # 後続ノードの情報を一括取得（ノード数に関わらず固定回数のクエリ）
+    parents = _load_subtask_parents(db, all_successors)
+
     console.print(f"\n[bold]=== Impact Analysis: SubTask {subtask_id} ===[/bold]\n")
     console.print(
         f"[bold]後続SubTask（このSubTaskがDONEになると解放される可能性のあるSubTask）:[/bold]"
@@ -455,11 +818,9 @@ def show_impact_analysis_subtask(
 
     if all_successors:
         for succ_id in all_successors:
-            succ_subtask = subtask_repo.get_by_id(succ_id)
-            if succ_subtask:
-                parent_task = task_repo.get_by_id(succ_subtask.task_id)
-                status_symbol = formatters.format_subtask_status(succ_subtask.status)
-                parent_task_name = parent_task.name if parent_task else "?"
+            if succ_id in parents:
+                succ_subtask, parent_task_name = parents[succ_id]
+                status_symbol = formatters.format_status(succ_subtask.status)
                 console.print(
                     f"  → SubTask {succ_id}: {succ_subtask.name} (in Task '{parent_task_name}') {status_symbol}"
                 )
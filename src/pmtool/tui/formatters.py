@@ -4,6 +4,10 @@ TUI フォーマッター
 ステータスの記号・色付けなど、共通のフォーマット処理を提供します。
 """
 
+from typing import Optional
+
+from ..models import ProgressRollup
+
 
 def get_entity_symbol(entity_type: str, use_emoji: bool = True) -> str:
     """
@@ -79,3 +83,24 @@ def format_status(status: str, use_emoji: bool = True) -> str:
         }
 
     return status_map.get(status, f"[dim][?] {status}[/dim]")
+
+
+def format_progress(rollup: Optional[ProgressRollup]) -> str:
+    """
+    進捗率を「DONE件数/合計件数」とともに表現（Richマークアップなし）
+
+    Args:
+        rollup: ステータス別件数（Noneまたは0件の場合は "-"）
+
+    Returns:
+        進捗表示文字列
+
+    Examples:
+        >>> format_progress(ProgressRollup({"DONE": 1, "UNSET": 1}, {"DONE": 1}))
+        '67% (2/3)'
+        >>> format_progress(None)
+        '-'
+    """
+    if rollup is None or rollup.percent is None:
+        return "-"
+    return f"{rollup.percent:.0f}% ({rollup.done}/{rollup.total})"
@@ -1,4 +1,6 @@
 """Textual UI アプリケーションメインクラス"""
+import argparse
+from pmtool.database import PROFILES, ProfileSpec
 from textual.app import App
 from textual.binding import Binding
 from .screens.home import HomeScreen
@@ -24,9 +26,9 @@ class PMToolApp(App):
 
     SCREENS = {"home": HomeScreen}
 
-    def __init__(self):
+    def __init__(self, profile: ProfileSpec = "default"):
         super().__init__()
-        self.db_manager = DBManager()
+        self.db_manager = DBManager(profile=profile)
 
     def on_mount(self) -> None:
         """アプリケーション起動時の処理"""
@@ -88,7 +90,16 @@ class PMToolApp(App):
 
 def main() -> None:
     """エントリーポイント"""
-    app = PMToolApp()
+    parser = argparse.ArgumentParser(prog="pmtool-ui")
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="default",
+        help="SQLite性能プロファイル",
+    )
+    args = parser.parse_args()
+
+    app = PMToolApp(profile=args.profile)
     app.run()
 
 
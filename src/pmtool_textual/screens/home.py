@@ -4,6 +4,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from .base import BaseScreen
 from pmtool.repository import ProjectRepository
+from pmtool.tui.formatters import format_progress
 
 
 class HomeScreen(BaseScreen):
@@ -24,7 +25,7 @@ class HomeScreen(BaseScreen):
         table = self.query_one(DataTable)
 
         # カラム設定
-        table.add_columns("ID", "Name", "Description", "Status", "Updated")
+        table.add_columns("ID", "Name", "Description", "Status", "Progress", "Updated")
         table.cursor_type = "row"
         table.zebra_stripes = True
 
@@ -36,6 +37,8 @@ class HomeScreen(BaseScreen):
         db = self.app.db_manager.connect()
         repo = ProjectRepository(db)
         projects = repo.get_all()
+        # 進捗は集計表から一括取得（Task / SubTask は走査しない）
+        progress = repo.get_progress()
 
         table = self.query_one(DataTable)
         table.clear()
@@ -51,6 +54,7 @@ class HomeScreen(BaseScreen):
                 project.name,
                 project.description or "",
                 status,
+                format_progress(progress.get(project.id)),
                 project.updated_at[:10],  # YYYY-MM-DD部分のみ
                 key=str(project.id),
             )
@@ -1,10 +1,14 @@
 """Project Detail画面 - 4階層ツリー表示"""
+from typing import Optional
+
 from textual.widgets import Tree, Static
 from textual.containers import Vertical
 from textual.app import ComposeResult
 from textual.binding import Binding
 from .base import BaseScreen
-from pmtool.repository import ProjectRepository, SubProjectRepository, TaskRepository, SubTaskRepository
+from pmtool.models import ProgressRollup, ProjectTree
+from pmtool.repository import ProjectRepository, SubProjectRepository
+from pmtool.tui.formatters import format_progress
 
 
 class ProjectDetailScreen(BaseScreen):
@@ -29,68 +33,67 @@ class ProjectDetailScreen(BaseScreen):
         """Project情報とツリーを読み込む"""
         db = self.app.db_manager.connect()
         repo = ProjectRepository(db)
-        project = repo.get_by_id(self.project_id)
+        project_tree = repo.load_tree(self.project_id)
 
-        if project is None:
+        if project_tree is None:
             self.app.pop_screen()
             return
 
+        project = project_tree.project
+
         # Project情報表示
+        project_progress = repo.get_progress([project.id]).get(project.id)
         info = self.query_one("#project_info", Static)
         info.update(
             f"[bold]{project.name}[/bold]\n"
-            f"ID: {project.id} | Updated: {project.updated_at[:10]}\n"
+            f"ID: {project.id} | Progress: {format_progress(project_progress)}"
+            f" | Updated: {project.updated_at[:10]}\n"
             f"{project.description or ''}"
         )
 
-        # 4階層ツリー構築
-        self.build_tree(project)
-
-    def build_tree(self, project) -> None:
-        """4階層ツリーを構築"""
+        # 4階層ツリー構築（SubProjectの進捗は集計表から一括取得）
+        progress = SubProjectRepository(db).get_progress_by_project(self.project_id)
+        self.build_tree(project_tree, progress)
+
+    def build_tree(
+        self,
+        project_tree: ProjectTree,
+        progress: Optional[dict[int, ProgressRollup]] = None,
+    ) -> None:
+        """4階層ツリーを構築（ProjectRepository.load_tree の結果から組み立てる）"""
+        progress = progress or {}
         tree = self.query_one("#project_tree", Tree)
         tree.clear()
 
-        db = self.app.db_manager.connect()
-        sp_repo = SubProjectRepository(db)
-        task_repo = TaskRepository(db)
-        st_repo = SubTaskRepository(db)
-
-        # SubProject一覧取得
-        subprojects = sp_repo.get_by_project(project.id)
-
-        for sp in subprojects:
-            sp_node = tree.root.add(
-                f"📁 {sp.name} [UNSET]",  # SubProjectにはstatusフィールドがない
+        for sp_node in project_tree.subprojects:
+            sp = sp_node.subproject
+            sp_branch = tree.root.add(
+                f"📁 {sp.name} ({format_progress(progress.get(sp.id))})",
                 data={"type": "subproject", "id": sp.id},
             )
 
-            # Task一覧取得
-            tasks = task_repo.get_by_parent(project.id, sp.id)
-            for task in tasks:
-                task_node = sp_node.add(
+            for task_node in sp_node.tasks:
+                task = task_node.task
+                task_branch = sp_branch.add(
                     f"📋 {task.name} [{task.status}]",
                     data={"type": "task", "id": task.id},
                 )
 
-                # SubTask一覧取得
-                subtasks = st_repo.get_by_task(task.id)
-                for st in subtasks:
-                    task_node.add(
+                for st in task_node.subtasks:
+                    task_branch.add(
                         f"✓ {st.name} [{st.status}]",
                         data={"type": "subtask", "id": st.id},
                     )
 
         # Project直下Task区画（グレーアウト）
-        direct_tasks = task_repo.get_by_parent(project.id, None)
-        if direct_tasks:
+        if project_tree.direct_tasks:
             direct_node = tree.root.add(
                 "[dim]Project直下のTask（操作不可）[/dim]",
                 data={"type": "section"},
             )
-            for task in direct_tasks:
+            for task_node in project_tree.direct_tasks:
                 direct_node.add(
-                    f"[dim]📋 {task.name}[/dim]",
+                    f"[dim]📋 {task_node.task.name}[/dim]",
                     data={"type": "readonly"},
                 )
 
@@ -8,7 +8,7 @@ from .base import BaseScreen
 class SettingsScreen(BaseScreen):
     """設定画面
 
-    DBパス表示とバックアップ案内を提供する。
+    DBパス・性能プロファイルの表示とバックアップ案内を提供する。
     """
 
     BINDINGS = [
@@ -19,6 +19,7 @@ class SettingsScreen(BaseScreen):
         """メインコンテンツの構成"""
         yield Static("[bold cyan]設定[/bold cyan]", id="title")
         yield Static("", id="db_info")
+        yield Static("", id="profile_info")
         yield Static("", id="backup_guide")
 
     def on_mount(self) -> None:
@@ -30,6 +31,17 @@ class SettingsScreen(BaseScreen):
             f"  {db_path}\n"
         )
 
+        # 性能プロファイル（実際に有効なPRAGMA値）
+        db_manager = self.app.db_manager
+        lines = [
+            "\n[bold]性能プロファイル:[/bold] "
+            f"{db_manager.profile if isinstance(db_manager.profile, str) else 'custom'}"
+        ]
+        if db_manager.is_db_exists():
+            for name, value in db_manager.connect().get_active_pragmas().items():
+                lines.append(f"  {name:<13} {value}")
+        self.query_one("#profile_info").update("\n".join(lines) + "\n")
+
         # バックアップ案内
         self.query_one("#backup_guide").update(
             "\n[bold]バックアップ:[/bold]\n"
@@ -4,7 +4,8 @@ from textual.containers import Vertical
 from textual.app import ComposeResult
 from textual.binding import Binding
 from .base import BaseScreen
-from pmtool.repository import SubProjectRepository, TaskRepository, SubTaskRepository
+from pmtool.models import SubProjectNode
+from pmtool.repository import SubProjectRepository
 
 
 class SubProjectDetailScreen(BaseScreen):
@@ -30,12 +31,14 @@ class SubProjectDetailScreen(BaseScreen):
         """SubProject情報とツリーを読み込む"""
         db = self.app.db_manager.connect()
         sp_repo = SubProjectRepository(db)
-        subproject = sp_repo.get_by_id(self.subproject_id)
+        subproject_tree = sp_repo.load_tree(self.subproject_id)
 
-        if subproject is None:
+        if subproject_tree is None:
             self.app.pop_screen()
             return
 
+        subproject = subproject_tree.subproject
+
         # SubProject情報表示
         info = self.query_one("#subproject_info", Static)
         info.update(
@@ -45,30 +48,22 @@ class SubProjectDetailScreen(BaseScreen):
         )
 
         # Task/SubTaskツリー構築
-        self.build_tree(subproject)
+        self.build_tree(subproject_tree)
 
-    def build_tree(self, subproject) -> None:
-        """Task/SubTaskツリーを構築"""
+    def build_tree(self, subproject_tree: SubProjectNode) -> None:
+        """Task/SubTaskツリーを構築（SubProjectRepository.load_tree の結果から組み立てる）"""
         tree = self.query_one("#subproject_tree", Tree)
         tree.clear()
 
-        db = self.app.db_manager.connect()
-        task_repo = TaskRepository(db)
-        st_repo = SubTaskRepository(db)
-
-        # Task一覧取得
-        tasks = task_repo.get_by_parent(subproject.project_id, subproject.id)
-
-        for task in tasks:
-            task_node = tree.root.add(
+        for task_node in subproject_tree.tasks:
+            task = task_node.task
+            task_branch = tree.root.add(
                 f"📋 {task.name} [{task.status}]",
                 data={"type": "task", "id": task.id},
             )
 
-            # SubTask一覧取得
-            subtasks = st_repo.get_by_task(task.id)
-            for st in subtasks:
-                task_node.add(
+            for st in task_node.subtasks:
+                task_branch.add(
                     f"✓ {st.name} [{st.status}]",
                     data={"type": "subtask", "id": st.id},
                 )
@@ -1,19 +1,20 @@
 """DB接続管理ユーティリティ"""
 from pathlib import Path
-from pmtool.database import Database
+from pmtool.database import Database, ProfileSpec
 
 
 class DBManager:
     """Textual UI用DB接続マネージャー"""
 
-    def __init__(self, db_path: str = "data/pmtool.db"):
+    def __init__(self, db_path: str = "data/pmtool.db", profile: ProfileSpec = "default"):
         self.db_path = db_path
+        self.profile = profile
         self.db: Database | None = None
 
     def connect(self) -> Database:
-        """DB接続"""
+        """DB接続（性能プロファイルを適用）"""
         if self.db is None:
-            self.db = Database(self.db_path)
+            self.db = Database(self.db_path, profile=self.profile)
         return self.db
 
     def is_db_exists(self) -> bool:
@@ -1,15 +1,18 @@
 """
 pytest configuration and shared fixtures
 """
+import gc
 import os
 import sqlite3
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Callable, ContextManager, Generator
 
 import pytest
 
 from pmtool.database import Database
+from pmtool.instrumentation import QueryTracer
 
 
 @pytest.fixture
@@ -68,3 +71,45 @@ def db_connection(temp_db: Database) -> Generator[sqlite3.Connection, None, None
         yield conn
     finally:
         conn.close()
+
+
+@pytest.fixture
+def assert_max_queries(
+    temp_db: Database,
+) -> Callable[[int], ContextManager[QueryTracer]]:
+    """
+    with ブロック内で temp_db に発行されたSQLの数を上限と比較するfixture
+
+    使用例::
+
+        with assert_max_queries(5):
+            show_project_tree(temp_db, project_id)
+
+    書き込み用・読み取り用どちらのコネクションの実行も数えます
+    （commit は COMMIT として1件に数え、トリガー内のステートメントは数えません）。
+    上限を超えた場合は、実行回数の多いステートメントを添えてテストを失敗させます。
+    """
+    tracer = QueryTracer(slow_threshold_ms=None)
+    # 計測付きのコネクションで開き直す（接続時の設定・マイグレーション確認は数えない）
+    temp_db.close()
+    temp_db.tracer = tracer
+    temp_db.connect()
+
+    @contextmanager
+    def _assert_max_queries(limit: int) -> Generator[QueryTracer, None, None]:
+        gc.collect()
+        tracer.reset()
+        yield tracer
+        # 結果を取り切らずに破棄されたカーソルの実行もここで記録させる
+        gc.collect()
+
+        executed = tracer.total_statements
+        if executed > limit:
+            top = sorted(tracer.stats.values(), key=lambda s: -s.count)[:10]
+            details = "\n".join(f"  {s.count:>5}  {s.sql}" for s in top)
+            pytest.fail(
+                f"SQLの実行数が上限を超えました: {executed} > {limit}\n{details}",
+                pytrace=False,
+            )
+
+    return _assert_max_queries
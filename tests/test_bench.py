@@ -0,0 +1,93 @@
+"""
+bench.py（pmtool bench）のテスト
+"""
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.tui.bench import (
+    BenchResult,
+    BenchThresholds,
+    compare_results,
+    load_results,
+    prepare_database,
+    run_benchmarks,
+    save_results,
+)
+
+
+def _result(scenario: str, wall_time: float, queries: int, peak_memory: int) -> BenchResult:
+    return BenchResult("small", scenario, wall_time, wall_time, queries, peak_memory)
+
+
+def test_run_benchmarks_measures_and_rolls_back(tmp_path):
+    """各シナリオを計測し、書き込みを伴うシナリオもDBを変更しないこと"""
+    path = prepare_database("small", tmp_path)
+    db = Database(str(path))
+    conn = db.connect()
+    before = conn.execute(
+        "SELECT (SELECT COUNT(*) FROM task_dependencies), (SELECT COUNT(*) FROM templates)"
+    ).fetchone()
+    db.close()
+
+    results = run_benchmarks(
+        ["small"],
+        ["list-projects", "deps-add", "delete-dry-run", "template"],
+        repeat=1,
+        workdir=tmp_path,
+    )
+
+    assert [r.scenario for r in results] == [
+        "list-projects",
+        "deps-add",
+        "delete-dry-run",
+        "template",
+    ]
+    for result in results:
+        assert result.wall_time > 0
+        assert result.queries > 0
+        assert result.peak_memory > 0
+
+    db = Database(str(path))
+    after = db.connect().execute(
+        "SELECT (SELECT COUNT(*) FROM task_dependencies), (SELECT COUNT(*) FROM templates)"
+    ).fetchone()
+    db.close()
+    assert tuple(after) == tuple(before)
+    # 生成済みのDBは再利用される
+    assert prepare_database("small", tmp_path) == path
+
+
+def test_run_benchmarks_rejects_unknown_names(tmp_path):
+    """不明な規模名・シナリオ名は ValueError になること"""
+    with pytest.raises(ValueError):
+        run_benchmarks(["huge"], workdir=tmp_path)
+    with pytest.raises(ValueError):
+        run_benchmarks(["small"], ["no-such-scenario"], workdir=tmp_path)
+
+
+def test_compare_results_detects_regressions(tmp_path):
+    """閾値を超えた悪化のみを退行として検出し、保存した結果と比較できること"""
+    baseline_path = tmp_path / "baseline.json"
+    save_results(
+        baseline_path,
+        [_result("doctor", 0.100, 28, 1000), _result("show-project", 0.001, 7, 1000)],
+    )
+    baseline = load_results(baseline_path)
+
+    current = [
+        _result("doctor", 0.110, 29, 1300),  # 時間+10%, SQL+1, メモリ+30%
+        _result("show-project", 0.002, 7, 1000),  # 時間は倍だが増加が1ms
+        _result("template", 0.050, 900, 1000),  # ベースラインにない
+    ]
+    comparison = compare_results(current, baseline, BenchThresholds())
+
+    assert not comparison.ok
+    assert {(r.scenario, r.metric) for r in comparison.regressions} == {
+        ("doctor", "queries"),
+        ("doctor", "peak_memory"),
+    }
+    assert comparison.missing == [("small", "template")]
+
+    relaxed = BenchThresholds(queries=0.1, peak_memory=0.5)
+    assert compare_results(current, baseline, relaxed).ok
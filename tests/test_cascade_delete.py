@@ -173,3 +173,67 @@ def test_cascade_delete_dry_run(temp_db: Database):
 
     cursor.execute("SELECT COUNT(*) FROM subtasks WHERE id = ?", (subtask.id,))
     assert cursor.fetchone()[0] == 1
+
+
+def test_cascade_delete_subproject_nested(temp_db: Database):
+    """SubProject のカスケード削除が入れ子の子SubProjectとそのTaskも削除すること"""
+    project = ProjectRepository(temp_db).create("TestProject", "")
+    subproject_repo = SubProjectRepository(temp_db)
+    outer = subproject_repo.create(project.id, "Outer")
+    inner = subproject_repo.create(project.id, "Inner", outer.id)
+    innermost = subproject_repo.create(project.id, "Innermost", inner.id)
+    sibling = subproject_repo.create(project.id, "Sibling")
+    task_repo = TaskRepository(temp_db)
+    task_repo.create(project.id, "T-inner", inner.id)
+    task_repo.create(project.id, "T-innermost", innermost.id)
+    kept = task_repo.create(project.id, "T-sibling", sibling.id)
+
+    dry = subproject_repo.cascade_delete(outer.id, dry_run=True)
+    assert not temp_db.connect().in_transaction
+
+    result = subproject_repo.cascade_delete(outer.id, chunk_size=1)
+    assert result == dry
+
+    assert result["subprojects"] == 3
+    assert result["tasks"] == 2
+    assert subproject_repo.get_by_id(inner.id) is None
+    assert subproject_repo.get_by_id(sibling.id) is not None
+    assert task_repo.get_by_id(kept.id) is not None
+
+
+def test_cascade_delete_large_project_in_chunks(temp_db: Database):
+    """
+    バインド変数の上限を超える件数でも、チャンク単位で削除し進捗を通知すること
+    """
+    from pmtool.datagen import DatasetSpec, generate_dataset
+
+    spec = DatasetSpec(
+        projects=2, subprojects_per_project=2, tasks_per_subproject=100, subtasks_per_task=90
+    )
+    generate_dataset(temp_db, spec)
+    project_repo = ProjectRepository(temp_db)
+
+    dry = project_repo.cascade_delete(1, dry_run=True)
+    # dry-run は共有コネクションにトランザクションを残さない
+    assert not temp_db.connect().in_transaction
+    assert dry["subtasks"] == 2 * 100 * 90
+
+    progress = []
+    with temp_db.transaction() as conn:
+        result = project_repo.cascade_delete(
+            1, conn=conn, chunk_size=5000, on_progress=lambda *args: progress.append(args)
+        )
+
+    assert result == dry
+    assert [p for p in progress if p[0] == "subtasks"] == [
+        ("subtasks", 5000, 18000),
+        ("subtasks", 10000, 18000),
+        ("subtasks", 15000, 18000),
+        ("subtasks", 18000, 18000),
+    ]
+    assert project_repo.get_by_id(1) is None
+    conn = temp_db.connect()
+    assert conn.execute("SELECT COUNT(*) FROM subtasks").fetchone()[0] == 18000
+    assert conn.execute(
+        "SELECT COUNT(*) FROM tasks WHERE project_id = 1"
+    ).fetchone()[0] == 0
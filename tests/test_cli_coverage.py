@@ -15,7 +15,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pmtool.tui.cli import create_parser, main
+from pmtool.tui.cli import build_profile, build_tracer, create_parser, main
 
 
 class TestCreateParser:
@@ -225,12 +225,141 @@ class TestCreateParser:
         args = parser.parse_args(["deps", "impact", "task", "1"])
         assert args.deps_command == "impact"
         assert args.id == 1
+        assert args.traversal == "auto"
+        args = parser.parse_args(["deps", "impact", "task", "1", "--traversal", "sql"])
+        assert args.traversal == "sql"
+
+    def test_deps_reindex_parser(self):
+        """deps reindexコマンドの解析（entity省略可）"""
+        parser = create_parser()
+        args = parser.parse_args(["deps", "reindex"])
+        assert args.deps_command == "reindex"
+        assert args.entity is None
+        args = parser.parse_args(["deps", "reindex", "subtask"])
+        assert args.entity == "subtask"
 
     def test_doctor_command_parser(self):
         """doctorコマンドの解析"""
         parser = create_parser()
         args = parser.parse_args(["doctor"])
         assert args.command == "doctor"
+        assert args.jobs == 1
+
+    def test_doctor_jobs_parser(self):
+        """doctor --jobs の解析"""
+        parser = create_parser()
+        args = parser.parse_args(["doctor", "--jobs", "4"])
+        assert args.jobs == 4
+
+    def test_doctor_incremental_full_parser(self):
+        """doctor --incremental / --full の解析（同時指定は不可）"""
+        parser = create_parser()
+        args = parser.parse_args(["doctor", "--incremental"])
+        assert args.incremental is True
+        assert args.full is False
+
+        args = parser.parse_args(["doctor", "--full"])
+        assert args.full is True
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["doctor", "--incremental", "--full"])
+
+    def test_profile_options(self):
+        """--profile / --pragma の解析とプロファイル構築"""
+        parser = create_parser()
+        args = parser.parse_args(["doctor"])
+        assert build_profile(args) == "default"
+
+        args = parser.parse_args(
+            ["--profile", "fast", "--pragma", "synchronous=OFF", "doctor"]
+        )
+        profile = build_profile(args)
+        assert profile["journal_mode"] == "WAL"
+        assert profile["synchronous"] == "OFF"
+
+        args = parser.parse_args(["--pragma", "synchronous", "doctor"])
+        with pytest.raises(ValueError):
+            build_profile(args)
+
+    def test_trace_options(self, monkeypatch):
+        """--trace はサブコマンドの前後どちらでも指定でき、PMTOOL_TRACE でも有効になる"""
+        parser = create_parser()
+        monkeypatch.delenv("PMTOOL_TRACE", raising=False)
+        monkeypatch.delenv("PMTOOL_TRACE_SLOW_MS", raising=False)
+
+        assert build_tracer(parser.parse_args(["doctor"])) is None
+        assert build_tracer(parser.parse_args(["--trace", "doctor"])) is not None
+        tracer = build_tracer(parser.parse_args(["list", "projects", "--trace"]))
+        assert tracer is not None
+        assert tracer.slow_threshold_ms == 100
+
+        # 入れ子のサブコマンドでも後ろに指定できる
+        for argv in (
+            ["deps", "add", "task", "--from", "1", "--to", "2", "--trace"],
+            ["deps", "impact", "task", "1", "--trace"],
+            ["stats", "flow", "--trace"],
+        ):
+            assert parser.parse_args(argv).trace is True
+
+        monkeypatch.setenv("PMTOOL_TRACE", "1")
+        monkeypatch.setenv("PMTOOL_TRACE_SLOW_MS", "5")
+        tracer = build_tracer(parser.parse_args(["doctor"]))
+        assert tracer is not None
+        assert tracer.slow_threshold_ms == 5
+
+    def test_bench_parser(self):
+        """benchコマンドの解析"""
+        parser = create_parser()
+        args = parser.parse_args(
+            ["bench", "--sizes", "small", "medium", "--scenario", "doctor", "--repeat", "1"]
+        )
+        assert args.command == "bench"
+        assert args.sizes == ["small", "medium"]
+        assert args.scenarios == ["doctor"]
+        assert args.repeat == 1
+        assert args.baseline is None
+        assert args.time_threshold == 0.25
+
+    def test_status_bulk_parser(self):
+        """status --bulk の解析（個別指定の引数は省略可能）"""
+        parser = create_parser()
+        args = parser.parse_args(["status", "--bulk", "changes.txt", "--dry-run"])
+        assert args.bulk == "changes.txt"
+        assert args.entity is None and args.dry_run
+
+    def test_ready_parser(self):
+        """readyコマンドの解析"""
+        parser = create_parser()
+        args = parser.parse_args(["ready"])
+        assert (args.project, args.node_type, args.limit) == (None, None, 100)
+
+        args = parser.parse_args(["ready", "--project", "2", "--type", "subtask"])
+        assert (args.project, args.node_type) == (2, "subtask")
+
+    def test_stats_flow_parser(self):
+        """stats flowコマンドの解析"""
+        parser = create_parser()
+        args = parser.parse_args(["stats", "flow"])
+        assert (args.stats_command, args.project, args.node_type, args.weeks) == (
+            "flow",
+            None,
+            "task",
+            12,
+        )
+
+        args = parser.parse_args(["stats", "flow", "--project", "1", "--weeks", "52"])
+        assert (args.project, args.weeks) == (1, 52)
+
+    def test_export_import_parser(self):
+        """export / importコマンドの解析"""
+        parser = create_parser()
+        args = parser.parse_args(["export", "project", "3", "--format", "ndjson"])
+        assert (args.command, args.entity, args.id) == ("export", "project", 3)
+        assert args.output is None
+
+        args = parser.parse_args(["import", "p.ndjson", "--name", "Copy"])
+        assert (args.command, args.file, args.name) == ("import", "p.ndjson", "Copy")
+        assert args.batch_size == 5000
 
     def test_check_alias_parser(self):
         """checkコマンド（doctorのalias）の解析"""
@@ -85,3 +85,103 @@ class TestHandleDoctor:
 
         # show_doctor_reportが呼ばれたことを確認
         mock_display.assert_called_once()
+
+
+class TestHandleStatusBulk:
+    """handle_status --bulk のテスト"""
+
+    def test_handle_status_bulk(self, temp_db, tmp_path, monkeypatch):
+        """ファイルに列挙した変更が一括適用されること"""
+        from pmtool.repository import TaskRepository
+
+        project = ProjectRepository(temp_db).create("Project1", "")
+        task_repo = TaskRepository(temp_db)
+        t1 = task_repo.create(project.id, "T1")
+        t2 = task_repo.create(project.id, "T2")
+        bulk = tmp_path / "changes.txt"
+        bulk.write_text(
+            f"# sprint close\ntask {t2.id} done\ntask,{t1.id},IN_PROGRESS\n\n", encoding="utf-8"
+        )
+
+        mock_display = MagicMock()
+        monkeypatch.setattr("pmtool.tui.commands.display.show_status_batch_result", mock_display)
+
+        args = Namespace(entity=None, id=None, status=None, dry_run=False, bulk=str(bulk))
+        commands.handle_status(temp_db, args)
+
+        result = mock_display.call_args[0][0]
+        assert len(result.applied) == 2
+        assert task_repo.get_by_id(t1.id).status == "IN_PROGRESS"
+        assert task_repo.get_by_id(t2.id).status == "DONE"
+
+    def test_handle_status_bulk_rejects_malformed_line(self, temp_db, tmp_path):
+        """書式が不正な行は行番号つきのValidationErrorとなること"""
+        from pmtool.exceptions import ValidationError
+
+        bulk = tmp_path / "changes.txt"
+        bulk.write_text("task 1 DONE\ntask one DONE\n", encoding="utf-8")
+        args = Namespace(entity=None, id=None, status=None, dry_run=False, bulk=str(bulk))
+
+        with pytest.raises(ValidationError, match=":2:"):
+            commands.handle_status(temp_db, args)
+
+
+class TestHandleStats:
+    """handle_stats のテスト"""
+
+    def test_handle_stats_flow(self, temp_db, capsys):
+        """ステータス変更の履歴からフロー指標が表示されること"""
+        from pmtool.dependencies import DependencyManager
+        from pmtool.repository import TaskRepository
+        from pmtool.status import StatusManager
+
+        project = ProjectRepository(temp_db).create("Flow Project", "")
+        task = TaskRepository(temp_db).create(project.id, "T1")
+        status_mgr = StatusManager(temp_db, DependencyManager(temp_db))
+        status_mgr.update_task_status(task.id, "IN_PROGRESS")
+        status_mgr.update_task_status(task.id, "DONE")
+
+        args = Namespace(stats_command="flow", project=None, node_type="task", weeks=4)
+        commands.handle_stats(temp_db, args)
+
+        output = capsys.readouterr().out
+        assert "Flow Project" in output
+        assert "1 / 0" in output
+
+    def test_handle_stats_requires_subcommand(self, temp_db):
+        """サブコマンド未指定はValidationErrorとなること"""
+        from pmtool.exceptions import ValidationError
+
+        args = Namespace(stats_command=None)
+        with pytest.raises(ValidationError):
+            commands.handle_stats(temp_db, args)
+
+
+class TestHandleReady:
+    """handle_ready のテスト"""
+
+    def test_handle_ready_shows_unblocked_tasks(self, temp_db, capsys):
+        """先行ノードが未完了のTaskは表示されないこと"""
+        from pmtool.dependencies import DependencyManager
+        from pmtool.repository import TaskRepository
+
+        project = ProjectRepository(temp_db).create("Project1", "")
+        task_repo = TaskRepository(temp_db)
+        t1 = task_repo.create(project.id, "Upstream")
+        t2 = task_repo.create(project.id, "Blocked")
+        DependencyManager(temp_db).add_task_dependency(t1.id, t2.id)
+
+        args = Namespace(project=project.id, node_type=None, limit=100)
+        commands.handle_ready(temp_db, args)
+
+        output = capsys.readouterr().out
+        assert "Upstream" in output
+        assert "Blocked" not in output
+
+    def test_handle_ready_unknown_project(self, temp_db):
+        """存在しないプロジェクトはValidationErrorとなること"""
+        from pmtool.exceptions import ValidationError
+
+        args = Namespace(project=999, node_type=None, limit=100)
+        with pytest.raises(ValidationError):
+            commands.handle_ready(temp_db, args)
@@ -416,6 +416,23 @@ class TestHandleDepsSmoke:
         assert mock_display.called
 
 
+    def test_deps_reindex_smoke(self, temp_db):
+        """deps reindex - 到達可能性インデックスが作成される"""
+        proj_repo = ProjectRepository(temp_db)
+        task_repo = TaskRepository(temp_db)
+        dep_mgr = DependencyManager(temp_db)
+        proj = proj_repo.create("Project", "Desc")
+        task1 = task_repo.create(proj.id, "Task1", description="Desc1")
+        task2 = task_repo.create(proj.id, "Task2", description="Desc2")
+        dep_mgr.add_task_dependency(task1.id, task2.id)
+
+        args = Namespace(deps_command="reindex", entity=None)
+        commands.handle_deps(temp_db, args)
+
+        assert dep_mgr.has_reachability_index("task")
+        assert dep_mgr.has_reachability_index("subtask")
+
+
 # ========================================
 # handle_doctor のスモークテスト
 # ========================================
@@ -434,6 +451,17 @@ class TestHandleDoctorSmoke:
         # 呼ばれたことを確認
         assert mock_display.called
 
+    def test_doctor_incremental_smoke(self, temp_db, monkeypatch):
+        """doctor --incremental - 初回は全件チェックでウォーターマークが保存される"""
+        mock_display = MagicMock()
+        monkeypatch.setattr("pmtool.tui.commands.display.show_doctor_report", mock_display)
+
+        args = Namespace(jobs=1, incremental=True, full=False)
+        commands.handle_doctor(temp_db, args)
+
+        assert mock_display.called
+        assert temp_db.get_metadata("doctor.watermark") is not None
+
 
 # ========================================
 # handle_update のスモークテスト
@@ -16,7 +16,8 @@ from pathlib import Path
 import pytest
 import sqlite3
 
-from pmtool.database import Database
+from pmtool.database import PROFILES, Database
+from pmtool.migrations import LATEST_SCHEMA_VERSION, apply_migrations
 
 
 class TestDatabaseInitialization:
@@ -167,6 +168,140 @@ class TestDatabaseInitialize:
         db.close()
 
 
+class TestMigrations:
+    """スキーママイグレーションと metadata のテスト"""
+
+    def test_initialize_applies_latest_version(self, temp_db):
+        """初期化直後に最新スキーマバージョンまで移行される"""
+        assert temp_db.get_schema_version() == LATEST_SCHEMA_VERSION
+        assert "metadata" in temp_db.get_table_list()
+
+    def test_connect_migrates_existing_v1_database(self, tmp_path):
+        """バージョン1のDBは次回接続時に移行される"""
+        db_path = tmp_path / "legacy.db"
+        init_sql_path = Path(__file__).parent.parent / "scripts" / "init_db.sql"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(init_sql_path.read_text(encoding="utf-8"))
+        conn.close()
+
+        db = Database(db_path)
+        try:
+            assert db.get_schema_version() == LATEST_SCHEMA_VERSION
+            assert apply_migrations(db.connect()) == []
+        finally:
+            db.close()
+
+    def test_migration_backfills_pending_predecessors(self, tmp_path):
+        """既存データから未完了の先行ノード数と進捗集計が埋められる"""
+        db_path = tmp_path / "legacy.db"
+        init_sql_path = Path(__file__).parent.parent / "scripts" / "init_db.sql"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(init_sql_path.read_text(encoding="utf-8"))
+        now = "2026-01-01T00:00:00"
+        conn.execute(
+            "INSERT INTO projects (id, name, description, order_index, created_at, updated_at) "
+            "VALUES (1, 'P', '', 0, ?, ?)",
+            (now, now),
+        )
+        conn.executemany(
+            "INSERT INTO tasks (id, project_id, name, description, status, order_index, "
+            "created_at, updated_at) VALUES (?, 1, ?, '', ?, ?, ?, ?)",
+            [
+                (1, "A", "DONE", 0, now, now),
+                (2, "B", "IN_PROGRESS", 1, now, now),
+                (3, "C", "NOT_STARTED", 2, now, now),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+            "VALUES (?, ?, ?)",
+            [(1, 3, now), (2, 3, now), (1, 2, now)],
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        try:
+            rows = db.connect().execute(
+                "SELECT id, pending_predecessors FROM tasks ORDER BY id"
+            ).fetchall()
+            assert [tuple(row) for row in rows] == [(1, 0), (2, 0), (3, 1)]
+
+            rows = db.connect().execute(
+                "SELECT scope, scope_id, node_type, status, count FROM progress_rollups "
+                "ORDER BY status"
+            ).fetchall()
+            assert [tuple(row) for row in rows] == [
+                ("project", 1, "task", "DONE", 1),
+                ("project", 1, "task", "IN_PROGRESS", 1),
+                ("project", 1, "task", "NOT_STARTED", 1),
+            ]
+        finally:
+            db.close()
+
+    def test_metadata_round_trip(self, temp_db):
+        """metadata の保存・上書き・削除"""
+        assert temp_db.get_metadata("key") is None
+
+        temp_db.set_metadata("key", "value1")
+        temp_db.set_metadata("key", "value2")
+        assert temp_db.get_metadata("key") == "value2"
+
+        temp_db.delete_metadata("key")
+        assert temp_db.get_metadata("key") is None
+
+
+class TestPerformanceProfile:
+    """性能プロファイルのテスト"""
+
+    def test_default_profile_keeps_sqlite_defaults(self, tmp_path):
+        """default プロファイルではPRAGMAを変更しない"""
+        db = Database(tmp_path / "test.db")
+        try:
+            assert db.profile == "default"
+            assert db.get_active_pragmas()["journal_mode"] == "DELETE"
+        finally:
+            db.close()
+
+    def test_fast_profile_applies_pragmas(self, tmp_path):
+        """fast プロファイルのPRAGMAが共有・読み取り専用コネクションに適用される"""
+        db = Database(tmp_path / "test.db", profile="fast")
+        try:
+            assert db.get_active_pragmas() == PROFILES["fast"]
+
+            conn = db.connect_readonly()
+            try:
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            finally:
+                conn.close()
+        finally:
+            db.close()
+
+    def test_custom_profile(self, tmp_path):
+        """辞書で指定したPRAGMAが適用される（文字列の数値も受け付ける）"""
+        db = Database(
+            tmp_path / "test.db",
+            profile={"synchronous": "off", "cache_size": "-4096"},
+        )
+        try:
+            active = db.get_active_pragmas()
+            assert db.profile == "custom"
+            assert active["synchronous"] == "OFF"
+            assert active["cache_size"] == -4096
+        finally:
+            db.close()
+
+    @pytest.mark.parametrize(
+        "profile",
+        ["turbo", {"page_size": 4096}, {"synchronous": "FAST"}, {"cache_size": 1.5}],
+    )
+    def test_invalid_profile_raises(self, tmp_path, profile):
+        """不正なプロファイルは ValueError"""
+        with pytest.raises(ValueError):
+            Database(tmp_path / "test.db", profile=profile)
+
+
 class TestVerifyForeignKeys:
     """verify_foreign_keys関数のテスト"""
 
@@ -0,0 +1,211 @@
+"""
+datagen.py（合成データセット生成）のテスト
+"""
+
+import sqlite3
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.datagen import DatasetSpec, generate_dataset, main, parse_status_mix
+from pmtool.dependencies import DependencyManager
+from pmtool.doctor import Doctor
+
+SPEC = DatasetSpec(
+    projects=2,
+    subprojects_per_project=3,
+    tasks_per_subproject=8,
+    subtasks_per_task=5,
+    dependency_density=1.5,
+    cross_subproject_ratio=0.3,
+    seed=42,
+)
+
+
+def _edges(db: Database, table: str) -> list[tuple[int, int]]:
+    rows = db.connect().execute(
+        f"SELECT predecessor_id, successor_id FROM {table} ORDER BY 1, 2"
+    )
+    return [tuple(row) for row in rows]
+
+
+def test_generate_dataset_counts(temp_db: Database):
+    """指定した規模の行が生成されること"""
+    result = generate_dataset(temp_db, SPEC)
+
+    assert result.projects == 2
+    assert result.subprojects == 6
+    assert result.tasks == SPEC.total_tasks == 48
+    assert result.subtasks == SPEC.total_subtasks == 240
+    assert result.task_dependencies == len(_edges(temp_db, "task_dependencies")) > 0
+    assert result.subtask_dependencies == len(_edges(temp_db, "subtask_dependencies")) > 0
+
+
+def test_generate_dataset_is_valid(temp_db: Database):
+    """生成したデータがFK・D1制約・DAG・DONE条件を満たすこと"""
+    generate_dataset(temp_db, SPEC)
+    conn = temp_db.connect()
+
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    # D1制約: Task依存は同じProject内、SubTask依存は同じTask内
+    assert conn.execute(
+        """
+        SELECT COUNT(*) FROM task_dependencies d
+        JOIN tasks p ON p.id = d.predecessor_id
+        JOIN tasks s ON s.id = d.successor_id
+        WHERE p.project_id != s.project_id
+        """
+    ).fetchone()[0] == 0
+    assert conn.execute(
+        """
+        SELECT COUNT(*) FROM subtask_dependencies d
+        JOIN subtasks p ON p.id = d.predecessor_id
+        JOIN subtasks s ON s.id = d.successor_id
+        WHERE p.task_id != s.task_id
+        """
+    ).fetchone()[0] == 0
+    # 別SubProjectへの依存関係も含まれる
+    assert conn.execute(
+        """
+        SELECT COUNT(*) FROM task_dependencies d
+        JOIN tasks p ON p.id = d.predecessor_id
+        JOIN tasks s ON s.id = d.successor_id
+        WHERE p.subproject_id != s.subproject_id
+        """
+    ).fetchone()[0] > 0
+
+    dep_manager = DependencyManager(temp_db)
+    assert len(dep_manager.get_topological_order("task")) == SPEC.total_tasks
+    assert len(dep_manager.get_topological_order("subtask")) == SPEC.total_subtasks
+
+    report = Doctor(temp_db).check_all()
+    assert report.error_count == 0
+    assert report.warning_count == 0
+
+
+def test_generate_dataset_bypasses_row_triggers(temp_db: Database):
+    """
+    一括投入中は行ごとのトリガーが発火せず、派生データは最後に再計算されること
+
+    トリガーの処理も1文として記録されるため、実行文数は挿入行数程度に収まる
+    （派生データのトリガーを追加した場合は bulk_load() の対象に含めること）
+    """
+    conn = temp_db.connect()
+    triggers = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name"
+    ).fetchall()
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        result = generate_dataset(temp_db, SPEC)
+    finally:
+        conn.set_trace_callback(None)
+
+    rows = (
+        result.projects + result.subprojects + result.tasks + result.subtasks
+        + result.task_dependencies + result.subtask_dependencies
+    )
+    assert len(statements) <= rows + 100
+
+    # トリガーは元に戻り、派生データは行ごとに数えた場合と一致する
+    assert conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name"
+    ).fetchall() == triggers
+    for node_table, dep_table in (
+        ("tasks", "task_dependencies"),
+        ("subtasks", "subtask_dependencies"),
+    ):
+        assert conn.execute(
+            f"""
+            SELECT COUNT(*) FROM {node_table} n
+            WHERE n.pending_predecessors != (
+                SELECT COUNT(*) FROM {dep_table} d
+                JOIN {node_table} p ON p.id = d.predecessor_id
+                WHERE d.successor_id = n.id AND p.status != 'DONE'
+            )
+            """
+        ).fetchone()[0] == 0
+    assert conn.execute(
+        "SELECT SUM(count) FROM progress_rollups WHERE scope = 'project'"
+    ).fetchone()[0] == result.tasks + result.subtasks
+
+
+def test_generate_dataset_is_deterministic(tmp_path):
+    """同じシードからは同じデータが生成されること"""
+    edges = []
+    for name in ("a.db", "b.db"):
+        db = Database(str(tmp_path / name))
+        db.initialize("scripts/init_db.sql")
+        generate_dataset(db, SPEC)
+        edges.append(
+            (
+                _edges(db, "task_dependencies"),
+                _edges(db, "subtask_dependencies"),
+                db.connect().execute("SELECT id, status FROM subtasks").fetchall(),
+            )
+        )
+        db.close()
+
+    assert edges[0][0] == edges[1][0]
+    assert edges[0][1] == edges[1][1]
+    assert [tuple(r) for r in edges[0][2]] == [tuple(r) for r in edges[1][2]]
+
+
+def test_generate_dataset_status_mix(temp_db: Database):
+    """status_mix で指定しなかったステータスは生成されないこと"""
+    spec = DatasetSpec(
+        projects=1,
+        subprojects_per_project=2,
+        tasks_per_subproject=5,
+        subtasks_per_task=3,
+        status_mix={"DONE": 0.0, "NOT_STARTED": 1.0},
+    )
+    generate_dataset(temp_db, spec)
+
+    statuses = {
+        row[0]
+        for row in temp_db.connect().execute(
+            "SELECT status FROM tasks UNION SELECT status FROM subtasks"
+        )
+    }
+    assert statuses == {"NOT_STARTED"}
+
+
+def test_generate_dataset_rejects_invalid(temp_db: Database):
+    """不正な設定値・データのあるDBは拒否されること"""
+    with pytest.raises(ValueError):
+        generate_dataset(temp_db, DatasetSpec(status_mix={"FINISHED": 1.0}))
+    with pytest.raises(ValueError):
+        generate_dataset(temp_db, DatasetSpec(cross_subproject_ratio=1.5))
+    with pytest.raises(ValueError):
+        parse_status_mix("DONE")
+
+    generate_dataset(temp_db, DatasetSpec(projects=1, tasks_per_subproject=1))
+    with pytest.raises(RuntimeError):
+        generate_dataset(temp_db, DatasetSpec(projects=1))
+
+
+def test_main_generates_database(tmp_path, capsys):
+    """pmtool-gen でDBファイルが生成され、既存ファイルは --force なしでは上書きしないこと"""
+    output = tmp_path / "gen.db"
+    argv = [
+        str(output),
+        "--projects", "1",
+        "--subprojects", "2",
+        "--tasks", "3",
+        "--subtasks", "4",
+        "--status-mix", "DONE=1,UNSET=1",
+        "--init-sql", "scripts/init_db.sql",
+    ]
+    main(argv)
+    assert "subtasks=24" in capsys.readouterr().out
+
+    conn = sqlite3.connect(output)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM subtasks").fetchone()[0] == 24
+    finally:
+        conn.close()
+
+    with pytest.raises(SystemExit):
+        main(argv)
+    main(argv + ["--force"])
@@ -239,3 +239,309 @@ def test_cross_layer_dependency_rejected(temp_db: Database):
     # 実装上、異なるレイヤーのIDを渡すとFK制約違反やConstraintViolationErrorになる
     with pytest.raises((ConstraintViolationError, Exception)):
         dep_mgr.add_task_dependency(task.id, subtask.id)
+
+
+def test_graph_cache_reused_and_updated_in_place(temp_db: Database):
+    """依存グラフのキャッシュが再利用され、自身の追加・削除がその場で反映されること"""
+    from pmtool.graph import get_graph_cache
+
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    task1 = task_repo.create(project.id, "Task 1", None, "")
+    task2 = task_repo.create(project.id, "Task 2", None, "")
+    task3 = task_repo.create(project.id, "Task 3", None, "")
+
+    dep_mgr.add_task_dependency(task1.id, task2.id)
+    graph = dep_mgr._get_graph("task")
+
+    # 2回目の追加でもグラフは再構築されず、同じオブジェクトが更新される
+    dep_mgr.add_task_dependency(task2.id, task3.id)
+    assert dep_mgr._get_graph("task") is graph
+    assert graph.has_edge(task2.id, task3.id)
+
+    # 別の DependencyManager でも同じキャッシュを共有する
+    assert DependencyManager(temp_db)._get_graph("task") is graph
+
+    dep_mgr.remove_task_dependency(task2.id, task3.id)
+    assert dep_mgr._get_graph("task") is graph
+    assert not graph.has_edge(task2.id, task3.id)
+    assert get_graph_cache(temp_db, "task").get(temp_db.connect()) is graph
+
+
+def test_graph_cache_invalidated_by_external_write(temp_db: Database):
+    """他の接続や直接SQLによる変更でキャッシュが無効化されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    task1 = task_repo.create(project.id, "Task 1", None, "")
+    task2 = task_repo.create(project.id, "Task 2", None, "")
+    task3 = task_repo.create(project.id, "Task 3", None, "")
+
+    dep_mgr.add_task_dependency(task1.id, task2.id)
+    dep_mgr._get_graph("task")
+
+    # 別接続で task2 → task3 を追加
+    other = Database(temp_db.db_path)
+    other_conn = other.connect()
+    other_conn.execute(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, '2025-01-01T00:00:00')",
+        (task2.id, task3.id),
+    )
+    other_conn.commit()
+    other.close()
+
+    # 再読み込みされたグラフで task3 → task1 の循環が検出される
+    with pytest.raises(CyclicDependencyError):
+        dep_mgr.add_task_dependency(task3.id, task1.id)
+
+    # 同一接続での直接削除 (ON DELETE CASCADE) も検知される
+    conn = temp_db.connect()
+    conn.execute("DELETE FROM tasks WHERE id = ?", (task2.id,))
+    conn.commit()
+    assert not dep_mgr._get_graph("task").has_edge(task1.id, task2.id)
+    dep_mgr.add_task_dependency(task3.id, task1.id)
+
+
+def test_get_topological_order(temp_db: Database):
+    """依存関係の追加・削除後もトポロジカル順序が維持されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    t = [task_repo.create(project.id, f"Task {i}", None, "") for i in range(5)]
+
+    # 作成順とは逆向きの依存を追加し、順序の並べ替えを発生させる
+    dep_mgr.add_task_dependency(t[3].id, t[4].id)
+    dep_mgr.add_task_dependency(t[4].id, t[1].id)
+    dep_mgr.add_task_dependency(t[2].id, t[3].id)
+    dep_mgr.add_task_dependency(t[1].id, t[0].id)
+
+    order = dep_mgr.get_topological_order("task")
+    assert order == [t[2].id, t[3].id, t[4].id, t[1].id, t[0].id]
+
+    with pytest.raises(CyclicDependencyError):
+        dep_mgr.add_task_dependency(t[0].id, t[2].id)
+
+    # 削除後は孤立ノードが除外される
+    dep_mgr.remove_task_dependency(t[1].id, t[0].id)
+    assert dep_mgr.get_topological_order("task") == order[:-1]
+    assert dep_mgr.get_topological_order("subtask") == []
+
+
+def test_dynamic_topological_order_matches_reachability():
+    """動的に維持した順序が、ランダムなエッジ追加に対して常に有効であること"""
+    import random
+
+    from pmtool.graph import DependencyGraph
+
+    rng = random.Random(42)
+    graph = DependencyGraph()
+    for _ in range(400):
+        pred, succ = rng.randrange(40), rng.randrange(40)
+        expected_cycle = pred == succ or graph.has_path(succ, pred)
+        assert graph.would_create_cycle(pred, succ) == expected_cycle
+        if not expected_cycle:
+            graph.add_edge(pred, succ)
+
+    position = {node: i for i, node in enumerate(graph.topological_order())}
+    for pred, succs in graph.forward.items():
+        for succ in succs:
+            assert position[pred] < position[succ]
+
+
+def test_add_task_dependencies_batch(temp_db: Database):
+    """一括追加で有効な組のみが追加され、拒否理由が入力順に報告されること"""
+    from pmtool.exceptions import DependencyRejectionReason
+
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    other_project = proj_repo.create("Other", "")
+    t = [task_repo.create(project.id, f"Task {i}", None, "") for i in range(4)]
+    other = task_repo.create(other_project.id, "Other Task", None, "")
+    dep_mgr.add_task_dependency(t[0].id, t[1].id)
+
+    result = dep_mgr.add_task_dependencies(
+        [
+            (t[1].id, t[2].id),
+            (t[2].id, t[3].id),
+            (t[3].id, t[3].id),
+            (t[1].id, t[2].id),
+            (t[0].id, t[1].id),
+            (t[0].id, other.id),
+            (t[0].id, 99999),
+            (t[3].id, t[0].id),
+        ]
+    )
+
+    assert [(d.predecessor_id, d.successor_id) for d in result.added] == [
+        (t[1].id, t[2].id),
+        (t[2].id, t[3].id),
+    ]
+    assert all(d.id is not None for d in result.added)
+    assert [r.reason for r in result.rejected] == [
+        DependencyRejectionReason.SELF_REFERENCE,
+        DependencyRejectionReason.DUPLICATE_IN_BATCH,
+        DependencyRejectionReason.ALREADY_EXISTS,
+        DependencyRejectionReason.LAYER_MISMATCH,
+        DependencyRejectionReason.NODE_NOT_FOUND,
+        DependencyRejectionReason.CYCLE,
+    ]
+
+    assert dep_mgr.get_task_dependencies(t[3].id)["predecessors"] == [t[2].id]
+    order = dep_mgr.get_topological_order("task")
+    assert order == [t[0].id, t[1].id, t[2].id, t[3].id]
+
+
+def test_add_subtask_dependencies_batch(temp_db: Database):
+    """SubTaskの一括追加で異なるTask間の組が拒否されること"""
+    from pmtool.exceptions import DependencyRejectionReason
+
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    task1 = task_repo.create(project.id, "Task 1", None, "")
+    task2 = task_repo.create(project.id, "Task 2", None, "")
+    st1 = subtask_repo.create(task1.id, "SubTask 1", "")
+    st2 = subtask_repo.create(task1.id, "SubTask 2", "")
+    st3 = subtask_repo.create(task2.id, "SubTask 3", "")
+
+    result = dep_mgr.add_subtask_dependencies(
+        [(st1.id, st2.id), (st2.id, st3.id)]
+    )
+
+    assert len(result.added) == 1
+    assert result.has_rejections
+    assert result.rejected[0].reason == DependencyRejectionReason.LAYER_MISMATCH
+    assert dep_mgr.add_subtask_dependencies([]).added == []
+
+
+def test_bridge_hub_task_skips_existing_edges(temp_db: Database):
+    """ハブTaskの橋渡しで全組み合わせが一括作成され、既存の依存関係は重複しないこと"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    hub = task_repo.create(project.id, "Hub", None, "")
+    preds = [task_repo.create(project.id, f"Pred {i}", None, "") for i in range(3)]
+    succs = [task_repo.create(project.id, f"Succ {i}", None, "") for i in range(2)]
+
+    dep_mgr.add_task_dependencies(
+        [(p.id, hub.id) for p in preds] + [(hub.id, s.id) for s in succs]
+    )
+    dep_mgr.add_task_dependency(preds[0].id, succs[0].id)
+
+    bridged = task_repo.delete_with_bridge(hub.id)
+
+    expected = sorted(
+        (p.id, s.id) for p in preds for s in succs
+        if (p.id, s.id) != (preds[0].id, succs[0].id)
+    )
+    assert bridged == expected
+    for s in succs:
+        assert sorted(dep_mgr.get_task_dependencies(s.id)["predecessors"]) == [
+            p.id for p in preds
+        ]
+    assert hub.id not in dep_mgr.get_topological_order("task")
+
+
+def test_reachability_index_tracks_dependency_changes(temp_db: Database):
+    """到達可能性インデックスが依存関係の追加・削除・Task削除に追従すること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+
+    project = proj_repo.create("Project", "")
+    a, b, c, d = [task_repo.create(project.id, n, None, "") for n in "ABCD"]
+
+    # A → B → C, A → D → C
+    dep_mgr.add_task_dependencies(
+        [(a.id, b.id), (b.id, c.id), (a.id, d.id), (d.id, c.id)]
+    )
+    assert not dep_mgr.has_reachability_index("task")
+    assert dep_mgr.rebuild_reachability_index("task") == {"task": 5}
+    assert dep_mgr.has_reachability_index("task")
+
+    assert sorted(dep_mgr.get_all_task_successors_recursive(a.id)) == sorted(
+        [b.id, c.id, d.id]
+    )
+    assert dep_mgr.find_path_between_tasks(a.id, c.id) == [a.id, b.id, c.id]
+    assert dep_mgr.find_path_between_tasks(c.id, a.id) is None
+
+    # B → C を削除しても A → D → C が残る
+    dep_mgr.remove_task_dependency(b.id, c.id)
+    assert dep_mgr.is_reachable(a.id, c.id, "task")
+    assert not dep_mgr.is_reachable(b.id, c.id, "task")
+    assert dep_mgr.find_path_between_tasks(a.id, c.id) == [a.id, d.id, c.id]
+
+    # D を削除 (依存関係は CASCADE で削除される) すると A から C へは到達不能
+    task_repo.delete(d.id)
+    assert not dep_mgr.is_reachable(a.id, c.id, "task")
+    assert dep_mgr.get_all_task_successors_recursive(a.id) == [b.id]
+
+    # 再構築結果とトリガーによる差分更新結果が一致する
+    conn = temp_db.connect()
+    before = set(map(tuple, conn.execute("SELECT * FROM task_reachability")))
+    dep_mgr.rebuild_reachability_index("task")
+    after = set(map(tuple, conn.execute("SELECT * FROM task_reachability")))
+    assert before == after
+
+
+@pytest.mark.parametrize("traversal", ["memory", "sql", "index"])
+def test_traversal_backends_agree(temp_db: Database, traversal: str):
+    """どの探索方式でも閉包・経路・近傍の結果が一致すること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+
+    project = proj_repo.create("Project", "")
+    t = [task_repo.create(project.id, f"Task {i}", None, "") for i in range(6)]
+
+    # 0 → 1 → 2 → 3, 0 → 4 → 3, 5 は孤立
+    DependencyManager(temp_db).add_task_dependencies(
+        [(t[0].id, t[1].id), (t[1].id, t[2].id), (t[2].id, t[3].id),
+         (t[0].id, t[4].id), (t[4].id, t[3].id)]
+    )
+    if traversal == "index":
+        DependencyManager(temp_db).rebuild_reachability_index("task")
+        dep_mgr = DependencyManager(temp_db)
+    else:
+        dep_mgr = DependencyManager(temp_db, traversal=traversal)
+
+    assert sorted(dep_mgr.get_all_task_successors_recursive(t[0].id)) == [
+        t[1].id, t[2].id, t[3].id, t[4].id
+    ]
+    assert sorted(dep_mgr.get_all_task_predecessors_recursive(t[3].id)) == [
+        t[0].id, t[1].id, t[2].id, t[4].id
+    ]
+    assert dep_mgr.find_path_between_tasks(t[0].id, t[3].id) == [
+        t[0].id, t[4].id, t[3].id
+    ]
+    assert dep_mgr.find_path_between_tasks(t[0].id, t[5].id) is None
+    assert dep_mgr.find_path_between_tasks(t[2].id, t[2].id) == [t[2].id]
+    assert dep_mgr.is_reachable(t[1].id, t[3].id, "task")
+    assert not dep_mgr.is_reachable(t[3].id, t[1].id, "task")
+    assert dep_mgr.get_neighborhood(t[0].id, "task", max_depth=2) == {
+        t[1].id: 1, t[4].id: 1, t[2].id: 2, t[3].id: 2
+    }
+    assert dep_mgr.get_neighborhood(
+        t[3].id, "task", max_depth=None, direction="predecessors"
+    ) == {t[2].id: 1, t[4].id: 1, t[1].id: 2, t[0].id: 2}
+
+
+def test_invalid_traversal_rejected(temp_db: Database):
+    """不正な探索方式はValueErrorになること"""
+    with pytest.raises(ValueError):
+        DependencyManager(temp_db, traversal="graphdb")
@@ -6,9 +6,12 @@ doctor/check機能のテスト
 
 import sqlite3
 
+import pytest
+
 from pmtool.database import Database
 from pmtool.dependencies import DependencyManager
-from pmtool.doctor import Doctor, IssueLevel
+from pmtool.doctor import WATERMARK_KEY, Doctor, IssueLevel
+from pmtool.exceptions import ValidationError
 from pmtool.repository import (
     ProjectRepository,
     SubProjectRepository,
@@ -218,3 +221,202 @@ def test_doctor_detect_order_index_gap(temp_db: Database):
     finally:
         cursor.execute("PRAGMA foreign_keys = ON")
         conn.commit()
+
+
+def test_doctor_reports_each_cycle_component_once(temp_db: Database):
+    """サイクルは強連結成分ごとに1件だけ、代表サイクル付きで報告されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    t = [task_repo.create(project.id, f"Task {i}", None, "") for i in range(6)]
+
+    # DAG検証を迂回して直接サイクルを作成
+    # 成分1: 0 → 1 → 2 → 0 (+ 1 → 0), 成分2: 3 ⇄ 4, 5 はサイクル外
+    conn = temp_db.connect()
+    edges = [(0, 1), (1, 2), (2, 0), (1, 0), (3, 4), (4, 3), (2, 5)]
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, '2025-01-01T00:00:00')",
+        [(t[a].id, t[b].id) for a, b in edges],
+    )
+    conn.commit()
+
+    report = Doctor(temp_db).check_all()
+    dag_errors = [i for i in report.errors if i.code == "DAG001"]
+
+    assert len(dag_errors) == 2
+    components = sorted(i.details["component"] for i in dag_errors)
+    assert components == [[t[0].id, t[1].id, t[2].id], [t[3].id, t[4].id]]
+    cycles = {tuple(i.details["cycle"]) for i in dag_errors}
+    assert (t[0].id, t[1].id, t[0].id) in cycles
+    assert (t[3].id, t[4].id, t[3].id) in cycles
+
+
+def test_doctor_cycle_detection_handles_long_chain(temp_db: Database):
+    """再帰上限を超える長さの依存チェーンでもサイクル検出が完了すること"""
+    import sys
+
+    proj_repo = ProjectRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    length = sys.getrecursionlimit() + 500
+
+    conn = temp_db.connect()
+    now = "2025-01-01T00:00:00"
+    conn.executemany(
+        "INSERT INTO tasks (id, project_id, name, description, status, order_index, "
+        "created_at, updated_at) VALUES (?, ?, ?, '', 'UNSET', ?, ?, ?)",
+        [(i, project.id, f"T{i}", i, now, now) for i in range(1, length + 1)],
+    )
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, ?)",
+        [(i, i + 1, now) for i in range(1, length)] + [(length, 1, now)],
+    )
+    conn.commit()
+
+    dag_errors = [i for i in Doctor(temp_db).check_all().errors if i.code == "DAG001"]
+    assert len(dag_errors) == 1
+    assert len(dag_errors[0].details["cycle"]) == length + 1
+
+
+def test_doctor_parallel_matches_sequential(temp_db: Database):
+    """--jobs 指定の並列実行でも順次実行と同じ結果になり、所要時間が記録されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+
+    conn = temp_db.connect()
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, '2025-01-01T00:00:00')",
+        [(t1.id, t2.id), (t2.id, t1.id)],
+    )
+    conn.commit()
+
+    doctor = Doctor(temp_db)
+    sequential = doctor.check_all()
+    parallel = doctor.check_all(jobs=4)
+
+    assert [(i.code, i.message) for i in parallel.errors] == [
+        (i.code, i.message) for i in sequential.errors
+    ]
+    assert parallel.warnings == sequential.warnings
+    assert list(parallel.timings) == [
+        "fk_integrity",
+        "dag_integrity",
+        "status_consistency",
+        "order_index",
+        "subproject_nesting",
+        "progress_rollups",
+    ]
+    assert all(elapsed >= 0 for elapsed in parallel.timings.values())
+
+
+def test_doctor_rejects_invalid_jobs(temp_db: Database):
+    """jobs が1未満の場合は ValidationError になること"""
+    with pytest.raises(ValidationError):
+        Doctor(temp_db).check_all(jobs=0)
+
+
+def test_doctor_incremental_checks_only_changed_scope(temp_db: Database):
+    """差分チェックはウォーターマーク以降の変更と隣接要素のみを対象にすること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+    t3 = task_repo.create(project.id, "Task 3", None, "")
+    t4 = task_repo.create(project.id, "Task 4", None, "")
+
+    doctor = Doctor(temp_db)
+    assert doctor.check_full().is_healthy
+    watermark = temp_db.get_metadata(WATERMARK_KEY)
+    assert watermark is not None
+
+    # created_at / updated_at を伴わない直接の破損は差分チェックの対象外
+    conn = temp_db.connect()
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, '2000-01-01T00:00:00')",
+        [(t3.id, t4.id), (t4.id, t3.id)],
+    )
+    conn.commit()
+
+    DependencyManager(temp_db).add_task_dependency(t1.id, t2.id)
+
+    report = doctor.check_incremental()
+    assert report.is_healthy
+    assert report.scope is not None
+    assert report.scope.since == watermark
+    assert report.scope.task_ids == {t1.id, t2.id}
+    assert report.scope.project_ids == {project.id}
+    assert temp_db.get_metadata(WATERMARK_KEY) > watermark
+
+    # 全件チェックでは検出され、ウォーターマークは削除される
+    full = doctor.check_full()
+    assert any(i.code == "DAG001" for i in full.errors)
+    assert temp_db.get_metadata(WATERMARK_KEY) is None
+
+
+def test_doctor_incremental_keeps_watermark_on_error(temp_db: Database):
+    """差分チェックでエラーを検出した場合はウォーターマークを進めないこと"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+
+    doctor = Doctor(temp_db)
+    # ウォーターマーク未保存の場合は全件チェックになる
+    first = doctor.check_incremental()
+    assert first.scope is None
+    watermark = temp_db.get_metadata(WATERMARK_KEY)
+
+    conn = temp_db.connect()
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, ?)",
+        [(t1.id, t2.id, "9999-01-01T00:00:00"), (t2.id, t1.id, "9999-01-01T00:00:00")],
+    )
+    conn.commit()
+
+    for jobs in (1, 2):
+        report = doctor.check_incremental(jobs=jobs)
+        dag_errors = [i for i in report.errors if i.code == "DAG001"]
+        assert len(dag_errors) == 1
+        assert dag_errors[0].details["component"] == [t1.id, t2.id]
+        assert temp_db.get_metadata(WATERMARK_KEY) == watermark
+
+
+def test_doctor_detects_progress_rollup_drift(temp_db: Database):
+    """進捗集計が実データと食い違う場合に ROLLUP001 を報告すること"""
+    proj_repo = ProjectRepository(temp_db)
+    subproj_repo = SubProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    project = proj_repo.create("Project", "")
+    subproj = subproj_repo.create(project.id, "SubProject")
+    task_repo.create(project.id, "Task", subproj.id, "")
+
+    doctor = Doctor(temp_db)
+    assert not [i for i in doctor.check_all().errors if i.code == "ROLLUP001"]
+
+    conn = temp_db.connect()
+    conn.execute(
+        "UPDATE progress_rollups SET count = count + 2 "
+        "WHERE scope = 'subproject' AND scope_id = ? AND node_type = 'task'",
+        (subproj.id,),
+    )
+    conn.commit()
+
+    issues = [i for i in doctor.check_all().errors if i.code == "ROLLUP001"]
+    assert len(issues) == 1
+    assert issues[0].details == {
+        "scope": "subproject",
+        "scope_id": subproj.id,
+        "node_type": "task",
+        "status": "UNSET",
+        "expected": 1,
+        "actual": 3,
+    }
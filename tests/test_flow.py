@@ -0,0 +1,106 @@
+"""
+ステータス履歴 (status_events) とフロー分析のテスト
+"""
+
+from datetime import datetime
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.dependencies import DependencyManager
+from pmtool.exceptions import ValidationError
+from pmtool.flow import compute_flow_stats
+from pmtool.repository import ProjectRepository, SubTaskRepository, TaskRepository
+from pmtool.status import StatusManager
+
+
+def _events(db: Database) -> list[tuple]:
+    rows = db.connect().execute(
+        "SELECT node_type, node_id, project_id, from_status, to_status "
+        "FROM status_events ORDER BY id"
+    ).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def test_status_updates_append_events(temp_db: Database):
+    """単体・一括のステータス更新が遷移を記録し、変化のない更新は記録しないこと"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    status_mgr = StatusManager(temp_db, DependencyManager(temp_db))
+    task = task_repo.create(project.id, "Task")
+    subtask = subtask_repo.create(task.id, "SubTask")
+
+    status_mgr.update_task_status(task.id, "IN_PROGRESS")
+    status_mgr.update_task_status(task.id, "IN_PROGRESS")
+    status_mgr.update_subtask_status(subtask.id, "DONE")
+    status_mgr.update_statuses(
+        [("task", task.id, "DONE"), ("subtask", subtask.id, "DONE")]
+    )
+    status_mgr.update_statuses([("task", task.id, "NOT_STARTED")], dry_run=True)
+
+    assert _events(temp_db) == [
+        ("task", task.id, project.id, "UNSET", "IN_PROGRESS"),
+        ("subtask", subtask.id, project.id, "UNSET", "DONE"),
+        ("task", task.id, project.id, "IN_PROGRESS", "DONE"),
+    ]
+
+
+def test_compute_flow_stats(temp_db: Database):
+    """サイクルタイムのパーセンタイル・週次スループット・WIPを集計できること"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    other = ProjectRepository(temp_db).create("Other", "")
+
+    # (node_id, project_id, from, to, occurred_at)
+    events = [
+        # 集計期間前から作業中のまま（WIPの基準値）
+        (1, project.id, "UNSET", "IN_PROGRESS", "2026-08-03T09:00:00"),
+        # 2日・4日・6日で完了
+        (2, project.id, "UNSET", "IN_PROGRESS", "2026-09-28T00:00:00"),
+        (2, project.id, "IN_PROGRESS", "DONE", "2026-09-30T00:00:00"),
+        (3, project.id, "NOT_STARTED", "IN_PROGRESS", "2026-10-01T00:00:00"),
+        (3, project.id, "IN_PROGRESS", "DONE", "2026-10-05T00:00:00"),
+        (4, project.id, "UNSET", "IN_PROGRESS", "2026-10-06T00:00:00"),
+        (4, project.id, "IN_PROGRESS", "DONE", "2026-10-12T00:00:00"),
+        # 作業中を経ずに完了（スループットのみ）
+        (5, project.id, "UNSET", "DONE", "2026-10-13T00:00:00"),
+        # 完了後に差し戻し（サイクルタイムの対象外）
+        (6, project.id, "UNSET", "IN_PROGRESS", "2026-10-01T00:00:00"),
+        (6, project.id, "IN_PROGRESS", "DONE", "2026-10-02T00:00:00"),
+        (6, project.id, "DONE", "IN_PROGRESS", "2026-10-14T00:00:00"),
+        (7, other.id, "UNSET", "IN_PROGRESS", "2026-10-14T00:00:00"),
+        # 削除済みプロジェクトの履歴
+        (8, 999, "UNSET", "IN_PROGRESS", "2026-10-14T00:00:00"),
+    ]
+    conn = temp_db.connect()
+    conn.executemany(
+        "INSERT INTO status_events "
+        "(node_type, node_id, project_id, from_status, to_status, occurred_at) "
+        "VALUES ('task', ?, ?, ?, ?, ?)",
+        events,
+    )
+    conn.commit()
+
+    now = datetime(2026, 10, 15, 12, 0, 0)
+    stats = compute_flow_stats(temp_db, weeks=3, now=now)
+    assert [item.project_id for item in stats] == [project.id, other.id]
+
+    item = stats[0]
+    assert item.cycle_time_count == 3
+    assert item.cycle_time_percentiles == {50: 4.0, 85: 6.0, 95: 6.0}
+    assert item.cycle_time_mean == pytest.approx(4.0)
+    assert item.completed == 5
+    assert [(w.week_start, w.throughput, w.wip) for w in item.weeks] == [
+        ("2026-09-28", 2, 2),
+        ("2026-10-05", 1, 2),
+        ("2026-10-12", 2, 2),
+    ]
+
+    (only,) = compute_flow_stats(temp_db, project_id=other.id, weeks=1, now=now)
+    assert (only.project_name, only.weeks[0].wip, only.cycle_time_count) == ("Other", 1, 0)
+
+    assert compute_flow_stats(temp_db, node_type="subtask", now=now) == []
+    with pytest.raises(ValidationError):
+        compute_flow_stats(temp_db, project_id=999)
+    with pytest.raises(ValidationError):
+        compute_flow_stats(temp_db, weeks=0)
@@ -0,0 +1,76 @@
+"""
+SQL計測（instrumentation.py）のテスト
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.instrumentation import QueryTracer, normalize_sql
+from pmtool.repository import ProjectRepository, TaskRepository
+
+
+@pytest.fixture
+def traced_db(tmp_path):
+    """計測を有効にした初期化済みDB"""
+    tracer = QueryTracer(slow_threshold_ms=None)
+    db = Database(tmp_path / "trace.db", tracer=tracer)
+    db.initialize(Path(__file__).parent.parent / "scripts" / "init_db.sql")
+    tracer.reset()
+    yield db
+    db.close()
+
+
+def test_normalize_sql():
+    """リテラル・IN リスト・空白が正規化されること"""
+    assert (
+        normalize_sql("SELECT *\n  FROM tasks WHERE id IN (?, ?, ?) AND name = 'a''b'")
+        == "SELECT * FROM tasks WHERE id IN (?, ...) AND name = ?"
+    )
+    assert normalize_sql("SELECT * FROM t1 WHERE x = 10") == "SELECT * FROM t1 WHERE x = ?"
+    assert (
+        normalize_sql("INSERT INTO t VALUES (?, ?), (?, ?), (?, ?)")
+        == "INSERT INTO t VALUES (?, ...), ..."
+    )
+
+
+def test_tracer_records_counts_rows_and_commits(traced_db: Database):
+    """実行回数・返却行数・COMMIT が記録されること"""
+    tracer = traced_db.tracer
+    project = ProjectRepository(traced_db).create("Project", "")
+    task_repo = TaskRepository(traced_db)
+    for i in range(3):
+        task_repo.create(project.id, f"Task {i}", None, "")
+    tracer.reset()
+
+    for _ in range(4):
+        task_repo.get_by_parent(project_id=project.id, subproject_id=None)
+    traced_db.set_metadata("k", "v")
+
+    stats = {s.sql: s for s in tracer.summary()}
+    by_parent = [s for sql, s in stats.items() if sql.startswith("SELECT * FROM tasks")]
+    assert len(by_parent) == 1
+    assert by_parent[0].count == 4
+    assert by_parent[0].rows == 12
+    assert by_parent[0].p95 >= 0
+    assert stats["COMMIT"].count == 1
+    assert tracer.total_statements == sum(s.count for s in stats.values())
+
+
+def test_tracer_records_statements_outside_wrappers(traced_db: Database):
+    """executescript 等のラッパー外のステートメントも回数が記録されること"""
+    traced_db.connect().executescript("SELECT 1; SELECT 2;")
+    stats = {s.sql: s for s in traced_db.tracer.summary()}
+    assert stats["SELECT ?;"].count == 2
+
+
+def test_slow_query_log_includes_plan(traced_db: Database):
+    """閾値を超えたステートメントが実行計画付きで記録されること"""
+    tracer = traced_db.tracer
+    tracer.slow_threshold_ms = 0
+    ProjectRepository(traced_db).get_by_id(1)
+
+    slow = [q for q in tracer.slow_queries if "FROM projects" in q.sql]
+    assert slow
+    assert any("projects" in detail for detail in slow[0].plan)
@@ -0,0 +1,166 @@
+"""
+コネクションプール (Database.read() / Database.write()) のテスト
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.pool import ConnectionPool, WriterQueue
+from pmtool.repository import ProjectRepository, TaskRepository
+
+
+def test_concurrent_writes_are_serialized(temp_db: Database):
+    """複数スレッドからの write() が直列化され、すべて反映されること"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    errors = []
+
+    def worker(index: int) -> None:
+        try:
+            for i in range(10):
+                with temp_db.write():
+                    # スコープ内ではリポジトリも書き込み用コネクションを使う
+                    TaskRepository(temp_db).create(project.id, f"T{index}-{i}", None, "")
+        except Exception as e:  # pragma: no cover - 失敗時の報告用
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    count = temp_db.connect().execute(
+        "SELECT COUNT(*) FROM tasks WHERE project_id = ?", (project.id,)
+    ).fetchone()[0]
+    assert count == 80
+
+
+def test_read_scope_uses_pooled_readonly_connection(temp_db: Database):
+    """read() ではスレッドごとに読み取り専用コネクションが貸し出されること"""
+    ProjectRepository(temp_db).create("Project", "")
+
+    with temp_db.read() as conn:
+        assert temp_db.connect() is conn
+        with temp_db.read() as nested:
+            assert nested is conn
+        assert len(ProjectRepository(temp_db).get_all()) == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM projects")
+
+    # スコープ外では共有の書き込み用コネクションに戻る
+    assert temp_db.connect() is not conn
+    with temp_db.read() as again:
+        assert again is conn
+
+
+def test_unscoped_connect_from_other_thread_gets_own_connection(temp_db: Database):
+    """スコープ外の connect() は、所有スレッド以外には専用のコネクションを返すこと"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    main_conn = temp_db.connect()
+    seen = []
+
+    def worker() -> None:
+        conn = temp_db.connect()
+        seen.append((conn, temp_db.connect()))
+        TaskRepository(temp_db).create(project.id, "Task", None, "")
+        # スコープ内は書き込み用の共有コネクション
+        with temp_db.write() as writer:
+            seen.append((writer, temp_db.connect()))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    (own, again), (writer, scoped) = seen
+    assert own is again
+    assert own is not main_conn
+    assert writer is main_conn and scoped is main_conn
+    assert len(TaskRepository(temp_db).get_by_parent(project.id)) == 1
+
+    temp_db.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        own.execute("SELECT 1")
+
+
+def test_write_scope_commits_only_outermost(temp_db: Database):
+    """write() は最外側でコミットし、例外時はロールバックすること"""
+    with temp_db.write() as conn:
+        with temp_db.write() as nested:
+            assert nested is conn
+            conn.execute("INSERT INTO metadata (key, value) VALUES ('a', '1')")
+        assert conn.in_transaction
+    assert temp_db.get_metadata("a") == "1"
+
+    with pytest.raises(RuntimeError):
+        with temp_db.write() as conn:
+            conn.execute("INSERT INTO metadata (key, value) VALUES ('b', '1')")
+            raise RuntimeError("boom")
+    assert temp_db.get_metadata("b") is None
+
+
+def test_reader_pool_is_bounded(temp_db: Database):
+    """読み取りコネクションの同時貸し出し数は max_readers までであること"""
+    pool = ConnectionPool(temp_db.connect_readonly, max_readers=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    start = threading.Barrier(6)
+
+    def worker() -> None:
+        nonlocal active, peak
+        start.wait()
+        with pool.reader():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+
+    assert peak <= 2
+    assert pool.reader_count == 0
+
+    with pytest.raises(ValueError):
+        ConnectionPool(temp_db.connect_readonly, max_readers=0)
+
+
+def test_writer_queue_is_fifo_and_reentrant():
+    """WriterQueue は到着順に権利を与え、同一スレッドでは再入できること"""
+    queue = WriterQueue()
+    assert queue.acquire() == 1
+    assert queue.acquire() == 2
+    queue.release()
+
+    order = []
+    threads = []
+    for n in range(3):
+        def worker(n=n):
+            queue.acquire()
+            order.append(n)
+            queue.release()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+        # 前のスレッドが待ち行列に入るまで待つ
+        while queue.waiting < n + 1:
+            threading.Event().wait(0.001)
+
+    queue.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2]
+    with pytest.raises(RuntimeError):
+        queue.release()
@@ -0,0 +1,174 @@
+"""
+主要な読み取り経路のクエリ数バジェットのテスト
+
+既知の大きさの合成データに対して、表示・分析・doctor・テンプレート適用が
+発行するSQLの数が上限を超えないことを確認します（N+1 の混入を検出する）。
+"""
+
+import pytest
+from rich.console import Console
+
+from pmtool.database import Database
+from pmtool.dependencies import DependencyManager
+from pmtool.doctor import Doctor
+from pmtool.status import StatusManager
+from pmtool.repository import (
+    ProjectRepository,
+    SubProjectRepository,
+    SubTaskRepository,
+    TaskRepository,
+)
+from pmtool.template import TemplateManager
+from pmtool.tui import display
+
+SUBPROJECTS = 3
+TASKS_PER_SUBPROJECT = 10
+SUBTASKS_PER_TASK = 4
+
+
+@pytest.fixture
+def dataset(temp_db: Database) -> dict:
+    """
+    合成データ（3 SubProject × 10 Task × 4 SubTask）
+
+    Taskは全体で1本の依存チェーン、SubTaskはTaskごとに1本の依存チェーンを持ちます。
+    """
+    project = ProjectRepository(temp_db).create("Budget", "")
+    subproj_repo = SubProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_manager = DependencyManager(temp_db)
+
+    subprojects, task_ids, subtask_ids = [], [], []
+    with temp_db.transaction():
+        for i in range(SUBPROJECTS):
+            subproj = subproj_repo.create(project.id, f"SubProject {i}")
+            subprojects.append(subproj.id)
+            for j in range(TASKS_PER_SUBPROJECT):
+                task = task_repo.create(project.id, f"Task {i}-{j}", subproj.id)
+                task_ids.append(task.id)
+                chain = [
+                    subtask_repo.create(task.id, f"SubTask {k}").id
+                    for k in range(SUBTASKS_PER_TASK)
+                ]
+                dep_manager.add_subtask_dependencies(zip(chain, chain[1:]))
+                subtask_ids.append(chain)
+        dep_manager.add_task_dependencies(zip(task_ids, task_ids[1:]))
+
+    return {
+        "project_id": project.id,
+        "subproject_ids": subprojects,
+        "task_ids": task_ids,
+        "subtask_ids": subtask_ids,
+    }
+
+
+@pytest.fixture
+def console(monkeypatch) -> Console:
+    """表示内容を記録するコンソール"""
+    console = Console(record=True, width=200)
+    monkeypatch.setattr("pmtool.tui.display.console", console)
+    return console
+
+
+def test_project_tree_budget(temp_db, dataset, console, assert_max_queries):
+    """ツリー表示はノード数に関わらず固定回数のクエリで済むこと（進捗は集計表から2回）"""
+    with assert_max_queries(6):
+        display.show_project_tree(temp_db, dataset["project_id"])
+
+    output = console.export_text()
+    assert "Task 2-9" in output
+    assert "0% (0/150)" in output
+
+
+def test_dependency_graph_budget(temp_db, dataset, console, assert_max_queries):
+    """依存グラフ表示は先行・後続ノード数に関わらず固定回数のクエリで済むこと"""
+    task_ids = dataset["task_ids"]
+    target = task_ids[len(task_ids) // 2]
+    dep_manager = DependencyManager(temp_db)
+
+    with assert_max_queries(6):
+        deps = dep_manager.get_task_dependencies(target)
+        display.show_dependency_graph_task(
+            temp_db, target, deps["predecessors"], deps["successors"]
+        )
+
+    chain = dataset["subtask_ids"][0]
+    with assert_max_queries(5):
+        deps = dep_manager.get_subtask_dependencies(chain[1])
+        display.show_dependency_graph_subtask(
+            temp_db, chain[1], deps["predecessors"], deps["successors"]
+        )
+
+    output = console.export_text()
+    assert "SubProject 'SubProject 1'" in output
+    assert "in Task 'Task 0-0'" in output
+
+
+def test_impact_analysis_budget(temp_db, dataset, console, assert_max_queries):
+    """影響範囲分析は後続ノード数に関わらず固定回数のクエリで済むこと"""
+    task_ids = dataset["task_ids"]
+    dep_manager = DependencyManager(temp_db)
+
+    with assert_max_queries(7):
+        successors = dep_manager.get_all_task_successors_recursive(task_ids[0])
+        display.show_impact_analysis_task(temp_db, task_ids[0], successors)
+
+    assert len(successors) == len(task_ids) - 1
+    assert f"Task {task_ids[-1]}: Task 2-9" in console.export_text()
+
+    with assert_max_queries(5):
+        path = dep_manager.find_path_between_tasks(task_ids[0], task_ids[-1])
+        display.show_dependency_chain_task(temp_db, path)
+
+    assert len(path) == len(task_ids)
+
+
+def test_doctor_budget(temp_db, dataset, assert_max_queries):
+    """doctor はデータ量に関わらず固定回数のクエリで済むこと"""
+    with assert_max_queries(30):
+        report = Doctor(temp_db).check_all()
+
+    assert report.is_healthy
+
+
+def test_template_apply_budget(temp_db, dataset, assert_max_queries):
+    """テンプレート適用のクエリ数がTask数に比例し、SubTask数には依存しないこと"""
+    manager = TemplateManager(temp_db)
+    result = manager.save_template(
+        dataset["subproject_ids"][0], "Budget Template", include_tasks=True
+    )
+
+    with assert_max_queries(30 + 8 * TASKS_PER_SUBPROJECT):
+        manager.apply_template(result.template.id, dataset["project_id"], "Copy")
+
+
+def test_done_validation_budget(temp_db, dataset, assert_max_queries):
+    """DONE遷移の検証は先行ノード・子SubTaskの数に関わらず層ごとに1回のクエリで済むこと"""
+    task_ids = dataset["task_ids"]
+    hub = task_ids[-1]
+    DependencyManager(temp_db).add_task_dependencies(
+        (pred, hub) for pred in task_ids[:-2]
+    )
+    status_mgr = StatusManager(temp_db, DependencyManager(temp_db))
+
+    with assert_max_queries(2):
+        ok, _, _, details = status_mgr.validate_done_transition(hub, "task")
+
+    assert not ok
+    assert len(details["incomplete_predecessors"]) == len(task_ids) - 1
+
+    with assert_max_queries(2):
+        assert not status_mgr._all_predecessors_done(hub, "task")
+        assert not status_mgr._all_child_subtasks_done(hub)
+
+
+def test_assert_max_queries_reports_overrun(temp_db, assert_max_queries):
+    """上限を超えた場合は実行したステートメントを添えて失敗すること"""
+    project = ProjectRepository(temp_db).create("Overrun", "")
+    repo = ProjectRepository(temp_db)
+
+    with pytest.raises(pytest.fail.Exception, match="SELECT \\* FROM projects"):
+        with assert_max_queries(2):
+            for _ in range(3):
+                repo.get_by_id(project.id)
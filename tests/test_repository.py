@@ -180,3 +180,154 @@ def test_update_project_preserves_other_fields(temp_db: Database):
 
     # updated_at は変更されている
     assert updated.updated_at != original_created
+
+
+def test_load_tree_assembles_hierarchy_in_order(temp_db: Database):
+    """load_treeがSubProject/Task/SubTaskをorder_index順に組み立てること"""
+    proj_repo = ProjectRepository(temp_db)
+    subproj_repo = SubProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+
+    project = proj_repo.create("Project", "")
+    sp1 = subproj_repo.create(project.id, "SP1")
+    sp2 = subproj_repo.create(project.id, "SP2")
+    t1 = task_repo.create(project.id, "T1", sp1.id)
+    t2 = task_repo.create(project.id, "T2", sp1.id)
+    t3 = task_repo.create(project.id, "T3", sp2.id)
+    direct = task_repo.create(project.id, "Direct", None)
+    st1 = subtask_repo.create(t1.id, "ST1")
+    st2 = subtask_repo.create(t1.id, "ST2")
+    st3 = subtask_repo.create(direct.id, "ST3")
+
+    # 別Projectのデータは含まれない
+    other = proj_repo.create("Other", "")
+    other_task = task_repo.create(other.id, "OtherTask", None)
+    subtask_repo.create(other_task.id, "OtherSubTask")
+
+    tree = proj_repo.load_tree(project.id)
+
+    assert tree.project.id == project.id
+    assert [node.subproject.id for node in tree.subprojects] == [sp1.id, sp2.id]
+    assert [node.task.id for node in tree.subprojects[0].tasks] == [t1.id, t2.id]
+    assert [node.task.id for node in tree.subprojects[1].tasks] == [t3.id]
+    assert [st.id for st in tree.subprojects[0].tasks[0].subtasks] == [st1.id, st2.id]
+    assert tree.subprojects[0].tasks[1].subtasks == []
+    assert [node.task.id for node in tree.direct_tasks] == [direct.id]
+    assert [st.id for st in tree.direct_tasks[0].subtasks] == [st3.id]
+
+
+def test_load_tree_returns_none_for_nonexistent(temp_db: Database):
+    """存在しないIDではload_treeがNoneを返すこと"""
+    assert ProjectRepository(temp_db).load_tree(999) is None
+    assert SubProjectRepository(temp_db).load_tree(999) is None
+
+
+def test_subproject_load_tree(temp_db: Database):
+    """SubProjectRepository.load_treeが配下のTask/SubTaskのみを返すこと"""
+    proj_repo = ProjectRepository(temp_db)
+    subproj_repo = SubProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+
+    project = proj_repo.create("Project", "")
+    sp1 = subproj_repo.create(project.id, "SP1")
+    sp2 = subproj_repo.create(project.id, "SP2")
+    t1 = task_repo.create(project.id, "T1", sp1.id)
+    st1 = subtask_repo.create(t1.id, "ST1")
+    t2 = task_repo.create(project.id, "T2", sp2.id)
+    subtask_repo.create(t2.id, "ST2")
+
+    node = subproj_repo.load_tree(sp1.id)
+
+    assert node.subproject.id == sp1.id
+    assert [tn.task.id for tn in node.tasks] == [t1.id]
+    assert [st.id for st in node.tasks[0].subtasks] == [st1.id]
+
+
+def test_task_create_many_assigns_contiguous_order(temp_db: Database):
+    """Task.create_manyが既存の末尾から連番でTaskを作成し、入力順に返すこと"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    sp = SubProjectRepository(temp_db).create(project.id, "SP")
+    task_repo = TaskRepository(temp_db)
+    task_repo.create(project.id, "Existing", sp.id)
+
+    created = task_repo.create_many(
+        project.id,
+        sp.id,
+        ["A", {"name": "B", "description": "desc", "status": "IN_PROGRESS"}],
+    )
+
+    assert [t.name for t in created] == ["A", "B"]
+    assert [t.order_index for t in created] == [1, 2]
+    assert created[1].description == "desc"
+    stored = task_repo.get_by_ids([t.id for t in created])
+    assert stored[created[1].id].status == "IN_PROGRESS"
+    assert stored[created[0].id].subproject_id == sp.id
+    assert task_repo.create_many(project.id, None, []) == []
+
+
+def test_create_many_is_atomic_on_duplicate(temp_db: Database):
+    """重複名を含む場合はConstraintViolationErrorとなり、1件も作成されないこと"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    task = task_repo.create(project.id, "T1")
+    subtask_repo.create(task.id, "ST1")
+
+    with pytest.raises(ConstraintViolationError, match="T1"):
+        task_repo.create_many(project.id, None, ["T2", "T1"])
+    with pytest.raises(ConstraintViolationError, match="T3"):
+        task_repo.create_many(project.id, None, ["T3", "T3"])
+    with pytest.raises(ConstraintViolationError, match="ST1"):
+        subtask_repo.create_many(task.id, ["ST2", "ST1"])
+    with pytest.raises(ConstraintViolationError):
+        subtask_repo.create_many(999, ["ST2"])
+
+    assert [t.name for t in task_repo.get_by_parent(project.id)] == ["T1"]
+    assert [st.name for st in subtask_repo.get_by_task(task.id)] == ["ST1"]
+
+    created = subtask_repo.create_many(task.id, ["ST2", "ST3"])
+    assert [st.order_index for st in created] == [1, 2]
+
+
+def test_progress_rollups_follow_writes(temp_db: Database):
+    """進捗集計が作成・ステータス変更・削除・連鎖削除に追従すること"""
+    from pmtool.dependencies import DependencyManager
+    from pmtool.status import StatusManager
+
+    proj_repo = ProjectRepository(temp_db)
+    subproj_repo = SubProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    status_mgr = StatusManager(temp_db, DependencyManager(temp_db))
+
+    project = proj_repo.create("Project", "")
+    empty = proj_repo.create("Empty", "")
+    sp = subproj_repo.create(project.id, "SP")
+    t1 = task_repo.create(project.id, "T1", sp.id)
+    t2 = task_repo.create(project.id, "T2")
+    st1 = subtask_repo.create(t1.id, "ST1")
+    subtask_repo.create(t1.id, "ST2")
+
+    status_mgr.update_subtask_status(st1.id, "DONE")
+    status_mgr.update_task_status(t2.id, "IN_PROGRESS")
+
+    progress = proj_repo.get_progress()
+    assert empty.id not in progress
+    rollup = progress[project.id]
+    assert rollup.task_counts == {"UNSET": 1, "IN_PROGRESS": 1}
+    assert rollup.subtask_counts == {"DONE": 1, "UNSET": 1}
+    assert (rollup.done, rollup.total) == (1, 4)
+    assert rollup.percent == 25.0
+
+    sp_rollup = subproj_repo.get_progress_by_project(project.id)[sp.id]
+    assert sp_rollup.task_counts == {"UNSET": 1}
+    assert sp_rollup.subtask_counts == {"DONE": 1, "UNSET": 1}
+
+    task_repo.delete(t2.id)
+    assert proj_repo.get_progress([project.id])[project.id].task_counts == {"UNSET": 1}
+
+    subproj_repo.cascade_delete(sp.id)
+    assert proj_repo.get_progress([project.id]) == {}
+    assert subproj_repo.get_progress_by_project(project.id) == {}
@@ -14,7 +14,11 @@ from pmtool.repository import (
 )
 from pmtool.dependencies import DependencyManager
 from pmtool.status import StatusManager
-from pmtool.exceptions import StatusTransitionError, StatusTransitionFailureReason
+from pmtool.exceptions import (
+    StatusTransitionError,
+    StatusTransitionFailureReason,
+    ValidationError,
+)
 
 
 def test_status_transition_to_done_success(temp_db: Database):
@@ -202,3 +206,211 @@ def test_subtask_status_transition_with_prerequisite(temp_db: Database):
     # st1がNOT_STARTEDの状態でst2をDONEにしようとするとエラー
     with pytest.raises(StatusTransitionError):
         status_mgr.update_subtask_status(st2.id, "DONE")
+
+
+def test_done_validation_reports_only_incomplete_nodes(temp_db: Database):
+    """DONE遷移の検証が未完了の先行ノード・子SubTaskのみを (id, name, status) で返すこと"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+    status_mgr = StatusManager(temp_db, dep_mgr)
+
+    project = proj_repo.create("Project", "")
+    hub = task_repo.create(project.id, "Hub", None, "")
+    done = task_repo.create(project.id, "Done", None, "", status="DONE")
+    pending = task_repo.create(project.id, "Pending", None, "", status="IN_PROGRESS")
+    dep_mgr.add_task_dependencies([(done.id, hub.id), (pending.id, hub.id)])
+    subtask_repo.create(hub.id, "Child done", "", status="DONE")
+    child = subtask_repo.create(hub.id, "Child open", "")
+
+    assert not status_mgr._all_predecessors_done(hub.id, "task")
+    ok, _, reason, details = status_mgr.validate_done_transition(hub.id, "task")
+    assert not ok
+    assert reason == StatusTransitionFailureReason.PREREQUISITE_NOT_DONE
+    assert details["incomplete_predecessors"] == [
+        {"id": pending.id, "name": "Pending", "status": "IN_PROGRESS"}
+    ]
+
+    status_mgr.update_task_status(pending.id, "DONE")
+    assert status_mgr._all_predecessors_done(hub.id, "task")
+    assert not status_mgr._all_child_subtasks_done(hub.id)
+    ok, _, reason, details = status_mgr.validate_done_transition(hub.id, "task")
+    assert reason == StatusTransitionFailureReason.CHILD_NOT_DONE
+    assert details["incomplete_children"] == [
+        {"id": child.id, "name": "Child open", "status": "UNSET"}
+    ]
+
+
+def test_update_statuses_orders_batch_topologically(temp_db: Database):
+    """一括更新が入力順に関わらずSubTask→Task、先行→後続の順に判定・適用されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+    status_mgr = StatusManager(temp_db, dep_mgr)
+
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+    st1 = subtask_repo.create(t1.id, "SubTask 1", "")
+    st2 = subtask_repo.create(t1.id, "SubTask 2", "")
+    dep_mgr.add_task_dependency(t1.id, t2.id)
+    dep_mgr.add_subtask_dependency(st1.id, st2.id)
+
+    # 後続・親を先に並べても、一括更新後の状態で判定されるため全件受理される
+    result = status_mgr.update_statuses(
+        [
+            ("task", t2.id, "DONE"),
+            ("task", t1.id, "DONE"),
+            ("subtask", st2.id, "DONE"),
+            ("subtask", st1.id, "DONE"),
+        ]
+    )
+
+    assert not result.has_rejections
+    assert [(c.node_type, c.node_id) for c in result.applied] == [
+        ("subtask", st1.id),
+        ("subtask", st2.id),
+        ("task", t1.id),
+        ("task", t2.id),
+    ]
+    assert task_repo.get_by_id(t2.id).status == "DONE"
+    assert subtask_repo.get_by_id(st1.id).status == "DONE"
+
+
+def test_update_statuses_reports_rejections(temp_db: Database):
+    """拒否された変更は理由とともに返され、それを前提とする変更も拒否されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+    status_mgr = StatusManager(temp_db, dep_mgr)
+
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+    t3 = task_repo.create(project.id, "Task 3", None, "")
+    subtask_repo.create(t1.id, "Open", "")
+    dep_mgr.add_task_dependencies([(t1.id, t2.id), (t2.id, t3.id)])
+
+    changes = [
+        ("task", t3.id, "DONE"),
+        ("task", t2.id, "DONE"),
+        ("task", t1.id, "DONE"),
+        ("task", t1.id, "IN_PROGRESS"),
+        ("task", 999, "DONE"),
+        ("subtask", t1.id, "BOGUS"),
+        ("project", t1.id, "DONE"),
+    ]
+    dry = status_mgr.update_statuses(changes, dry_run=True)
+    result = status_mgr.update_statuses(changes)
+
+    Reason = StatusTransitionFailureReason
+    assert [(r.change.node_id, r.reason) for r in result.rejected] == [
+        (t3.id, Reason.PREREQUISITE_NOT_DONE),
+        (t2.id, Reason.PREREQUISITE_NOT_DONE),
+        (t1.id, Reason.CHILD_NOT_DONE),
+        (t1.id, Reason.DUPLICATE_IN_BATCH),
+        (999, Reason.NODE_NOT_FOUND),
+        (t1.id, Reason.INVALID_STATUS),
+        (t1.id, Reason.INVALID_NODE_TYPE),
+    ]
+    assert result.rejected[1].details["incomplete_predecessors"][0]["id"] == t1.id
+    assert result.applied == [] and dry.rejected == result.rejected
+    assert task_repo.get_by_id(t1.id).status == "UNSET"
+
+
+def test_update_statuses_rejects_stored_dependency_cycle(temp_db: Database):
+    """DB上の循環に含まれるノードの変更は、判定できないとして拒否されること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    status_mgr = StatusManager(temp_db, DependencyManager(temp_db))
+
+    project = proj_repo.create("Project", "")
+    t1 = task_repo.create(project.id, "Task 1", None, "")
+    t2 = task_repo.create(project.id, "Task 2", None, "")
+    t3 = task_repo.create(project.id, "Task 3", None, "")
+
+    # API経由では作れない循環 t1 ⇄ t2 を直接作成
+    conn = temp_db.connect()
+    conn.executemany(
+        "INSERT INTO task_dependencies (predecessor_id, successor_id, created_at) "
+        "VALUES (?, ?, '2025-01-01T00:00:00')",
+        [(t1.id, t2.id), (t2.id, t1.id)],
+    )
+    conn.commit()
+
+    result = status_mgr.update_statuses(
+        [("task", t1.id, "DONE"), ("task", t2.id, "DONE"), ("task", t3.id, "DONE")]
+    )
+
+    assert [change.node_id for change in result.applied] == [t3.id]
+    assert [(r.change.node_id, r.reason) for r in result.rejected] == [
+        (t1.id, StatusTransitionFailureReason.INVALID_TRANSITION),
+        (t2.id, StatusTransitionFailureReason.INVALID_TRANSITION),
+    ]
+    assert "循環" in result.rejected[0].message
+    assert task_repo.get_by_id(t1.id).status == "UNSET"
+
+
+def test_ready_nodes_follow_status_and_dependency_changes(temp_db: Database):
+    """着手可能ノードが依存関係・ステータス・削除の変更に追従すること"""
+    proj_repo = ProjectRepository(temp_db)
+    task_repo = TaskRepository(temp_db)
+    subtask_repo = SubTaskRepository(temp_db)
+    dep_mgr = DependencyManager(temp_db)
+    status_mgr = StatusManager(temp_db, dep_mgr)
+
+    project = proj_repo.create("Project", "")
+    other = proj_repo.create("Other", "")
+    a = task_repo.create(project.id, "A", None, "")
+    b = task_repo.create(project.id, "B", None, "")
+    c = task_repo.create(project.id, "C", None, "")
+    x = task_repo.create(other.id, "X", None, "")
+
+    def ready_ids(**kwargs) -> list[int]:
+        return [t.id for t in status_mgr.get_ready_nodes(node_type="task", **kwargs)["tasks"]]
+
+    # A -> C, B -> C
+    dep_mgr.add_task_dependency(a.id, c.id)
+    dep_mgr.add_task_dependency(b.id, c.id)
+    assert ready_ids(project_id=project.id) == [a.id, b.id]
+    assert ready_ids() == [a.id, b.id, x.id]
+
+    status_mgr.update_task_status(a.id, "DONE")
+    assert ready_ids(project_id=project.id) == [b.id]
+
+    # DONEから戻すと後続は再び待ち状態になる
+    status_mgr.update_task_status(a.id, "IN_PROGRESS")
+    dep_mgr.remove_task_dependency(b.id, c.id)
+    assert ready_ids(project_id=project.id) == [a.id, b.id]
+
+    # 未完了の先行ノードを削除すると後続が着手可能になる
+    task_repo.delete(a.id)
+    assert ready_ids(project_id=project.id) == [b.id, c.id]
+    assert ready_ids(project_id=project.id, limit=1) == [b.id]
+
+    # SubTask層（Project配下への絞り込みを含む）
+    s1 = subtask_repo.create(b.id, "S1", "")
+    s2 = subtask_repo.create(b.id, "S2", "")
+    subtask_repo.create(x.id, "SX", "")
+    dep_mgr.add_subtask_dependency(s1.id, s2.id)
+    ready = status_mgr.get_ready_nodes(project_id=project.id)
+    assert [st.id for st in ready["subtasks"]] == [s1.id]
+
+    status_mgr.update_statuses(
+        [("subtask", s1.id, "DONE"), ("subtask", s2.id, "DONE")]
+    )
+    assert status_mgr.get_ready_nodes(project_id=project.id, node_type="subtask") == {
+        "tasks": [],
+        "subtasks": [],
+    }
+
+    rows = temp_db.connect().execute(
+        "SELECT COUNT(*) FROM tasks WHERE pending_predecessors < 0"
+    ).fetchone()
+    assert rows[0] == 0
+
+    with pytest.raises(ValidationError):
+        status_mgr.get_ready_nodes(node_type="project")
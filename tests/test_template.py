@@ -295,3 +295,30 @@ def test_detect_external_dependencies_exists(template_manager, repos):
     assert warnings[0].from_task_id == task2.id
     assert warnings[0].to_task_id == task1.id
     assert warnings[0].direction == 'incoming'
+
+
+def test_apply_template_is_atomic(template_manager, repos, monkeypatch):
+    """適用途中で失敗した場合は何も作成されない"""
+    project1 = repos["project"].create("Project1", "desc")
+    subproject1 = repos["subproject"].create(project1.id, "SubProject1", None, "desc")
+    repos["task"].create(project1.id, "Task1", subproject1.id, "desc")
+    result = template_manager.save_template(
+        subproject_id=subproject1.id,
+        name="Template1",
+        description="desc",
+        include_tasks=True,
+    )
+    project2 = repos["project"].create("Project2", "desc")
+
+    def fail(pairs):
+        raise sqlite3.OperationalError("boom")
+
+    monkeypatch.setattr(template_manager.dep_manager, "add_task_dependencies", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        template_manager.apply_template(
+            template_id=result.template.id,
+            project_id=project2.id,
+        )
+
+    assert repos["subproject"].get_by_project(project2.id) == []
+    assert repos["task"].get_by_parent(project_id=project2.id, subproject_id=None) == []
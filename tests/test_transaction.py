@@ -0,0 +1,113 @@
+"""
+作業単位（Database.transaction()）のテスト
+"""
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.dependencies import DependencyManager
+from pmtool.exceptions import ConstraintViolationError, CyclicDependencyError
+from pmtool.repository import ProjectRepository, TaskRepository
+
+
+def _count_tasks(db: Database) -> int:
+    return db.connect().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+
+def test_transaction_defers_repository_commits(temp_db: Database):
+    """スコープ内の大量作成が1回のコミットで反映されること"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+
+    statements = []
+    conn = temp_db.connect()
+    conn.set_trace_callback(statements.append)
+    try:
+        with temp_db.transaction():
+            for i in range(5000):
+                task_repo.create(project.id, f"Task {i}", None, "")
+            assert temp_db.in_transaction
+    finally:
+        conn.set_trace_callback(None)
+
+    assert not temp_db.in_transaction
+    # 最も外側の SAVEPOINT の RELEASE がトランザクション全体の唯一のコミット
+    commits = [
+        sql for sql in statements if sql.upper().startswith(("COMMIT", "RELEASE"))
+    ]
+    assert commits == ["RELEASE pmtool_sp_0"]
+    assert _count_tasks(temp_db) == 5000
+
+
+def test_transaction_rolls_back_on_error(temp_db: Database):
+    """例外で抜けた場合はスコープ内の変更がすべて取り消されること"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction():
+            task_repo.create(project.id, "Task 1", None, "")
+            task_repo.create(project.id, "Task 2", None, "")
+            raise RuntimeError("boom")
+
+    assert _count_tasks(temp_db) == 0
+
+
+def test_nested_transaction_rolls_back_only_inner(temp_db: Database):
+    """入れ子のスコープの失敗はそのスコープの変更だけを取り消すこと"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+
+    with temp_db.transaction():
+        t1 = task_repo.create(project.id, "Task 1", None, "")
+        with pytest.raises(ConstraintViolationError):
+            with temp_db.transaction():
+                t2 = task_repo.create(project.id, "Task 2", None, "")
+                DependencyManager(temp_db).add_task_dependency(t1.id, t2.id)
+                # 重複追加は制約違反
+                DependencyManager(temp_db).add_task_dependency(t1.id, t2.id)
+        task_repo.create(project.id, "Task 3", None, "")
+
+    names = [
+        row[0]
+        for row in temp_db.connect().execute("SELECT name FROM tasks ORDER BY id")
+    ]
+    assert names == ["Task 1", "Task 3"]
+    assert DependencyManager(temp_db).get_task_dependencies(t1.id)["successors"] == []
+
+
+def test_transaction_keeps_dependency_graph_cache(temp_db: Database):
+    """スコープ内の依存追加で依存グラフを読み直さず、コミットでキャッシュに反映されること"""
+    project = ProjectRepository(temp_db).create("Project", "")
+    task_repo = TaskRepository(temp_db)
+    tasks = [task_repo.create(project.id, f"Task {i}", None, "") for i in range(52)]
+    dep_mgr = DependencyManager(temp_db)
+
+    statements = []
+    conn = temp_db.connect()
+    conn.set_trace_callback(statements.append)
+    try:
+        with temp_db.transaction():
+            for pred, succ in zip(tasks[:49], tasks[1:50]):
+                dep_mgr.add_task_dependency(pred.id, succ.id)
+            # 未コミットのエッジも循環判定に使われる
+            with pytest.raises(CyclicDependencyError):
+                dep_mgr.add_task_dependency(tasks[49].id, tasks[0].id)
+        dep_mgr.add_task_dependency(tasks[49].id, tasks[50].id)
+
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                dep_mgr.add_task_dependency(tasks[51].id, tasks[0].id)
+                raise RuntimeError("boom")
+        # ロールバックしたエッジはキャッシュにも残らない
+        dep_mgr.add_task_dependency(tasks[0].id, tasks[51].id)
+    finally:
+        conn.set_trace_callback(None)
+
+    loads = [
+        sql for sql in statements
+        if sql.startswith("SELECT predecessor_id, successor_id FROM task_dependencies")
+    ]
+    # 最初の1回と、ロールバック後の1回のみ
+    assert len(loads) == 2
+    assert dep_mgr._get_graph("task").edge_count == 51
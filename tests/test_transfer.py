@@ -0,0 +1,160 @@
+"""
+transfer.py（NDJSON エクスポート / インポート）のテスト
+"""
+
+import io
+import json
+
+import pytest
+
+from pmtool.database import Database
+from pmtool.datagen import DatasetSpec, generate_dataset
+from pmtool.doctor import Doctor
+from pmtool.exceptions import (
+    ConstraintViolationError,
+    CyclicDependencyError,
+    EntityNotFoundError,
+    ValidationError,
+)
+from pmtool.repository import ProjectRepository, SubProjectRepository, TaskRepository
+from pmtool.transfer import export_project, import_ndjson, iter_project_records
+
+SPEC = DatasetSpec(
+    projects=2,
+    subprojects_per_project=3,
+    tasks_per_subproject=6,
+    subtasks_per_task=3,
+    cross_subproject_ratio=0.3,
+    seed=7,
+)
+
+
+def _export(db: Database, project_id: int) -> str:
+    buf = io.StringIO()
+    export_project(db, project_id, buf)
+    return buf.getvalue()
+
+
+def _shape(db: Database, project_id: int) -> list:
+    """IDに依存しない比較用の表現（種別・名前・親の名前・依存関係の名前）"""
+    names: dict[tuple[str, int], str] = {}
+    shape = []
+    for record in iter_project_records(db, project_id):
+        kind = record["type"]
+        if kind in ("header", "project"):
+            continue
+        if kind.endswith("_dependency"):
+            node = kind.removesuffix("_dependency")
+            shape.append(
+                (kind, names[(node, record["predecessor_id"])], names[(node, record["successor_id"])])
+            )
+            continue
+        parent = record.get("parent_subproject_id") or record.get("subproject_id")
+        parent_name = names.get(("subproject", parent))
+        if kind == "subtask":
+            parent_name = names[("task", record["task_id"])]
+        name = f"{parent_name}/{record['name']}"
+        names[(kind, record["id"])] = name
+        shape.append((kind, name, record.get("status"), record["order_index"]))
+    return sorted(shape, key=repr)
+
+
+def test_round_trip_preserves_project(temp_db: Database):
+    """エクスポートしたファイルを取り込むと、IDのみ異なる同じ構造のプロジェクトになること"""
+    generate_dataset(temp_db, SPEC)
+    text = _export(temp_db, 1)
+
+    result = import_ndjson(temp_db, io.StringIO(text), name="Copy", batch_size=4)
+
+    assert result.project_id != 1
+    assert result.counts["task"] == SPEC.subprojects_per_project * SPEC.tasks_per_subproject
+    assert result.total_records == len(text.splitlines()) - 1
+    assert ProjectRepository(temp_db).get_by_id(result.project_id).name == "Copy"
+    assert _shape(temp_db, result.project_id) == _shape(temp_db, 1)
+    assert Doctor(temp_db).check_all().error_count == 0
+    # 派生データは取り込み後に再計算される
+    conn = temp_db.connect()
+    pending = "SELECT name, status, pending_predecessors FROM tasks WHERE project_id = ?"
+    assert sorted(tuple(r) for r in conn.execute(pending, (result.project_id,))) == sorted(
+        tuple(r) for r in conn.execute(pending, (1,))
+    )
+    assert ProjectRepository(temp_db).get_progress([1, result.project_id])[
+        result.project_id
+    ] == ProjectRepository(temp_db).get_progress([1])[1]
+
+
+def test_round_trip_nested_subprojects(temp_db: Database):
+    """入れ子のSubProjectとプロジェクト直下のTaskも復元されること"""
+    project = ProjectRepository(temp_db).create("Nested", "desc")
+    subproj_repo = SubProjectRepository(temp_db)
+    outer = subproj_repo.create(project.id, "Outer")
+    inner = subproj_repo.create(project.id, "Inner", parent_subproject_id=outer.id)
+    task_repo = TaskRepository(temp_db)
+    task_repo.create(project.id, "Direct")
+    task_repo.create(project.id, "InInner", inner.id)
+
+    text = _export(temp_db, project.id)
+    result = import_ndjson(temp_db, io.StringIO(text), name="Nested 2", batch_size=1)
+
+    assert _shape(temp_db, result.project_id) == _shape(temp_db, project.id)
+
+
+def test_import_is_atomic(temp_db: Database):
+    """不正なファイルの場合は例外となり、何も作成されないこと"""
+    generate_dataset(temp_db, SPEC)
+    lines = _export(temp_db, 1).splitlines()
+    before = _export(temp_db, 2)
+    trigger_sql = "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' ORDER BY name"
+    triggers = temp_db.connect().execute(trigger_sql).fetchall()
+
+    # 名前の重複（--name 未指定）
+    with pytest.raises(ConstraintViolationError):
+        import_ndjson(temp_db, lines)
+
+    # 循環する依存関係
+    dep = json.loads(lines[-1])
+    cyclic = lines + [
+        json.dumps({**dep, "predecessor_id": dep["successor_id"], "successor_id": dep["predecessor_id"]})
+    ]
+    with pytest.raises(CyclicDependencyError):
+        import_ndjson(temp_db, cyclic, name="Cyclic")
+
+    # ファイル内に存在しない親
+    task_index = next(i for i, line in enumerate(lines) if '"type": "task"' in line)
+    orphan = json.loads(lines[task_index])
+    lines[task_index] = json.dumps({**orphan, "subproject_id": 999})
+    with pytest.raises(ValidationError, match=f"{task_index + 1}行目"):
+        import_ndjson(temp_db, lines, name="Orphan")
+
+    assert len(ProjectRepository(temp_db).get_all()) == SPEC.projects
+    assert _export(temp_db, 2).splitlines()[1:] == before.splitlines()[1:]
+    # 一括投入中に外したトリガーも元に戻る
+    assert temp_db.connect().execute(trigger_sql).fetchall() == triggers
+
+
+@pytest.mark.parametrize(
+    "lines, message",
+    [
+        ([], "空"),
+        (['{"type": "project", "name": "X"}'], "header"),
+        (['{"type": "header", "format": "pmtool-ndjson", "version": 99}'], "バージョン"),
+        (['{"type": "header", "format": "pmtool-ndjson", "version": 1}', "not json"], "2行目"),
+        (
+            [
+                '{"type": "header", "format": "pmtool-ndjson", "version": 1}',
+                '{"type": "task", "id": 1, "name": "T", "status": "UNSET", "order_index": 0}',
+            ],
+            "project",
+        ),
+    ],
+)
+def test_import_rejects_malformed_files(temp_db: Database, lines, message):
+    """形式の不正なファイルはValidationErrorとなること"""
+    with pytest.raises(ValidationError, match=message):
+        import_ndjson(temp_db, lines)
+
+
+def test_export_missing_project(temp_db: Database):
+    """存在しないプロジェクトのエクスポートはEntityNotFoundErrorとなること"""
+    with pytest.raises(EntityNotFoundError):
+        export_project(temp_db, 999, io.StringIO())